@@ -728,6 +728,7 @@ from .data_classes.container import conversions as cont_conversions
 from .data_classes.container import (
     ContainerBase,
     Container,
+    DataLoader,
     add_ivy_container_instance_methods,
 )
 from .data_classes.nested_array import NestedArray
@@ -775,6 +776,7 @@ except:  # noqa: E722
     pass
 try:
     from .compiler.compiler import transpile, trace_graph, unify
+    from .compiler.tracer import graph_cache_info, clear_graph_cache
 except:  # noqa: E722
     pass  # Added for the finally statement
 try:
@@ -934,6 +936,8 @@ globals_vars = GlobalsDict(
         "tmp_dir_stack": general.tmp_dir_stack,
         "precise_mode_stack": general.precise_mode_stack,
         "nestable_mode_stack": general.nestable_mode_stack,
+        "fused_dispatch_mode_stack": general.fused_dispatch_mode_stack,
+        "flat_container_mode_stack": general.flat_container_mode_stack,
         "exception_trace_mode_stack": general.exception_trace_mode_stack,
         "default_dtype_stack": data_type.default_dtype_stack,
         "default_float_dtype_stack": data_type.default_float_dtype_stack,
@@ -1434,6 +1438,8 @@ GLOBAL_PROPS = [
     "nan_policy",
     "array_mode",
     "nestable_mode",
+    "fused_dispatch_mode",
+    "flat_container_mode",
     "inplace_mode",
     "exception_trace_mode",
     "show_func_wrapper_trace_mode",
@@ -1504,10 +1510,16 @@ class LoggingMode:
             logging.getLogger().setLevel(self.logging_mode_stack[-1])
 
 
+# bumped whenever an attribute of the ivy namespace other than a global
+# property is set or deleted, the namespaces of the backends set before are
+# only replayed by `ivy.set_backend` while it's unchanged
+_namespace_version = 0
+
+
 class IvyWithGlobalProps(sys.modules[__name__].__class__):
     def __setattr__(self, name, value, internal=False):
         previous_frame = inspect.currentframe().f_back
-        filename = inspect.getframeinfo(previous_frame)[0]
+        filename = previous_frame.f_code.co_filename
         internal = internal and _is_from_internal(filename)
         if not internal and name in GLOBAL_PROPS:
             raise ivy.utils.exceptions.IvyException(
@@ -1515,6 +1527,12 @@ class IvyWithGlobalProps(sys.modules[__name__].__class__):
                 " for setting its value!"
             )
         self.__dict__[name] = value
+        if name not in GLOBAL_PROPS:
+            self.__dict__["_namespace_version"] += 1
+
+    def __delattr__(self, name):
+        super().__delattr__(name)
+        self.__dict__["_namespace_version"] += 1
 
     def __reduce__(self):
         def _get_module_and_replace_name(module_name: str):
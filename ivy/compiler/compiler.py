@@ -56,6 +56,12 @@ def trace_graph(
     kwargs
         keyword arguments for `obj`
 
+    When the compiled tracer isn't installed, `objs` are traced with the
+    pure-Python tracer of :mod:`ivy.compiler.tracer`, which only uses the
+    `include_generators`, `graph_caching`, `args` and `kwargs` arguments. Its
+    graphs are cached by input signature and retrace the function when called
+    with new shapes, dtypes or non-array arguments.
+
     Returns
     -------
     the traced `Graph` object.
@@ -94,7 +100,18 @@ def trace_graph(
     >>> print(time.time() - start)
     0.0001785755157470703
     """
-    from ._compiler import trace_graph as _trace_graph
+    try:
+        from ._compiler import trace_graph as _trace_graph
+    except ImportError:
+        from .tracer import trace_graph as _trace_python
+
+        return _trace_python(
+            *objs,
+            include_generators=include_generators,
+            graph_caching=graph_caching,
+            args=args,
+            kwargs=kwargs,
+        )
 
     return _trace_graph(
         *objs,
@@ -0,0 +1,407 @@
+"""A pure-Python tracer, used by :func:`ivy.trace_graph` when the compiled
+tracer isn't installed.
+
+Tracing runs the function once, eagerly, while the backend implementations
+wrapped by ``ivy.func_wrapper._record_backend_calls`` record each of their
+calls. The recorded calls form a flat list of native operations which is
+replayed on later calls, skipping the ivy wrappers and the python logic of the
+function. As a replayed graph only holds for the input shapes, dtypes and
+non-array arguments it was traced with, graphs are cached by input signature
+and a new graph is traced for each new signature.
+"""
+
+import collections
+import threading
+from typing import Callable, Optional, Sequence, Mapping
+
+import ivy
+from ivy import func_wrapper
+
+# upper bound on the number of graphs in a graph cache
+GRAPH_CACHE_SIZE = 128
+
+GraphCacheInfo = collections.namedtuple(
+    "GraphCacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+
+class _GraphCache(collections.OrderedDict):
+    """An LRU cache mapping (function, input signature) keys to traced
+    graphs, which can be shared by several threads."""
+
+    def __init__(self, maxsize=GRAPH_CACHE_SIZE):
+        super().__init__()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, key):
+        with self._lock:
+            graph = self.get(key)
+            if graph is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.move_to_end(key)
+            return graph
+
+    def insert(self, key, graph):
+        with self._lock:
+            self[key] = graph
+            self.move_to_end(key)
+            while len(self) > self.maxsize:
+                self.popitem(last=False)
+
+    def info(self):
+        with self._lock:
+            return GraphCacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+    def reset(self):
+        with self._lock:
+            self.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# the cache shared by the graphs traced with `graph_caching=True`
+_graph_cache = _GraphCache()
+
+# guards the count of the graphs being traced in all threads
+_num_traces_lock = threading.Lock()
+
+
+def graph_cache_info():
+    """Return the hit and miss counters and the current and maximum size of
+    the graph cache shared by the functions traced with
+    ``graph_caching=True``.
+
+    Returns
+    -------
+    ret
+        A named tuple with the fields ``hits``, ``misses``, ``maxsize`` and
+        ``currsize``.
+
+    Examples
+    --------
+    >>> ivy.clear_graph_cache()
+    >>> graph = ivy.trace_graph(ivy.sin, graph_caching=True)
+    >>> y = graph(ivy.array([1., 2.]))
+    >>> y = graph(ivy.array([3., 4.]))
+    >>> ivy.graph_cache_info().hits
+    1
+    """
+    return _graph_cache.info()
+
+
+def clear_graph_cache():
+    """Clear the shared graph cache and reset its hit and miss counters."""
+    _graph_cache.reset()
+
+
+# Helpers #
+# --------#
+
+
+def _get_leaf_signature(leaf):
+    if isinstance(leaf, ivy.Array):
+        leaf = leaf._data
+        return True, tuple(leaf.shape), leaf.dtype
+    if isinstance(leaf, ivy.NativeArray):
+        return False, tuple(leaf.shape), leaf.dtype
+    try:
+        hash(leaf)
+    except TypeError:
+        return type(leaf), id(leaf)
+    return type(leaf), leaf
+
+
+def _get_signature(flat):
+    """Return the input signature of flattened arguments: the structure of the
+    nest, the shape and dtype of its arrays and the value of its other
+    leaves."""
+    return (
+        ivy.current_backend_str(),
+        tuple(flat.indices),
+        tuple(_get_leaf_signature(leaf) for leaf in flat.leaves),
+    )
+
+
+def _to_native(x):
+    return x._data if isinstance(x, ivy.Array) else x
+
+
+def _fill(value, is_ivy):
+    return ivy.Array(value) if is_ivy else value
+
+
+class _Op:
+    """A recorded backend call, with the slots it reads its array arguments
+    from and writes its array outputs to."""
+
+    __slots__ = (
+        "fn",
+        "flat",
+        "args",
+        "kwargs",
+        "arg_inputs",
+        "kwarg_inputs",
+        "inputs",
+        "outputs",
+        "nested_output",
+        "release",
+    )
+
+    def __init__(self, fn, args, kwargs, flat, inputs, outputs, nested_output):
+        self.fn = fn
+        self.outputs = outputs
+        self.nested_output = nested_output
+        self.release = ()
+        # arguments without nests are filled in place, the others are rebuilt
+        # from their flattened leaves
+        if len(flat.leaves) == len(args) + len(kwargs) and all(
+            len(index) == 2 for index in flat.indices
+        ):
+            self.flat = None
+            self.args = list(args)
+            self.kwargs = dict(kwargs)
+            self.arg_inputs = []
+            self.kwarg_inputs = []
+            for i, slot, is_ivy in inputs:
+                where, key = flat.indices[i]
+                if where == 0:
+                    self.args[key] = None
+                    self.arg_inputs.append((key, slot, is_ivy))
+                else:
+                    self.kwargs[key] = None
+                    self.kwarg_inputs.append((key, slot, is_ivy))
+        else:
+            leaves = list(flat.leaves)
+            for i, _, _ in inputs:
+                leaves[i] = None
+            self.flat = flat._with_leaves(leaves)
+        self.inputs = inputs
+
+    def run(self, slots):
+        if self.flat is None:
+            args = self.args.copy()
+            for i, slot, is_ivy in self.arg_inputs:
+                args[i] = _fill(slots[slot], is_ivy)
+            kwargs = self.kwargs.copy()
+            for k, slot, is_ivy in self.kwarg_inputs:
+                kwargs[k] = _fill(slots[slot], is_ivy)
+        else:
+            leaves = list(self.flat.leaves)
+            for i, slot, is_ivy in self.inputs:
+                leaves[i] = _fill(slots[slot], is_ivy)
+            args, kwargs = ivy.unflatten_nest(self.flat, leaves)
+        ret = self.fn(*args, **kwargs)
+        if self.nested_output:
+            ret = ivy.flatten_nest(ret).leaves
+            for i, slot in self.outputs:
+                slots[slot] = _to_native(ret[i])
+        elif self.outputs:
+            slots[self.outputs[0][1]] = _to_native(ret)
+        for slot in self.release:
+            slots[slot] = None
+
+
+class _Recorder:
+    """Collects the backend calls made while a function is traced."""
+
+    def __init__(self, include_generators=True):
+        self.include_generators = include_generators
+        self.depth = 0
+        self.ops = []
+        self.num_slots = 0
+        self._slots = {}
+        # the tracked objects are kept alive such that their ids aren't reused
+        self._tracked = []
+
+    def _new_slot(self, x):
+        slot = self.num_slots
+        self._slots[id(x)] = slot
+        self._tracked.append(x)
+        self.num_slots += 1
+        return slot
+
+    def _find_slots(self, leaves):
+        found = []
+        for i, leaf in enumerate(leaves):
+            if isinstance(leaf, ivy.Array):
+                slot = self._slots.get(id(leaf._data))
+            elif isinstance(leaf, ivy.NativeArray):
+                slot = self._slots.get(id(leaf))
+            else:
+                continue
+            if slot is not None:
+                found.append((i, slot, isinstance(leaf, ivy.Array)))
+        return found
+
+    def add_inputs(self, leaves):
+        inputs = []
+        for i, leaf in enumerate(leaves):
+            if isinstance(leaf, (ivy.Array, ivy.NativeArray)):
+                native = _to_native(leaf)
+                slot = self._slots.get(id(native))
+                inputs.append((i, self._new_slot(native) if slot is None else slot))
+        return inputs
+
+    def record(self, fn, args, kwargs, ret):
+        flat = ivy.flatten_nest((args, kwargs))
+        inputs = self._find_slots(flat.leaves)
+        # without generators, the calls which don't depend on the inputs are
+        # folded into constants
+        if not inputs and not self.include_generators:
+            return
+        # only the arrays are tracked, the shapes, dtypes, devices and other
+        # values returned are constants of the input signature
+        out_flat = ivy.flatten_nest(ret)
+        outputs = [
+            (i, self._new_slot(_to_native(leaf)))
+            for i, leaf in enumerate(out_flat.leaves)
+            if isinstance(leaf, (ivy.Array, ivy.NativeArray))
+        ]
+        if not outputs:
+            return
+        nested_output = out_flat._root is not None
+        self.ops.append(_Op(fn, args, kwargs, flat, inputs, outputs, nested_output))
+
+    def build(self, inputs, ret):
+        out_flat = ivy.flatten_nest(ret)
+        outputs = self._find_slots(out_flat.leaves)
+        leaves = list(out_flat.leaves)
+        for i, _, _ in outputs:
+            leaves[i] = None
+        # release each intermediate array after the last op reading it
+        last_use = {}
+        for op_index, op in enumerate(self.ops):
+            for _, slot, _ in op.inputs:
+                last_use[slot] = op_index
+        for _, slot, _ in outputs:
+            last_use.pop(slot, None)
+        release = collections.defaultdict(list)
+        for slot, op_index in last_use.items():
+            release[op_index].append(slot)
+        for op_index, slots in release.items():
+            self.ops[op_index].release = tuple(slots)
+        return _Trace(
+            inputs, self.ops, self.num_slots, out_flat._with_leaves(leaves), outputs
+        )
+
+
+class _Trace:
+    """The flat list of native operations traced for one input signature."""
+
+    def __init__(self, inputs, ops, num_slots, output, outputs):
+        self.inputs = inputs
+        self.ops = ops
+        self.num_slots = num_slots
+        self.output = output
+        self.outputs = outputs
+
+    def run(self, leaves):
+        slots = [None] * self.num_slots
+        for i, slot in self.inputs:
+            slots[slot] = _to_native(leaves[i])
+        for op in self.ops:
+            op.run(slots)
+        ret = list(self.output.leaves)
+        for i, slot, is_ivy in self.outputs:
+            ret[i] = _fill(slots[slot], is_ivy)
+        return ivy.unflatten_nest(self.output, ret)
+
+
+# Graph #
+# ------#
+
+
+class Graph:
+    """A function traced into flat lists of native operations, one per input
+    signature.
+
+    Calling the graph with the shapes, dtypes and non-array arguments of a
+    previous call replays the operations recorded for them, any other call
+    traces the function again. Replayed calls don't run the python logic of
+    the function, so control flow depending on array values and side effects
+    other than the returned arrays are frozen at tracing time.
+    """
+
+    def __init__(self, fn, *, include_generators=True, graph_caching=False):
+        self.fn = fn
+        self.include_generators = include_generators
+        self._cache = _graph_cache if graph_caching else _GraphCache()
+
+    def __repr__(self):
+        return f"Graph({self.fn!r}, traces={self.cache_info().currsize})"
+
+    def cache_info(self):
+        """Return the hit and miss counters and the size of the cache of this
+        graph, which is the shared graph cache when traced with
+        ``graph_caching=True``."""
+        return self._cache.info()
+
+    def __call__(self, *args, **kwargs):
+        flat = ivy.flatten_nest((args, kwargs))
+        # when called while another function is traced, the calls are recorded
+        # into the outer graph instead
+        if func_wrapper._trace_recorder.get() is not None:
+            return self.fn(*args, **kwargs)
+        key = (self.fn, self.include_generators, _get_signature(flat))
+        trace = self._cache.lookup(key)
+        if trace is not None:
+            return trace.run(flat.leaves)
+        recorder = _Recorder(self.include_generators)
+        inputs = recorder.add_inputs(flat.leaves)
+        # only the calls of the current thread or context are recorded
+        token = func_wrapper._trace_recorder.set(recorder)
+        with _num_traces_lock:
+            func_wrapper._num_traces += 1
+        try:
+            ret = self.fn(*args, **kwargs)
+        finally:
+            with _num_traces_lock:
+                func_wrapper._num_traces -= 1
+            func_wrapper._trace_recorder.reset(token)
+        self._cache.insert(key, recorder.build(inputs, ret))
+        return ret
+
+
+def trace_graph(
+    *objs: Callable,
+    include_generators: bool = True,
+    graph_caching: bool = False,
+    args: Optional[Sequence] = None,
+    kwargs: Optional[Mapping] = None,
+):
+    """Trace callables into :class:`Graph` objects with the pure-Python
+    tracer.
+
+    Parameters
+    ----------
+    objs
+        callable(s) to trace.
+    include_generators
+        replay the array creation and random functions which don't depend on
+        the inputs, otherwise their outputs are traced as constants.
+    graph_caching
+        store the traced graphs in the graph cache shared by all functions,
+        rather than in a cache private to each graph.
+    args
+        positional arguments to trace the graphs with eagerly.
+    kwargs
+        keyword arguments to trace the graphs with eagerly.
+
+    Returns
+    -------
+    ret
+        the graph, or a tuple of graphs when several callables are given.
+    """
+    graphs = tuple(
+        Graph(obj, include_generators=include_generators, graph_caching=graph_caching)
+        for obj in objs
+    )
+    if args is not None or kwargs is not None:
+        for graph in graphs:
+            graph(*ivy.default(args, ()), **ivy.default(kwargs, {}))
+    return graphs[0] if len(graphs) == 1 else graphs
@@ -27,6 +27,7 @@ from .sorting import _ArrayWithSorting
 from .statistical import _ArrayWithStatistical
 from .utility import _ArrayWithUtility
 from ivy.func_wrapper import handle_view_indexing
+from ivy.utils.backend.handler import _register_array
 from .experimental import (
     _ArrayWithSearchingExperimental,
     _ArrayWithActivationsExperimental,
@@ -136,7 +137,7 @@ class Array(
         self._view_attributes(data)
 
     def _init(self, data, dynamic_backend=None):
-        if ivy.is_ivy_array(data):
+        if isinstance(data, ivy.Array) and ivy.is_ivy_array(data):
             self._data = data.data
         elif ivy.is_native_array(data):
             self._data = data
@@ -160,11 +161,13 @@ class Array(
         self._dev_str = None
         self._pre_repr = None
         self._post_repr = None
+        previous_backend = self.__dict__.get("_backend")
         self._backend = ivy.current_backend(self._data).backend
         if dynamic_backend is not None:
             self._dynamic_backend = dynamic_backend
         else:
             self._dynamic_backend = ivy.dynamic_backend
+        _register_array(self, previous_backend)
         self.weak_type = False  # to handle 0-D jax front weak typed arrays
 
     def _view_attributes(self, data):
@@ -191,6 +194,7 @@ class Array(
         from ivy.functional.ivy.gradients import _variable
         from ivy.utils.backend.handler import _data_to_new_backend, _get_backend_for_arg
 
+        previous_backend = self._backend
         if value:
             ivy_backend = ivy.with_backend(self._backend)
 
@@ -210,6 +214,7 @@ class Array(
             self._backend = _get_backend_for_arg(self.data.__class__.__module__).backend
 
         self._dynamic_backend = value
+        _register_array(self, previous_backend)
 
     @property
     def data(self) -> ivy.NativeArray:
@@ -460,6 +465,7 @@ class Array(
         ivy.previous_backend()
 
         self.__dict__ = ivy_array.__dict__
+        _register_array(self)
 
         # TODO: what about placement of the array on the right device ?
         # device = backend.as_native_dev(state["device_str"])
@@ -647,6 +647,7 @@ class _ArrayWithStatistical(abc.ABC):
         self: ivy.Array,
         equation: str,
         *operands: Union[ivy.Array, ivy.NativeArray],
+        optimize: Union[bool, str] = False,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         """ivy.Array instance method variant of ivy.einsum. This method simply
@@ -660,6 +661,10 @@ class _ArrayWithStatistical(abc.ABC):
         operands
             seq of arrays, the inputs to contract (each one an ivy.Array), whose shapes
             should be consistent with equation.
+        optimize
+            Whether to plan the contraction into pairwise contractions, and with
+            which path algorithm, either ``"greedy"`` or ``"optimal"``. ``True``
+            uses ``"greedy"``. Default is ``False``.
         out
             optional output array, for writing the result to.
 
@@ -717,4 +722,6 @@ class _ArrayWithStatistical(abc.ABC):
         >>> print(C)
         ivy.array(510)
         """
-        return ivy.einsum(equation, *(self._data,) + operands, out=out)
+        return ivy.einsum(
+            equation, *(self._data,) + operands, optimize=optimize, out=out
+        )
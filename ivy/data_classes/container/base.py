@@ -19,7 +19,10 @@ try:
 except ModuleNotFoundError:
     h5py = None
 import pickle
+import queue
 import random
+import threading
+from multiprocessing.pool import ThreadPool
 from operator import mul
 from functools import reduce as _reduce
 from typing import Union, Tuple
@@ -32,6 +35,56 @@ import ivy
 ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
 
+# the byte alignment of the leaves of the files saved by cont_to_disk_as_mmap
+_MMAP_ALIGNMENT = 64
+
+# the number of leaves converted to numpy ahead of their write to an hdf5 file
+_H5_WRITE_DEPTH = 2
+
+
+def _h5_chunk_shape(chunks, dataset_shape):
+    if isinstance(chunks, int) and not isinstance(chunks, bool):
+        # a number of rows, spanning all the other dimensions
+        return (min(chunks, max(dataset_shape[0], 1)),) + tuple(
+            max(dim, 1) for dim in dataset_shape[1:]
+        )
+    return chunks
+
+
+def _write_h5_leaves(h5_obj, leaves, errors, dataset_kwargs):
+    # writes the leaves put in the queue until None is put, and keeps draining
+    # it after an error so that the thread converting the leaves never blocks
+    while True:
+        leaf = leaves.get()
+        if leaf is None:
+            return
+        if errors:
+            continue
+        key_chain, value_as_np, starting_index, max_batch_size = leaf
+        try:
+            this_batch_size = value_as_np.shape[0]
+            max_bs = (
+                max_batch_size if max_batch_size else starting_index + this_batch_size
+            )
+            if key_chain not in h5_obj:
+                dataset_shape = [max_bs] + list(value_as_np.shape[1:])
+                h5_obj.create_dataset(
+                    key_chain,
+                    dataset_shape,
+                    dtype=value_as_np.dtype,
+                    maxshape=[None for _ in dataset_shape],
+                    chunks=_h5_chunk_shape(dataset_kwargs["chunks"], dataset_shape),
+                    compression=dataset_kwargs["compression"],
+                    compression_opts=dataset_kwargs["compression_opts"],
+                )
+            amount_to_write = min(this_batch_size, max_bs - starting_index)
+            h5_obj[key_chain][starting_index : starting_index + amount_to_write] = (
+                value_as_np[:amount_to_write]
+            )
+        except Exception as e:
+            errors.append(e)
+
+
 def _is_jsonable(x):
     try:
         json.dumps(x)
@@ -47,9 +100,270 @@ def _repr(x):
         return str(x)
 
 
-# noinspection PyMissingConstructor
+# Flat Container Mode #
+# --------------------#
+
+# the elementwise functions, which the static methods apply to the concatenated
+# leaves of their containers in flat container mode
+_ELEMENTWISE_FNS = frozenset(
+    (
+        "abs",
+        "acos",
+        "acosh",
+        "add",
+        "angle",
+        "asin",
+        "asinh",
+        "atan",
+        "atan2",
+        "atanh",
+        "bitwise_and",
+        "bitwise_invert",
+        "bitwise_left_shift",
+        "bitwise_or",
+        "bitwise_right_shift",
+        "bitwise_xor",
+        "ceil",
+        "cos",
+        "cosh",
+        "deg2rad",
+        "divide",
+        "equal",
+        "erf",
+        "exp",
+        "exp2",
+        "expm1",
+        "floor",
+        "floor_divide",
+        "fmin",
+        "fmod",
+        "gcd",
+        "greater",
+        "greater_equal",
+        "imag",
+        "isfinite",
+        "isinf",
+        "isnan",
+        "isreal",
+        "lcm",
+        "less",
+        "less_equal",
+        "log",
+        "log10",
+        "log1p",
+        "log2",
+        "logaddexp",
+        "logaddexp2",
+        "logical_and",
+        "logical_not",
+        "logical_or",
+        "logical_xor",
+        "maximum",
+        "minimum",
+        "multiply",
+        "nan_to_num",
+        "negative",
+        "not_equal",
+        "positive",
+        "pow",
+        "rad2deg",
+        "real",
+        "reciprocal",
+        "remainder",
+        "round",
+        "sign",
+        "sin",
+        "sinh",
+        "sqrt",
+        "square",
+        "subtract",
+        "tan",
+        "tanh",
+        "trunc",
+        "trunc_divide",
+    )
+)
+_NUMBER_TYPES = (bool, int, float, complex)
+_SCALAR_TYPES = _NUMBER_TYPES + (str, type(None))
+
+
+def _flat_view_versions(nodes):
+    # the mutation counters of the containers a flat view is built from, the
+    # view is only valid as long as none of them changes
+    return tuple(cont.__dict__.get("_cont_version", 0) for cont, _ in nodes)
+
+
+def _cont_from_template(template, items):
+    """Create a container holding `items`, with the config of `template`,
+    without going through the config handling of the constructor."""
+    cont = type(template).__new__(type(template))
+    cont.__dict__.update(template.__dict__)
+    cont.__dict__["_config"] = dict(template._config)
+    cont.__dict__["_cont_flat_view"] = None
+    cont.__dict__.pop("_cont_flat_buffers", None)
+    cont.__dict__["_dynamic_backend"] = ivy.dynamic_backend
+    dict.update(cont, items)
+    return cont
+
+
+class _FlatView:
+    """The leaves of a container in depth-first order, along with their key
+    chains, a signature of the structure and the nodes needed to rebuild the
+    container from new leaves.
+
+    Views are cached on the containers in flat container mode, and are
+    only valid as long as none of the containers they were built from is
+    mutated, which each of them counts.
+    """
+
+    __slots__ = (
+        "leaves",
+        "key_chains",
+        "nodes",
+        "signature",
+        "fast",
+        "has_empty_nodes",
+        "versions",
+    )
+
+    @classmethod
+    def from_container(cls, cont):
+        view = cls()
+        view.leaves, view.key_chains, view.nodes, signature = [], [], [], []
+        # the views of containers with queues, child rebuilding, iterative nesting
+        # or mixed key ordering are only used to check for identical structures
+        view.fast = True
+        view.has_empty_nodes = False
+        view._add_node(cont, "", cont._alphabetical_keys, signature)
+        view.signature = tuple(signature)
+        view.versions = _flat_view_versions(view.nodes)
+        return view
+
+    def _add_node(self, cont, prefix, alphabetical, signature):
+        cont.__dict__["_cont_flattened"] = True
+        if (
+            ivy.exists(cont._queues)
+            or cont._rebuild_child_containers
+            or cont._types_to_iteratively_nest
+            or cont._alphabetical_keys != alphabetical
+        ):
+            self.fast = False
+        children = []
+        self.nodes.append((cont, children))
+        num_leaves = len(self.leaves)
+        keys = sorted(dict.keys(cont)) if alphabetical else list(dict.keys(cont))
+        for key in keys:
+            value = dict.__getitem__(cont, key)
+            key_chain = f"{prefix}{key}"
+            if isinstance(value, ivy.Container):
+                children.append((key, True, len(self.nodes)))
+                signature.append((key,))
+                self._add_node(value, key_chain + "/", alphabetical, signature)
+                signature.append(None)
+            else:
+                children.append((key, False, len(self.leaves)))
+                signature.append(key)
+                self.leaves.append(value)
+                self.key_chains.append(key_chain)
+        if prefix and len(self.leaves) == num_leaves:
+            self.has_empty_nodes = True
+
+    def rebuild(self, leaves, template=None):
+        """Build a container with the structure of the view holding `leaves`.
+
+        Each node takes the config of `template` if given, otherwise the
+        config of the node it replaces. The new container gets a view of
+        its own, so that chained maps don't flatten it again.
+        """
+        # leaves holding dicts are turned into containers by the constructor
+        slow = not self.fast or any(isinstance(x, dict) for x in leaves)
+        built = [None] * len(self.nodes)
+        for i in range(len(self.nodes) - 1, -1, -1):
+            node, children = self.nodes[i]
+            items = {
+                key: built[j] if is_node else leaves[j] for key, is_node, j in children
+            }
+            config_node = node if template is None else template
+            if slow:
+                built[i] = ivy.Container(items, **config_node._config)
+            else:
+                built[i] = _cont_from_template(config_node, items)
+        ret = built[0]
+        if not slow:
+            view = _FlatView()
+            view.leaves = list(leaves)
+            view.key_chains = self.key_chains
+            view.nodes = [
+                (cont, children) for cont, (_, children) in zip(built, self.nodes)
+            ]
+            view.signature = self.signature
+            view.fast = True
+            view.has_empty_nodes = self.has_empty_nodes
+            view.versions = _flat_view_versions(view.nodes)
+            for cont in built:
+                cont.__dict__["_cont_flattened"] = True
+            ret.__dict__["_cont_flat_view"] = view
+        return ret
+
+
+def _flat_views(containers):
+    """Return the flat views of `containers` if they can be mapped over in flat
+    container mode, i.e. they all have the same structure, otherwise None."""
+    views = [cont._cont_get_flat_view() for cont in containers]
+    view0 = views[0]
+    if not view0.fast or view0.has_empty_nodes:
+        return None
+    for view in views[1:]:
+        if not view.fast or view.signature != view0.signature:
+            return None
+    return views
+
+
+def _flat_apply(fn, views, ivy_arrays_only=False):
+    """Call `fn` once with the concatenated leaves of each view, as flat
+    ivy.Array instances, and split the returned array back into leaves.
+
+    Return None if the leaves of the views at each key chain don't have
+    the same shape, if the leaves of a view don't share a dtype, if the
+    leaves of all views don't share a device, or if `fn` doesn't return an
+    ivy.Array.
+    """
+    backend = ivy.current_backend()
+    native_leaves = []
+    device = None
+    for view in views:
+        if ivy_arrays_only and not all(isinstance(x, ivy.Array) for x in view.leaves):
+            return None
+        natives = [x._data if isinstance(x, ivy.Array) else x for x in view.leaves]
+        if not natives or not all(isinstance(x, ivy.NativeArray) for x in natives):
+            return None
+        dtype = natives[0].dtype
+        if any(x.dtype != dtype for x in natives):
+            return None
+        device = backend.dev(natives[0]) if device is None else device
+        if any(backend.dev(x) != device for x in natives):
+            return None
+        native_leaves.append(natives)
+    shapes = [tuple(x.shape) for x in native_leaves[0]]
+    for natives in native_leaves[1:]:
+        if any(tuple(x.shape) != shape for x, shape in zip(natives, shapes)):
+            return None
+    ret = fn(
+        [ivy.Array(backend.concat(natives, axis=None)) for natives in native_leaves]
+    )
+    if not isinstance(ret, ivy.Array):
+        return None
+    ret = ret._data
+    leaves = []
+    start = 0
+    for shape in shapes:
+        stop = start + _reduce(mul, shape, 1)
+        leaves.append(ivy.Array(backend.reshape(ret[start:stop], shape)))
+        start = stop
+    return leaves
 
 
+# noinspection PyMissingConstructor
 class ContainerBase(dict, abc.ABC):
     def __init__(
         self,
@@ -219,6 +533,7 @@ class ContainerBase(dict, abc.ABC):
             conts, message="no containers found in arguments"
         )
         cont0 = conts[0]
+        fn_name = fn if isinstance(fn, str) else None
         if isinstance(fn, str):
             fn = cont0.cont_ivy.__dict__[fn]
         # Get the function with the name fn_name, enabling containers to specify
@@ -240,17 +555,48 @@ class ContainerBase(dict, abc.ABC):
             else:
                 return fn(*a, **kw)
 
-        # Replace each container in arg and kwarg with the arrays at the leaf
-        # levels of that container using map_fn and call fn using those arrays
-        # as inputs
-        ret = ivy.Container.cont_multi_map(
-            map_fn,
-            conts,
-            key_chains,
-            to_apply,
-            prune_unapplied,
-            map_nests=map_sequences,
-        )
+        views = None
+        if ivy.flat_container_mode and not with_out and key_chains is None:
+            views = _flat_views(conts)
+            if map_sequences and views is not None:
+                if any(
+                    isinstance(x, (list, tuple)) for view in views for x in view.leaves
+                ):
+                    views = None
+        if views is not None:
+            # in flat container mode, elementwise functions are called once on
+            # the concatenated leaves, and other functions once per leaf
+            # without the recursion over the container structure
+            leaves = None
+            others = [x for i, x in enumerate(args) if [i] not in arg_cont_idxs] + [
+                x for k, x in kwargs.items() if [k] not in kwarg_cont_idxs
+            ]
+            if (
+                fn_name in _ELEMENTWISE_FNS
+                and cont0.cont_ivy is ivy
+                and all(type(x) in _SCALAR_TYPES for x in others)
+            ):
+                leaves = _flat_apply(lambda flat: map_fn(flat, None), views)
+            if leaves is None:
+                leaves = [
+                    map_fn(vals, key_chain)
+                    for key_chain, *vals in zip(
+                        views[0].key_chains, *(view.leaves for view in views)
+                    )
+                ]
+            ret = views[0].rebuild(leaves, template=cont0)
+        else:
+            # Replace each container in arg and kwarg with the arrays at the leaf
+            # levels of that container using map_fn and call fn using those
+            # arrays as inputs
+            ret = ivy.Container.cont_multi_map(
+                map_fn,
+                conts,
+                key_chains,
+                to_apply,
+                prune_unapplied,
+                map_nests=map_sequences,
+            )
 
         # Multiple containers for functions returning multiple arrays
         if ivy.is_ivy_container(ret):
@@ -688,6 +1034,18 @@ class ContainerBase(dict, abc.ABC):
         -------
             Container
         """
+        if (
+            ivy.flat_container_mode
+            and key_chain == ""
+            and config is None
+            and not (prune_unapplied and key_chains is not None)
+            and all(isinstance(cont, ivy.Container) for cont in containers)
+        ):
+            ret = ivy.Container._cont_flat_multi_map(
+                func, containers, key_chains, to_apply, map_nests
+            )
+            if ret is not None:
+                return ret
         # retrieve all keys and the first container if it exists
         keys = set([])
         container0 = None
@@ -775,6 +1133,55 @@ class ContainerBase(dict, abc.ABC):
             # noinspection PyProtectedMember
         return ivy.Container(return_dict, **config)
 
+    @staticmethod
+    def _cont_flat_multi_map(func, containers, key_chains, to_apply, map_nests):
+        views = _flat_views(containers)
+        if views is None:
+            return None
+        if map_nests and any(
+            isinstance(x, (list, tuple)) for view in views for x in view.leaves
+        ):
+            return None
+        leaves = []
+        for key_chain, *values in zip(
+            views[0].key_chains, *(view.leaves for view in views)
+        ):
+            if key_chains is not None and to_apply != any(
+                key_chain.startswith(kc) for kc in key_chains
+            ):
+                leaves.append(values[0])
+            else:
+                leaves.append(func(values, key_chain))
+        return views[0].rebuild(leaves, template=containers[0])
+
+    @staticmethod
+    def _cont_flat_operator(op, operands):
+        """Apply the elementwise operator `op` once to the concatenated leaves
+        of the container operands, for containers of ivy.Array leaves with
+        identical structures and number operands.
+
+        Return None if the operator can't be applied to the flat leaves.
+        """
+        conts = [x for x in operands if isinstance(x, ivy.Container)]
+        if not all(
+            isinstance(x, ivy.Container) or type(x) in _NUMBER_TYPES for x in operands
+        ):
+            return None
+        views = _flat_views(conts)
+        if views is None:
+            return None
+
+        def flat_op(flat):
+            flat = iter(flat)
+            return op(
+                *(next(flat) if isinstance(x, ivy.Container) else x for x in operands)
+            )
+
+        leaves = _flat_apply(flat_op, views, ivy_arrays_only=True)
+        if leaves is None:
+            return None
+        return views[0].rebuild(leaves, template=conts[0])
+
     @staticmethod
     def cont_common_key_chains(containers):
         """Return the key-chains common across all containers.
@@ -1120,6 +1527,8 @@ class ContainerBase(dict, abc.ABC):
             return ivy.Container.cont_from_disk_as_pickled(filepath)
         elif format == "h5py":
             return ivy.Container.cont_from_disk_as_hdf5(filepath)
+        elif format == "mmap":
+            return ivy.Container.cont_from_disk_as_mmap(filepath)
         else:
             raise ivy.utils.exceptions.IvyException("Unsupported format")
 
@@ -1130,6 +1539,10 @@ class ContainerBase(dict, abc.ABC):
         """Load container object from disk, as an h5py file, at the specified
         hdf5 filepath.
 
+        The same rows of all datasets are read, each dataset with a single slice
+        read, such that a batch of rows of a whole container comes back in one
+        call.
+
         Parameters
         ----------
         h5_obj_or_filepath
@@ -1154,20 +1567,23 @@ class ContainerBase(dict, abc.ABC):
                 "files from disk into a container."
             ),
         )
-        container_dict = {}
         if isinstance(h5_obj_or_filepath, str):
-            h5_obj = h5py.File(h5_obj_or_filepath, "r")
-        else:
-            h5_obj = h5_obj_or_filepath
+            with h5py.File(h5_obj_or_filepath, "r") as h5_obj:
+                return ivy.Container.cont_from_disk_as_hdf5(
+                    h5_obj, slice_obj, alphabetical_keys, ivyh
+                )
+        container_dict = {}
+        h5_obj = h5_obj_or_filepath
         items = sorted(h5_obj.items()) if alphabetical_keys else h5_obj.items()
         for key, value in items:
             if isinstance(value, h5py.Group):
                 container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
+                    value, slice_obj, alphabetical_keys, ivyh
                 )
             elif isinstance(value, h5py.Dataset):
+                value_as_np = value[slice_obj]
                 container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj]), dtype=str(value[slice_obj].dtype)
+                    value_as_np, dtype=str(value_as_np.dtype)
                 )
             else:
                 raise ivy.utils.exceptions.IvyException(
@@ -1175,6 +1591,82 @@ class ContainerBase(dict, abc.ABC):
                 )
         return ivy.Container(container_dict, ivyh=ivyh)
 
+    @staticmethod
+    def cont_from_disk_as_mmap(
+        filepath, /, *, key_chains=None, lazy=True, num_workers=None, ivyh=None
+    ):
+        """Load container object from disk, as saved by
+        ``cont_to_disk_as_mmap``, at the specified filepath.
+
+        Only the header of the file is parsed up front. With ``lazy``, the file
+        is memory-mapped and each leaf wraps a view of the map, so its data is
+        only read from disk once it is accessed, and memory is never held twice.
+        Backends which can't share the memory of numpy arrays copy each leaf
+        when the container is loaded. Otherwise, the leaves are read into newly
+        allocated arrays by a pool of threads.
+
+        Parameters
+        ----------
+        filepath
+            Filepath where the container object is saved to disk.
+        key_chains
+            The key chains of the leaves or sub-containers to load, leaves whose
+            key chain doesn't start with any of them aren't read. Default is
+            ``None``, in which case all leaves are loaded.
+        lazy
+            Whether to memory-map the file rather than reading it. Default is
+            ``True``.
+        num_workers
+            The number of threads reading the leaves when not ``lazy``. Default
+            is ``None``, in which case the number of cpus is used.
+        ivyh
+            Handle to ivy module to use for the calculations. Default is ``None``, which
+            results in the global ivy.
+
+        Returns
+        -------
+            Container loaded from disk
+        """
+        with open(filepath, "rb") as f:
+            header_size = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(header_size))
+        data_start = 8 + header_size
+        if key_chains is not None:
+            prefixes = [kc.strip("/") for kc in key_chains]
+            header = {
+                kc: info
+                for kc, info in header.items()
+                if any(kc == p or kc.startswith(p + "/") for p in prefixes)
+            }
+
+        if lazy:
+            # copy-on-write, such that the leaves are writable but the file isn't
+            data = np.memmap(filepath, dtype=np.uint8, mode="c", offset=data_start)
+
+            def _load(info):
+                start, stop = info["offsets"]
+                return data[start:stop].view(info["dtype"]).reshape(info["shape"])
+
+            leaves = {kc: _load(info) for kc, info in header.items()}
+        else:
+
+            def _read(item):
+                kc, info = item
+                leaf = np.empty(info["shape"], info["dtype"])
+                with open(filepath, "rb") as f:
+                    f.seek(data_start + info["offsets"][0])
+                    f.readinto(leaf.reshape(-1).view(np.uint8))
+                return kc, leaf
+
+            with ThreadPool(num_workers) as pool:
+                leaves = dict(pool.map(_read, header.items()))
+
+        ivyh = ivy.default(ivyh, ivy)
+        container = ivy.Container(ivyh=ivyh)
+        for kc, leaf in leaves.items():
+            container.cont_set_at_key_chain(kc, ivyh.asarray(leaf), inplace=True)
+        return container
+
     @staticmethod
     def cont_from_disk_as_pickled(pickle_filepath, ivyh=None):
         """Load container object from disk at the specified pickle filepath.
@@ -1260,16 +1752,25 @@ class ContainerBase(dict, abc.ABC):
         return size, batch_size
 
     @staticmethod
-    def shuffle_h5_file(h5_obj_or_filepath, seed_value=0):
+    def shuffle_h5_file(h5_obj_or_filepath, seed_value=0, buffer_size=2**27):
         """Shuffle entries in all datasets of h5 file, such that they are still
         aligned along axis 0.
 
+        The shuffling is out-of-core. Each dataset is rewritten into a new one,
+        a block of rows at a time, with the rows of each block gathered from
+        the shuffled positions by a single read, after which the new dataset
+        takes the place of the old one. Only the block being written and the
+        permutation of the row indices are held in memory.
+
         Parameters
         ----------
         h5_obj_or_filepath
             Filepath where the container object is saved to disk, or h5 object.
         seed_value
             random seed to use for array shuffling (Default value = 0)
+        buffer_size
+            The maximum number of bytes of each block of rows read into memory.
+            (Default value = 2**27)
         """
         ivy.utils.assertions.check_exists(
             h5py,
@@ -1285,17 +1786,43 @@ class ContainerBase(dict, abc.ABC):
         else:
             h5_obj = h5_obj_or_filepath
 
-        for value in h5_obj.values():
-            if isinstance(value, h5py.Group):
-                ivy.Container.shuffle_h5_file(value, seed_value)
-            elif isinstance(value, h5py.Dataset):
-                random.seed(seed_value)
-                # noinspection PyTypeChecker
-                random.shuffle(value)
-            else:
+        datasets = []
+
+        def _collect(name, value):
+            if isinstance(value, h5py.Dataset):
+                datasets.append(name)
+            elif not isinstance(value, h5py.Group):
                 raise ivy.utils.exceptions.IvyException(
                     "Item found inside h5_obj which was neither a Group nor a Dataset."
                 )
+
+        h5_obj.visititems(_collect)
+        # the same permutation is applied to all the datasets of the same length
+        permutations = {}
+        for name in datasets:
+            value = h5_obj[name]
+            num_rows = value.shape[0]
+            if num_rows not in permutations:
+                permutation = list(range(num_rows))
+                random.Random(seed_value).shuffle(permutation)
+                permutations[num_rows] = np.array(permutation, dtype=np.int64)
+            permutation = permutations[num_rows]
+            row_nbytes = _reduce(mul, value.shape[1:], 1) * value.dtype.itemsize
+            block_size = max(buffer_size // max(row_nbytes, 1), 1)
+            shuffled_name = name + "__shuffled"
+            shuffled = h5_obj.create_dataset_like(shuffled_name, value)
+            for start in range(0, num_rows, block_size):
+                block_idxs = permutation[start : start + block_size]
+                # h5py only reads rows at increasing indices
+                sorted_idxs = np.sort(block_idxs)
+                block = value[sorted_idxs]
+                shuffled[start : start + len(block_idxs)] = block[
+                    np.searchsorted(sorted_idxs, block_idxs)
+                ]
+            for attr_name, attr_value in value.attrs.items():
+                shuffled.attrs[attr_name] = attr_value
+            del h5_obj[name]
+            h5_obj.move(shuffled_name, name)
         if isinstance(h5_obj, h5py.File):
             h5_obj.close()
 
@@ -1471,6 +1998,38 @@ class ContainerBase(dict, abc.ABC):
             out=out,
         )
 
+    def _cont_get_flat_view(self):
+        # read from the instance dict, as attribute lookups of missing
+        # attributes are forwarded to the leaves
+        view = self.__dict__.get("_cont_flat_view")
+        if view is None or view.versions != _flat_view_versions(view.nodes):
+            view = _FlatView.from_container(self)
+            self.__dict__["_cont_flat_view"] = view
+        return view
+
+    def _cont_get_flat_buffers(self):
+        """Return the flat buffers the leaves of the container are views of,
+        or None if the container wasn't built from flat buffers or if any of
+        its leaves was replaced since."""
+        flat_buffers = self.__dict__.get("_cont_flat_buffers")
+        if flat_buffers is None:
+            return None
+        items = list(self.cont_to_iterator())
+        if len(items) != len(flat_buffers.views) or any(
+            kc != flat_kc or not isinstance(x, ivy.Array) or x._data is not view
+            for (kc, x), flat_kc, view in zip(
+                items, flat_buffers.key_chains, flat_buffers.views
+            )
+        ):
+            del self.__dict__["_cont_flat_buffers"]
+            return None
+        return flat_buffers
+
+    def _cont_invalidate_flat_views(self):
+        # only the views built from this container are invalidated
+        if "_cont_flattened" in self.__dict__:
+            self.__dict__["_cont_version"] = self.__dict__.get("_cont_version", 0) + 1
+
     def _cont_get_shape(self):
         if not len(self.keys()):
             if ivy.exists(self._queues):
@@ -1603,6 +2162,7 @@ class ContainerBase(dict, abc.ABC):
         return duplicates
 
     def cont_update_config(self, **config):
+        self._cont_invalidate_flat_views()
         new_config = {}
         for k, v in config.items():
             att_name = f"_{k}"
@@ -1977,15 +2537,29 @@ class ContainerBase(dict, abc.ABC):
             self.cont_to_disk_as_pickled(filepath)
         elif format == "h5py":
             self.cont_to_disk_as_hdf5(filepath)
+        elif format == "mmap":
+            self.cont_to_disk_as_mmap(filepath)
         else:
             raise ValueError("Unsupported format")
 
     def cont_to_disk_as_hdf5(
-        self, h5_obj_or_filepath, starting_index=0, mode="a", max_batch_size=None
+        self,
+        h5_obj_or_filepath,
+        starting_index=0,
+        mode="a",
+        max_batch_size=None,
+        chunks=None,
+        compression=None,
+        compression_opts=None,
     ):
         """Save container object to disk, as an h5py file, at the specified
         filepath.
 
+        Each leaf is written to a dataset at its key chain, as a single slice
+        along axis 0. The leaves are converted to numpy arrays one after the
+        other, while the ones before them are being written by a background
+        thread, such that device-to-host copies overlap with the disk writes.
+
         Parameters
         ----------
         h5_obj_or_filepath
@@ -1999,6 +2573,17 @@ class ContainerBase(dict, abc.ABC):
         max_batch_size
             Maximum batch size for the container on disk, this is useful if later
             appending to file. (Default value = None)
+        chunks
+            The chunk shape of the datasets created. Either ``True`` for a shape
+            guessed by h5py, an int for chunks of that many rows spanning all the
+            other dimensions, or a tuple for the same chunk shape for all
+            datasets. Default is ``None``, which lets h5py guess it.
+        compression
+            The compression filter of the datasets created, such as ``"gzip"``
+            or ``"lzf"``. Default is ``None``, for no compression.
+        compression_opts
+            The options of the compression filter, such as the level of
+            ``"gzip"``. Default is ``None``.
         """
         ivy.utils.assertions.check_exists(
             h5py,
@@ -2011,36 +2596,76 @@ class ContainerBase(dict, abc.ABC):
             h5_obj = h5py.File(h5_obj_or_filepath, mode)
         else:
             h5_obj = h5_obj_or_filepath
-        for key, value in self.items():
-            if isinstance(value, ivy.Container):
-                if key not in h5_obj.keys():
-                    h5_group = h5_obj.create_group(key)
-                else:
-                    h5_group = h5_obj[key]
-                value.cont_to_disk_as_hdf5(
-                    h5_group, starting_index, mode, max_batch_size
-                )
-            else:
+        leaves = queue.Queue(maxsize=_H5_WRITE_DEPTH)
+        errors = []
+        dataset_kwargs = {
+            "chunks": chunks,
+            "compression": compression,
+            "compression_opts": compression_opts,
+        }
+        writer = threading.Thread(
+            target=_write_h5_leaves,
+            args=(h5_obj, leaves, errors, dataset_kwargs),
+            daemon=True,
+        )
+        writer.start()
+        try:
+            for key_chain, value in self.cont_to_iterator():
                 value_as_np = self._cont_ivy.to_numpy(value)
-                value_shape = value_as_np.shape
-                this_batch_size = value_shape[0]
-                max_bs = (
-                    max_batch_size
-                    if max_batch_size
-                    else starting_index + this_batch_size
-                )
-                if key not in h5_obj.keys():
-                    dataset_shape = [max_bs] + list(value_shape[1:])
-                    maxshape = [None for _ in dataset_shape]
-                    h5_obj.create_dataset(
-                        key, dataset_shape, dtype=value_as_np.dtype, maxshape=maxshape
-                    )
-                space_left = max_bs - starting_index
-                amount_to_write = min(this_batch_size, space_left)
-                for i in range(amount_to_write):
-                    h5_obj[key][starting_index + i : starting_index + i + 1] = (
-                        value_as_np[i : i + 1]
-                    )
+                leaves.put((key_chain, value_as_np, starting_index, max_batch_size))
+        finally:
+            leaves.put(None)
+            writer.join()
+            if isinstance(h5_obj_or_filepath, str):
+                h5_obj.close()
+        if errors:
+            raise errors[0]
+
+    def cont_to_disk_as_mmap(self, filepath):
+        """Save container object to disk, as a single binary file which can be
+        memory-mapped, at the specified filepath.
+
+        The file starts with the size of a json header as a little-endian
+        uint64, followed by the header, which maps the key chain of each leaf to
+        its dtype, its shape and its byte offsets within the raw data of the
+        leaves which follows. The leaves are converted and written one at a
+        time.
+
+        Parameters
+        ----------
+        filepath
+            Filepath for where to save the container to disk.
+        """
+        leaves = []
+        header = {}
+        offset = 0
+        for key_chain, value in self.cont_to_iterator():
+            if not ivy.is_array(value):
+                value = np.asarray(value)
+            if isinstance(value, np.ndarray):
+                dtype = value.dtype
+            else:
+                dtype = np.dtype(str(ivy.dtype(value)))
+            nbytes = _reduce(mul, value.shape, 1) * dtype.itemsize
+            header[key_chain] = {
+                "dtype": dtype.name,
+                "shape": list(value.shape),
+                "offsets": [offset, offset + nbytes],
+            }
+            leaves.append(value)
+            offset += -(-nbytes // _MMAP_ALIGNMENT) * _MMAP_ALIGNMENT
+        header = json.dumps(header).encode()
+        # pad the header such that the leaves are aligned in the file
+        header += b" " * (-(len(header) + 8) % _MMAP_ALIGNMENT)
+        with open(filepath, "wb") as f:
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            for value in leaves:
+                if not isinstance(value, np.ndarray):
+                    value = self._cont_ivy.to_numpy(value)
+                value_as_np = np.ascontiguousarray(value)
+                f.write(value_as_np.reshape(-1).view(np.uint8))
+                f.write(b"\0" * (-value_as_np.nbytes % _MMAP_ALIGNMENT))
 
     def cont_to_disk_as_pickled(self, pickle_filepath):
         """Save container object to disk, as an pickled file, at the specified
@@ -3174,6 +3799,26 @@ class ContainerBase(dict, abc.ABC):
         -------
             New container following the function mapped to each sub-array.
         """
+        if (
+            ivy.flat_container_mode
+            and not inplace
+            and not prune_unapplied
+            and key_chain == ""
+        ):
+            view = self._cont_get_flat_view()
+            if not map_sequences or not any(
+                isinstance(x, (list, tuple)) for x in view.leaves
+            ):
+                return view.rebuild(
+                    [
+                        (
+                            func(value, kc)
+                            if key_chains is None or (kc in key_chains) == to_apply
+                            else value
+                        )
+                        for kc, value in zip(view.key_chains, view.leaves)
+                    ]
+                )
         return_dict = self if inplace else {}
         for key, value in self.items():
             this_key_chain = key if key_chain == "" else f"{str(key_chain)}/{str(key)}"
@@ -4073,8 +4718,33 @@ class ContainerBase(dict, abc.ABC):
         if isinstance(query, str) and ("/" in query or "." in query):
             return self.cont_set_at_key_chain(query, val, inplace=True)
         else:
+            self._cont_invalidate_flat_views()
             return dict.__setitem__(self, query, val)
 
+    def __delitem__(self, key):
+        self._cont_invalidate_flat_views()
+        return dict.__delitem__(self, key)
+
+    def pop(self, *args):
+        self._cont_invalidate_flat_views()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self._cont_invalidate_flat_views()
+        return dict.popitem(self)
+
+    def clear(self):
+        self._cont_invalidate_flat_views()
+        return dict.clear(self)
+
+    def setdefault(self, *args):
+        self._cont_invalidate_flat_views()
+        return dict.setdefault(self, *args)
+
+    def update(self, *args, **kwargs):
+        self._cont_invalidate_flat_views()
+        return dict.update(self, *args, **kwargs)
+
     def __contains__(self, key):
         if isinstance(key, str) and ("/" in key or "." in key):
             return self.cont_has_key_chain(key)
@@ -4085,6 +4755,9 @@ class ContainerBase(dict, abc.ABC):
 
     def __getstate__(self):
         state_dict = copy.copy(self.__dict__)
+        state_dict.pop("_cont_flat_view", None)
+        state_dict.pop("_cont_flattened", None)
+        state_dict.pop("_cont_flat_buffers", None)
         state_dict["_local_ivy"] = (
             state_dict["_local_ivy"].current_backend_str()
             if state_dict["_local_ivy"] is not None
@@ -1,4 +1,5 @@
 # global
+import functools
 import operator
 
 # local
@@ -48,6 +49,25 @@ from ivy.data_classes.container.experimental import (
 )
 
 
+def _flat_operator(op, reflected=False):
+    """Apply `op` to the flat leaves of the operands in flat container mode,
+    before falling back to the decorated method."""
+
+    def _decorator(method):
+        @functools.wraps(method)
+        def _method(self, *args):
+            if ivy.flat_container_mode:
+                operands = (*args, self) if reflected else (self, *args)
+                ret = ContainerBase._cont_flat_operator(op, operands)
+                if ret is not None:
+                    return ret
+            return method(self, *args)
+
+        return _method
+
+    return _decorator
+
+
 class Container(
     _ContainerWithActivations,
     _ContainerWithConversions,
@@ -137,9 +157,11 @@ class Container(
     def __pos__(self):
         return self
 
+    @_flat_operator(operator.neg)
     def __neg__(self):
         return self.cont_map(lambda x, kc: -x, map_sequences=True)
 
+    @_flat_operator(operator.pow)
     def __pow__(self, power):
         """ivy.Container special method for the power operator, calling
         :code:`operator.pow` for each of the corresponding leaves of the two
@@ -185,6 +207,7 @@ class Container(
             )
         return self.cont_map(lambda x, kc: x**power, map_sequences=True)
 
+    @_flat_operator(operator.pow, reflected=True)
     def __rpow__(self, power):
         return self.cont_map(lambda x, kc: power**x, map_sequences=True)
 
@@ -195,6 +218,7 @@ class Container(
             )
         return self.cont_map(lambda x, _: operator.ipow(x, power), map_sequences=True)
 
+    @_flat_operator(operator.add)
     def __add__(self, other):
         """ivy.Container special method for the add operator, calling
         :code:`operator.add` for each of the corresponding leaves of the two
@@ -260,6 +284,7 @@ class Container(
             lambda xs, _: operator.add(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @_flat_operator(operator.add, reflected=True)
     def __radd__(self, other):
         """ivy.Container reverse special method for the add operator, calling
         :code:`operator.add` for each of the corresponding leaves of the two
@@ -299,6 +324,7 @@ class Container(
             lambda xs, _: operator.iadd(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @_flat_operator(operator.sub)
     def __sub__(self, other):
         """ivy.Container special method for the subtract operator, calling
         :code:`operator.sub` for each of the corresponding leaves of the two
@@ -369,6 +395,7 @@ class Container(
             lambda xs, _: operator.isub(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @_flat_operator(operator.sub, reflected=True)
     def __rsub__(self, other):
         """ivy.Container reverse special method for the subtract operator,
         calling :code:`operator.sub` for each of the corresponding leaves of
@@ -403,11 +430,13 @@ class Container(
             lambda xs, _: operator.sub(xs[0], xs[1]), [other, self], map_nests=True
         )
 
+    @_flat_operator(operator.mul)
     def __mul__(self, other):
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.mul(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @_flat_operator(operator.mul, reflected=True)
     def __rmul__(self, other):
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.mul(xs[0], xs[1]), [other, self], map_nests=True
@@ -418,11 +447,13 @@ class Container(
             lambda xs, _: operator.imul(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @_flat_operator(operator.mod)
     def __mod__(self, other):
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.mod(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @_flat_operator(operator.mod, reflected=True)
     def __rmod__(self, other):
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.mod(xs[0], xs[1]), [other, self], map_nests=True
@@ -447,6 +478,7 @@ class Container(
             map_nests=True,
         )
 
+    @_flat_operator(operator.truediv)
     def __truediv__(self, other):
         """ivy.Container special method for the divide operator, calling
         :code:`operator.truediv` for each of the corresponding leaves of the
@@ -496,6 +528,7 @@ class Container(
             lambda xs, _: operator.truediv(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @_flat_operator(operator.truediv, reflected=True)
     def __rtruediv__(self, other):
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.truediv(xs[0], xs[1]), [other, self], map_nests=True
@@ -506,6 +539,7 @@ class Container(
             lambda xs, _: operator.itruediv(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @_flat_operator(operator.floordiv)
     def __floordiv__(self, other):
         if isinstance(other, ivy.Container):
             return ivy.Container.cont_multi_map(
@@ -515,6 +549,7 @@ class Container(
             )
         return self.cont_map(lambda x, kc: x // other, map_sequences=True)
 
+    @_flat_operator(operator.floordiv, reflected=True)
     def __rfloordiv__(self, other):
         return self.cont_map(lambda x, kc: other // x, map_sequences=True)
 
@@ -562,6 +597,7 @@ class Container(
             lambda x, kc: operator.imatmul(x, other), map_sequences=True
         )
 
+    @_flat_operator(operator.abs)
     def __abs__(self):
         """ivy.Container special method for the abs operator, calling
         :code:`operator.abs` for each of the corresponding leaves of the two
@@ -592,6 +628,7 @@ class Container(
         """
         return self.cont_map(lambda x, kc: operator.abs(x), map_sequences=True)
 
+    @_flat_operator(operator.lt)
     def __lt__(self, other):
         """ivy.Container special method for the less operator, calling
         :code:`operator.lt` for each of the corresponding leaves of the two
@@ -630,6 +667,7 @@ class Container(
             )
         return self.cont_map(lambda x, kc: x < other, map_sequences=True)
 
+    @_flat_operator(operator.le)
     def __le__(self, other):
         """ivy.Container special method for the less_equal operator, calling
         :code:`operator.le` for each of the corresponding leaves of the two
@@ -668,6 +706,7 @@ class Container(
             )
         return self.cont_map(lambda x, kc: x <= other, map_sequences=True)
 
+    @_flat_operator(operator.eq)
     def __eq__(self, other):
         """ivy.Container special method for the equal operator, calling
         :code:`operator.eq` for each of the corresponding leaves of the two
@@ -730,6 +769,7 @@ class Container(
             )
         return self.cont_map(lambda x, kc: x == other, map_sequences=True)
 
+    @_flat_operator(operator.ne)
     def __ne__(self, other):
         """ivy.Container special method for the not_equal operator, calling
         :code:`operator.ne` for each of the corresponding leaves of the two
@@ -792,6 +832,7 @@ class Container(
             )
         return self.cont_map(lambda x, kc: x != other, map_sequences=True)
 
+    @_flat_operator(operator.gt)
     def __gt__(self, other):
         """ivy.Container special method for the greater operator, calling
         :code:`operator.gt` for each of the corresponding leaves of the two
@@ -830,6 +871,7 @@ class Container(
             )
         return self.cont_map(lambda x, kc: x > other, map_sequences=True)
 
+    @_flat_operator(operator.ge)
     def __ge__(self, other):
         """ivy.Container special method for the greater_equal operator, calling
         :code:`operator.ge` for each of the corresponding leaves of the two
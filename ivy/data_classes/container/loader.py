@@ -0,0 +1,230 @@
+"""Prefetching loader of batched containers, built on a pool of workers."""
+
+# global
+import collections
+import math
+import queue
+import threading
+import time
+from multiprocessing.pool import ThreadPool
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+# local
+import ivy
+
+# the dataset function of the process workers, set when each of them starts
+_worker_dataset_fn = None
+
+# put in the staging queue once the last batch of the epoch has been staged
+_end_of_epoch = object()
+
+
+def _init_worker(dataset_fn):
+    global _worker_dataset_fn
+    _worker_dataset_fn = dataset_fn
+
+
+def _load_batch(indices, dataset_fn=None):
+    if dataset_fn is None:
+        dataset_fn = _worker_dataset_fn
+    samples = [ivy.Container(dataset_fn(idx)) for idx in indices]
+    batch = ivy.Container.cont_multi_map(lambda xs, _: ivy.stack(xs), samples)
+    # a dict of native arrays, which the process workers can send back
+    return batch.to_native().cont_to_dict()
+
+
+class DataLoader:
+    def __init__(
+        self,
+        dataset_fn: Callable,
+        num_samples: int,
+        /,
+        *,
+        batch_size: int = 1,
+        num_workers: int = 1,
+        prefetch_depth: Optional[int] = None,
+        worker_type: str = "thread",
+        context: Optional[str] = None,
+        shuffle: bool = False,
+        drop_last: bool = False,
+        device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Load batched containers of a dataset ahead of their use.
+
+        The samples of each batch are loaded and stacked by a pool of thread or
+        process workers, while the batches before it are being consumed. At most
+        ``prefetch_depth`` batches are being loaded ahead at any time, and once
+        loaded each batch is moved to ``device`` by a staging thread. Batches are
+        dropped by the loader as soon as they are handed out, nothing is cached
+        across iterations.
+
+        Parameters
+        ----------
+        dataset_fn
+            Function mapping the index of a sample to a dict or container of
+            arrays. With process workers, the arrays have to be picklable.
+        num_samples
+            The number of samples of the dataset.
+        batch_size
+            The number of samples of each batch. Default is ``1``.
+        num_workers
+            The number of workers loading batches in parallel. Default is ``1``.
+        prefetch_depth
+            The maximum number of batches being loaded ahead of the one being
+            consumed. Default is ``None``, in which case twice the number of
+            workers is used.
+        worker_type
+            Either ``"thread"`` or ``"process"``. Threads suit datasets which
+            release the GIL, such as ones reading files or decoding with numpy,
+            processes suit the ones running python code. Default is ``"thread"``.
+        context
+            The context of the process workers, either 'fork', 'forkserver' or
+            'spawn', passed to ``ivy.multiprocessing``. Default is ``None``.
+        shuffle
+            Whether to visit the samples in a new random order at each iteration.
+            Default is ``False``.
+        drop_last
+            Whether to drop the last batch if it has fewer than ``batch_size``
+            samples. Default is ``False``.
+        device
+            The device to move the batches to ahead of their use. Default is
+            ``None``, in which case they stay on the device they are loaded on.
+        timeout
+            The timeout in seconds when waiting for a batch to be loaded. Default
+            is ``None``, in which case the loader waits until it is loaded.
+
+        Examples
+        --------
+        >>> loader = ivy.DataLoader(
+        ...     lambda idx: {"x": np.full((2,), idx)}, 5, batch_size=2
+        ... )
+        >>> for batch in loader:
+        ...     print(batch.x.shape)
+        ivy.Shape(2, 2)
+        ivy.Shape(2, 2)
+        ivy.Shape(1, 2)
+        >>> loader.close()
+        """
+        ivy.utils.assertions.check_elem_in_list(worker_type, ["thread", "process"])
+        ivy.utils.assertions.check_greater(batch_size, 0, as_array=False)
+        ivy.utils.assertions.check_greater(num_workers, 0, as_array=False)
+        if timeout is not None:
+            ivy.utils.assertions.check_greater(timeout, 0, as_array=False)
+            # longer waits can't be represented, and are as good as blocking
+            timeout = min(timeout, threading.TIMEOUT_MAX)
+        self._num_samples = num_samples
+        self._batch_size = batch_size
+        self._prefetch_depth = ivy.default(prefetch_depth, 2 * num_workers)
+        self._shuffle = shuffle
+        self._drop_last = drop_last
+        self._device = device
+        self._timeout = timeout
+        if worker_type == "thread":
+            self._pool = ThreadPool(num_workers)
+            self._load_fn = lambda indices: _load_batch(indices, dataset_fn)
+        else:
+            self._pool = ivy.multiprocessing(context).Pool(
+                num_workers, initializer=_init_worker, initargs=(dataset_fn,)
+            )
+            self._load_fn = _load_batch
+        self._num_loaded = 0
+        self._start_time = None
+        self._stop = None
+
+    def __len__(self):
+        if self._drop_last:
+            return self._num_samples // self._batch_size
+        return math.ceil(self._num_samples / self._batch_size)
+
+    def __iter__(self):
+        if self._stop is not None:
+            # a previous iteration was left unfinished
+            self._stop.set()
+        order = np.arange(self._num_samples)
+        if self._shuffle:
+            order = np.random.permutation(order)
+        batches = [
+            order[i : i + self._batch_size].tolist()
+            for i in range(0, len(self) * self._batch_size, self._batch_size)
+        ]
+        staged = queue.Queue(maxsize=1)
+        self._stop = stop = threading.Event()
+        threading.Thread(
+            target=self._stage, args=(batches, staged, stop), daemon=True
+        ).start()
+        self._num_loaded = 0
+        self._start_time = time.perf_counter()
+        return self._consume(staged, stop)
+
+    def _stage(self, batches, staged, stop):
+        batches = iter(batches)
+        pending = collections.deque()
+
+        def _submit():
+            indices = next(batches, None)
+            if indices is not None:
+                pending.append(
+                    (len(indices), self._pool.apply_async(self._load_fn, (indices,)))
+                )
+
+        for _ in range(self._prefetch_depth):
+            _submit()
+        try:
+            while pending and not stop.is_set():
+                batch_size, batch = pending.popleft()
+                batch = batch.get(timeout=self._timeout)
+                _submit()
+                batch = ivy.Container(batch).to_ivy()
+                if self._device is not None:
+                    batch = batch.to_device(self._device)
+                self._put(staged, (batch_size, batch), stop)
+            self._put(staged, _end_of_epoch, stop)
+        except Exception as e:
+            self._put(staged, e, stop)
+
+    @staticmethod
+    def _put(staged, item, stop):
+        while not stop.is_set():
+            try:
+                staged.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _consume(self, staged, stop):
+        try:
+            while True:
+                item = staged.get()
+                if item is _end_of_epoch:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                batch_size, batch = item
+                self._num_loaded += batch_size
+                yield batch
+        finally:
+            stop.set()
+
+    @property
+    def throughput(self):
+        """The number of samples handed out per second since the start of the
+        current iteration."""
+        if self._start_time is None:
+            return 0.0
+        return self._num_loaded / (time.perf_counter() - self._start_time)
+
+    def close(self):
+        """Stop the staging of batches and terminate the workers."""
+        if self._stop is not None:
+            self._stop.set()
+        self._pool.terminate()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -1,4 +1,5 @@
 import contextlib
+import contextvars
 import ivy
 import functools
 import logging
@@ -8,9 +9,15 @@ import copy as python_copy
 from types import FunctionType
 from typing import Callable, Literal
 import inspect
+import itertools
 import numpy as np
 
-from ivy.utils.exceptions import IvyValueError
+from ivy.utils.exceptions import (
+    IvyBackendException,
+    IvyException,
+    IvyValueError,
+    _non_ivy_exceptions_mapping,
+)
 
 
 # for wrapping (sequence matters)
@@ -263,6 +270,100 @@ def _get_preferred_device(args, kwargs):
     return ivy.default_device(as_native=True)
 
 
+# Dispatch Cache #
+# ---------------#
+
+# upper bound on the number of argument type signatures remembered
+DISPATCH_CACHE_SIZE = 1024
+
+
+def _get_dispatch_signature(args, kwargs):
+    """Return a hashable signature of the argument types, or None if any
+    argument is nested more than one level deep.
+
+    Top-level lists, tuples and dicts contribute the types of their items, so
+    that the signature still determines whether a container or ragged array is
+    present anywhere in the inputs.
+    """
+    signature = []
+    for arg in itertools.chain(args, kwargs.values()):
+        if isinstance(arg, (tuple, list)) or (
+            isinstance(arg, dict) and not isinstance(arg, ivy.Container)
+        ):
+            items = arg.values() if isinstance(arg, dict) else arg
+            item_types = tuple(map(type, items))
+            if any(issubclass(t, (tuple, list, dict)) for t in item_types):
+                return None
+            signature.append((type(arg), item_types))
+        else:
+            signature.append(type(arg))
+    return tuple(signature)
+
+
+def _overrides_array_function(arg_type):
+    return hasattr(arg_type, "__ivy_array_function__") and not issubclass(
+        arg_type, (ivy.Array, ivy.NativeArray)
+    )
+
+
+@functools.lru_cache(maxsize=DISPATCH_CACHE_SIZE)
+def _get_dispatch_flags(signature, native_array_type):
+    """Compute, once per argument type signature, whether a call needs
+    container mapping, ragged array mapping or a search for
+    `__ivy_array_function__` overrides.
+
+    `native_array_type` is only part of the cache key, so that flags computed
+    under one backend aren't reused under another.
+    """
+    top_level_types = [t if isinstance(t, type) else t[0] for t in signature]
+    all_types = top_level_types + [
+        item_type for t in signature if not isinstance(t, type) for item_type in t[1]
+    ]
+    has_container = any(issubclass(t, ivy.Container) for t in all_types)
+    has_ragged = any(issubclass(t, ivy.NestedArray) for t in all_types)
+    # containers still need to be searched leaf by leaf for overrides
+    needs_override_search = any(
+        issubclass(t, ivy.Container) or _overrides_array_function(t)
+        for t in top_level_types
+    )
+    return has_container, has_ragged, needs_override_search
+
+
+def _dispatch_flags(args, kwargs):
+    signature = _get_dispatch_signature(args, kwargs)
+    if signature is None:
+        return None
+    return _get_dispatch_flags(signature, ivy.NativeArray)
+
+
+def dispatch_cache_info():
+    """Return the hit and miss counters and the current and maximum size of
+    the cache mapping argument type signatures to the dispatch decisions of
+    `handle_nestable`, `handle_ragged` and `handle_array_function`.
+
+    Returns
+    -------
+    ret
+        A named tuple with the fields ``hits``, ``misses``, ``maxsize`` and
+        ``currsize``.
+
+    Examples
+    --------
+    >>> ivy.clear_dispatch_cache()
+    >>> x = ivy.array([1., 2.])
+    >>> y = ivy.add(x, x)
+    >>> y = ivy.add(x, x)
+    >>> ivy.dispatch_cache_info().hits > 0
+    True
+    """
+    return _get_dispatch_flags.cache_info()
+
+
+def clear_dispatch_cache():
+    """Clear the dispatch cache and reset its hit and miss counters."""
+    _get_dispatch_flags.cache_clear()
+
+
 # Array Handling #
 # ---------------#
 
@@ -276,6 +377,9 @@ def handle_array_function(fn):
 
     @functools.wraps(fn)
     def _handle_array_function(*args, **kwargs):
+        flags = _dispatch_flags(args, kwargs)
+        if flags is not None and not flags[2]:
+            return fn(*args, **kwargs)
         overloaded_types = []
         overloaded_args = []
 
@@ -331,6 +435,18 @@ def handle_array_function(fn):
     return _handle_array_function
 
 
+def _is_array_like_annotation(annotation, parameter):
+    annotation_str = str(annotation)
+    return (
+        ("rray" in annotation_str or "Tensor" in annotation_str)
+        and parameter != "out"
+        and all(
+            sq not in annotation_str
+            for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
+        )
+    )
+
+
 def handle_array_like_without_promotion(fn: Callable) -> Callable:
     @functools.wraps(fn)
     def _handle_array_like_without_promotion(*args, **kwargs):
@@ -348,15 +464,7 @@ def handle_array_like_without_promotion(fn: Callable) -> Callable:
         for i, (annotation, parameter, arg) in enumerate(
             zip(annotations, parameters, args)
         ):
-            annotation_str = str(annotation)
-            if (
-                ("rray" in annotation_str or "Tensor" in annotation_str)
-                and parameter != "out"
-                and all(
-                    sq not in annotation_str
-                    for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
-                )
-            ):
+            if _is_array_like_annotation(annotation, parameter):
                 if i < num_args:
                     # Fix for ellipsis, slices for numpy's __getitem__
                     # No need to try and convert them into arrays
@@ -899,11 +1007,16 @@ def handle_nestable(fn: Callable) -> Callable:
             def cont_fn(*args, **kwargs):
                 return ivy.Container.cont_multi_map_in_function(fn, *args, **kwargs)
 
-        if ivy.nestable_mode and (
-            ivy.nested_any(args, ivy.is_ivy_container, check_nests=True)
-            or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
-        ):
-            return cont_fn(*args, **kwargs)
+        if ivy.nestable_mode:
+            flags = _dispatch_flags(args, kwargs)
+            if flags is None:
+                has_container = ivy.nested_any(
+                    args, ivy.is_ivy_container, check_nests=True
+                ) or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
+            else:
+                has_container = flags[0]
+            if has_container:
+                return cont_fn(*args, **kwargs)
 
         # if the passed arguments does not contain a container, the function using
         # the passed arguments, returning an ivy or a native array.
@@ -936,9 +1049,14 @@ def handle_ragged(fn: Callable) -> Callable:
         def nested_fn(*args, **kwargs):
             return ivy.NestedArray.ragged_multi_map_in_function(fn, *args, **kwargs)
 
-        if ivy.nested_any(
-            args, ivy.is_ivy_nested_array, check_nests=True
-        ) or ivy.nested_any(kwargs, ivy.is_ivy_nested_array, check_nests=True):
+        flags = _dispatch_flags(args, kwargs)
+        if flags is None:
+            has_ragged = ivy.nested_any(
+                args, ivy.is_ivy_nested_array, check_nests=True
+            ) or ivy.nested_any(kwargs, ivy.is_ivy_nested_array, check_nests=True)
+        else:
+            has_ragged = flags[1]
+        if has_ragged:
             return nested_fn(*args, **kwargs)
 
         # if the passed arguments does not contain a container, the function using
@@ -1026,6 +1144,216 @@ def download_cython_wrapper_wrapper(fn: Callable) -> Callable:
     return _download_cython_wrapper_wrapper
 
 
+# Fused Dispatch #
+# ---------------#
+
+# the wrappers which the fused fast path can skip for plain array inputs, a function
+# wrapped with anything outside this set always goes through the full wrapper stack
+_FUSABLE_DECORATORS = frozenset(
+    (
+        "handle_device",
+        "handle_array_function",
+        "outputs_to_ivy_arrays",
+        "inputs_to_native_arrays",
+        "handle_out_argument",
+        "handle_array_like_without_promotion",
+        "handle_nestable",
+        "handle_ragged",
+        "handle_backend_invalid",
+        "handle_exceptions",
+    )
+)
+_FUSED_SCALAR_TYPES = (bool, int, float, complex, str)
+_fused_miss = object()
+
+
+def _get_array_like_positions(fn):
+    try:
+        parameters = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return None
+    return frozenset(
+        i
+        for i, (parameter, param) in enumerate(parameters.items())
+        if _is_array_like_annotation(param.annotation, parameter)
+    )
+
+
+def _fuse_native_arg(x, unwrap, native_array_cls, native_dtype_cls, arrays):
+    """Return `x` as the backend function should receive it, or the
+    `_fused_miss` sentinel when `x` needs the full wrapper stack (containers,
+    views, arrays of another backend, nests containing arrays and so on)."""
+    if type(x) is ivy.Array:
+        data = x._data
+        if x._base is not None or not isinstance(data, native_array_cls):
+            return _fused_miss
+        arrays.append(data)
+        return data if unwrap else x
+    if isinstance(x, native_array_cls):
+        arrays.append(x)
+        return x
+    if x is None or isinstance(x, (_FUSED_SCALAR_TYPES, native_dtype_cls)):
+        return x
+    if type(x) in (tuple, list) and all(isinstance(v, _FUSED_SCALAR_TYPES) for v in x):
+        return x
+    return _fused_miss
+
+
+def _fuse_dispatch(wrapped: Callable, backend_fn: Callable) -> Callable:
+    """Compile the wrapper stack of `wrapped` into a single closure.
+
+    When ``ivy.fused_dispatch_mode`` is set, the returned function first probes
+    the arguments, and if none of them is a container, a view, a non-native
+    array or a nest containing arrays, it calls `backend_fn` directly, doing the
+    little work the skipped wrappers would have done for such inputs inline.
+    Every other call is handed to `wrapped`. The backend function is only ever
+    called once, and its exceptions are raised as `handle_exceptions` would.
+
+    Parameters
+    ----------
+    wrapped
+        the backend function with all of its wrappers applied.
+    backend_fn
+        the unwrapped backend implementation.
+
+    Returns
+    -------
+    ret
+        the fused function, or `wrapped` itself if any of its wrappers can't be
+        skipped.
+    """
+    decorators = {attr for attr in FN_DECORATORS if hasattr(wrapped, attr)}
+    if decorators <= {"handle_exceptions"} or not decorators <= _FUSABLE_DECORATORS:
+        return wrapped
+    unwrap = "inputs_to_native_arrays" in decorators
+    handles_exceptions = "handle_exceptions" in decorators
+    to_ivy_out = "outputs_to_ivy_arrays" in decorators
+    handles_out = "handle_out_argument" in decorators
+    handles_device = "handle_device" in decorators
+    array_like_positions = (
+        _get_array_like_positions(backend_fn)
+        if "handle_array_like_without_promotion" in decorators
+        else frozenset()
+    )
+    if array_like_positions is None:
+        return wrapped
+
+    @functools.wraps(wrapped)
+    def _fused_dispatch(*args, **kwargs):
+        if (
+            not ivy.fused_dispatch_mode
+            or not ivy.array_mode
+            or kwargs.get("out") is not None
+            or (
+                handles_device
+                and (ivy.soft_device_mode or kwargs.get("device") is not None)
+            )
+        ):
+            return wrapped(*args, **kwargs)
+        native_array_cls = ivy.NativeArray
+        native_dtype_cls = ivy.NativeDtype
+        arrays = []
+        native_args = []
+        for i, arg in enumerate(args):
+            num_arrays = len(arrays)
+            native_arg = _fuse_native_arg(
+                arg, unwrap, native_array_cls, native_dtype_cls, arrays
+            )
+            # non-array inputs to array-like parameters need to be converted
+            if native_arg is _fused_miss or (
+                i in array_like_positions and len(arrays) == num_arrays
+            ):
+                return wrapped(*args, **kwargs)
+            native_args.append(native_arg)
+        native_kwargs = {}
+        for k, v in kwargs.items():
+            native_v = _fuse_native_arg(
+                v, unwrap, native_array_cls, native_dtype_cls, arrays
+            )
+            if native_v is _fused_miss:
+                return wrapped(*args, **kwargs)
+            native_kwargs[k] = native_v
+        if handles_out:
+            native_kwargs["out"] = None
+        if handles_device:
+            dev_fn = ivy.current_backend().dev
+            devices = {dev_fn(x) for x in arrays}
+            if len(devices) > 1:
+                return wrapped(*args, **kwargs)
+            dst_dev = devices.pop() if devices else None
+        try:
+            if handles_device:
+                with ivy.DefaultDevice(ivy.default_device(dst_dev)):
+                    ret = ivy.handle_soft_device_variable(
+                        *native_args, fn=backend_fn, **native_kwargs
+                    )
+            else:
+                ret = backend_fn(*native_args, **native_kwargs)
+            if not to_ivy_out:
+                return ret
+            if isinstance(ret, native_array_cls):
+                return ivy.Array(ret)
+            return ivy.to_ivy(ret, nested=True, include_derived={"tuple": True})
+        except Exception as e:
+            if not handles_exceptions:
+                raise
+            cls = (
+                type(e)
+                if isinstance(e, IvyException)
+                else _non_ivy_exceptions_mapping.get(type(e), IvyBackendException)
+            )
+            raise cls(wrapped.__name__, str(e), include_backend=True) from e
+
+    return _fused_dispatch
+
+
+# Tracing #
+# --------#
+
+# the recorder of the graph being traced by `ivy.trace_graph` in the current
+# thread or context, if any
+_trace_recorder = contextvars.ContextVar("trace_recorder", default=None)
+
+# the number of graphs being traced in all threads, the backend calls only look
+# up their recorder while it isn't zero
+_num_traces = 0
+
+# backend functions which only forward their arguments to the function they are
+# given, the forwarded call is recorded instead
+_UNRECORDED_BACKEND_FNS = frozenset(("handle_soft_device_variable",))
+
+
+def _record_backend_calls(backend_fn: Callable) -> Callable:
+    """Wrap a backend implementation such that, while a graph is being traced,
+    each of its calls is recorded along with its native inputs and outputs.
+
+    Only the calls made in the thread or context tracing the graph are
+    recorded.
+
+    Calls made from within a recorded call, such as the ivy functions used by
+    the backend implementation itself, aren't recorded, since replaying the
+    outer call repeats them.
+    """
+
+    @functools.wraps(backend_fn)
+    def _traced_backend_fn(*args, **kwargs):
+        if not _num_traces:
+            return backend_fn(*args, **kwargs)
+        recorder = _trace_recorder.get()
+        if recorder is None or recorder.depth:
+            return backend_fn(*args, **kwargs)
+        recorder.depth += 1
+        try:
+            ret = backend_fn(*args, **kwargs)
+        finally:
+            recorder.depth -= 1
+        recorder.record(_traced_backend_fn, args, kwargs, ret)
+        return ret
+
+    _traced_backend_fn.records_backend_calls = True
+    return _traced_backend_fn
+
+
 # Functions #
 
 
@@ -1097,6 +1425,14 @@ def _wrap_function(
             and hasattr(original, "handle_partial_mixed_function")
             and hasattr(to_wrap, "partial_mixed_handler")
         )
+        if (
+            not compositional
+            and to_wrap is not original
+            and key not in _UNRECORDED_BACKEND_FNS
+            and not hasattr(to_wrap, "records_backend_calls")
+        ):
+            to_wrap = _record_backend_calls(to_wrap)
+        backend_fn = to_wrap
         add_wrappers, skip_wrappers = [], []
         if mixed_fn:
             backend_wrappers = getattr(original, "mixed_backend_wrappers")
@@ -1125,6 +1461,8 @@ def _wrap_function(
                 if hasattr(to_wrap.compos, attr):
                     to_wrap.compos = to_wrap.compos.__wrapped__
             to_wrap.compos.__dict__["array_spec"] = array_spec
+        elif not compositional and backend_fn is not original:
+            to_wrap = _fuse_dispatch(to_wrap, backend_fn)
     return to_wrap
 
 
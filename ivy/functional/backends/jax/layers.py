@@ -465,6 +465,59 @@ def conv_general_transpose(
     return res
 
 
+def lstm_update(
+    x: JaxArray,
+    init_h: JaxArray,
+    init_c: JaxArray,
+    kernel: JaxArray,
+    recurrent_kernel: JaxArray,
+    /,
+    *,
+    bias: Optional[JaxArray] = None,
+    recurrent_bias: Optional[JaxArray] = None,
+    time_major: bool = False,
+    lengths: Optional[JaxArray] = None,
+) -> Tuple[JaxArray, Tuple[JaxArray, JaxArray]]:
+    if not time_major:
+        x = jnp.moveaxis(x, -2, 0)
+
+    # input projections of all timesteps, with both biases folded in
+    Wi_x = jnp.matmul(x, kernel)
+    if bias is not None:
+        Wi_x = Wi_x + bias
+    if recurrent_bias is not None:
+        Wi_x = Wi_x + recurrent_bias
+
+    dtype = jnp.result_type(Wi_x, init_h, init_c)
+    if not jnp.issubdtype(dtype, jnp.floating):
+        dtype = ivy.default_float_dtype(as_native=True)
+    if lengths is None:
+        masks = None
+    else:
+        steps = jnp.arange(x.shape[0]).reshape((-1,) + (1,) * (x.ndim - 2))
+        masks = jnp.expand_dims(steps < lengths, -1)
+
+    def _step(states, inputs):
+        ht, ct = states
+        Wi_xt, mask_t = inputs
+        gates = Wi_xt + jnp.matmul(ht, recurrent_kernel)
+        it, ft, gt, ot = jnp.split(gates, 4, axis=-1)
+        new_ct = jlax.logistic(ft) * ct + jlax.logistic(it) * jnp.tanh(gt)
+        new_ht = (jlax.logistic(ot) * jnp.tanh(new_ct)).astype(dtype)
+        new_ct = new_ct.astype(dtype)
+        if mask_t is None:
+            return (new_ht, new_ct), new_ht
+        states = (jnp.where(mask_t, new_ht, ht), jnp.where(mask_t, new_ct, ct))
+        return states, jnp.where(mask_t, new_ht, 0)
+
+    (ht, ct), hts = jlax.scan(
+        _step, (init_h.astype(dtype), init_c.astype(dtype)), (Wi_x, masks)
+    )
+    if not time_major:
+        hts = jnp.moveaxis(hts, 0, -2)
+    return hts, (ht, ct)
+
+
 def nms(
     boxes,
     scores=None,
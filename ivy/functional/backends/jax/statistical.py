@@ -7,6 +7,7 @@ from typing import Union, Optional, Sequence
 import ivy
 from ivy.func_wrapper import with_unsupported_dtypes
 from ivy.functional.backends.jax import JaxArray
+from ivy.utils.einsum_path_helpers import planned_einsum
 from . import backend_version
 
 # Array API Standard #
@@ -221,6 +222,19 @@ def cumsum(
 
 
 def einsum(
-    equation: str, *operands: JaxArray, out: Optional[JaxArray] = None
+    equation: str,
+    *operands: JaxArray,
+    optimize: Union[bool, str] = False,
+    out: Optional[JaxArray] = None,
 ) -> JaxArray:
+    if optimize and len(operands) > 2:
+        # jnp.einsum would search for the path again on every eager call
+        return planned_einsum(
+            equation,
+            *operands,
+            optimize=optimize,
+            einsum=jnp.einsum,
+            tensordot=jnp.tensordot,
+            transpose=jnp.transpose,
+        )
     return jnp.einsum(equation, *operands)
@@ -140,6 +140,7 @@ def cumsum(
 def einsum(
     equation: str,
     *operands: Union[(None, mx.ndarray.NDArray)],
+    optimize: Union[bool, str] = False,
     out: Optional[Union[(None, mx.ndarray.NDArray)]] = None,
 ) -> Union[(None, mx.ndarray.NDArray)]:
     raise IvyNotImplementedException()
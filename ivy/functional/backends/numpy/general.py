@@ -15,6 +15,7 @@ import numpy as np
 import ivy
 from ivy.func_wrapper import with_unsupported_dtypes
 from ivy.functional.backends.numpy.helpers import _scalar_output_to_0d_array
+from ivy.utils.batching_rules import _NoBatchingRule, batched_call
 
 from ...ivy.general import _broadcast_to
 from . import backend_version
@@ -408,36 +409,34 @@ def vmap(
                 in_axes, message="single value in_axes should not be None"
             )
 
-        # Handling None in in_axes by broadcasting the axis_size
-        if isinstance(in_axes, (tuple, list)) and None in in_axes:
-            none_axis_index = []
-            for index, axis in enumerate(in_axes):
-                if axis is None:
-                    none_axis_index.append(index)
-
-            for none_mapped_axis in none_axis_index:
-                args[none_mapped_axis] = np.broadcast_to(
-                    args[none_mapped_axis],
-                    (tuple(axis_size) + args[none_mapped_axis].shape),
-                )
-
         # set up the axis to be mapped to index zero.
-        if isinstance(in_axes, (tuple, list)):
-            for i in range(len(in_axes)):
-                if in_axes[i] is not None:
-                    args[i] = np.moveaxis(args[i], in_axes[i], 0)
-        elif isinstance(in_axes, int):
-            args[0] = np.moveaxis(args[0], in_axes, 0)
-
-        # vectorisation. To be optimized.
-        arr_results = []
-        for arrays in zip(*args):
-            single_op = func(*arrays)
-            arr_results.append(single_op)
-        res = np.stack(arr_results)
-
-        if out_axes:
-            res = np.moveaxis(res, 0, out_axes)
+        axes = in_axes if isinstance(in_axes, (tuple, list)) else [in_axes] * len(args)
+        for i, axis in enumerate(axes):
+            if axis is not None:
+                args[i] = np.moveaxis(args[i], axis, 0)
+        mapped = [axis is not None for axis in axes]
+
+        try:
+            # a single call of func over the whole batch
+            res = batched_call(func, args, mapped)
+        except _NoBatchingRule:
+            # func does something the batching rules can't follow, such as
+            # control flow on the values of its inputs, so it's called for
+            # each example, with the unmapped args broadcast along the batch
+            for i, is_mapped in enumerate(mapped):
+                if not is_mapped:
+                    args[i] = np.broadcast_to(args[i], tuple(axis_size) + args[i].shape)
+            arr_results = []
+            for arrays in zip(*args):
+                single_op = func(*arrays)
+                arr_results.append(single_op)
+            res = np.stack(arr_results)
+
+        if out_axes and res is not None:
+            if isinstance(res, (tuple, list)):
+                res = type(res)(np.moveaxis(r, 0, out_axes) for r in res)
+            else:
+                res = np.moveaxis(res, 0, out_axes)
 
         return res
 
@@ -38,8 +38,8 @@ def concat(
             xs = tuple(xs)
     ret = np.concatenate(xs, axis, out=out)
     highest_dtype = xs[0].dtype
-    for i in xs:
-        highest_dtype = ivy.as_native_dtype(ivy.promote_types(highest_dtype, i.dtype))
+    for dtype in {x.dtype for x in xs}:
+        highest_dtype = ivy.as_native_dtype(ivy.promote_types(highest_dtype, dtype))
     return ivy.astype(ret, highest_dtype, copy=False)
 
 
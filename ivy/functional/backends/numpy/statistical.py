@@ -8,6 +8,7 @@ from ivy.func_wrapper import with_unsupported_dtypes
 from ivy.functional.backends.numpy.helpers import _scalar_output_to_0d_array
 from . import backend_version
 from ivy.utils.einsum_parser import legalise_einsum_expr
+from ivy.utils.einsum_path_helpers import planned_einsum
 
 
 # Array API Standard #
@@ -248,8 +249,20 @@ cumsum.support_native_out = True
 
 @_scalar_output_to_0d_array
 def einsum(
-    equation: str, *operands: np.ndarray, out: Optional[np.ndarray] = None
+    equation: str,
+    *operands: np.ndarray,
+    optimize: Union[bool, str] = False,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
+    if optimize and len(operands) > 2:
+        return planned_einsum(
+            equation,
+            *operands,
+            optimize=optimize,
+            einsum=np.einsum,
+            tensordot=np.tensordot,
+            transpose=np.transpose,
+        )
     equation = legalise_einsum_expr(*[equation, *operands])
     return np.einsum(equation, *operands, out=out)
 
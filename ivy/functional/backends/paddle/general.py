@@ -15,6 +15,7 @@ import ivy
 import ivy.functional.backends.paddle as paddle_backend
 from ivy.func_wrapper import with_unsupported_device_and_dtypes, with_unsupported_dtypes
 from ivy.functional.ivy.general import _broadcast_to
+from ivy.utils.batching_rules import _NoBatchingRule, batched_call
 from ivy.utils.exceptions import _check_inplace_update_support
 from . import backend_version
 
@@ -639,37 +640,40 @@ def vmap(
                 in_axes, message="single value in_axes should not be None"
             )
 
-        # Handling None in in_axes by broadcasting the axis_size
-        if isinstance(in_axes, (tuple, list)) and None in in_axes:
-            none_axis_index = []
-            for index, axis in enumerate(in_axes):
-                if axis is None:
-                    none_axis_index.append(index)
-
-            for none_mapped_axis in none_axis_index:
-                args[none_mapped_axis] = paddle_backend.broadcast_to(
-                    args[none_mapped_axis],
-                    (tuple(axis_size) + args[none_mapped_axis].shape),
-                )
-
         # set up the axis to be mapped
-        if isinstance(in_axes, (tuple, list)):
-            for i in range(len(in_axes)):
-                args[i] = paddle_backend.moveaxis(args[i], in_axes[i], 0)
-        elif isinstance(in_axes, int):
-            args[0] = paddle_backend.moveaxis(args[0], in_axes, 0)
-
-        # vectorisation - applying map_fn if only one arg provided as reduce requires
-        # two elements to begin with.
-        arr_results = []
-        for arrays in zip(*args):
-            arrays = [a if a.shape != [] else a.unsqueeze(0) for a in arrays]
-            arr_results.append(func(*arrays))
-
-        res = paddle_backend.concat(arr_results)
-
-        if out_axes:
-            res = paddle_backend.moveaxis(res, 0, out_axes)
+        axes = in_axes if isinstance(in_axes, (tuple, list)) else [in_axes] * len(args)
+        for i, axis in enumerate(axes):
+            if axis is not None:
+                args[i] = paddle_backend.moveaxis(args[i], axis, 0)
+        mapped = [axis is not None for axis in axes]
+
+        try:
+            # a single call of func over the whole batch
+            res = batched_call(func, args, mapped)
+        except _NoBatchingRule:
+            # func does something the batching rules can't follow, such as
+            # control flow on the values of its inputs, so it's called for
+            # each example, with the unmapped args broadcast along the batch
+            for i, is_mapped in enumerate(mapped):
+                if not is_mapped:
+                    args[i] = paddle_backend.broadcast_to(
+                        args[i], tuple(axis_size) + tuple(args[i].shape)
+                    )
+
+            # vectorisation - applying map_fn if only one arg provided as reduce
+            # requires two elements to begin with.
+            arr_results = []
+            for arrays in zip(*args):
+                arrays = [a if a.shape != [] else a.unsqueeze(0) for a in arrays]
+                arr_results.append(func(*arrays))
+
+            res = paddle_backend.concat(arr_results)
+
+        if out_axes and res is not None:
+            if isinstance(res, (tuple, list)):
+                res = type(res)(paddle_backend.moveaxis(r, 0, out_axes) for r in res)
+            else:
+                res = paddle_backend.moveaxis(res, 0, out_axes)
 
         return res
 
@@ -12,6 +12,7 @@ from ivy.func_wrapper import (
 )
 import ivy.functional.backends.paddle as paddle_backend
 from ivy.utils.einsum_parser import legalise_einsum_expr
+from ivy.utils.einsum_path_helpers import planned_einsum
 
 # local
 from . import backend_version
@@ -401,10 +402,9 @@ def cumsum(
 def einsum(
     equation: str,
     *operands: paddle.Tensor,
+    optimize: Union[bool, str] = False,
     out: Optional[paddle.Tensor] = None,
 ) -> paddle.Tensor:
-    equation = legalise_einsum_expr(*[equation, *operands])
-
     dtype_list = set(map(lambda x: x.dtype, operands))
     dtype = dtype_list.pop()
     if len(dtype_list) > 0:
@@ -414,4 +414,14 @@ def einsum(
             map(lambda x: x.cast(dtype) if x.dtype != dtype else x, operands)
         )
 
+    if optimize and len(operands) > 2:
+        return planned_einsum(
+            equation,
+            *operands,
+            optimize=optimize,
+            einsum=paddle.einsum,
+            tensordot=paddle.tensordot,
+            transpose=paddle.transpose,
+        )
+    equation = legalise_einsum_expr(*[equation, *operands])
     return paddle.einsum(equation, *operands)
@@ -702,7 +702,15 @@ def conv_general_transpose(
 
 
 def _cpu_lstm(
-    x, init_h, init_c, kernel, recurrent_kernel, bias, recurrent_bias, time_major
+    x,
+    init_h,
+    init_c,
+    kernel,
+    recurrent_kernel,
+    bias,
+    recurrent_bias,
+    time_major,
+    lengths=None,
 ):
     def step(cell_inputs, cell_states):
         h_tm1 = cell_states[0]  # previous memory state
@@ -726,11 +734,22 @@ def _cpu_lstm(
         h = o * tf.tanh(c)
         return h, [h, c]
 
+    mask = None
+    if lengths is not None:
+        # the mask follows the layout of x
+        steps = tf.range(x.shape[0 if time_major else 1], dtype=lengths.dtype)
+        if time_major:
+            mask = steps[:, None] < lengths[None]
+        else:
+            mask = lengths[:, None] > steps[None]
+
     _, outputs, new_states = tf.keras.backend.rnn(
         step,
         x,
         [init_h, init_c],
+        mask=mask,
         time_major=time_major,
+        zero_output_for_mask=lengths is not None,
     )
     return outputs, new_states
 
@@ -779,6 +798,7 @@ def lstm_update(
     bias: Optional[Union[tf.Tensor, tf.Variable]] = None,
     recurrent_bias: Optional[Union[tf.Tensor, tf.Variable]] = None,
     time_major: bool = False,
+    lengths: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Tuple[Tensor, Tuple[Tensor, Tensor]]:
     dev = x.device
     x = x.data
@@ -790,7 +810,8 @@ def lstm_update(
     recurrent_bias = (
         recurrent_bias.data if recurrent_bias is not None else recurrent_bias
     )
-    if "cpu" in dev:
+    # the cudnn kernel takes no sequence lengths
+    if "cpu" in dev or lengths is not None:
         outputs, new_states = _cpu_lstm(
             x,
             init_h,
@@ -800,6 +821,7 @@ def lstm_update(
             bias,
             recurrent_bias,
             time_major,
+            lengths=lengths,
         )
     else:
         outputs, new_states = _gpu_lstm(
@@ -7,6 +7,7 @@ import ivy
 from ivy.func_wrapper import with_unsupported_dtypes
 from . import backend_version
 from ivy.utils.einsum_parser import legalise_einsum_expr
+from ivy.utils.einsum_path_helpers import planned_einsum
 
 # Array API Standard #
 # -------------------#
@@ -230,9 +231,9 @@ def cumsum(
 def einsum(
     equation: str,
     *operands: Union[tf.Tensor, tf.Variable],
+    optimize: Union[bool, str] = False,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Union[tf.Tensor, tf.Variable]:
-    equation = legalise_einsum_expr(*[equation, *operands])
     dtype_list = set(map(lambda x: x.dtype, operands))
     dtype = dtype_list.pop()
     if len(dtype_list) > 0:
@@ -243,4 +244,14 @@ def einsum(
             map(lambda x: tf.cast(x, dtype) if x.dtype != dtype else x, operands)
         )
 
+    if optimize and len(operands) > 2:
+        return planned_einsum(
+            equation,
+            *operands,
+            optimize=optimize,
+            einsum=tf.einsum,
+            tensordot=tf.tensordot,
+            transpose=tf.transpose,
+        )
+    equation = legalise_einsum_expr(*[equation, *operands])
     return tf.einsum(equation, *operands)
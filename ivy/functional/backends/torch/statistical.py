@@ -8,6 +8,7 @@ import torch
 import ivy
 from ivy.functional.ivy.statistical import _get_promoted_type_of_operands
 from ivy.func_wrapper import with_unsupported_dtypes, with_supported_dtypes
+from ivy.utils.einsum_path_helpers import planned_einsum
 from . import backend_version
 
 # Array API Standard #
@@ -342,7 +343,20 @@ cumsum.support_native_out = True
 def einsum(
     equation: str,
     *operands: torch.Tensor,
+    optimize: Union[bool, str] = False,
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
     dtype = _get_promoted_type_of_operands(operands)
-    return ivy.astype(torch.einsum(equation, *operands), dtype, copy=False)
+    if optimize and len(operands) > 2:
+        native_dtype = ivy.as_native_dtype(dtype)
+        ret = planned_einsum(
+            equation,
+            *[operand.type(native_dtype) for operand in operands],
+            optimize=optimize,
+            einsum=torch.einsum,
+            tensordot=lambda x1, x2, axes: torch.tensordot(x1, x2, dims=axes),
+            transpose=torch.permute,
+        )
+    else:
+        ret = torch.einsum(equation, *operands)
+    return ivy.astype(ret, dtype, copy=False)
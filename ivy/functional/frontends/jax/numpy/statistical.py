@@ -172,7 +172,10 @@ def einsum(
     _use_xeinsum=False,
     _dot_general=None,
 ):
-    return ivy.einsum(subscripts, *operands, out=out)
+    # explicit paths and other path algorithms are planned greedily
+    if optimize not in ("greedy", "optimal"):
+        optimize = bool(optimize)
+    return ivy.einsum(subscripts, *operands, optimize=optimize, out=out)
 
 
 @to_ivy_arrays_and_back
@@ -54,7 +54,10 @@ def einsum(
     casting="safe",
     optimize=False,
 ):
-    return ivy.einsum(subscripts, *operands, out=out)
+    # explicit paths and other path algorithms are planned greedily
+    if optimize not in ("greedy", "optimal"):
+        optimize = bool(optimize)
+    return ivy.einsum(subscripts, *operands, optimize=optimize, out=out)
 
 
 @to_ivy_arrays_and_back
@@ -1,5 +1,6 @@
-from .generic import NDFrame
+from .generic import NDFrame, _is_scalar, _to_array
 import ivy
+import numpy as np
 from .series import Series
 from ivy.functional.frontends.pandas.index import Index
 
@@ -22,52 +23,111 @@ class DataFrame(NDFrame):
             dtype=dtype,
             copy=copy,
             name=None,
-            columns=None,
+            columns=columns,
             *args,
             **kwargs,
         )
-        if isinstance(self.orig_data, dict):
-            # if data is a dict the underlying array needs to be extended to match the
-            # index as a 2d array
-            self.columns = list(self.orig_data.keys()) if columns is None else columns
-            array_data = list(self.orig_data.values())
-            self.array = ivy.array([array_data for _ in range(len(self.index))])
-        elif isinstance(self.orig_data, Series):
-            self.array = self.array.expand_dims()
-            self.columns = [0]
-        elif columns is None:
-            self.columns = ivy.arange(self.array.shape[1]).tolist()
+
+    def _init_data(self, data, index):
+        # the frame is stored column by column, as one 1-D array per column, and
+        # the columns are shared with the frames and series they are taken from
+        self._array = None
+        columns = self.columns
+        if isinstance(data, dict):
+            columns = list(data.keys()) if columns is None else list(columns)
+            num_rows = None if index is None else len(index)
+            for value in data.values():
+                if num_rows is None and not _is_scalar(value):
+                    num_rows = len(value)
+            ivy.utils.assertions.check_exists(
+                num_rows,
+                message="If using all scalar values, an index must be passed",
+            )
+            self._columns_data = [
+                self._to_column(data.get(label, ivy.nan), num_rows)
+                for label in columns
+            ]
+        elif isinstance(data, DataFrame):
+            columns = data.columns if columns is None else columns
+            self._columns_data = [
+                _to_array(data[label].array, self.copy) for label in columns
+            ]
+            index = data.index if index is None else index
+        elif isinstance(data, Series):
+            columns = [0] if columns is None else columns
+            self._columns_data = [_to_array(data.array, self.copy)]
+            index = data.index if index is None else index
+        elif isinstance(data, (ivy.Array, np.ndarray, list, tuple)) or (
+            ivy.is_native_array(data)
+        ):
+            array = _to_array(data, self.copy)
+            assert array.ndim == 2, "DataFrame Data must be 2-dimensional"
+            columns = list(range(array.shape[1])) if columns is None else columns
+            self._columns_data = ivy.unstack(array, axis=1)
         else:
-            self.columns = columns
+            raise TypeError(
+                "Data must be one of array, dict, iterables or Series."
+                f" Got {type(data)}"
+            )
+        if index is None:
+            index = ivy.arange(len(self._columns_data[0]) if self._columns_data else 0)
+        self.index = index
+        self.columns = columns if isinstance(columns, Index) else Index(columns)
+
+    def _to_column(self, value, num_rows):
+        if _is_scalar(value):
+            # scalars are broadcast along the rows
+            return ivy.full((num_rows,), ivy.to_scalar(value))
+        return _to_array(value, self.copy)
+
+    @property
+    def array(self):
+        # the columns stacked as the 2-D array of the frame, which is cached until
+        # the columns are set
+        if self._array is None:
+            self._array = ivy.stack(self._columns_data, axis=1)
+        return self._array
 
-        assert self.array.ndim == 2, "DataFrame Data must be 2-dimensional"
+    @array.setter
+    def array(self, array):
+        array = _to_array(array)
+        assert array.ndim == 2, "DataFrame Data must be 2-dimensional"
+        self._columns_data = ivy.unstack(array, axis=1)
+        self._array = array
 
     def __getitem__(self, col):
-        # turn labels (strings) into numbered indexing so that self.array columns can
-        # be accessed.
+        # labels are looked up in the hashed column index
         if isinstance(col, (tuple, list)):
-            numbered_col = [self.columns.index(i) for i in col]
             return DataFrame(
-                self.array[:, numbered_col],
+                {label: self[label].array for label in col},
                 index=self.index,
                 dtype=self.dtype,
                 columns=col,
             )
-        col = self.columns.index(col)
         return Series(
-            self.array[:, col],
+            self._columns_data[self.columns.get_loc(col)],
             index=self.index,
             dtype=self.dtype,
         )
 
+    def __setitem__(self, col, value):
+        # only the column list of this frame is written to, the frames and series
+        # sharing the previous column are left as they are
+        value = self._to_column(
+            value.array if isinstance(value, Series) else value, len(self.index)
+        )
+        self._array = None
+        if col in self.columns:
+            self._columns_data = list(self._columns_data)
+            self._columns_data[self.columns.get_loc(col)] = value
+        else:
+            self._columns_data = [*self._columns_data, value]
+            self.columns = Index([*self.columns, col])
+
     def __getattr__(self, item):
-        if item in self.columns:
-            item_index = self.columns.index(item)
-            return Series(
-                self.array[:, item_index],
-                index=self.index,
-                dtype=self.dtype,
-            )
+        columns = self.__dict__.get("columns")
+        if columns is not None and item in columns:
+            return self[item]
         else:
             return super().__getattr__(item)
 
@@ -77,37 +137,42 @@ class DataFrame(NDFrame):
             f"index={self.index}), columns={self.columns})"
         )
 
+    def _count_values(self):
+        # the number of values which aren't nan
+        return sum(
+            col.size - int(ivy.sum(ivy.isnan(col))) for col in self._columns_data
+        )
+
     def sum(self, axis=None, skipna=True, level=None, numeric_only=None, min_count=0):
-        _array = self.array
         if axis is None or axis == "index":
             axis = 0  # due to https://github.com/pandas-dev/pandas/issues/54547. TODO: remove this when fixed # noqa: E501
         elif axis == "columns":
             axis = 1
-        if min_count > 0:
-            if ivy.has_nans(_array):
-                number_values = _array.size - ivy.sum(ivy.isnan(_array))
-            else:
-                number_values = _array.size
-            if min_count > number_values:
-                return ivy.nan
-        if skipna:
-            ret = ivy.nansum(_array, axis=axis)
-        else:
-            ret = _array.sum(axis=axis)
-        return Series(ret, index=self.columns if axis in (0, "index") else self.index)
+        if min_count > 0 and min_count > self._count_values():
+            return ivy.nan
+        sum_fn = ivy.nansum if skipna else ivy.sum
+        if axis == 0:
+            # each column is reduced on its own, without stacking the frame
+            ret = ivy.stack([sum_fn(col) for col in self._columns_data])
+            return Series(ret, index=self.columns)
+        return Series(sum_fn(self.array, axis=axis), index=self.index)
 
     def mean(self, axis=0, skipna=True, numeric_only=None, **kwargs):
-        _array = ivy.astype(self.array, ivy.default_float_dtype())
         axis = 0 if axis == "index" else 1 if axis == "columns" else axis
-        if skipna:
-            ret = ivy.nanmean(_array, axis=axis)
-        else:
-            ret = _array.mean(axis=axis)
+        mean_fn = ivy.nanmean if skipna else ivy.mean
+        float_dtype = ivy.default_float_dtype()
+        if axis == 0:
+            ret = ivy.stack(
+                [
+                    mean_fn(ivy.astype(col, float_dtype, copy=False))
+                    for col in self._columns_data
+                ]
+            )
+            return Series(ret, index=self.columns)
+        ret = mean_fn(ivy.astype(self.array, float_dtype, copy=False), axis=axis)
         if axis is None:
             return ret  # scalar case
-        return Series(
-            ret, index=Index(self.columns) if axis in (0, "index") else self.index
-        )
+        return Series(ret, index=self.index)
 
     def get(self, key, default=None):
         if key in self.columns:
@@ -1,55 +1,74 @@
+from numbers import Number
+
 import ivy
 import numpy as np
-import copy as py_copy
 from ivy.functional.frontends.pandas.func_wrapper import outputs_to_self_class
 import ivy.functional.frontends.pandas.series as series
 from ivy.functional.frontends.pandas.index import Index
 
 
+def _is_scalar(value):
+    # python and numpy scalars, and 0-d arrays
+    return isinstance(value, Number) or getattr(value, "ndim", None) == 0
+
+
+def _to_array(data, copy=False):
+    # ivy arrays are shared rather than copied, unless a copy is asked for
+    if isinstance(data, ivy.Array) and not copy:
+        return data
+    return ivy.array(data, copy=True if copy else None)
+
+
 class NDFrame:
     def __init__(self, data, index, columns, dtype, name, copy, *args, **kwargs):
         self.name = name
         self.columns = columns
         self.dtype = dtype
         self.copy = copy
-        self.orig_data = py_copy.deepcopy(data)
-
-        if ivy.is_native_array(data):
-            self.array = ivy.array(data)
+        # the input isn't copied, the arrays are shared with it unless copy is
+        # set, and a dict input is only copied if it has to be extended
+        self.orig_data = data
+        self._init_data(data, index)
+        self.index = (
+            Index(self.index) if not isinstance(self.index, Index) else self.index
+        )
 
+    def _init_data(self, data, index):
         # repeatedly used checks
-        data_is_array = isinstance(data, (ivy.Array, np.ndarray))
+        data_is_array = not _is_scalar(data) and (
+            isinstance(data, (ivy.Array, np.ndarray)) or ivy.is_native_array(data)
+        )
         data_is_array_or_like = data_is_array or isinstance(data, (list, tuple))
 
         # setup a default index if none provided
-        orig_data_len = len(self.orig_data)
         if index is None:
             if data_is_array_or_like:
-                index = ivy.arange(orig_data_len)
+                index = ivy.arange(len(data))
             elif isinstance(data, dict):
                 index = list(data.keys())
             elif isinstance(data, series.Series):
                 index = data.index
-        elif isinstance(data, dict) and len(index) > orig_data_len:
+        elif isinstance(data, dict) and len(index) > len(data):
+            data = dict(data)
             for i in index:
                 if i not in data:
                     data[i] = ivy.nan
 
         if data_is_array_or_like:
             self.index = index
-            self.array = ivy.array(data)
+            self.array = _to_array(data, self.copy)
 
         elif isinstance(data, dict):
             self.index = index
             self.array = ivy.array(list(data.values()))
 
-        elif isinstance(data, (int, float)):
+        elif _is_scalar(data):
             if len(index) > 1:
                 data = [data] * len(index)
             self.index = index
             self.array = ivy.array(data)
         elif isinstance(data, series.Series):
-            self.array = data.array
+            self.array = _to_array(data.array, self.copy)
             self.index = index
         elif isinstance(data, str):
             pass  # TODO: implement string series
@@ -58,9 +77,6 @@ class NDFrame:
                 "Data must be one of array, dict, iterables, scalar value or Series."
                 f" Got {type(data)}"
             )
-        self.index = (
-            Index(self.index) if not isinstance(self.index, Index) else self.index
-        )
 
     @property
     def data(self):
@@ -10,7 +10,7 @@ class Index:
         if not isinstance(data, ivy.Array):
             try:
                 self.index_array = ivy.array(data, dtype=dtype)
-            except ivy.utils.exceptions.IvyBackendException:
+            except ivy.utils.exceptions.IvyException:
                 # labels as strings
                 if isinstance(data, (list, tuple)):
                     self.tokens = data
@@ -27,6 +27,8 @@ class Index:
         self.name = name
         self.copy = copy
         self.tupleize_cols = tupleize_cols
+        # the positions of the labels, hashed on the first lookup of a label
+        self._engine = None
 
     @staticmethod
     def _tokenize_1d(x: Iterable):
@@ -50,7 +52,34 @@ class Index:
         return len(self.index_array)
 
     def __iter__(self):
-        return iter(self.index_array.to_list())
+        return iter(self._labels)
+
+    def __contains__(self, key):
+        try:
+            return key in self._get_engine()
+        except TypeError:
+            # unhashable keys aren't labels
+            return False
+
+    @property
+    def _labels(self):
+        return list(self.tokens) if self.tokens_exist else self.index_array.to_list()
+
+    def _get_engine(self):
+        if self._engine is None:
+            labels = self._labels
+            # the labels are hashed from the last to the first, so duplicated
+            # labels map to their first position
+            self._engine = dict(
+                zip(reversed(labels), range(len(labels) - 1, -1, -1))
+            )
+        return self._engine
+
+    def get_loc(self, key):
+        try:
+            return self._get_engine()[key]
+        except (KeyError, TypeError):
+            raise KeyError(key) from None
 
     @property
     def ndim(self):
@@ -75,6 +104,7 @@ class Index:
     def unique(self, level=None):
         # todo handle level with mutliindexer
         self.index_array = ivy.unique_values(self)
+        self._engine = None
         return Index(self.index_array, dtype=self.dtype, copy=self.copy, name=self.name)
 
     def is_unique(self):
@@ -82,7 +112,7 @@ class Index:
         return len(uniques) == len(self.index_array)
 
     def to_list(self):
-        return self.index_array.to_list()
+        return self._labels
 
     def to_numpy(self, dtype=None, copy=False, na_value=ivy.nan, **kwargs):
         if dtype:
@@ -31,7 +31,7 @@ class Series(NDFrame):
         series_name = f"{self.name} " if self.name is not None else ""
         return (
             f"frontends.pandas.Series {series_name}({self.array.to_list()},"
-            f" index={self.index.array.to_list()})"
+            f" index={self.index.to_list()})"
         )
 
     def __getitem__(self, index_val):
@@ -43,7 +43,7 @@ class Series(NDFrame):
                 dtype=self.dtype,
                 copy=self.copy,
             )
-        return self.array[self.index.index(index_val)].item()
+        return self.array[self.index.get_loc(index_val)].item()
 
     def __getattr__(self, item):
         if item in self.index:
@@ -7,7 +7,7 @@ from ..base import (
 import copy
 from ._criterion import Gini, Criterion
 from ._splitter import BestSplitter, Splitter
-from ._tree import DepthFirstTreeBuilder, Tree
+from ._tree import DepthFirstTreeBuilder, HistogramTreeBuilder, Tree
 import ivy
 import numbers
 
@@ -114,24 +114,34 @@ class BaseDecisionTree(MultiOutputMixin, BaseEstimator, metaclass=ABCMeta):
         splitter = self.splitter
         monotonic_cst = None
 
-        if not isinstance(self.splitter, Splitter):
-            splitter = BestSplitter(
-                criterion,
-                self.max_features_,
+        if self.splitter == "hist":
+            # not in sklearn, bins the features and splits a level at a time
+            builder = HistogramTreeBuilder(
+                min_samples_split,
                 min_samples_leaf,
                 min_weight_leaf,
-                self.random_state,
-                monotonic_cst,
+                max_depth,
+                self.min_impurity_decrease,
+            )
+        else:
+            if not isinstance(self.splitter, Splitter):
+                splitter = BestSplitter(
+                    criterion,
+                    self.max_features_,
+                    min_samples_leaf,
+                    min_weight_leaf,
+                    self.random_state,
+                    monotonic_cst,
+                )
+            builder = DepthFirstTreeBuilder(
+                splitter,
+                min_samples_split,
+                min_samples_leaf,
+                min_weight_leaf,
+                max_depth,
+                self.min_impurity_decrease,
             )
         self.tree_ = Tree(self.n_features_in_, self.n_classes_, self.n_outputs_)
-        builder = DepthFirstTreeBuilder(
-            splitter,
-            min_samples_split,
-            min_samples_leaf,
-            min_weight_leaf,
-            max_depth,
-            self.min_impurity_decrease,
-        )
         builder.build(self.tree_, X, y, sample_weight, missing_values_in_feature_mask)
         if self.n_outputs_ == 1:
             self.n_classes_ = self.n_classes_[0]
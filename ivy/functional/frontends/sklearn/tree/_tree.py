@@ -6,6 +6,8 @@ INFINITY = ivy.inf
 INTPTR_MAX = ivy.iinfo(ivy.int32).max
 TREE_LEAF = -1
 TREE_UNDEFINED = -2
+MAX_BINS = 256
+MAX_HISTOGRAM_SIZE = 2**24
 _TREE_LEAF = TREE_LEAF
 _TREE_UNDEFINED = TREE_UNDEFINED
 
@@ -29,6 +31,7 @@ class Tree:
         self.capacity = 0
         self.nodes = []
         self.value = None
+        self._node_arrays = None
 
         self.n_features = n_features
         self.n_outputs = n_outputs
@@ -91,6 +94,7 @@ class Tree:
         if node_id >= self.capacity:
             self._resize_c()
 
+        self._node_arrays = None
         node = Node()
         node.impurity = impurity
         node.n_node_samples = n_node_samples
@@ -127,25 +131,43 @@ class Tree:
     def apply(self, X):
         return self._apply_dense(X)
 
+    def _get_node_arrays(self):
+        if self._node_arrays is None:
+            nodes = self.nodes
+            self._node_arrays = (
+                ivy.array([node.left_child for node in nodes], dtype="int64"),
+                ivy.array([node.right_child for node in nodes], dtype="int64"),
+                ivy.array([max(int(node.feature), 0) for node in nodes], dtype="int64"),
+                ivy.array([float(node.threshold) for node in nodes], dtype="float64"),
+                ivy.array([bool(node.missing_go_to_left) for node in nodes]),
+            )
+        return self._node_arrays
+
     def _apply_dense(self, X):
-        X_tensor = X
-        n_samples = X.shape[0]
-        out = ivy.zeros(n_samples, dtype="int32")
-        for i in range(n_samples):
-            node = self.nodes[0]  # root node
-            while node.left_child != _TREE_LEAF:
-                X_i_node_feature = X_tensor[i, node.feature]
-                if ivy.isnan(X_i_node_feature):
-                    if node.missing_go_to_left:
-                        node = self.nodes[node.left_child]
-                    else:
-                        node = self.nodes[node.right_child]
-                elif X_i_node_feature <= node.threshold:
-                    node = self.nodes[node.left_child]
-                else:
-                    node = self.nodes[node.right_child]
-            out[i] = self.nodes.index(node)  # terminal node index
-        return out
+        children_left, children_right, feature, threshold, missing_go_to_left = (
+            self._get_node_arrays()
+        )
+        n_samples, n_features = X.shape
+        X_flat = ivy.reshape(X, (-1,))
+        row_offsets = ivy.arange(n_samples, dtype="int64") * n_features
+        out = ivy.zeros(n_samples, dtype="int64")
+        # all the samples are moved down the tree together, one level at a time
+        for _ in range(self.max_depth):
+            left_child = ivy.gather(children_left, out)
+            X_i_node_feature = ivy.gather(
+                X_flat, row_offsets + ivy.gather(feature, out)
+            )
+            go_left = ivy.where(
+                ivy.isnan(X_i_node_feature),
+                ivy.gather(missing_go_to_left, out),
+                X_i_node_feature <= ivy.gather(threshold, out),
+            )
+            out = ivy.where(
+                left_child == _TREE_LEAF,
+                out,
+                ivy.where(go_left, left_child, ivy.gather(children_right, out)),
+            )
+        return ivy.astype(out, "int32")  # terminal node indices
 
 
 class StackRecord:
@@ -315,3 +337,423 @@ class DepthFirstTreeBuilder(TreeBuilder):
             if depth > max_depth_seen:
                 max_depth_seen = depth
                 tree.max_depth = max_depth_seen
+
+
+class HistogramTreeBuilder(TreeBuilder):
+    """Build a tree level by level from histograms of the binned features.
+
+    The features are binned once into at most ``max_bins`` quantile bins, after
+    which the class counts of every candidate split of all the nodes of a level
+    are computed with a single weighted bincount, and the best splits are found
+    with batched reductions over the cumulated histograms. When a feature has no
+    more than ``max_bins`` distinct values, the splits and thresholds are the
+    same as those of the ``BestSplitter``.
+    """
+
+    def __init__(
+        self,
+        min_samples_split,
+        min_samples_leaf,
+        min_weight_leaf,
+        max_depth,
+        min_impurity_decrease,
+        max_bins=MAX_BINS,
+        max_histogram_size=MAX_HISTOGRAM_SIZE,
+    ):
+        self.min_samples_split = min_samples_split
+        self.min_samples_leaf = min_samples_leaf
+        self.min_weight_leaf = min_weight_leaf
+        self.max_depth = max_depth
+        self.min_impurity_decrease = min_impurity_decrease
+        self.max_bins = max_bins
+        self.max_histogram_size = max_histogram_size
+
+    def build(
+        self, tree, X, y, sample_weight=None, missing_values_in_feature_mask=None
+    ):
+        n_samples, n_features = X.shape
+        n_outputs = int(tree.n_outputs)
+        max_n_classes = int(tree.max_n_classes)
+        X_binned, bin_min, bin_max = _bin_features(X, self.max_bins)
+        n_bins = bin_min.shape[1]
+        y = ivy.astype(y, "int64")
+        if sample_weight is None:
+            sample_weight = ivy.ones(n_samples, dtype="float64")
+        sample_weight = ivy.astype(sample_weight, "float64")
+        weighted_n_samples = float(ivy.sum(sample_weight))
+        # the open node of each sample at the current level, samples with a zero
+        # weight are left out like in Splitter.init
+        node_of_sample = ivy.where(sample_weight != 0.0, 0, -1)
+        levels = []
+        n_open = 1
+        depth = 0
+        while n_open:
+            level = self._split_level(
+                X_binned,
+                y,
+                sample_weight,
+                node_of_sample,
+                n_open,
+                depth,
+                weighted_n_samples,
+                bin_min,
+                bin_max,
+                n_outputs,
+                max_n_classes,
+                n_bins,
+            )
+            levels.append(level)
+            node_of_sample, n_open = self._next_level(
+                X_binned, node_of_sample, level, n_features
+            )
+            depth += 1
+        _add_levels_to_tree(tree, levels)
+        tree.max_depth = depth - 1
+
+    def _split_level(
+        self,
+        X_binned,
+        y,
+        sample_weight,
+        node_of_sample,
+        n_open,
+        depth,
+        weighted_n_samples,
+        bin_min,
+        bin_max,
+        n_outputs,
+        max_n_classes,
+        n_bins,
+    ):
+        active = node_of_sample >= 0
+        node_index = ivy.where(active, node_of_sample, 0)
+        weights = ivy.where(active, sample_weight, 0.0)
+        sum_total = _class_histogram(
+            node_index, y, weights, n_open, n_outputs, max_n_classes
+        )
+        n_node_samples = ivy.bincount(
+            node_index, weights=ivy.astype(active, "float64"), minlength=n_open
+        )
+        weighted_n_node_samples = ivy.sum(sum_total[:, 0], axis=-1)
+        impurity = _gini(sum_total, weighted_n_node_samples)
+        is_leaf = (
+            (n_node_samples < self.min_samples_split)
+            | (n_node_samples < 2 * self.min_samples_leaf)
+            | (weighted_n_node_samples < 2 * self.min_weight_leaf)
+            | (impurity <= EPSILON)
+        )
+        if depth >= self.max_depth:
+            is_leaf = ivy.ones_like(is_leaf)
+        level = {
+            "sum_total": sum_total,
+            "impurity": impurity,
+            "n_node_samples": n_node_samples,
+            "weighted_n_node_samples": weighted_n_node_samples,
+            "is_leaf": ivy.zeros(n_open, dtype="bool"),
+            "feature": ivy.zeros(n_open, dtype="int64"),
+            "bin": ivy.zeros(n_open, dtype="int64"),
+            "threshold": ivy.zeros(n_open, dtype="float64"),
+            "missing_go_to_left": ivy.zeros(n_open, dtype="bool"),
+        }
+        candidates = ivy.nonzero(~is_leaf)[0]
+        n_candidates = candidates.shape[0]
+        if not n_candidates:
+            level["is_leaf"] = is_leaf
+            return level
+        # position of the node of each sample among the candidates, -1 otherwise
+        candidate_position = ivy.where(
+            is_leaf, -1, ivy.cumsum(ivy.astype(~is_leaf, "int64")) - 1
+        )
+        sample_position = ivy.where(
+            active, ivy.gather(candidate_position, node_index), -1
+        )
+        n_features = X_binned.shape[1]
+        histogram_size = n_features * n_bins * n_outputs * max_n_classes
+        chunk_size = max(1, self.max_histogram_size // histogram_size)
+        splits = {}
+        for start in range(0, n_candidates, chunk_size):
+            chunk = candidates[start : start + chunk_size]
+            split = self._best_splits(
+                X_binned,
+                y,
+                sample_weight,
+                sample_position - start,
+                chunk.shape[0],
+                ivy.gather(sum_total, chunk, axis=0),
+                ivy.gather(n_node_samples, chunk),
+                ivy.gather(weighted_n_node_samples, chunk),
+                ivy.gather(impurity, chunk),
+                weighted_n_samples,
+                bin_min,
+                bin_max,
+                n_outputs,
+                max_n_classes,
+                n_bins,
+            )
+            for key, value in split.items():
+                splits.setdefault(key, []).append(value)
+        indices = ivy.expand_dims(candidates, axis=-1)
+        for key, value in splits.items():
+            value = ivy.scatter_nd(
+                indices, ivy.astype(ivy.concat(value), "float64"), shape=(n_open,)
+            )
+            level[key] = ivy.astype(value, level[key].dtype)
+        level["is_leaf"] = is_leaf | level["is_leaf"]
+        return level
+
+    def _best_splits(
+        self,
+        X_binned,
+        y,
+        sample_weight,
+        sample_position,
+        n_nodes,
+        sum_total,
+        n_node_samples,
+        weighted_n_node_samples,
+        impurity,
+        weighted_n_samples,
+        bin_min,
+        bin_max,
+        n_outputs,
+        max_n_classes,
+        n_bins,
+    ):
+        n_features = X_binned.shape[1]
+        samples = ivy.nonzero((sample_position >= 0) & (sample_position < n_nodes))[0]
+        node_index = ivy.gather(sample_position, samples)
+        # histogram index of each (sample, feature) pair
+        hist_index = (
+            ivy.expand_dims(node_index, axis=-1) * n_features
+            + ivy.arange(n_features, dtype="int64")
+        ) * n_bins + ivy.gather(X_binned, samples, axis=0)
+        n_left = ivy.cumsum(
+            ivy.reshape(
+                ivy.bincount(
+                    ivy.reshape(hist_index, (-1,)),
+                    minlength=n_nodes * n_features * n_bins,
+                ),
+                (n_nodes, n_features, n_bins),
+            ),
+            axis=-1,
+        )
+        node_counts = n_left - ivy.concat(
+            [ivy.zeros_like(n_left[..., :1]), n_left[..., :-1]], axis=-1
+        )
+        sum_left = ivy.cumsum(
+            _class_histogram(
+                ivy.reshape(hist_index, (-1,)),
+                ivy.repeat(ivy.gather(y, samples, axis=0), n_features, axis=0),
+                ivy.repeat(ivy.gather(sample_weight, samples), n_features),
+                n_nodes * n_features * n_bins,
+                n_outputs,
+                max_n_classes,
+            ).reshape((n_nodes, n_features, n_bins, n_outputs, max_n_classes)),
+            axis=2,
+        )
+        sum_right = ivy.expand_dims(sum_total, axis=(1, 2)) - sum_left
+        n_right = ivy.reshape(n_node_samples, (-1, 1, 1)) - n_left
+        weighted_n_left = ivy.sum(sum_left[..., 0, :], axis=-1)
+        weighted_n_right = (
+            ivy.reshape(weighted_n_node_samples, (-1, 1, 1)) - weighted_n_left
+        )
+        impurity_left = _gini(sum_left, weighted_n_left)
+        impurity_right = _gini(sum_right, weighted_n_right)
+        valid = (
+            (n_left >= self.min_samples_leaf)
+            & (n_right >= self.min_samples_leaf)
+            & (weighted_n_left >= self.min_weight_leaf)
+            & (weighted_n_right >= self.min_weight_leaf)
+            & (weighted_n_left > 0)
+            & (weighted_n_right > 0)
+        )
+        proxy_improvement = ivy.where(
+            valid,
+            -weighted_n_right * impurity_right - weighted_n_left * impurity_left,
+            -INFINITY,
+        )
+        # the first best (feature, bin) of each node, bins with no samples of the
+        # node never come first as they split like the preceding bin
+        best = ivy.argmax(ivy.reshape(proxy_improvement, (n_nodes, -1)), axis=-1)
+        best_offset = ivy.arange(n_nodes, dtype="int64") * n_features * n_bins + best
+
+        def _at_best(x):
+            return ivy.gather(ivy.reshape(x, (-1,)), best_offset)
+
+        has_split = _at_best(proxy_improvement) > -INFINITY
+        feature = best // n_bins
+        best_bin = best % n_bins
+        # the first non-empty bin of the node on the right of the split
+        bin_counts = ivy.gather(
+            ivy.reshape(node_counts, (-1, n_bins)),
+            ivy.arange(n_nodes, dtype="int64") * n_features + feature,
+            axis=0,
+        )
+        next_bin = ivy.argmax(
+            (ivy.arange(n_bins, dtype="int64") > ivy.expand_dims(best_bin, axis=-1))
+            & (bin_counts > 0),
+            axis=-1,
+        )
+        value_left = ivy.gather(
+            ivy.reshape(bin_max, (-1,)), feature * n_bins + best_bin
+        )
+        value_right = ivy.gather(
+            ivy.reshape(bin_min, (-1,)), feature * n_bins + next_bin
+        )
+        threshold = value_left / 2.0 + value_right / 2.0
+        threshold = ivy.where(
+            (threshold == value_right) | ivy.isinf(threshold), value_left, threshold
+        )
+        weighted_n_left = _at_best(weighted_n_left)
+        weighted_n_right = _at_best(weighted_n_right)
+        improvement = (weighted_n_node_samples / weighted_n_samples) * (
+            impurity
+            - weighted_n_right / weighted_n_node_samples * _at_best(impurity_right)
+            - weighted_n_left / weighted_n_node_samples * _at_best(impurity_left)
+        )
+        return {
+            "is_leaf": ~has_split
+            | (improvement + EPSILON < self.min_impurity_decrease),
+            "feature": feature,
+            "bin": best_bin,
+            "threshold": threshold,
+            # missing values are binned in the last bin, which is on the right of
+            # every split, and predicting must route them the same way
+            "missing_go_to_left": ivy.zeros(n_nodes, dtype="bool"),
+        }
+
+    def _next_level(self, X_binned, node_of_sample, level, n_features):
+        is_split = ~level["is_leaf"]
+        n_split = int(ivy.sum(ivy.astype(is_split, "int64")))
+        active = node_of_sample >= 0
+        node_index = ivy.where(active, node_of_sample, 0)
+        split_rank = ivy.cumsum(ivy.astype(is_split, "int64")) - 1
+        sample_feature = ivy.gather(level["feature"], node_index)
+        go_left = ivy.gather(
+            ivy.reshape(X_binned, (-1,)),
+            ivy.arange(X_binned.shape[0], dtype="int64") * n_features + sample_feature,
+        ) <= ivy.gather(level["bin"], node_index)
+        # the left and right children of the k-th split node are 2k and 2k + 1
+        node_of_sample = ivy.where(
+            active & ivy.gather(is_split, node_index),
+            2 * ivy.gather(split_rank, node_index) + ivy.astype(~go_left, "int64"),
+            -1,
+        )
+        return node_of_sample, 2 * n_split
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+def _add_levels_to_tree(tree, levels):
+    level_lists = [
+        {key: ivy.to_list(value) for key, value in level.items() if key != "sum_total"}
+        for level in levels
+    ]
+    level_offsets = [0]
+    for level in level_lists:
+        level_offsets.append(level_offsets[-1] + len(level["is_leaf"]))
+        n_split = 0
+        level["split_rank"] = []
+        for is_leaf in level["is_leaf"]:
+            level["split_rank"].append(n_split)
+            n_split += not is_leaf
+    tree._resize(level_offsets[-1])
+    # add the nodes depth first, such that the node ids are the same as those of
+    # the DepthFirstTreeBuilder
+    value_indices = []
+    builder_stack = [(0, 0, _TREE_UNDEFINED, False)]
+    while builder_stack:
+        depth, i, parent, is_left = builder_stack.pop()
+        level = level_lists[depth]
+        is_leaf = level["is_leaf"][i]
+        node_id = tree._add_node(
+            parent,
+            is_left,
+            is_leaf,
+            level["feature"][i],
+            level["threshold"][i],
+            level["impurity"][i],
+            int(level["n_node_samples"][i]),
+            level["weighted_n_node_samples"][i],
+            level["missing_go_to_left"][i],
+        )
+        value_indices.append(level_offsets[depth] + i)
+        if not is_leaf:
+            k = level["split_rank"][i]
+            builder_stack.append((depth + 1, 2 * k + 1, node_id, False))
+            builder_stack.append((depth + 1, 2 * k, node_id, True))
+    tree.value = ivy.astype(
+        ivy.gather(
+            ivy.concat([level["sum_total"] for level in levels]),
+            ivy.array(value_indices, dtype="int64"),
+            axis=0,
+        ),
+        ivy.float32,
+    )
+
+
+def _bin_features(X, max_bins):
+    # the upper and lower bounds of the bins of each feature are values of X, such
+    # that the thresholds between bins are the midpoints used by the BestSplitter
+    X_binned, bin_min, bin_max = [], [], []
+    for f in range(X.shape[1]):
+        column = ivy.astype(X[:, f], "float64")
+        values = ivy.sort(column[~ivy.isnan(column)])
+        upper = ivy.unique_values(values)
+        if upper.shape[0] > max_bins:
+            quantiles = ivy.linspace(0, values.shape[0] - 1, max_bins)
+            upper = ivy.unique_values(
+                ivy.gather(values, ivy.astype(quantiles, "int64"))
+            )
+            lower = ivy.concat(
+                [
+                    values[:1],
+                    ivy.gather(
+                        values, ivy.searchsorted(values, upper[:-1], side="right")
+                    ),
+                ]
+            )
+        else:
+            lower = upper
+        # missing values end up in the last bin, like values above the maximum
+        X_binned.append(
+            ivy.clip(ivy.searchsorted(upper, column), 0, max(upper.shape[0] - 1, 0))
+        )
+        bin_min.append(lower)
+        bin_max.append(upper)
+    n_bins = max(max(bounds.shape[0] for bounds in bin_max), 1)
+
+    def _pad(bounds):
+        return ivy.stack(
+            [
+                ivy.concat([b, ivy.zeros(n_bins - b.shape[0], dtype="float64")])
+                for b in bounds
+            ]
+        )
+
+    return ivy.stack(X_binned, axis=1), _pad(bin_min), _pad(bin_max)
+
+
+def _class_histogram(index, y, weights, size, n_outputs, max_n_classes):
+    # weighted class counts of each output for the samples of each of the bins
+    class_index = (
+        ivy.expand_dims(index, axis=-1) * n_outputs
+        + ivy.arange(n_outputs, dtype="int64")
+    ) * max_n_classes + y
+    weights = ivy.broadcast_to(ivy.expand_dims(weights, axis=-1), class_index.shape)
+    counts = ivy.bincount(
+        ivy.reshape(class_index, (-1,)),
+        weights=ivy.reshape(weights, (-1,)),
+        minlength=size * n_outputs * max_n_classes,
+    )
+    return ivy.reshape(counts, (size, n_outputs, max_n_classes))
+
+
+def _gini(sum_total, weighted_n):
+    weighted_n = ivy.expand_dims(ivy.where(weighted_n > 0, weighted_n, 1.0), axis=-1)
+    return ivy.mean(
+        1.0 - ivy.sum(sum_total * sum_total, axis=-1) / (weighted_n * weighted_n),
+        axis=-1,
+    )
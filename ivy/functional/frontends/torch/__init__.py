@@ -237,6 +237,13 @@ def promote_types_of_torch_inputs(
     used as inputs only for those functions that expect an array-like or
     tensor-like objects, otherwise it might give unexpected results.
     """
+    if (
+        isinstance(x1, ivy.Array)
+        and isinstance(x2, ivy.Array)
+        and x1.dtype == x2.dtype
+    ):
+        # arrays of the same dtype have nothing to promote
+        return x1, x2
     if ivy.isscalar(x1) and ivy.is_int_dtype(x1):
         x1 = ivy.asarray(x1, dtype="int64")
     elif ivy.isscalar(x1):
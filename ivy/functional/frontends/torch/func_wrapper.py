@@ -1,10 +1,12 @@
 # global
 import functools
+from collections import UserDict
 from typing import Callable
 
 # local
 import ivy
 import ivy.functional.frontends.torch as torch_frontend
+from ivy.functional.ivy.gradients import _variable
 
 
 numpy_compatible_args = {
@@ -16,6 +18,9 @@ numpy_compatible_args = {
     "x2": "other",
 }
 
+# the arguments which nested_map traverses rather than converts
+_nested_types = (list, tuple, dict, UserDict, slice, ivy.FlatNest)
+
 
 class AccumulateGrad:
     def __init__(self) -> None:
@@ -29,7 +34,8 @@ class AccumulateGrad:
         return self.__name__ == __value
 
     def __call__(self, grads):
-        self.__self__._grads = grads
+        tensor = self.__self__
+        tensor._grads = grads if tensor._grads is None else tensor._grads + grads
         return None
 
 
@@ -40,47 +46,39 @@ class GradFn:
         self.next_functions = []
         for idx, input in [*enumerate(args), *kwargs.items()]:
             if isinstance(input, torch_frontend.Tensor) and input.requires_grad:
+                if input.grad_fn is not None:
+                    next_function = input.grad_fn
+                elif input.is_leaf:
+                    next_function = AccumulateGrad()
+                    next_function.__self__ = input
+                else:
+                    continue
                 self._inputs.append(input.detach())
 
                 def wrap_fn(idx):
-                    def d_fn(x):
+                    # the vector-jacobian product of fn with respect to the
+                    # input at idx is the gradient of this scalar
+                    def d_fn(x, cotangent):
                         if idx in kwargs:
-                            return fn(
-                                *args,
-                                **{
-                                    key: value
-                                    for key, value in kwargs.items()
-                                    if key != idx
-                                },
-                                idx=x,
-                            )
-                        return fn(*args[:idx], x, *args[idx + 1 :], **kwargs)
+                            ret = fn(*args, **{**kwargs, idx: x})
+                        else:
+                            ret = fn(*args[:idx], x, *args[idx + 1 :], **kwargs)
+                        return ivy.sum(ivy.multiply(ret, cotangent))
 
                     return d_fn
 
-                self._fns.append(to_ivy_arrays_and_back(ivy.jac(wrap_fn(idx))))
-                if input.grad_fn is not None:
-                    self.next_functions.append(input.grad_fn)
-                elif input.is_leaf:
-                    acc_grad = AccumulateGrad()
-                    acc_grad.__self__ = input
-                    self.next_functions.append(acc_grad)
+                self._fns.append(wrap_fn(idx))
+                self.next_functions.append(next_function)
         self.__name__ = fn.__name__.capitalize() + "Backward"
 
     def __call__(self, prev_grads):
+        cotangent = ivy.stop_gradient(_to_ivy_array(prev_grads), preserve_type=False)
         result = []
-        for input_tensor, jac_fn in zip(self._inputs, self._fns):
-            jacobian = jac_fn(input_tensor)
-            dims = list(range(jacobian.dim()))
-            permuted_dims = dims[input_tensor.dim() :] + dims[: input_tensor.dim()]
-            result.append(
-                (
-                    jacobian.permute(dims=permuted_dims).reshape(
-                        shape=(*input_tensor.shape, -1)
-                    )
-                    * prev_grads.ravel()
-                ).sum(-1)
+        for input_tensor, vjp_fn in zip(self._inputs, self._fns):
+            _, grad = ivy.value_and_grad(lambda x: vjp_fn(x, cotangent))(
+                _variable(input_tensor.ivy_array)
             )
+            result.append(torch_frontend.Tensor(grad, _init_overload=True))
         return result
 
     def __repr__(self):
@@ -94,6 +92,37 @@ class GradFn:
 # --------------- #
 
 
+def _backward(grad_fn, grad):
+    # the number of edges into each node of the graph, such that each node is
+    # only called once the gradients of all of its outputs are accumulated
+    num_pending = {}
+    nodes = [grad_fn]
+    visited = {id(grad_fn)}
+    while nodes:
+        node = nodes.pop()
+        for next_function in node.next_functions:
+            key = id(next_function)
+            num_pending[key] = num_pending.get(key, 0) + 1
+            if key not in visited:
+                visited.add(key)
+                nodes.append(next_function)
+
+    # visit the nodes in topological order, from the output to the leaves
+    grads = {id(grad_fn): grad}
+    ready = [grad_fn]
+    while ready:
+        node = ready.pop()
+        node_grads = node(grads.pop(id(node)))
+        if node_grads is None:
+            continue
+        for next_function, next_grad in zip(node.next_functions, node_grads):
+            key = id(next_function)
+            grads[key] = next_grad if key not in grads else grads[key] + next_grad
+            num_pending[key] -= 1
+            if num_pending[key] == 0:
+                ready.append(next_function)
+
+
 def _from_ivy_array_to_torch_frontend_tensor(
     x, nested=False, include_derived=None, requires_grad=False
 ):
@@ -112,6 +141,15 @@ def _from_ivy_array_to_torch_frontend_tensor(
     return x
 
 
+@functools.lru_cache(maxsize=None)
+def _creation_op_names():
+    return frozenset(dir(torch_frontend.creation_ops))
+
+
+def _is_array_like(x):
+    return isinstance(x, (ivy.Array, ivy.NativeArray)) or hasattr(x, "ivy_array")
+
+
 def _to_ivy_array(x):
     # if x is a native array return it as an ivy array
     if isinstance(x, ivy.NativeArray):
@@ -137,6 +175,15 @@ def inputs_to_ivy_arrays(fn: Callable) -> Callable:
         into `ivy.Array` instances, and then call the function with the updated
         arguments.
         """
+        # most ops are called with tensors and python scalars only, which are
+        # converted directly rather than through nested_map
+        if not any(isinstance(a, _nested_types) for a in args) and not any(
+            isinstance(v, _nested_types) for v in kwargs.values()
+        ):
+            return fn(
+                *[_to_ivy_array(a) for a in args],
+                **{k: _to_ivy_array(v) for k, v in kwargs.items()},
+            )
         # convert all input arrays to ivy.Array instances
         new_args = ivy.nested_map(
             _to_ivy_array, args, include_derived={"tuple": True}, shallow=False
@@ -176,9 +223,11 @@ def outputs_to_frontend_arrays(fn: Callable) -> Callable:
         # call unmodified function
         # ToDo: Remove this default dtype setting
         #  once frontend specific backend setting is added
+        # the default dtypes only affect the ops creating arrays from python
+        # values, so they aren't set when the inputs already are arrays
         set_default_dtype = False
-        if not ("dtype" in kwargs and ivy.exists(kwargs["dtype"])) and all(
-            not (ivy.is_array(i) or hasattr(i, "ivy_array")) for i in args
+        if not ("dtype" in kwargs and ivy.exists(kwargs["dtype"])) and not any(
+            _is_array_like(i) for i in [*args, *kwargs.values()]
         ):
             if ivy.current_backend_str() == "jax":
                 import jax
@@ -193,26 +242,27 @@ def outputs_to_frontend_arrays(fn: Callable) -> Callable:
             if set_default_dtype:
                 ivy.unset_default_int_dtype()
                 ivy.unset_default_float_dtype()
-        # convert all arrays in the return to `torch_frontend.Tensor` instances
-        ret = _from_ivy_array_to_torch_frontend_tensor(
-            ret,
-            nested=True,
-            include_derived={"tuple": True},
-            requires_grad=kwargs.get(
-                "requires_grad",
-                any(
-                    isinstance(i, torch_frontend.Tensor) and i.requires_grad
-                    for i in args
-                ),
-            ),
+        requires_grad = kwargs.get(
+            "requires_grad",
+            any(isinstance(i, torch_frontend.Tensor) and i.requires_grad for i in args),
         )
-
-        def array_fn(x):
-            return ivy.is_array(x) or hasattr(x, "ivy_array")
+        # convert all arrays in the return to `torch_frontend.Tensor` instances
+        if isinstance(ret, (ivy.Array, ivy.NativeArray)):
+            # a single array needs no traversal of the return
+            ret = torch_frontend.Tensor(
+                ret, _init_overload=True, requires_grad=requires_grad
+            )
+        else:
+            ret = _from_ivy_array_to_torch_frontend_tensor(
+                ret,
+                nested=True,
+                include_derived={"tuple": True},
+                requires_grad=requires_grad,
+            )
 
         if "inplace" in kwargs and kwargs["inplace"]:
             first_array = ivy.func_wrapper._get_first_array(
-                *args, array_fn=array_fn, **kwargs
+                *args, array_fn=_is_array_like, **kwargs
             )
             native_ret_data = ret.ivy_array.data
             if ivy.is_ivy_array(first_array):
@@ -226,7 +276,7 @@ def outputs_to_frontend_arrays(fn: Callable) -> Callable:
 
         # logic for setting is_leaf
         if ret is not None and isinstance(ret, torch_frontend.Tensor):
-            if fn.__name__ in dir(torch_frontend.creation_ops):
+            if fn.__name__ in _creation_op_names():
                 ret.is_leaf = True
             elif all(
                 not isinstance(i, torch_frontend.Tensor)
@@ -5,6 +5,8 @@ from ivy.functional.ivy.gradients import _variable, _is_variable, _variable_data
 
 
 class Parameter(Tensor):
+    __slots__ = ("_data",)
+
     def __init__(self, data=None, device=None, requires_grad=True):
         if data is None:
             data = torch_frontend.empty(0)
@@ -12,17 +12,34 @@ from ivy.func_wrapper import with_unsupported_dtypes
 from ivy.func_wrapper import with_supported_dtypes
 from ivy.func_wrapper import with_supported_device_and_dtypes
 from ivy.functional.frontends.torch.func_wrapper import (
+    _backward,
     _to_ivy_array,
     numpy_to_torch_style_args,
 )
 
 
 class Tensor:
+    # the tensors created by each frontend op are short-lived, so they hold
+    # their state in slots rather than in a per-instance dict, while remaining
+    # weakly referenceable
+    __slots__ = (
+        "_ivy_array",
+        "_grads",
+        "_requires_grad",
+        "_is_leaf",
+        "grad_fn",
+        "__weakref__",
+    )
+
     def __init__(self, array, device=None, _init_overload=False, requires_grad=False):
         if _init_overload:
-            self._ivy_array = (
-                array if isinstance(array, ivy.Array) else ivy.array(array)
-            )
+            if isinstance(array, ivy.Array):
+                self._ivy_array = array
+            elif isinstance(array, ivy.NativeArray):
+                # wrap the native array as it is, without going through asarray
+                self._ivy_array = ivy.Array(array)
+            else:
+                self._ivy_array = ivy.array(array)
         else:
             self._ivy_array = ivy.array(
                 array, dtype=torch_frontend.float32, device=device
@@ -47,12 +64,6 @@ class Tensor:
     def __hash__(self):
         return id(self)
 
-    def __setattr__(self, name, value):
-        if name == "data":
-            self.ivy_array = value.ivy_array
-        else:
-            super().__setattr__(name, value)
-
     # Properties #
     # ---------- #
 
@@ -131,6 +142,10 @@ class Tensor:
     def ivy_array(self, array):
         self._ivy_array = array if isinstance(array, ivy.Array) else ivy.array(array)
 
+    @data.setter
+    def data(self, value):
+        self.ivy_array = value.ivy_array
+
     @requires_grad.setter
     def requires_grad(self, requires_grad):
         self._requires_grad = requires_grad
@@ -1915,14 +1930,10 @@ class Tensor:
             assert self.shape == gradient.shape, "Mismatch in shape"
             self._grads = gradient
             return
-        _grad_list = self.grad_fn(
-            gradient if gradient is not None else torch_frontend.tensor(1.0)
+        _backward(
+            self.grad_fn,
+            gradient if gradient is not None else torch_frontend.tensor(1.0),
         )
-        for idx, next_function in enumerate(self.grad_fn.next_functions):
-            if next_function.__self__.grad_fn is not None:
-                next_function.__self__.backward(_grad_list[idx])
-            else:
-                next_function(_grad_list[idx])
 
     @with_unsupported_dtypes({"2.2 and below": ("float16", "bfloat16")}, "torch")
     def logaddexp(self, other):
@@ -8,14 +8,13 @@ def batched_nms(boxes, scores, idxs, iou_threshold):
     if boxes.size == 0:
         return ivy.array([], dtype=ivy.int64)
     else:
-        max_coordinate = boxes.max()
-        boxes_dtype = boxes.dtype
-        offsets = idxs.astype(boxes_dtype) * (
-            max_coordinate + ivy.array(1, dtype=boxes_dtype)
+        keep, num_keep = ivy.batched_nms(
+            boxes[None],
+            scores[None],
+            class_ids=idxs[None],
+            iou_threshold=iou_threshold,
         )
-        boxes_for_nms = boxes + offsets[:, None]
-        keep = nms(boxes_for_nms, scores, iou_threshold)
-        return keep
+        return keep[0, : int(num_keep[0])]
 
 
 @to_ivy_arrays_and_back
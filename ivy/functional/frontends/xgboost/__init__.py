@@ -10,5 +10,7 @@ from . import sklearn
 from .sklearn import *
 from . import training
 from .training import *
+from . import tree
+from .tree import *
 
 _frontend_array = DMatrix
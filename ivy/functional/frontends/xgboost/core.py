@@ -1,6 +1,6 @@
 import ivy
 from ivy.func_wrapper import with_unsupported_dtypes
-from .gbm import GBLinear
+from .gbm import GBLinear, GBTree
 
 
 class DMatrix:
@@ -111,8 +111,11 @@ class Booster:
             }
         )
 
-        # create gbm(as for now only gblinear booster is available)
-        self.gbm = GBLinear(params, compile=compile, cache=cache)
+        # create gbm, gblinear is kept as the default for backward compatibility
+        if params.get("booster") == "gbtree":
+            self.gbm = GBTree(params, compile=compile, cache=cache)
+        else:
+            self.gbm = GBLinear(params, compile=compile, cache=cache)
         self.compile = compile
         if self.compile:
             self._comp_binary_prediction = ivy.trace_graph(
@@ -217,7 +220,7 @@ class Booster:
         """
         # currently supports prediction for binary task
         # get raw predictions
-        pred = self.gbm.pred(data)
+        pred = self.gbm.pred(data, iteration_range=tuple(iteration_range or (0, 0)))
         args = (self.gbm.obj, pred)
 
         if self.compile:
@@ -5,7 +5,13 @@ from ivy.functional.frontends.xgboost.objective.regression_loss import (
 from ivy.functional.frontends.xgboost.linear.updater_coordinate import (
     coordinate_updater,
 )
+from ivy.functional.frontends.xgboost.tree.hist_util import bin_data, quantile_cuts
+from ivy.functional.frontends.xgboost.tree.updater_quantile_hist import (
+    predict_trees,
+    quantile_hist_updater,
+)
 from copy import deepcopy
+import weakref
 
 
 class GBLinear:
@@ -116,7 +122,11 @@ class GBLinear:
         return self.is_converged_
 
     # used to obtain raw predictions
-    def pred(self, data):
+    def pred(self, data, iteration_range=(0, 0)):
+        start, stop = iteration_range
+        # the weights of the linear booster sum all the rounds up
+        if start or stop not in (0, self.num_boosted_rounds):
+            raise ValueError("Linear booster does not support prediction range.")
         args = (data, self.weight, self.base_margin)
         if self.compile:
             return self._comp_pred(*args)
@@ -149,6 +159,131 @@ class GBLinear:
                 self.weight = self.updater(*args)
 
 
+class GBTree:
+    def __init__(self, params=None, compile=False, cache=None):
+        # we start boosting from zero
+        self.num_boosted_rounds = 0
+
+        # the trees are grown with the quantile histogram updater, corresponding to
+        # xgboost's tree_method="hist" with the default depthwise grow policy
+        self.updater = quantile_hist_updater
+
+        # LogisticRegression corresponds to 'binary:logistic' objective in terms of
+        # calculations
+        self.obj = LogisticRegression()
+
+        self.base_score = self.obj.prob_to_margin(params["base_score"])
+        self.base_margin = (
+            params["base_margin"] if params.get("base_margin") else self.base_score
+        )
+        self.scale_pos_weight = (
+            1.0 if not params.get("scale_pos_weight") else params["scale_pos_weight"]
+        )
+        self.num_feature = params["num_feature"]
+
+        # tree parameters, with xgboost's defaults
+        self.max_depth = _get_param(params, "max_depth", 6)
+        self.max_bin = _get_param(params, "max_bin", 256)
+        self.learning_rate = _get_param(params, "learning_rate", 0.3)
+        self.reg_lambda = _get_param(params, "reg_lambda", 1.0)
+        self.reg_alpha = _get_param(params, "reg_alpha", 0.0)
+        self.gamma = _get_param(params, "gamma", 0.0)
+        self.min_child_weight = _get_param(params, "min_child_weight", 1.0)
+        self.max_delta_step = _get_param(params, "max_delta_step", 0.0)
+
+        # the node arrays of each tree, stacked on demand for prediction
+        self.trees = []
+        self._stacked_trees = None
+
+        # the histogram cuts are computed once from the training data
+        self.cuts = None
+        self._binned_cache = None
+
+        # raw predictions of the data seen so far, along with the number of trees
+        # they include, such that each round only adds the contribution of the new
+        # trees, like xgboost's prediction cache. The entries are keyed by the id
+        # of the data, and removed when the data is freed
+        self._prediction_cache = {}
+
+        # tracing the data dependent tree growth is not supported
+        self.compile = compile
+
+    def boosted_rounds(self):
+        return self.num_boosted_rounds
+
+    def model_fitted(self):
+        return self.num_boosted_rounds != 0
+
+    def _get_stacked_trees(self, start, stop):
+        if self._stacked_trees is None or len(self.trees) != self._stacked_trees[0]:
+            self._stacked_trees = (
+                len(self.trees),
+                {
+                    key: ivy.stack([tree[key] for tree in self.trees])
+                    for key in self.trees[0]
+                },
+            )
+        return {key: value[start:stop] for key, value in self._stacked_trees[1].items()}
+
+    def _predict_trees(self, data, start, stop):
+        if start >= stop:
+            return ivy.zeros((data.shape[0], 1), dtype="float64")
+        contribution = predict_trees(
+            data, self._get_stacked_trees(start, stop), self.max_depth
+        )
+        return ivy.expand_dims(contribution, axis=1)
+
+    # used to obtain raw predictions
+    def pred(self, data, iteration_range=(0, 0)):
+        start, stop = iteration_range
+        stop = stop or len(self.trees)
+        if start or stop != len(self.trees):
+            return self._predict_trees(data, start, stop) + self.base_margin
+        cached = self._prediction_cache.get(id(data))
+        if cached is None:
+            cached = [ivy.zeros((data.shape[0], 1)), 0]
+            self._prediction_cache[id(data)] = cached
+            weakref.finalize(data, self._prediction_cache.pop, id(data), None)
+        if cached[1] < len(self.trees):
+            cached[0] = cached[0] + self._predict_trees(
+                data, cached[1], len(self.trees)
+            )
+            cached[1] = len(self.trees)
+        return cached[0] + self.base_margin
+
+    def get_gradient(self, pred, label):
+        label = ivy.reshape(label, (-1, 1))
+        return _get_gradient(self.obj, pred, label, self.scale_pos_weight)
+
+    def do_boost(self, data, gpair, iter):
+        if self.cuts is None:
+            self.cuts = quantile_cuts(data, self.max_bin)
+        if self._binned_cache is None or self._binned_cache[0]() is not data:
+            self._binned_cache = (weakref.ref(data), bin_data(data, self.cuts))
+        tree, position = self.updater(
+            gpair,
+            self._binned_cache[1],
+            self.cuts,
+            self.max_depth,
+            self.learning_rate,
+            self.reg_lambda,
+            self.reg_alpha,
+            self.gamma,
+            self.min_child_weight,
+            self.max_delta_step,
+        )
+        # the leaves of the training samples are known, so their cached
+        # predictions are updated without traversing the new tree
+        cached = self._prediction_cache.get(id(data))
+        if cached is not None and cached[1] == len(self.trees):
+            cached[0] = cached[0] + ivy.expand_dims(
+                ivy.gather(tree["leaf_value"], position), axis=1
+            )
+            cached[1] += 1
+        self.trees.append(tree)
+        self.num_boosted_rounds += 1
+
+
 # --- Helpers --- #
 # --------------- #
 
@@ -173,3 +308,8 @@ def _get_gradient(obj, pred, label, scale_pos_weight):
 
 def _pred(dt, w, base):
     return ivy.matmul(dt, w[:-1]) + w[-1] + base
+
+
+def _get_param(params, name, default):
+    value = params.get(name)
+    return default if value is None else value
@@ -1,3 +1,4 @@
+import ivy
 from .core import Booster
 
 
@@ -78,11 +79,71 @@ def train(
     """
     # this function creates an instance of Booster and calls its update method
     # to learn model parameters
-    # ToDo: add handling for callbacks and write training history
+    # ToDo: add handling for callbacks
 
     bst = Booster(params, cache=[dtrain, dlabel], model_file=xgb_model)
+    evals = list(evals) if evals else []
+    metrics = _get_eval_metrics(params)
+    if evals_result is not None:
+        evals_result.clear()
+    best_score, best_iteration = None, 0
 
     for i in range(num_boost_round):
         bst.update(dtrain, dlabel, iteration=i, fobj=obj)
+        if not evals:
+            continue
 
+        # the predictions of the evaluation sets are cached by the booster, so each
+        # round only adds the contribution of the new trees
+        results = [
+            (name, metric, _evaluate(metric, bst.gbm.pred(dmat.data), dmat.label))
+            for dmat, name in evals
+            for metric in metrics
+        ]
+        if evals_result is not None:
+            for name, metric, score in results:
+                evals_result.setdefault(name, {}).setdefault(metric, []).append(score)
+        if verbose_eval and (
+            isinstance(verbose_eval, bool) or i % verbose_eval == 0
+        ):
+            print(f"[{i}]\t" + "\t".join(f"{n}-{m}:{s:.5f}" for n, m, s in results))
+
+        if early_stopping_rounds:
+            score = results[-1][2]
+            if best_score is None or (
+                score > best_score if maximize else score < best_score
+            ):
+                best_score, best_iteration = score, i
+            elif i - best_iteration >= early_stopping_rounds:
+                break
+
+    if early_stopping_rounds and evals:
+        bst.best_iteration = best_iteration
+        bst.best_score = best_score
     return bst
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+def _evaluate(metric, margin, label):
+    label = ivy.reshape(ivy.astype(label, "float64"), (-1,))
+    prob = ivy.sigmoid(ivy.reshape(ivy.astype(margin, "float64"), (-1,)))
+    if metric == "logloss":
+        prob = ivy.clip(prob, 1e-16, 1.0 - 1e-16)
+        score = -ivy.mean(label * ivy.log(prob) + (1.0 - label) * ivy.log(1.0 - prob))
+    elif metric == "error":
+        score = ivy.mean(ivy.astype((prob > 0.5) != (label > 0.5), "float64"))
+    else:
+        score = ivy.sqrt(ivy.mean(ivy.square(prob - label)))
+    return float(score)
+
+
+def _get_eval_metrics(params):
+    # logloss is the default metric of the binary:logistic objective
+    metrics = params.get("eval_metric") or ["logloss"]
+    metrics = [metrics] if isinstance(metrics, str) else list(metrics)
+    for metric in metrics:
+        ivy.utils.assertions.check_elem_in_list(metric, ["logloss", "error", "rmse"])
+    return metrics
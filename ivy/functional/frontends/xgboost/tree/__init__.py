@@ -0,0 +1,4 @@
+from . import hist_util
+from .hist_util import *
+from . import updater_quantile_hist
+from .updater_quantile_hist import *
@@ -0,0 +1,76 @@
+import ivy
+
+
+def quantile_cuts(data, max_bin):
+    """Compute the histogram cuts of each feature. Features with no more than
+    ``max_bin`` distinct values get one bin per value, the others are cut at
+    quantiles of their values. Like in xgboost, a value falls in the bin of the
+    first cut greater than it, and the last cut of each feature is above its
+    maximum.
+
+    Parameters
+    ----------
+    data
+        Training data of shape (n_samples, n_features).
+    max_bin
+        Maximum number of bins per feature.
+
+    Returns
+    -------
+        Cuts of shape (n_features, n_bins), the cuts of features with fewer bins
+        are padded with their last cut.
+    """
+    cuts = []
+    for f in range(data.shape[1]):
+        column = ivy.astype(data[:, f], "float64")
+        values = ivy.sort(column[~ivy.isnan(column)])
+        if not values.shape[0]:
+            cuts.append(ivy.array([ivy.inf], dtype="float64"))
+            continue
+        candidates = ivy.unique_values(values)
+        if candidates.shape[0] > max_bin:
+            positions = ivy.linspace(0, values.shape[0] - 1, max_bin)
+            candidates = ivy.unique_values(
+                ivy.gather(values, ivy.astype(positions, "int64"))
+            )
+        upper = candidates[-1] + ivy.abs(candidates[-1]) + 1e-5
+        cuts.append(ivy.concat([candidates[1:], ivy.expand_dims(upper, axis=0)]))
+    n_bins = max(feature_cuts.shape[0] for feature_cuts in cuts)
+    return ivy.stack(
+        [
+            ivy.concat(
+                [c, ivy.repeat(c[-1:], n_bins - c.shape[0])]
+                if c.shape[0] < n_bins
+                else [c]
+            )
+            for c in cuts
+        ]
+    )
+
+
+def bin_data(data, cuts):
+    """Map each value of the data to the index of its bin.
+
+    Parameters
+    ----------
+    data
+        Data of shape (n_samples, n_features).
+    cuts
+        Cuts of shape (n_features, n_bins) returned by ``quantile_cuts``.
+
+    Returns
+    -------
+        Bin indices of shape (n_samples, n_features).
+    """
+    n_bins = cuts.shape[1]
+    data = ivy.astype(data, "float64")
+    # missing values fall in the last bin
+    return ivy.stack(
+        [
+            ivy.clip(
+                ivy.searchsorted(cuts[f], data[:, f], side="right"), 0, n_bins - 1
+            )
+            for f in range(data.shape[1])
+        ],
+        axis=1,
+    )
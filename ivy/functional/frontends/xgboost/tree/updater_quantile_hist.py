@@ -0,0 +1,290 @@
+import ivy
+
+# minimal loss change of a split, xgboost's kRtEps
+RT_EPS = 1e-6
+# the maximal number of (node, feature, bin) entries of the histograms built at once
+MAX_HISTOGRAM_SIZE = 2**24
+
+
+def quantile_hist_updater(
+    gpair,
+    binned_data,
+    cuts,
+    max_depth,
+    lr,
+    reg_lambda,
+    reg_alpha,
+    gamma,
+    min_child_weight,
+    max_delta_step,
+    max_histogram_size=MAX_HISTOGRAM_SIZE,
+):
+    """Grow one regression tree depthwise from gradient histograms. The nodes
+    of the tree are stored in heap order, the children of node ``i`` being
+    ``2i + 1`` and ``2i + 2``, such that all the nodes of a level are split
+    together: the gradient and hessian histograms of the nodes of the level
+    holding samples are computed with a bincount per chunk of nodes, and the
+    best split of each node is found with batched reductions over their
+    cumulative sums.
+
+    Parameters
+    ----------
+    gpair
+        Array of shape (n_samples, 2) holding gradient-hessian pairs.
+    binned_data
+        Bin indices of the training data of shape (n_samples, n_features).
+    cuts
+        Cuts of shape (n_features, n_bins) of the bins.
+    max_depth
+        Maximum depth of the tree.
+    lr
+        Learning rate.
+    reg_lambda
+        L2 regularization of the leaf weights.
+    reg_alpha
+        L1 regularization of the leaf weights.
+    gamma
+        Minimum loss reduction required to split a node.
+    min_child_weight
+        Minimum sum of hessians of each child of a split.
+    max_delta_step
+        Maximum absolute leaf weight, no constraint when 0.
+    max_histogram_size
+        Maximum number of (node, feature, bin) entries of the histograms built
+        at once, which bounds the memory of the deep levels.
+
+    Returns
+    -------
+        A dict holding the ``"split_feature"``, ``"split_bin"``,
+        ``"split_condition"``, ``"is_leaf"`` and ``"leaf_value"`` arrays of the
+        nodes, and the leaf of each training sample.
+    """
+    n_samples, n_features = binned_data.shape
+    n_bins = cuts.shape[1]
+    grad = ivy.astype(gpair[:, 0], "float64")
+    hess = ivy.astype(gpair[:, 1], "float64")
+    # samples with negative hessians are ignored, like in the linear updater
+    hess_mask = ivy.astype(hess >= 0.0, "float64")
+    grad, hess = grad * hess_mask, hess * hess_mask
+    binned_flat = ivy.reshape(binned_data, (-1,))
+    row_offsets = ivy.arange(n_samples, dtype="int64") * n_features
+    position = ivy.zeros(n_samples, dtype="int64")
+    is_open = ivy.ones(n_samples, dtype="bool")
+    levels = []
+    for depth in range(max_depth + 1):
+        n_nodes = 2**depth
+        local = ivy.where(is_open, position - (n_nodes - 1), 0)
+        open_grad = ivy.where(is_open, grad, 0.0)
+        open_hess = ivy.where(is_open, hess, 0.0)
+        sum_grad = ivy.bincount(local, weights=open_grad, minlength=n_nodes)
+        sum_hess = ivy.bincount(local, weights=open_hess, minlength=n_nodes)
+        leaf_value = _calc_weight(
+            sum_grad, sum_hess, reg_lambda, reg_alpha, max_delta_step
+        )
+        level = {
+            "split_feature": ivy.zeros(n_nodes, dtype="int64"),
+            "split_bin": ivy.zeros(n_nodes, dtype="int64"),
+            "split_condition": ivy.zeros(n_nodes, dtype="float64"),
+            "is_leaf": ivy.ones(n_nodes, dtype="bool"),
+            "leaf_value": leaf_value * lr,
+        }
+        levels.append(level)
+        if depth == max_depth or not ivy.any(is_open):
+            break
+        # only the nodes holding samples are split, a chunk of them at a time
+        has_samples = (
+            ivy.bincount(
+                local, weights=ivy.astype(is_open, "float64"), minlength=n_nodes
+            )
+            > 0
+        )
+        candidates = ivy.nonzero(has_samples)[0]
+        candidate_rank = ivy.cumsum(ivy.astype(has_samples, "int64")) - 1
+        sample_rank = ivy.where(is_open, ivy.gather(candidate_rank, local), -1)
+        chunk_size = max(1, max_histogram_size // (n_features * n_bins))
+        splits = []
+        for start in range(0, candidates.shape[0], chunk_size):
+            chunk = candidates[start : start + chunk_size]
+            splits.append(
+                _best_splits(
+                    binned_data,
+                    sample_rank - start,
+                    chunk.shape[0],
+                    grad,
+                    hess,
+                    ivy.gather(sum_grad, chunk),
+                    ivy.gather(sum_hess, chunk),
+                    n_bins,
+                    reg_lambda,
+                    reg_alpha,
+                    gamma,
+                    min_child_weight,
+                )
+            )
+        split_feature, split_bin, is_split = (
+            ivy.scatter_nd(
+                ivy.expand_dims(candidates, axis=-1),
+                ivy.concat([ivy.astype(split[i], "int64") for split in splits]),
+                shape=(n_nodes,),
+            )
+            for i in range(3)
+        )
+        is_split = ivy.astype(is_split, "bool")
+        level["split_feature"] = split_feature
+        level["split_bin"] = split_bin
+        level["split_condition"] = ivy.gather(
+            ivy.reshape(cuts, (-1,)), split_feature * n_bins + split_bin
+        )
+        level["is_leaf"] = ~is_split
+        # move the samples of the split nodes to their children
+        sample_split = is_open & ivy.gather(is_split, local)
+        go_right = ivy.gather(
+            binned_flat, row_offsets + ivy.gather(split_feature, local)
+        ) > ivy.gather(split_bin, local)
+        position = ivy.where(
+            sample_split, 2 * position + 1 + ivy.astype(go_right, "int64"), position
+        )
+        is_open = sample_split
+    # the levels below the last one are never reached, they are padded such that
+    # all the trees of a model have the same number of nodes
+    for depth in range(len(levels), max_depth + 1):
+        n_nodes = 2**depth
+        levels.append(
+            {
+                key: ivy.zeros(n_nodes, dtype=value.dtype)
+                for key, value in levels[0].items()
+            }
+        )
+    tree = {
+        key: ivy.concat([level[key] for level in levels]) for key in levels[0].keys()
+    }
+    return tree, position
+
+
+def predict_trees(data, trees, max_depth):
+    """Compute the sum of the leaf values reached by each sample in each tree,
+    moving the samples down all the trees together, one level at a time.
+
+    Parameters
+    ----------
+    data
+        Data of shape (n_samples, n_features).
+    trees
+        A dict of node arrays of shape (n_trees, n_nodes), as returned by
+        ``quantile_hist_updater`` and stacked.
+    max_depth
+        Maximum depth of the trees.
+
+    Returns
+    -------
+        Array of shape (n_samples,) holding the sum of the leaf values.
+    """
+    n_samples, n_features = data.shape
+    n_trees, n_nodes = trees["is_leaf"].shape
+    if not n_trees:
+        return ivy.zeros(n_samples, dtype="float64")
+    flat = {key: ivy.reshape(value, (-1,)) for key, value in trees.items()}
+    data_flat = ivy.reshape(ivy.astype(data, "float64"), (-1,))
+    row_offsets = ivy.arange(n_samples, dtype="int64") * n_features
+    tree_offsets = ivy.arange(n_trees, dtype="int64") * n_nodes
+    node = ivy.zeros((n_samples, n_trees), dtype="int64")
+    for _ in range(max_depth):
+        index = node + tree_offsets
+        value = ivy.gather(
+            data_flat,
+            ivy.expand_dims(row_offsets, axis=-1)
+            + ivy.gather(flat["split_feature"], index),
+        )
+        go_right = ~(value < ivy.gather(flat["split_condition"], index))
+        node = ivy.where(
+            ivy.gather(flat["is_leaf"], index),
+            node,
+            2 * node + 1 + ivy.astype(go_right, "int64"),
+        )
+    return ivy.sum(ivy.gather(flat["leaf_value"], node + tree_offsets), axis=-1)
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+def _threshold_l1(w, alpha):
+    if not alpha:
+        return w
+    return ivy.where(w > alpha, w - alpha, ivy.where(w < -alpha, w + alpha, 0.0))
+
+
+def _best_splits(
+    binned_data,
+    sample_node,
+    n_nodes,
+    grad,
+    hess,
+    sum_grad,
+    sum_hess,
+    n_bins,
+    reg_lambda,
+    reg_alpha,
+    gamma,
+    min_child_weight,
+):
+    # the best split of each of n_nodes nodes, from the gradient and hessian
+    # histograms of their samples, those whose sample_node is in [0, n_nodes)
+    n_features = binned_data.shape[1]
+    samples = ivy.nonzero((sample_node >= 0) & (sample_node < n_nodes))[0]
+    hist_index = ivy.reshape(
+        (
+            ivy.expand_dims(ivy.gather(sample_node, samples), axis=-1) * n_features
+            + ivy.arange(n_features, dtype="int64")
+        )
+        * n_bins
+        + ivy.gather(binned_data, samples, axis=0),
+        (-1,),
+    )
+    hist_shape = (n_nodes, n_features, n_bins)
+    grad_left, hess_left = (
+        ivy.cumsum(
+            ivy.reshape(
+                ivy.bincount(
+                    hist_index,
+                    weights=ivy.repeat(ivy.gather(weights, samples), n_features),
+                    minlength=n_nodes * n_features * n_bins,
+                ),
+                hist_shape,
+            ),
+            axis=-1,
+        )
+        for weights in (grad, hess)
+    )
+    grad_right = ivy.reshape(sum_grad, (-1, 1, 1)) - grad_left
+    hess_right = ivy.reshape(sum_hess, (-1, 1, 1)) - hess_left
+    loss_chg = (
+        _calc_gain(grad_left, hess_left, reg_lambda, reg_alpha)
+        + _calc_gain(grad_right, hess_right, reg_lambda, reg_alpha)
+        - ivy.reshape(_calc_gain(sum_grad, sum_hess, reg_lambda, reg_alpha), (-1, 1, 1))
+    )
+    valid = (
+        (hess_left >= min_child_weight)
+        & (hess_right >= min_child_weight)
+        & (hess_left > 0)
+        & (hess_right > 0)
+    )
+    loss_chg = ivy.reshape(
+        ivy.where(valid, loss_chg, -ivy.inf), (n_nodes, n_features * n_bins)
+    )
+    best = ivy.argmax(loss_chg, axis=-1)
+    is_split = ivy.max(loss_chg, axis=-1) > max(gamma, RT_EPS)
+    return best // n_bins, best % n_bins, is_split
+
+
+def _calc_gain(sum_grad, sum_hess, reg_lambda, reg_alpha):
+    return ivy.square(_threshold_l1(sum_grad, reg_alpha)) / (sum_hess + reg_lambda)
+
+
+def _calc_weight(sum_grad, sum_hess, reg_lambda, reg_alpha, max_delta_step):
+    weight = -_threshold_l1(sum_grad, reg_alpha) / ivy.where(
+        sum_hess + reg_lambda > 0, sum_hess + reg_lambda, 1.0
+    )
+    if max_delta_step:
+        weight = ivy.clip(weight, -max_delta_step, max_delta_step)
+    return ivy.where(sum_hess > 0, weight, 0.0)
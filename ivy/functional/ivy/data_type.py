@@ -2,7 +2,9 @@
 import ast
 import logging
 import inspect
+import json
 import math
+import os
 import functools
 from numbers import Number
 from typing import Union, Tuple, List, Optional, Callable, Iterable, Any
@@ -275,6 +277,105 @@ def _get_dtypes(fn, complement=True):
     return tuple(supported)
 
 
+# Support Tables #
+# ---------------#
+
+# The results of the function_(un)supported_* queries only depend on the function,
+# the backend and their versions, so recursive queries are served from a table
+# keyed on the ivy version and the backend version, which can also be persisted
+# with ivy.build_support_table
+SUPPORT_TABLE_DIR = os.environ.get(
+    "IVY_SUPPORT_TABLE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "ivy", "support_tables"),
+)
+_support_tables = {}
+# the files the tables were saved to by this process, which are loaded again
+# after the tables are cleared from memory
+_support_table_paths = {}
+
+
+def _get_support_table_id():
+    backend = ivy.current_backend_str()
+    if not backend:
+        return None
+    version = getattr(ivy.current_backend(), "backend_version", {}).get("version", "")
+    return backend, str(version), ivy.__version__
+
+
+def _get_support_table_path(table_id, cache_dir=None):
+    backend, backend_version, ivy_version = table_id
+    return os.path.join(
+        SUPPORT_TABLE_DIR if cache_dir is None else cache_dir,
+        f"{backend}-{backend_version}-ivy-{ivy_version}.json",
+    )
+
+
+def _get_support_table(table_id):
+    if table_id not in _support_tables:
+        table = {}
+        path = _support_table_paths.get(table_id)
+        if path is None:
+            path = _get_support_table_path(table_id)
+        if os.path.isfile(path):
+            with open(path) as f:
+                table = {
+                    fn_key: {
+                        query: _load_support(query, v) for query, v in queries.items()
+                    }
+                    for fn_key, queries in json.load(f).items()
+                }
+        _support_tables[table_id] = table
+    return _support_tables[table_id]
+
+
+# only functions defined in ivy can be identified across processes, frontend
+# functions are excluded as their support also depends on the frontend version
+def _get_support_fn_key(fn):
+    module = getattr(fn, "__module__", None) or ""
+    qualname = getattr(fn, "__qualname__", None)
+    if (
+        qualname is None
+        or "<locals>" in qualname
+        or not module.startswith("ivy.")
+        or "frontend" in module
+    ):
+        return None
+    return f"{module}.{qualname}"
+
+
+def _to_support(value):
+    if isinstance(value, dict):
+        return {k: _to_support(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return tuple(value)
+    return value
+
+
+def _load_support(query, value):
+    # json stores the dtypes as strings, they are converted back to ivy dtypes as
+    # returned by the queries, while the devices are returned as strings
+    if isinstance(value, dict):
+        return {k: _load_support(query, v) for k, v in value.items()}
+    if query.endswith("_dtypes"):
+        return tuple(ivy.__dict__.get(dtype, dtype) for dtype in value)
+    return tuple(value)
+
+
+def _cached_support_query(fn):
+    @functools.wraps(fn)
+    def _cached_support_query_wrapper(f, recurse=True):
+        table_id = _get_support_table_id() if recurse else None
+        fn_key = _get_support_fn_key(f) if table_id is not None else None
+        if fn_key is None:
+            return fn(f, recurse=recurse)
+        queries = _get_support_table(table_id).setdefault(fn_key, {})
+        if fn.__name__ not in queries:
+            queries[fn.__name__] = _to_support(fn(f, recurse=recurse))
+        return _to_support(queries[fn.__name__])
+
+    return _cached_support_query_wrapper
+
+
 # Array API Standard #
 # -------------------#
 
@@ -1693,6 +1794,7 @@ def dtype(
 
 @handle_exceptions
 @handle_nestable
+@_cached_support_query
 def function_supported_dtypes(fn: Callable, recurse: bool = True) -> Union[Tuple, dict]:
     """Return the supported data types of the current backend's function. The
     function returns a dict containing the supported dtypes for the
@@ -1742,6 +1844,7 @@ def function_supported_dtypes(fn: Callable, recurse: bool = True) -> Union[Tuple
 
 @handle_exceptions
 @handle_nestable
+@_cached_support_query
 def function_unsupported_dtypes(
     fn: Callable, recurse: bool = True
 ) -> Union[Tuple, dict]:
@@ -1792,6 +1895,127 @@ def function_unsupported_dtypes(
     )
 
 
+@handle_exceptions
+def build_support_table(
+    fn_names: Optional[Iterable[str]] = None,
+    /,
+    *,
+    save: bool = True,
+    cache_dir: Optional[str] = None,
+) -> dict:
+    """Compute the supported and unsupported devices and dtypes of functions
+    for the current backend in one go. Later calls to
+    ``ivy.function_supported_dtypes``, ``ivy.function_supported_devices``,
+    ``ivy.function_supported_devices_and_dtypes`` and their unsupported
+    counterparts with ``recurse=True`` are then served from the table, which is
+    keyed on the ivy version and the backend version. When saved, the table is
+    also loaded by later processes using the same versions.
+
+    Parameters
+    ----------
+    fn_names
+        The names of the ivy functions to include in the table. Defaults to all
+        the functions of the ivy functional API.
+    save
+        Whether to persist the table as a json file. Default is ``True``.
+    cache_dir
+        The directory to save the table to. Defaults to ``ivy.SUPPORT_TABLE_DIR``,
+        which can be set with the ``IVY_SUPPORT_TABLE_DIR`` environment variable.
+        The table is loaded from there again once cleared from memory, while
+        other processes load the tables of ``ivy.SUPPORT_TABLE_DIR``.
+
+    Returns
+    -------
+    ret
+        A dict mapping each function to the results of the support queries.
+
+    Examples
+    --------
+    >>> ivy.set_backend("numpy")
+    >>> table = ivy.build_support_table(["acosh"], save=False)
+    >>> print(table["ivy.functional.backends.numpy.elementwise.acosh"].keys())
+    dict_keys(['function_supported_dtypes', 'function_unsupported_dtypes', \
+'function_supported_devices', 'function_unsupported_devices', \
+'function_supported_devices_and_dtypes', 'function_unsupported_devices_and_dtypes'])
+    """
+    table_id = _get_support_table_id()
+    ivy.utils.assertions.check_exists(
+        table_id, message="a backend must be set to build a support table"
+    )
+    if fn_names is None:
+        fn_names = importlib.import_module("ivy.functional.ivy").__all__
+    queries = (
+        function_supported_dtypes,
+        function_unsupported_dtypes,
+        ivy.function_supported_devices,
+        ivy.function_unsupported_devices,
+        ivy.function_supported_devices_and_dtypes,
+        ivy.function_unsupported_devices_and_dtypes,
+    )
+    table = _get_support_table(table_id)
+    for fn_name in fn_names:
+        fn = getattr(ivy, fn_name, None)
+        if not inspect.isfunction(fn) or _get_support_fn_key(fn) is None:
+            continue
+        for query in queries:
+            try:
+                query(fn)
+            except ivy.utils.exceptions.IvyException:
+                # inconsistent support attributes, which are reported on query
+                break
+    if save:
+        path = _get_support_table_path(table_id, cache_dir)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(table, f)
+        _support_table_paths[table_id] = path
+    return table
+
+
+@handle_exceptions
+def clear_support_table(
+    backend: Optional[str] = None,
+    /,
+    *,
+    persistent: bool = False,
+    cache_dir: Optional[str] = None,
+) -> None:
+    """Clear the support tables used to serve the
+    ``ivy.function_(un)supported_*`` queries, such that the supported devices
+    and dtypes are recomputed on the next query.
+
+    Parameters
+    ----------
+    backend
+        The backend to clear the tables of. Defaults to all backends.
+    persistent
+        Whether to also delete the tables saved with ``ivy.build_support_table``.
+        Default is ``False``.
+    cache_dir
+        The directory the tables were saved to. Defaults to
+        ``ivy.SUPPORT_TABLE_DIR``.
+
+    Examples
+    --------
+    >>> ivy.set_backend("numpy")
+    >>> _ = ivy.build_support_table(["acosh"], save=False)
+    >>> ivy.clear_support_table("numpy")
+    """
+    for table_id in list(_support_tables):
+        if backend is None or table_id[0] == backend:
+            del _support_tables[table_id]
+    cache_dir = SUPPORT_TABLE_DIR if cache_dir is None else cache_dir
+    if persistent and os.path.isdir(cache_dir):
+        for file_name in os.listdir(cache_dir):
+            if file_name.endswith(".json") and (
+                backend is None or file_name.startswith(f"{backend}-")
+            ):
+                os.remove(os.path.join(cache_dir, file_name))
+        for table_id, path in list(_support_table_paths.items()):
+            if not os.path.isfile(path):
+                del _support_table_paths[table_id]
+
+
 @handle_exceptions
 def invalid_dtype(dtype_in: Union[ivy.Dtype, ivy.NativeDtype, str, None], /) -> bool:
     """Determine whether the provided data type is not support by the current
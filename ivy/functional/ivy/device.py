@@ -2,8 +2,11 @@
 
 # global
 import os
-import gc
 import abc
+import collections
+import concurrent.futures
+import contextlib
+import itertools
 import math
 import psutil
 import warnings
@@ -38,6 +41,8 @@ from ivy.func_wrapper import (
     handle_array_like_without_promotion,
     handle_backend_invalid,
 )
+from ivy.functional.ivy.data_type import _cached_support_query
+from ivy.utils.backend.handler import _get_registered_arrays
 from ivy.utils.exceptions import handle_exceptions
 
 default_device_stack = []
@@ -196,14 +201,11 @@ def get_all_ivy_arrays_on_dev(
     {139740789224448:ivy.array([1,0,2])},
     """
     device = ivy.as_ivy_dev(device)
-    all_arrays = []
-    for obj in gc.get_objects():
-        if (
-            obj is ivy.data_classes.array.array.Array
-            and ivy.is_ivy_array(obj)
-            and ivy.dev(obj) == device
-        ):
-            all_arrays.append(obj)
+    all_arrays = [
+        x
+        for x in _get_registered_arrays()
+        if ivy.is_ivy_array(x) and ivy.dev(x) == device
+    ]
 
     return ivy.Container(dict(zip([str(id(a)) for a in all_arrays], all_arrays)))
 
@@ -1029,6 +1031,84 @@ def set_split_factor(
     split_factors[device] = factor
 
 
+def _map_chunks(func, chunks, executor):
+    """Yield ``func(*chunk)`` for each chunk in order, running up to
+    ``ivy.num_cpu_cores()`` chunks concurrently on `executor` if given."""
+    if executor is None:
+        for chunk in chunks:
+            yield func(*chunk)
+        return
+    # bound the number of chunk outputs alive at once
+    max_in_flight = num_cpu_cores()
+    pending = collections.deque()
+    for chunk in chunks:
+        pending.append(executor.submit(func, *chunk))
+        if len(pending) >= max_in_flight:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _unify_chunk_returns(
+    func,
+    inputs_split,
+    chunk_sizes,
+    mode,
+    input_axes,
+    output_axes,
+    post_fn,
+    executor,
+    stream,
+):
+    rets = (
+        tuple(post_fn(r) for r in ret) if isinstance(ret, tuple) else (post_fn(ret),)
+        for ret in _map_chunks(func, zip(*inputs_split), executor)
+    )
+    if mode in ("mean", "sum"):
+        sums = None
+        for ret in rets:
+            if sums is None:
+                # copy arrays so that they can be accumulated into inplace
+                sums = [ivy.copy_array(r) if ivy.is_array(r) else r for r in ret]
+                continue
+            for i, r in enumerate(ret):
+                if ivy.is_ivy_array(sums[i]):
+                    ivy.add(sums[i], r, out=sums[i])
+                else:
+                    sums[i] = sums[i] + r
+        sums_or_means = [s / len(chunk_sizes) for s in sums] if mode == "mean" else sums
+        return sums_or_means[0] if len(sums_or_means) == 1 else tuple(sums_or_means)
+    first_ret = next(rets)
+    num_outputs = len(first_ret)
+    if output_axes is None:
+        output_axes = [input_axes[0]] * num_outputs
+    elif isinstance(output_axes, int):
+        output_axes = [output_axes] * num_outputs
+    if stream and all(
+        ivy.is_array(r) and r.shape[axis] == chunk_sizes[0]
+        for r, axis in zip(first_ret, output_axes)
+    ):
+        # write each chunk into its slice of preallocated outputs
+        outs = []
+        for r, axis in zip(first_ret, output_axes):
+            shape = list(r.shape)
+            shape[axis] = sum(chunk_sizes)
+            outs.append(ivy.empty(shape, dtype=ivy.dtype(r), device=ivy.dev(r)))
+        start = 0
+        for chunk_size, ret in zip(chunk_sizes, itertools.chain([first_ret], rets)):
+            for i, (r, axis) in enumerate(zip(ret, output_axes)):
+                query = (slice(None),) * axis + (slice(start, start + chunk_size),)
+                outs[i] = ivy.inplace_update(outs[i], ivy.set_item(outs[i], query, r))
+            start += chunk_size
+        return outs[0] if num_outputs == 1 else outs
+    rets = [first_ret] + list(rets)
+    ret = [
+        ivy.concat([r[i] for r in rets], axis=output_axes[i])
+        for i in range(num_outputs)
+    ]
+    return ret[0] if len(ret) == 1 else ret
+
+
 @handle_exceptions
 def split_func_call(
     func: Callable,
@@ -1042,6 +1122,9 @@ def split_func_call(
     output_axes: Optional[Union[int, Iterable[int]]] = None,
     stop_gradients: bool = False,
     device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+    parallel: bool = False,
+    executor: Optional[concurrent.futures.Executor] = None,
+    stream: bool = False,
 ) -> Union[ivy.Array, ivy.NativeArray]:
     """Call a function by splitting its inputs along a given axis, and calling
     the function in chunks, rather than feeding the entire input array at once.
@@ -1071,6 +1154,20 @@ def split_func_call(
         Whether to stop the gradients for each computed return. Default is ``False``.
     device
         The device to set the split factor for. Sets the default device by default.
+    parallel
+        Whether to call the function on several chunks concurrently, using a thread
+        pool with one thread per cpu core. This speeds up backends which release
+        the GIL, such as numpy and torch on cpu. Default is ``False``.
+    executor
+        An executor to run the chunks on, instead of creating a thread pool. Implies
+        ``parallel``. At most ``ivy.num_cpu_cores()`` chunks are submitted at once.
+        Default is ``None``.
+    stream
+        Whether to write the output of each chunk into a preallocated array in
+        ``concat`` mode, rather than concatenating all chunk outputs at the end, so
+        that only one chunk output needs to be alive at a time. Only used when all
+        outputs are arrays with the same length as the chunk along their output
+        axis. Default is ``False``.
 
     Returns
     -------
@@ -1102,7 +1199,6 @@ def split_func_call(
         return func(*inputs)
     num_chunks = dim_size / chunk_size
     num_chunks_floored = math.floor(num_chunks)
-    num_chunks_ceiled = math.ceil(num_chunks)
     chunk_sizes = [chunk_size] * num_chunks_floored
     if num_chunks != num_chunks_floored:
         chunk_sizes.append(dim_size - chunk_size * num_chunks_floored)
@@ -1121,43 +1217,23 @@ def split_func_call(
         )
         for i, inp in enumerate(inputs)
     ]
-    is_mean = mode == "mean"
-    is_sum = mode == "sum"
     post_fn = ivy.stop_gradient if stop_gradients else lambda x: x
-    if is_mean or is_sum:
-        sums = None
-        for inps in zip(*inputs_split):
-            if not sums:
-                sums = func(*inps)
-                sums = (
-                    [post_fn(s) for s in sums]
-                    if isinstance(sums, tuple)
-                    else [post_fn(sums)]
-                )
-            else:
-                ret = func(*inps)
-                if isinstance(ret, tuple):
-                    for i, r in enumerate(ret):
-                        sums[i] = sums[i] + post_fn(r)
-                else:
-                    sums[0] = sums[0] + post_fn(ret)
-        sums_or_means = [s / num_chunks_ceiled for s in sums] if is_mean else sums
-        return sums_or_means[0] if len(sums_or_means) == 1 else tuple(sums_or_means)
-    rets = [func(*i) for i in zip(*inputs_split)]
-    rets = [
-        tuple(post_fn(r) for r in ret) if isinstance(ret, tuple) else (post_fn(ret),)
-        for ret in rets
-    ]
-    num_outputs = len(rets[0])
-    if output_axes is None:
-        output_axes = [input_axes[0]] * num_outputs
-    elif isinstance(output_axes, int):
-        output_axes = [output_axes] * num_outputs
-    ret = [
-        ivy.concat([r[i] for r in rets], axis=output_axes[i])
-        for i in range(num_outputs)
-    ]
-    return ret[0] if len(ret) == 1 else ret
+    if parallel and executor is None:
+        executor_context = concurrent.futures.ThreadPoolExecutor(num_cpu_cores())
+    else:
+        executor_context = contextlib.nullcontext(executor)
+    with executor_context as executor:
+        return _unify_chunk_returns(
+            func,
+            inputs_split,
+            chunk_sizes,
+            mode,
+            input_axes,
+            output_axes,
+            post_fn,
+            executor,
+            stream,
+        )
 
 
 def _is_valid_devices_attributes(fn: Callable) -> bool:
@@ -1215,6 +1291,7 @@ def _get_devices(fn: Callable, complement: bool = True) -> Tuple:
 
 @handle_exceptions
 @handle_nestable
+@_cached_support_query
 def function_supported_devices(
     fn: Callable, recurse: bool = True
 ) -> Union[Tuple, dict]:
@@ -1273,6 +1350,7 @@ def function_supported_devices(
 
 @handle_exceptions
 @handle_nestable
+@_cached_support_query
 def function_unsupported_devices(
     fn: Callable, recurse: bool = True
 ) -> Union[Tuple, dict]:
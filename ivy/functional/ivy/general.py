@@ -26,6 +26,8 @@ import numpy as np
 # local
 import ivy
 from ivy.utils.backend import current_backend, backend_stack
+from ivy.utils.backend.handler import _get_registered_arrays
+from ivy.functional.ivy.data_type import _cached_support_query
 from ivy.functional.ivy.gradients import _is_variable
 from ivy.utils.exceptions import handle_exceptions
 from ivy.func_wrapper import (
@@ -54,6 +56,8 @@ queue_timeout_stack = []
 array_mode_stack = []
 shape_array_mode_stack = []
 nestable_mode_stack = []
+fused_dispatch_mode_stack = []
+flat_container_mode_stack = []
 exception_trace_mode_stack = []
 inplace_mode_stack = []
 trace_mode_dict = {
@@ -510,6 +514,114 @@ def unset_nestable_mode() -> None:
         ivy.__setattr__("nestable_mode", mode, True)
 
 
+ivy.fused_dispatch_mode = (
+    fused_dispatch_mode_stack[-1] if fused_dispatch_mode_stack else False
+)
+
+
+@handle_exceptions
+def set_fused_dispatch_mode(mode: bool) -> None:
+    """Set the mode of whether to dispatch function calls with only native
+    array, non-view ivy.Array and scalar inputs straight to the backend,
+    skipping the rest of the function wrappers.
+
+    Parameter
+    ---------
+    mode
+        boolean whether to use the fused dispatch fast path
+
+    Examples
+    --------
+    >>> ivy.set_fused_dispatch_mode(True)
+    >>> ivy.fused_dispatch_mode
+    True
+
+    >>> ivy.set_fused_dispatch_mode(False)
+    >>> ivy.fused_dispatch_mode
+    False
+    """
+    global fused_dispatch_mode_stack
+    ivy.utils.assertions.check_isinstance(mode, bool)
+    fused_dispatch_mode_stack.append(mode)
+    ivy.__setattr__("fused_dispatch_mode", mode, True)
+
+
+@handle_exceptions
+def unset_fused_dispatch_mode() -> None:
+    """Reset the mode of whether to use the fused dispatch fast path to the
+    previous state.
+
+    Examples
+    --------
+    >>> ivy.set_fused_dispatch_mode(True)
+    >>> ivy.fused_dispatch_mode
+    True
+
+    >>> ivy.unset_fused_dispatch_mode()
+    >>> ivy.fused_dispatch_mode
+    False
+    """
+    global fused_dispatch_mode_stack
+    if fused_dispatch_mode_stack:
+        fused_dispatch_mode_stack.pop(-1)
+        mode = fused_dispatch_mode_stack[-1] if fused_dispatch_mode_stack else False
+        ivy.__setattr__("fused_dispatch_mode", mode, True)
+
+
+ivy.flat_container_mode = (
+    flat_container_mode_stack[-1] if flat_container_mode_stack else False
+)
+
+
+@handle_exceptions
+def set_flat_container_mode(mode: bool) -> None:
+    """Set the mode of whether to map over containers through flat, cached
+    lists of their leaves, and to apply the elementwise static methods of
+    containers to all of their leaves at once.
+
+    Parameter
+    ---------
+    mode
+        boolean whether to use flat container mode
+
+    Examples
+    --------
+    >>> ivy.set_flat_container_mode(True)
+    >>> ivy.flat_container_mode
+    True
+
+    >>> ivy.set_flat_container_mode(False)
+    >>> ivy.flat_container_mode
+    False
+    """
+    global flat_container_mode_stack
+    ivy.utils.assertions.check_isinstance(mode, bool)
+    flat_container_mode_stack.append(mode)
+    ivy.__setattr__("flat_container_mode", mode, True)
+
+
+@handle_exceptions
+def unset_flat_container_mode() -> None:
+    """Reset the mode of whether to use flat container mode to the previous
+    state.
+
+    Examples
+    --------
+    >>> ivy.set_flat_container_mode(True)
+    >>> ivy.flat_container_mode
+    True
+
+    >>> ivy.unset_flat_container_mode()
+    >>> ivy.flat_container_mode
+    False
+    """
+    global flat_container_mode_stack
+    if flat_container_mode_stack:
+        flat_container_mode_stack.pop(-1)
+        mode = flat_container_mode_stack[-1] if flat_container_mode_stack else False
+        ivy.__setattr__("flat_container_mode", mode, True)
+
+
 ivy.exception_trace_mode = (
     exception_trace_mode_stack[-1] if exception_trace_mode_stack else "full"
 )
@@ -2416,15 +2528,14 @@ def get_all_arrays_in_memory() -> List[Union[ivy.Array, ivy.NativeArray]]:
     >>> x
     [ivy.array([0, 1, 2])]
     """
+    if ivy.current_backend_str() in ["", "numpy"]:
+        # ivy arrays are tracked as they are created, so no gc scan is needed
+        return [x for x in _get_registered_arrays() if ivy.is_ivy_array(x)]
     all_arrays = []
     for obj in gc.get_objects():
         try:
-            if ivy.current_backend_str() in ["", "numpy"]:
-                if ivy.is_ivy_array(obj):
-                    all_arrays.append(obj)
-            else:
-                if ivy.is_native_array(obj):
-                    all_arrays.append(obj)
+            if ivy.is_native_array(obj):
+                all_arrays.append(obj)
 
         except Exception:
             pass
@@ -4310,6 +4421,7 @@ def _get_devices_and_dtypes(fn, recurse=True, complement=True):
 
 @handle_exceptions
 @handle_nestable
+@_cached_support_query
 def function_supported_devices_and_dtypes(fn: Callable, recurse: bool = True) -> Dict:
     """Return the supported combination of devices and dtypes of the current
     backend's function. The function returns a dict containing the supported
@@ -4358,6 +4470,7 @@ def function_supported_devices_and_dtypes(fn: Callable, recurse: bool = True) ->
 
 @handle_exceptions
 @handle_nestable
+@_cached_support_query
 def function_unsupported_devices_and_dtypes(fn: Callable, recurse: bool = True) -> Dict:
     """Return the unsupported combination of devices and dtypes of the current
     backend's function. The function returns a dict containing the unsupported
@@ -480,6 +480,11 @@ def execute_with_gradients(
         the function result func_ret and a dictionary of gradients of each output
         variable w.r.t each input variable.
 
+    When ``xs`` is a container of views into flat buffers, such as the variables of
+    an ``ivy.Module`` built with ``flat_params=True``, and the default indices are
+    used, the gradients are computed w.r.t the flat buffers, and are returned as
+    views into flat buffers of gradients.
+
     Examples
     --------
     With :class:`ivy.Array` input:
@@ -513,6 +518,24 @@ def execute_with_gradients(
     }
     })
     """
+    flat_buffers = (
+        xs._cont_get_flat_buffers()
+        if ivy.is_ivy_container(xs)
+        and xs_grad_idxs == ((0,),)
+        and ret_grad_idxs == ((0,),)
+        else None
+    )
+    if flat_buffers is not None:
+        # differentiate w.r.t the flat buffers, with the function called on views
+        # into them
+        func_ret, grads = current_backend(None).execute_with_gradients(
+            lambda flats: func(flat_buffers.from_container(xs, flats)),
+            flat_buffers.as_container(),
+            retain_grads=retain_grads,
+            xs_grad_idxs=xs_grad_idxs,
+            ret_grad_idxs=ret_grad_idxs,
+        )
+        return func_ret, flat_buffers.from_container(xs, grads)
     return current_backend(None).execute_with_gradients(
         func,
         xs,
@@ -763,7 +786,8 @@ def adam_step(
         b: ivy.array([0.216, 0.384, 0.6])
     })
     """
-    step = float(step)
+    # the step count of the optimizers is a one element array
+    step = float(ivy.to_scalar(step) if ivy.is_array(step) else step)
     mw = ivy.add(beta1 * mw, (1 - beta1) * dcdw)
     dcdw_sqrd = dcdw**2
     vw = ivy.add(ivy.multiply(beta2, vw), (1 - beta2) * dcdw_sqrd)
@@ -1416,7 +1440,7 @@ def lamb_update(
         r2 = ivy.vector_norm(eff_grads + decay_lambda * w)
     else:
         r2 = ivy.vector_norm(eff_grads)
-    r = ivy.minimum(ivy.stable_divide(r1, r2), ivy.array(max_trust_ratio))
+    r = ivy.minimum(ivy.stable_divide(r1, r2), float(max_trust_ratio))
     lr = r * lr
     return (
         ivy.optimizer_update(w, eff_grads, lr, stop_gradients=stop_gradients, out=out),
@@ -1,6 +1,7 @@
 """Collection of Ivy neural network layers in functional form."""
 
 # global
+import functools
 from typing import Optional, Tuple, Union, Sequence
 
 # local
@@ -84,6 +85,105 @@ def _in_projection(
         )
 
 
+def _split_heads(x, num_heads, head_dim):
+    """Reshape `x` of shape *[batch,seq,num_heads*head_dim]* into
+    *[batch*num_heads,seq,head_dim]*, with the heads of each batch element
+    next to each other."""
+    num_batches, seq_len = x.shape[:2]
+    x = ivy.reshape(x, (num_batches, seq_len, num_heads, head_dim))
+    return ivy.reshape(
+        ivy.permute_dims(x, (0, 2, 1, 3)), (num_batches * num_heads, seq_len, head_dim)
+    )
+
+
+# upper bound on the number of queries and keys attended at once by
+# scaled_dot_product_attention, longer sequences are attended in blocks
+_SDPA_CHUNK_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=16)
+def _get_causal_mask(backend, num_queries, num_keys, device, offset=0):
+    mask = ivy.tril(ivy.ones((num_queries, num_keys), device=device), k=offset)
+    return ivy.astype(mask, ivy.bool)
+
+
+def _mask_block(mask, q_slice, k_slice):
+    # masks broadcast along the query or key axis aren't sliced along it
+    if mask.shape[-2] != 1:
+        mask = mask[..., q_slice, :]
+    if mask.shape[-1] != 1:
+        mask = mask[..., k_slice]
+    return mask
+
+
+def _chunked_scaled_dot_product_attention(
+    query, key, value, scale, mask, is_causal, dropout_p, training, chunk_size
+):
+    """Scaled dot product attention over blocks of at most `chunk_size` queries
+    and keys.
+
+    The softmax over the keys is computed online: the running maximum and sum
+    of the exponentiated similarities of each query are rescaled as each block
+    of keys is attended, so that only one block of the similarity matrix is
+    held at a time. With a causal mask, the blocks above the diagonal are
+    skipped. The blocks are computed with the backend functions on native
+    arrays, as the wrappers of the ivy functions would dominate for the
+    smaller blocks.
+    """
+    backend = ivy.current_backend()
+    query, key, value, mask = ivy.to_native([query, key, value, mask])
+    device = ivy.dev(query)
+    fill_value = -float(ivy.finfo(query.dtype).max)
+    num_queries, num_keys = query.shape[-2], key.shape[-2]
+    outputs = []
+    for q_start in range(0, num_queries, chunk_size):
+        q_stop = min(q_start + chunk_size, num_queries)
+        q = query[..., q_start:q_stop, :] * scale
+        k_stop = min(q_stop, num_keys) if is_causal else num_keys
+        row_max = row_sum = acc = None
+        for k_start in range(0, k_stop, chunk_size):
+            k_end = min(k_start + chunk_size, k_stop)
+            sim = backend.matmul(
+                q, backend.swapaxes(key[..., k_start:k_end, :], -1, -2)
+            )
+            if training and dropout_p:
+                sim = ivy.to_native(ivy.dropout(sim, dropout_p, training=training))
+            if mask is not None:
+                block_mask = _mask_block(
+                    mask, slice(q_start, q_stop), slice(k_start, k_end)
+                )
+            elif is_causal and k_end > q_start + 1:
+                block_mask = _get_causal_mask(
+                    ivy.current_backend_str(),
+                    q_stop - q_start,
+                    k_end - k_start,
+                    device,
+                    q_start - k_start,
+                )._data
+            else:
+                block_mask = None
+            if block_mask is not None:
+                sim = backend.where(block_mask, sim, fill_value)
+            block_max = backend.max(sim, axis=-1, keepdims=True)
+            new_max = (
+                block_max if row_max is None else backend.maximum(row_max, block_max)
+            )
+            weights = backend.exp(sim - new_max)
+            block_sum = backend.sum(weights, axis=-1, keepdims=True)
+            block_out = backend.matmul(weights, value[..., k_start:k_end, :])
+            if row_max is None:
+                row_sum, acc = block_sum, block_out
+            else:
+                correction = backend.exp(row_max - new_max)
+                row_sum = row_sum * correction + block_sum
+                acc = acc * correction + block_out
+            row_max = new_max
+        outputs.append(acc / row_sum)
+    return ivy.Array(
+        outputs[0] if len(outputs) == 1 else backend.concat(outputs, axis=-2)
+    )
+
+
 # Linear #
 @handle_exceptions
 @handle_nestable
@@ -689,22 +789,31 @@ def scaled_dot_product_attention(
     )
     embed_dim = query.shape[-1]
     scale = scale if scale else 1 / (embed_dim**0.5)
+    L = query.shape[-2]  # Source sequence length
+    S = key.shape[-2]  # Target sequence length
+    if max(L, S) > _SDPA_CHUNK_SIZE and all(
+        ivy.is_array(x) for x in [query, key, value, ivy.default(mask, query)]
+    ):
+        result = _chunked_scaled_dot_product_attention(
+            query,
+            key,
+            value,
+            scale,
+            mask if mask is None or ivy.is_bool_dtype(mask) else ivy.astype(mask, bool),
+            is_causal,
+            dropout_p,
+            training,
+            _SDPA_CHUNK_SIZE,
+        )
+        return ivy.inplace_update(out, result) if ivy.exists(out) else result
     sim = ivy.einsum("... q f, ... k f -> ... q k", query, key) * scale
     sim = ivy.dropout(sim, dropout_p, training=training)
+    if not ivy.exists(mask) and is_causal:
+        mask = _get_causal_mask(ivy.current_backend_str(), L, S, ivy.dev(sim))
     if ivy.exists(mask):
         sim = ivy.where(
             ivy.logical_not(mask),
-            -ivy.ones_like(sim) * ivy.finfo(ivy.dtype(sim)).max,
-            sim,
-        )
-    elif is_causal:
-        L = query.shape[-2]  # Source sequence length
-        S = key.shape[-2]  # Target sequence length
-        mask = ivy.tril(ivy.ones((L, S)), k=0)
-        mask = ivy.astype(mask, ivy.bool)
-        sim = ivy.where(
-            ivy.logical_not(mask),
-            -ivy.ones_like(sim) * ivy.finfo(ivy.dtype(sim)).max,
+            -float(ivy.finfo(ivy.dtype(sim)).max),
             sim,
         )
     attn = ivy.softmax(sim, axis=-1)
@@ -894,18 +1003,11 @@ def multi_head_attention(
         k = ivy.concat([k, ivy.tile(bias_k, (num_batches, 1, 1))], axis=1)
         v = ivy.concat([v, ivy.tile(bias_v, (num_batches, 1, 1))], axis=1)
 
-    num_keys = k.shape[1]
-
     # reshape q, k, v for efficient matrix multiplication
-    q = ivy.swapaxes(q.reshape((num_queries, num_batches * num_heads, head_dim)), 0, 1)
-    if static_k is None:
-        k = ivy.swapaxes(k.reshape((num_keys, num_batches * num_heads, head_dim)), 0, 1)
-    else:
-        k = static_k
-    if static_v is None:
-        v = ivy.swapaxes(v.reshape((num_keys, num_batches * num_heads, head_dim)), 0, 1)
-    else:
-        v = static_v
+    q = _split_heads(q, num_heads, head_dim)
+    k = _split_heads(k, num_heads, head_dim) if static_k is None else static_k
+    v = _split_heads(v, num_heads, head_dim) if static_v is None else static_v
+    num_keys = k.shape[1]
 
     # add extra batch of zeros to k, v
     if add_zero_attn:
@@ -920,18 +1022,18 @@ def multi_head_attention(
     attn_scores *= scale
 
     # mask the attention scores
-    if ivy.exists(attention_mask):
+    if is_causal:
+        mask = ivy.triu(ivy.ones((num_queries, num_keys)), k=1)
+        attention_mask = ivy.where(mask, float("-inf"), 0)
+    elif ivy.exists(attention_mask):
         assert attention_mask.dtype in [query.dtype, ivy.bool], (
             "was expecting attention_mask of type bool or the same as the input's, but"
             f" got {attention_mask.dtype}"
         )
-        if is_causal:
-            mask = ivy.triu(ivy.ones((num_queries, num_keys)), k=1)
-            attention_mask = ivy.where(mask, float("-inf"), 0)
-        elif ivy.is_bool_dtype(attention_mask):
+        if ivy.is_bool_dtype(attention_mask):
             attention_mask = ivy.where(attention_mask, float("-inf"), 0)
-        if attention_mask.ndim == 2:
-            attention_mask = ivy.tile(attention_mask, (num_batches * num_heads, 1, 1))
+    if ivy.exists(attention_mask) and attention_mask.ndim == 2:
+        attention_mask = ivy.tile(attention_mask, (num_batches * num_heads, 1, 1))
     if key_padding_mask is not None:
         assert ivy.is_bool_dtype(key_padding_mask), (
             "was expecting key_padding_mask of type bool, but got"
@@ -940,9 +1042,20 @@ def multi_head_attention(
         key_padding_mask = ivy.where(key_padding_mask, float("-inf"), 0)
         if num_dims == 2:
             key_padding_mask = ivy.expand_dims(key_padding_mask, axis=0)
-        key_padding_mask = ivy.tile(
-            key_padding_mask, (num_batches * num_heads, num_queries, 1)
+        # repeat the mask of each batch element for each of its heads and queries
+        key_padding_mask = ivy.reshape(
+            ivy.tile(
+                ivy.expand_dims(key_padding_mask, axis=(1, 2)),
+                (1, num_heads, num_queries, 1),
+            ),
+            (num_batches * num_heads, num_queries, -1),
         )
+        if is_causal:
+            # the causal mask already spans the extra bias and zero keys
+            key_padding_mask = ivy.pad(
+                key_padding_mask,
+                [(0, 0), (0, 0), (0, num_keys - key_padding_mask.shape[-1])],
+            )
         if attention_mask is None:
             attention_mask = key_padding_mask
         else:
@@ -960,9 +1073,10 @@ def multi_head_attention(
 
     # get attention output
     attention_out = ivy.matmul(attn_weights, v)
-    attention_out = ivy.swapaxes(attention_out, 0, 1).reshape(
-        (num_batches, num_queries, emb_dim)
-    )
+    attention_out = ivy.permute_dims(
+        attention_out.reshape((num_batches, num_heads, num_queries, head_dim)),
+        (0, 2, 1, 3),
+    ).reshape((num_batches, num_queries, emb_dim))
     if ivy.exists(out_proj_weights):
         attention_out = ivy.linear(attention_out, out_proj_weights, bias=out_proj_bias)
 
@@ -2271,6 +2385,28 @@ def conv(
 # LSTM #
 
 
+def _lstm_step(ht, ct, Wi_xt, Wh, mask_t=None):
+    # all four gates of the step from a single matmul
+    hidden_channels = Wh.shape[0]
+    gates = Wi_xt + ivy.matmul(ht, Wh)
+    sig_gates = ivy.sigmoid(gates)
+    it = sig_gates[..., :hidden_channels]
+    ft = sig_gates[..., hidden_channels : 2 * hidden_channels]
+    gt = ivy.tanh(gates[..., 2 * hidden_channels : 3 * hidden_channels])
+    ot = sig_gates[..., 3 * hidden_channels :]
+    ct = ft * ct + it * gt
+    ht = ot * ivy.tanh(ct)
+    return ht, ct, ht
+
+
+def _masked_lstm_step(ht, ct, Wi_xt, Wh, mask_t):
+    # the sequences past their length, masked by zeros, keep their states and
+    # output zeros
+    new_ht, new_ct, _ = _lstm_step(ht, ct, Wi_xt, Wh)
+    out_t = new_ht * mask_t
+    return out_t + ht * (1 - mask_t), new_ct * mask_t + ct * (1 - mask_t), out_t
+
+
 @handle_exceptions
 @handle_nestable
 @handle_array_like_without_promotion
@@ -2287,10 +2423,15 @@ def lstm_update(
     bias: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     recurrent_bias: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     time_major: bool = False,
+    lengths: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
 ) -> Tuple[ivy.Array, Tuple[ivy.Array, ivy.Array]]:
     """Perform long-short term memory update by unrolling time dimension of
     input array.
 
+    The input projections of all timesteps are computed with a single matmul, after
+    which each step computes all four gates with a single matmul, and writes its
+    output into a preallocated buffer.
+
     Parameters
     ----------
     x
@@ -2310,6 +2451,10 @@ def lstm_update(
         bias for cell recurrent kernel *[4 x out]*. (Default value = None)
     time_major
         whether or not the input tensor `x` has the time dimension before batch dim.
+    lengths
+        the lengths of the sequences of a variable-length batch *[batch_shape]*.
+        The states of each sequence stop being updated past its length, and its
+        outputs past its length are zeros. (Default value = None)
 
     Returns
     -------
@@ -2319,62 +2464,49 @@ def lstm_update(
         states, both of shape *[batch_shape,out]*.
     """
     # ToDo: test_lstm_update needs to be fixed
-    if time_major:
-        x = ivy.swapaxes(x, 0, 1)
-    # get shapes
-    x_shape = list(x.shape)
-    batch_shape = x_shape[:-2]
-    timesteps = x_shape[-2]
-    input_channels = x_shape[-1]
-    x_flat = ivy.reshape(x, (-1, input_channels))
-
-    # input kernel
-    Wi = kernel
-    Wi_x = ivy.reshape(
-        ivy.matmul(x_flat, Wi) + (bias if bias is not None else 0),
-        batch_shape + [timesteps, -1],
-    )
-    Wii_x, Wif_x, Wig_x, Wio_x = ivy.split(Wi_x, num_or_size_splits=4, axis=-1)
-
-    # recurrent kernel
-    Wh = recurrent_kernel
+    # move the time dimension first, so that the steps index contiguous slices
+    if not time_major:
+        x = ivy.moveaxis(x, -2, 0)
+    timesteps, *batch_shape, input_channels = x.shape
+    hidden_channels = recurrent_kernel.shape[0]
+
+    # input projections of all timesteps, with both biases folded in
+    Wi_x = ivy.matmul(ivy.reshape(x, (-1, input_channels)), kernel)
+    if bias is not None:
+        Wi_x = Wi_x + bias
+    if recurrent_bias is not None:
+        Wi_x = Wi_x + recurrent_bias
+    Wi_x = ivy.reshape(Wi_x, (timesteps, *batch_shape, 4 * hidden_channels))
 
     # lstm states
     ht = init_h
     ct = init_c
 
-    # lstm outputs
-    hts_list = []
-
-    # unrolled time dimension with lstm steps
-    for Wii_xt, Wif_xt, Wig_xt, Wio_xt in zip(
-        ivy.unstack(Wii_x, axis=-2),
-        ivy.unstack(Wif_x, axis=-2),
-        ivy.unstack(Wig_x, axis=-2),
-        ivy.unstack(Wio_x, axis=-2),
-    ):
-        htm1 = ht
-        ctm1 = ct
-
-        Wh_htm1 = ivy.matmul(htm1, Wh) + (
-            recurrent_bias if recurrent_bias is not None else 0
-        )
-        Whi_htm1, Whf_htm1, Whg_htm1, Who_htm1 = ivy.split(
-            Wh_htm1, num_or_size_splits=4, axis=-1
+    if lengths is None:
+        step = _lstm_step
+        masks = [None] * timesteps
+    else:
+        step = _masked_lstm_step
+        steps = ivy.reshape(ivy.arange(timesteps), (-1, *[1] * len(batch_shape), 1))
+        masks = ivy.unstack(
+            ivy.astype(steps < ivy.expand_dims(lengths, axis=-1), Wi_x.dtype), axis=0
         )
+        # the steps past the longest sequence leave all states unchanged
+        timesteps = min(timesteps, int(ivy.max(lengths)))
 
-        it = ivy.sigmoid(Wii_xt + Whi_htm1)
-        ft = ivy.sigmoid(Wif_xt + Whf_htm1)
-        gt = ivy.tanh(Wig_xt + Whg_htm1)
-        ot = ivy.sigmoid(Wio_xt + Who_htm1)
-        ct = ft * ctm1 + it * gt
-        ht = ot * ivy.tanh(ct)
+    # lstm outputs, zero past the longest sequence
+    hts = None
 
-        hts_list.append(ivy.expand_dims(ht, axis=-2))
+    # unrolled time dimension with lstm steps
+    for t, Wi_xt in enumerate(ivy.unstack(Wi_x, axis=0)[:timesteps]):
+        ht, ct, out_t = step(ht, ct, Wi_xt, recurrent_kernel, masks[t])
+        if hts is None:
+            hts = ivy.zeros((len(masks), *out_t.shape), dtype=out_t.dtype)
+        hts[t] = out_t
+    if hts is None:
+        hts = ivy.zeros((len(masks), *ht.shape), dtype=ht.dtype)
 
-    ret = ivy.concat(hts_list, axis=-2)
-    if time_major:
-        ret = ivy.swapaxes(ret, 0, 1)
+    ret = hts if time_major else ivy.moveaxis(hts, 0, -2)
 
     return ret, (ht, ct)
 
@@ -2829,6 +2961,7 @@ def _lstm_cell(
         bias=bias,
         recurrent_bias=recurrent_bias,
         time_major=not batch_first,
+        lengths=batch_sizes,
     )
     h, c = states
     h = ivy.expand_dims(h) if len(h.shape) == 2 else h
@@ -2860,7 +2993,7 @@ def _lstm_layer(
             batch_first=batch_first,
             batch_sizes=batch_sizes,
         )
-        x_reversed = ivy.flip(x, axis=0)
+        x_reversed = _reverse_sequence(x, batch_sizes)
         result_bw, (h_bw, c_bw) = _lstm_cell(
             x_reversed,
             hidden[0][1:],
@@ -2872,7 +3005,7 @@ def _lstm_layer(
             batch_first=batch_first,
             batch_sizes=batch_sizes,
         )
-        result_bw = ivy.flip(result_bw, axis=0)
+        result_bw = _reverse_sequence(result_bw, batch_sizes)
         result = ivy.concat([result_fw, result_bw], axis=len(result_fw.shape) - 1)
         c = ivy.concat([c_fw, c_bw], axis=0)
         h = ivy.concat([h_fw, h_bw], axis=0)
@@ -2880,38 +3013,38 @@ def _lstm_layer(
 
 
 def _pack_padded_sequence(input, lengths):
-    input = ivy.swapaxes(input, 0, 1)
-    data = []
-    batch_sizes = []
-    for i in range(int(max(lengths))):
-        valid_data_mask = ivy.array(lengths) > i
-        data.append(input[valid_data_mask, i])
-        batch_sizes.append(int(sum(valid_data_mask)))
-    data = ivy.concat(data)
-    batch_sizes = ivy.array(batch_sizes, dtype=ivy.int64)
+    # the time-major steps of the sequences within their lengths, in order
+    lengths = ivy.array(lengths)
+    valid_data_mask = ivy.arange(int(ivy.max(lengths)))[:, None] < lengths
+    data = input[: valid_data_mask.shape[0]][valid_data_mask]
+    batch_sizes = ivy.sum(valid_data_mask, axis=1, dtype=ivy.int64)
     return data, batch_sizes
 
 
 def _pad_packed_sequence(data, batch_sizes):
+    batch_sizes = ivy.array(batch_sizes)
+    valid_data_mask = ivy.arange(int(ivy.max(batch_sizes)))[None] < batch_sizes[:, None]
     padded_data = ivy.full(
-        (len(batch_sizes), int(max(batch_sizes)), *data.shape[1:]),
+        (*valid_data_mask.shape, *data.shape[1:]),
         0,
         dtype=data.dtype,
         device=data.device,
     )
-    data_offset = 0
-    for i, batch_size in enumerate(batch_sizes):
-        batch_size = int(batch_size)
-        padded_data[i, :batch_size] = data[data_offset : data_offset + batch_size]
-        data_offset += batch_size
-    lengths = ivy.sum(
-        ivy.arange(1, int(max(batch_sizes)) + 1)[:, ivy.newaxis] <= batch_sizes,
-        axis=1,
-        dtype=ivy.int64,
-    )
+    padded_data[valid_data_mask] = data
+    lengths = ivy.sum(valid_data_mask, axis=0, dtype=ivy.int64)
     return padded_data, lengths
 
 
+def _reverse_sequence(x, lengths=None):
+    # reverse the time-major sequences of x, each within its length if given
+    if lengths is None:
+        return ivy.flip(x, axis=0)
+    steps = ivy.arange(x.shape[0], dtype=lengths.dtype)[:, None]
+    indices = ivy.where(steps < lengths, lengths - 1 - steps, steps)
+    x = _batched_take(ivy.swapaxes(x, 0, 1), ivy.swapaxes(indices, 0, 1))
+    return ivy.swapaxes(x, 0, 1)
+
+
 def _retrieve_state(x, start, end, num_layers):
     return x if num_layers == 1 else _slice_along_axis(x, start=start, stop=end, axis=0)
 
@@ -3038,6 +3171,58 @@ def roi_align(
     return output
 
 
+def _batched_take(x, indices):
+    # gather along the second axis of x with indices of shape (batch, num_indices)
+    batch_size, num_elements = x.shape[:2]
+    offsets = ivy.arange(batch_size, dtype=indices.dtype)[:, None] * num_elements
+    flat_indices = ivy.reshape(indices + offsets, (-1,))
+    ret = ivy.gather(ivy.reshape(x, (-1, *x.shape[2:])), flat_indices, axis=0)
+    return ivy.reshape(ret, (*indices.shape, *x.shape[2:]))
+
+
+def _nms_keep(boxes, iou_threshold, valid=None, class_ids=None):
+    # boxes of shape (batch, num_boxes, 4), sorted by descending score
+    x1, y1, x2, y2 = (boxes[..., i] for i in range(4))
+    areas = (x2 - x1) * (y2 - y1)
+    w = ivy.maximum(
+        ivy.minimum(x2[..., :, None], x2[..., None, :], use_where=False)
+        - ivy.maximum(x1[..., :, None], x1[..., None, :], use_where=False),
+        0.0,
+        use_where=False,
+    )
+    h = ivy.maximum(
+        ivy.minimum(y2[..., :, None], y2[..., None, :], use_where=False)
+        - ivy.maximum(y1[..., :, None], y1[..., None, :], use_where=False),
+        0.0,
+        use_where=False,
+    )
+    inter = w * h
+    iou = inter / (areas[..., :, None] + areas[..., None, :] - inter)
+    # box i can only suppress the lower scoring boxes j > i
+    num_boxes = boxes.shape[-2]
+    suppresses = ivy.logical_and(
+        ivy.logical_not(iou <= iou_threshold),
+        ivy.triu(ivy.ones((num_boxes, num_boxes)), k=1).astype(ivy.bool),
+    )
+    if class_ids is not None:
+        suppresses = ivy.logical_and(
+            suppresses, class_ids[..., :, None] == class_ids[..., None, :]
+        )
+    if valid is None:
+        valid = ivy.ones(boxes.shape[:-1], dtype=ivy.bool)
+    # the boxes kept by the greedy pass are the fixed point of keeping each box
+    # not suppressed by a kept box, and every pass settles at least one more box,
+    # so this takes as many passes as the longest chain of suppressions
+    keep = valid
+    for _ in range(num_boxes):
+        suppressed = ivy.any(ivy.logical_and(suppresses, keep[..., None]), axis=-2)
+        new_keep = ivy.logical_and(valid, ivy.logical_not(suppressed))
+        if ivy.array_equal(new_keep, keep):
+            break
+        keep = new_keep
+    return keep
+
+
 # TODO add paddle backend implementation back,
 #  once paddle.argsort uses a stable algorithm
 #  https://github.com/PaddlePaddle/Paddle/issues/57508
@@ -3069,40 +3254,10 @@ def nms(
         else:
             ret = ivy.array([], dtype=ivy.int64)
     else:
-        x1 = boxes[:, 0]
-        y1 = boxes[:, 1]
-        x2 = boxes[:, 2]
-        y2 = boxes[:, 3]
-
-        areas = (x2 - x1) * (y2 - y1)
-        order = ivy.argsort(
-            (-1 * scores), stable=True
-        )  # get boxes with more ious first
-        keep = []
-
-        while order.size > 0:
-            i = order[0]  # pick maxmum iou box
-            keep.append(i)
-            xx1 = ivy.maximum(x1[i], x1[order[1:]])
-            yy1 = ivy.maximum(y1[i], y1[order[1:]])
-            xx2 = ivy.minimum(x2[i], x2[order[1:]])
-            yy2 = ivy.minimum(y2[i], y2[order[1:]])
-
-            w = ivy.maximum(0.0, xx2 - xx1)  # maximum width
-            h = ivy.maximum(0.0, yy2 - yy1)  # maximum height
-            inter = w * h
-            ovr = inter / (areas[i] + areas[order[1:]] - inter)
-            inds = ivy.nonzero(ovr <= iou_threshold)[0]
-
-            order = order[inds + 1]
-
-        ret = ivy.array(keep)
-
-    if len(ret) > 1 and scores is not None:
-        ret = sorted(
-            ret.flatten().tolist(), reverse=True, key=lambda x: (scores[x], -x)
-        )
-        ret = ivy.array(ret, dtype=ivy.int64).flatten()
+        # get boxes with higher scores first, and lower indices first on ties
+        order = ivy.argsort((-1 * scores), stable=True)
+        keep = _nms_keep(ivy.expand_dims(boxes[order], axis=0), iou_threshold)[0]
+        ret = order[keep].astype(ivy.int64)
 
     if change_id and len(ret) > 0:
         ret = ivy.array(nonzero[ret], dtype=ivy.int64).flatten()
@@ -3119,3 +3274,102 @@ nms.mixed_backend_wrappers = {
     ),
     "to_skip": ("inputs_to_ivy_arrays",),
 }
+
+
+@handle_exceptions
+@handle_nestable
+@handle_array_like_without_promotion
+@inputs_to_ivy_arrays
+@handle_array_function
+@handle_device
+def batched_nms(
+    boxes: Union[ivy.Array, ivy.NativeArray],
+    scores: Union[ivy.Array, ivy.NativeArray],
+    /,
+    *,
+    class_ids: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+    iou_threshold: float = 0.5,
+    max_output_size: Optional[int] = None,
+    score_threshold: float = float("-inf"),
+    top_k: Optional[int] = None,
+) -> Tuple[ivy.Array, ivy.Array]:
+    """Perform non-maximum suppression on a batch of images at once.
+
+    The intersection over union of all pairs of boxes of each image is computed
+    as a single matrix, from which the boxes kept by the greedy suppression of
+    :func:`ivy.nms` are found with a few vectorized passes over the whole batch,
+    instead of one pass per kept box.
+
+    Parameters
+    ----------
+    boxes
+        boxes of shape ``(batch, num_boxes, 4)``, as ``(x1, y1, x2, y2)``.
+    scores
+        scores of the boxes, of shape ``(batch, num_boxes)``.
+    class_ids
+        classes of the boxes, of shape ``(batch, num_boxes)``. If given, boxes only
+        suppress boxes of the same class. Default is ``None``.
+    iou_threshold
+        boxes overlapping a higher scoring box by more than this intersection over
+        union are suppressed. Default is ``0.5``.
+    max_output_size
+        the maximum number of boxes kept per image. Default is ``None``, which
+        keeps all the boxes not suppressed.
+    score_threshold
+        boxes scoring at most this are discarded. Default is ``-inf``.
+    top_k
+        if given, only the ``top_k`` highest scoring boxes of each image are
+        considered, which bounds the size of the matrices. Default is ``None``.
+
+    Returns
+    -------
+    ret
+        the indices of the kept boxes of each image, by descending score, padded
+        with ``-1`` to ``max_output_size`` (or to the number of boxes considered),
+        and the number of kept boxes of each image.
+
+    Examples
+    --------
+    >>> boxes = ivy.array([[[0., 0., 2., 2.], [0., 0., 2., 1.9], [3., 3., 4., 4.]]])
+    >>> scores = ivy.array([[0.9, 0.8, 0.7]])
+    >>> indices, num_valid = ivy.batched_nms(boxes, scores, max_output_size=3)
+    >>> print(indices)
+    ivy.array([[ 0,  2, -1]])
+    >>> print(num_valid)
+    ivy.array([2])
+    """
+    ivy.utils.assertions.check_equal(
+        len(boxes.shape),
+        3,
+        message="boxes must be of shape (batch, num_boxes, 4)",
+        as_array=False,
+    )
+    # get boxes with higher scores first, and lower indices first on ties
+    order = ivy.argsort(-1 * scores, axis=-1, stable=True)
+    if top_k is not None:
+        order = order[:, :top_k]
+    num_boxes = order.shape[-1]
+    boxes = _batched_take(boxes, order)
+    valid = _batched_take(scores, order) > score_threshold
+    if class_ids is not None:
+        class_ids = _batched_take(class_ids, order)
+    keep = _nms_keep(boxes, iou_threshold, valid=valid, class_ids=class_ids)
+
+    # move the kept indices to the front, keeping them sorted by score
+    num_valid = ivy.sum(keep.astype(ivy.int64), axis=-1)
+    kept_first = ivy.argsort(ivy.logical_not(keep).astype(ivy.int64), stable=True)
+    indices = ivy.where(
+        ivy.arange(num_boxes)[None] < num_valid[:, None],
+        _batched_take(order, kept_first),
+        -1,
+    ).astype(ivy.int64)
+    if max_output_size is not None:
+        if max_output_size > num_boxes:
+            indices = ivy.pad(
+                indices,
+                [(0, 0), (0, max_output_size - num_boxes)],
+                constant_values=-1,
+            )
+        indices = indices[:, :max_output_size]
+        num_valid = ivy.minimum(num_valid, max_output_size)
+    return indices, num_valid
@@ -13,6 +13,21 @@ from typing import Optional, Union, Callable, Tuple, Any
 # Private #
 
 
+def _fill_missing_grads(grads, variables):
+    # the variables the cost doesn't depend on get zero gradients, the
+    # container is only rebuilt when there are any
+    if isinstance(grads, ivy.Container) and all(
+        k in grads for k in variables.cont_to_iterator_keys()
+    ):
+        return grads
+    return ivy.Container(
+        {
+            k: ivy.zeros_like(v) if k not in grads else grads[k]
+            for k, v in variables.cont_to_iterator()
+        }
+    )
+
+
 def _compute_cost_and_update_grads(
     cost_fn,
     order,
@@ -72,28 +87,17 @@ def _compute_cost_and_update_grads(
                 batch, v=variables.cont_set_at_key_chains(v) if unique_outer else v
             )
 
-        cost, inner_grads = ivy.execute_with_gradients(
-            cost_fn_with_variable,
-            (
-                variables.cont_at_key_chains(outer_v, ignore_none=True)
-                if keep_outer_v
-                else variables.cont_prune_key_chains(outer_v, ignore_none=True)
-            ),
-            retain_grads=False,
-        )
-
         var = (
             variables.cont_at_key_chains(outer_v, ignore_none=True)
             if keep_outer_v
             else variables.cont_prune_key_chains(outer_v, ignore_none=True)
         )
-
-        inner_grads = ivy.Container(
-            {
-                k: ivy.zeros_like(v) if k not in inner_grads else inner_grads[k]
-                for k, v in var.cont_to_iterator()
-            }
+        cost, inner_grads = ivy.execute_with_gradients(
+            cost_fn_with_variable,
+            var,
+            retain_grads=False,
         )
+        inner_grads = _fill_missing_grads(inner_grads, var)
 
         if batched:
             inner_grads = ivy.multiply(inner_grads, num_tasks)
@@ -136,33 +140,20 @@ def _train_task(
     # iterate through inner loop training steps
     for i in range(inner_grad_steps):
         # compute inner gradient for update the inner variables
+        var = (
+            variables.cont_at_key_chains(inner_v, ignore_none=True)
+            if keep_innver_v
+            else variables.cont_prune_key_chains(inner_v, ignore_none=True)
+        )
         cost, inner_update_grads = ivy.execute_with_gradients(
             lambda v: inner_cost_fn(
                 inner_batch,
                 v=variables.cont_set_at_key_chains(v) if unique_inner else v,
             ),
-            (
-                variables.cont_at_key_chains(inner_v, ignore_none=True)
-                if keep_innver_v
-                else variables.cont_prune_key_chains(inner_v, ignore_none=True)
-            ),
+            var,
             retain_grads=order > 1,
         )
-        var = (
-            variables.cont_at_key_chains(inner_v, ignore_none=True)
-            if keep_innver_v
-            else variables.cont_prune_key_chains(inner_v, ignore_none=True)
-        )
-        inner_update_grads = ivy.Container(
-            {
-                k: (
-                    ivy.zeros_like(v)
-                    if k not in inner_update_grads
-                    else inner_update_grads[k]
-                )
-                for k, v in var.cont_to_iterator()
-            }
-        )
+        inner_update_grads = _fill_missing_grads(inner_update_grads, var)
         if batched:
             inner_update_grads = ivy.multiply(inner_update_grads, num_tasks)
 
@@ -355,6 +346,13 @@ def _train_tasks_batched(
     return cost
 
 
+def _is_task_sequence(v):
+    # whether the variable keys are given separately for each task
+    return isinstance(v, (list, tuple)) and isinstance(
+        v[0], (list, tuple, dict, type(None))
+    )
+
+
 def _train_tasks_with_for_loop(
     batch,
     inner_sub_batch_fn,
@@ -378,18 +376,8 @@ def _train_tasks_with_for_loop(
     total_cost = 0
     updated_ivs_to_return = []
     all_grads = []
-    if isinstance(inner_v, (list, tuple)) and isinstance(
-        inner_v[0], (list, tuple, dict, type(None))
-    ):
-        inner_v_seq = True
-    else:
-        inner_v_seq = False
-    if isinstance(outer_v, (list, tuple)) and isinstance(
-        outer_v[0], (list, tuple, dict, type(None))
-    ):
-        outer_v_seq = True
-    else:
-        outer_v_seq = False
+    inner_v_seq = _is_task_sequence(inner_v)
+    outer_v_seq = _is_task_sequence(outer_v)
     for i, sub_batch in enumerate(batch.cont_unstack_conts(0, True, num_tasks)):
         if inner_sub_batch_fn is not None:
             inner_sub_batch = inner_sub_batch_fn(sub_batch)
@@ -437,6 +425,87 @@ def _train_tasks_with_for_loop(
     return total_cost / num_tasks
 
 
+def _vmapped_cost_fn(cost_fn):
+    # the cost function of a single task, vectorized over the task axis of the
+    # batch and of the stacked variables, with the costs of the tasks averaged
+    # as the cost functions of the batched mode do
+    def _cost_fn(batch, v):
+        batch_leaves = batch.cont_to_flat_list()
+        num_batch_leaves = len(batch_leaves)
+
+        def _task_cost(*leaves):
+            # the sub-batch of the task keeps its task axis, as in the for loop
+            sub_batch = batch.cont_from_flat_list(
+                [ivy.expand_dims(x, axis=0) for x in leaves[:num_batch_leaves]]
+            )
+            sub_v = v.cont_from_flat_list(list(leaves[num_batch_leaves:]))
+            return cost_fn(sub_batch, v=sub_v)
+
+        return ivy.mean(ivy.vmap(_task_cost)(*batch_leaves, *v.cont_to_flat_list()))
+
+    return _cost_fn
+
+
+def _task_batch_fn(batch_fn, num_tasks):
+    # the batch function of a single task, applied to each task of the batch
+    if batch_fn is None:
+        return None
+
+    def _batch_fn(batch):
+        sub_batches = batch.cont_unstack_conts(0, True, num_tasks)
+        return ivy.concat([batch_fn(sub_batch) for sub_batch in sub_batches], axis=0)
+
+    return _batch_fn
+
+
+def _train_tasks_vmapped(
+    batch,
+    inner_batch_fn,
+    outer_batch_fn,
+    inner_cost_fn,
+    outer_cost_fn,
+    variables,
+    inner_grad_steps,
+    inner_learning_rate,
+    inner_optimization_step,
+    order,
+    average_across_steps,
+    inner_v,
+    keep_innver_v,
+    outer_v,
+    keep_outer_v,
+    return_inner_v,
+    num_tasks,
+    stop_gradients,
+):
+    # the variables of the tasks are stacked along a task axis, so that each
+    # inner step adapts all of them with a single gradient computation, rather
+    # than one for each task as in the for loop
+    task_variables = variables.cont_map(
+        lambda x, _: ivy.repeat(ivy.expand_dims(x, axis=0), num_tasks, axis=0)
+    )
+    return _train_tasks_batched(
+        batch,
+        _task_batch_fn(inner_batch_fn, num_tasks),
+        _task_batch_fn(outer_batch_fn, num_tasks),
+        _vmapped_cost_fn(inner_cost_fn),
+        None if outer_cost_fn is None else _vmapped_cost_fn(outer_cost_fn),
+        task_variables,
+        inner_grad_steps,
+        inner_learning_rate,
+        inner_optimization_step,
+        order,
+        average_across_steps,
+        inner_v,
+        keep_innver_v,
+        outer_v,
+        keep_outer_v,
+        return_inner_v,
+        num_tasks,
+        stop_gradients,
+    )
+
+
 def _train_tasks(
     batch,
     inner_batch_fn,
@@ -458,7 +527,32 @@ def _train_tasks(
     num_tasks,
     stop_gradients,
 ):
-    if batched:
+    if (
+        batched == "vmap"
+        and not _is_task_sequence(inner_v)
+        and not _is_task_sequence(outer_v)
+    ):
+        return _train_tasks_vmapped(
+            batch,
+            inner_batch_fn,
+            outer_batch_fn,
+            inner_cost_fn,
+            outer_cost_fn,
+            variables,
+            inner_grad_steps,
+            inner_learning_rate,
+            inner_optimization_step,
+            order,
+            average_across_steps,
+            inner_v,
+            keep_innver_v,
+            outer_v,
+            keep_outer_v,
+            return_inner_v,
+            num_tasks,
+            stop_gradients,
+        )
+    if batched and batched != "vmap":
         return _train_tasks_batched(
             batch,
             inner_batch_fn,
@@ -521,7 +615,7 @@ def fomaml_step(
     inner_batch_fn: Optional[Callable] = None,
     outer_batch_fn: Optional[Callable] = None,
     average_across_steps: bool = False,
-    batched: bool = True,
+    batched: Union[bool, str] = True,
     inner_v: Optional[ivy.Container] = None,
     keep_inner_v: bool = True,
     outer_v: Optional[ivy.Container] = None,
@@ -563,7 +657,10 @@ def fomaml_step(
         Default is ``False``.
     batched
         Whether to batch along the time dimension, and run the meta steps in batch.
-        Default is ``True``.
+        If ``"vmap"``, the cost functions receive the sub-batch and variables of a
+        single task, as when ``False``, and are vectorized over the tasks with
+        :func:`ivy.vmap`, so that the inner loop adapts the variables of all tasks
+        together. Default is ``True``.
     inner_v
         Nested variable keys to be optimized during the inner loop, with same keys and
         boolean values. (Default value = None)
@@ -640,7 +737,7 @@ def reptile_step(
     /,
     *,
     inner_optimization_step: Callable = gradient_descent_update,
-    batched: bool = True,
+    batched: Union[bool, str] = True,
     return_inner_v: Union[str, bool] = False,
     num_tasks: Optional[int] = None,
     stop_gradients: bool = True,
@@ -667,7 +764,10 @@ def reptile_step(
         Default is `gradient_descent_update`.
     batched
         Whether to batch along the time dimension and run the meta steps in batch.
-        Default is `True`.
+        If `"vmap"`, the cost function receives the sub-batch and variables of a
+        single task, as when `False`, and is vectorized over the tasks with
+        `ivy.vmap`, so that the inner loop adapts the variables of all tasks
+        together. Default is `True`.
     return_inner_v
         Either `'first'`, `'all'`, or `False`. If `'first'`, the variables for the first
         task inner loop will also be returned. If `'all'`, variables for all tasks will
@@ -785,7 +885,7 @@ def maml_step(
     inner_batch_fn: Optional[Callable] = None,
     outer_batch_fn: Optional[Callable] = None,
     average_across_steps: bool = False,
-    batched: bool = True,
+    batched: Union[bool, str] = True,
     inner_v: Optional[ivy.Container] = None,
     keep_inner_v: bool = True,
     outer_v: Optional[ivy.Container] = None,
@@ -827,7 +927,10 @@ def maml_step(
         Default is ``False``.
     batched
         Whether to batch along the time dimension, and run the meta steps in batch.
-        Default is ``True``.
+        If ``"vmap"``, the cost functions receive the sub-batch and variables of a
+        single task, as when ``False``, and are vectorized over the tasks with
+        :func:`ivy.vmap`, so that the inner loop adapts the variables of all tasks
+        together. Default is ``True``.
     inner_v
         Nested variable keys to be optimized during the inner loop, with same keys and
         boolean values. (Default value = None)
@@ -1,6 +1,7 @@
 """Collection of Ivy functions for nested objects."""
 
 # global
+import copy
 from builtins import map as _map
 from typing import Callable, Any, Union, List, Tuple, Optional, Dict, Iterable, Sequence
 from collections import UserDict, OrderedDict
@@ -388,7 +389,8 @@ def multi_index_nest(
     Parameters
     ----------
     nest
-        The nested object to slice.
+        The nested object to slice. If a :class:`ivy.FlatNest`, each index is
+        looked up directly instead of by traversing the nest.
     indices
         A tuple of tuples of indices to apply.
 
@@ -443,6 +445,8 @@ def multi_index_nest(
     >>> print(z)
     ['h', 'b']
     """
+    if isinstance(nest, FlatNest):
+        return [nest._index(index) for index in indices]
     return [index_nest(nest, index) for index in indices]
 
 
@@ -480,7 +484,8 @@ def set_nest_at_indices(
     Parameters
     ----------
     nest
-        The nested object to update.
+        The nested object to update. If a :class:`ivy.FlatNest`, its leaves
+        are updated without traversing the nest, and a flat nest is returned.
     indices
         A tuple of tuples of indices for the indices at which to update.
     values
@@ -532,6 +537,10 @@ def set_nest_at_indices(
     >>> print(nest)
     ivy.array([[1., 11., 3.], [4., 5., 22.]])
     """
+    if isinstance(nest, FlatNest):
+        if not isinstance(values, (list, tuple)):
+            values = [values] * len(indices)
+        return nest._update_at_indices(indices, lambda i, _: values[i], shallow)
     is_tuple = isinstance(nest, tuple)
     nest_type = type(nest) if is_tuple else lambda x: x
     if shallow:
@@ -586,7 +595,8 @@ def map_nest_at_indices(
     Parameters
     ----------
     nest
-        The nested object to update.
+        The nested object to update. If a :class:`ivy.FlatNest`, its leaves
+        are updated without traversing the nest, and a flat nest is returned.
     indices
         A tuple of tuples of indices for the indices at which to update.
     fn
@@ -639,6 +649,8 @@ def map_nest_at_indices(
     ivy.array([[ -9.,  64., -17.],
            [ 11.,   9.,  25.]])
     """
+    if isinstance(nest, FlatNest):
+        return nest._update_at_indices(indices, lambda _, value: fn(value), shallow)
     is_tuple = isinstance(nest, tuple)
     nest_type = type(nest) if is_tuple else lambda x: x
     if shallow:
@@ -671,7 +683,8 @@ def nested_argwhere(
     Parameters
     ----------
     nest
-        The nest to check the leaves of.
+        The nest to check the leaves of. If a :class:`ivy.FlatNest`, its leaf
+        list is scanned instead, and `to_ignore` is the one it was flattened with.
     fn
         The condition function, returning True or False.
     check_nests
@@ -730,6 +743,8 @@ def nested_argwhere(
         ['c', 0]
     ]
     """
+    if isinstance(nest, FlatNest):
+        return nest._argwhere(fn, check_nests, stop_after_n_found)
     to_ignore = ivy.default(to_ignore, ())
     _index = [] if _index is None else _index
     if isinstance(nest, (tuple, list)) and not isinstance(nest, to_ignore):
@@ -1030,7 +1045,10 @@ def nested_map(
     fn
         The function to map onto x.
     x
-        The item to apply the mapped function to.
+        The item to apply the mapped function to. If a :class:`ivy.FlatNest`,
+        a flat nest of the result is returned, and the function is mapped
+        directly over its leaves unless the other arguments select different
+        leaves.
     include_derived
         Whether to also recursive for classes derived from tuple, list and dict.
         Default is ``False``.
@@ -1111,6 +1129,37 @@ def nested_map(
     >>> ivy.nested_map(function, nest, to_mutable=True)
     [[24, 25, 1338], [64, 99, 7]]
     """
+    if isinstance(x, FlatNest):
+        if (
+            to_ignore
+            or to_mutable
+            or _tuple_check_fn is not None
+            or _list_check_fn is not None
+            or _dict_check_fn is not None
+            or (include_derived is not True and x._has_derived_nodes())
+        ):
+            # the leaves to map over differ from those of the flat nest
+            nest = nested_map(
+                fn,
+                unflatten_nest(x),
+                include_derived,
+                to_ignore,
+                to_mutable,
+                _tuple_check_fn,
+                _list_check_fn,
+                _dict_check_fn,
+                shallow=False,
+            )
+            ret = flatten_nest(nest, to_ignore=x._to_ignore)
+            if shallow:
+                x.__dict__.update(ret.__dict__)
+                return x
+            return ret
+        leaves = [fn(leaf) for leaf in x.leaves]
+        if shallow:
+            x.leaves[:] = leaves
+            return x
+        return x._with_leaves(leaves)
     to_ignore = ivy.default(to_ignore, ())
     if include_derived is True:
         include_derived = {"tuple": True, "list": True, "dict": True}
@@ -1590,3 +1639,255 @@ def prune_empty(nest):
     if not valid and not ivy.is_array(nest) and not isinstance(nest, (int, float, str)):
         return None
     return nest
+
+
+# Flattened Nests #
+# ----------------#
+
+
+class _NestNode:
+    """A nested tuple, list or dict in the structure of a :class:`FlatNest`.
+
+    Each child is either the position of a leaf in the leaf list, or
+    another ``_NestNode``. ``leaf_start`` and ``leaf_stop`` delimit the
+    (contiguous) leaves below the node.
+    """
+
+    __slots__ = ("nest", "index", "keys", "children", "leaf_start", "leaf_stop")
+
+    def __init__(self, nest, index, leaf_start):
+        self.nest = nest
+        self.index = index
+        self.keys = list(nest.keys()) if isinstance(nest, (dict, UserDict)) else None
+        self.children = []
+        self.leaf_start = leaf_start
+        self.leaf_stop = leaf_start
+
+    def items(self):
+        if self.keys is not None:
+            return ((k, self.nest[k]) for k in self.keys)
+        return enumerate(self.nest)
+
+    def rebuild(self, leaves):
+        values = [
+            leaves[child] if isinstance(child, int) else child.rebuild(leaves)
+            for child in self.children
+        ]
+        nest_type = type(self.nest)
+        if self.keys is not None:
+            if isinstance(self.nest, ivy.Container):
+                return nest_type(dict(zip(self.keys, values)), **self.nest.cont_config)
+            try:
+                return nest_type(zip(self.keys, values))
+            except TypeError:
+                ret = copy.copy(self.nest)
+                ret.update(zip(self.keys, values))
+                return ret
+        if hasattr(self.nest, "_fields"):
+            return nest_type(**dict(zip(self.nest._fields, values)))
+        return nest_type(values)
+
+
+class FlatNest:
+    """A nest flattened into the list of its leaves and their index chains,
+    together with the structure needed to rebuild it.
+
+    Flat nests are created with :func:`ivy.flatten_nest`, and can be passed
+    in place of the nest to :func:`ivy.nested_map`, :func:`ivy.nested_argwhere`,
+    :func:`ivy.multi_index_nest`, :func:`ivy.set_nest_at_indices` and
+    :func:`ivy.map_nest_at_indices`, which then operate on the leaf list
+    without traversing the nest again. :func:`ivy.unflatten_nest` rebuilds the
+    nest from the (possibly updated) leaves.
+    """
+
+    def __init__(self, leaves, indices, root, entries, to_ignore):
+        self.leaves = leaves
+        self.indices = indices
+        self._root = root
+        self._entries = entries
+        self._to_ignore = to_ignore
+        self._positions = None
+
+    def __len__(self):
+        return len(self.leaves)
+
+    def __repr__(self):
+        return f"FlatNest(leaves={self.leaves!r}, indices={self.indices!r})"
+
+    def _with_leaves(self, leaves):
+        ret = FlatNest(leaves, self.indices, self._root, self._entries, self._to_ignore)
+        ret._positions = self._positions
+        return ret
+
+    def _has_derived_nodes(self):
+        """Whether the nest has subclasses of tuple, list or dict, which
+        :func:`ivy.nested_map` only traverses if `include_derived` is set."""
+        return any(
+            not isinstance(entry, int)
+            and type(entry.nest) not in (tuple, list, dict)
+            and not isinstance(entry.nest, UserDict)
+            for entry in self._entries
+        )
+
+    def _lookup(self, index):
+        """Return the leaf position or the node at `index`, or None if
+        `index` isn't part of the nest structure."""
+        if self._positions is None:
+            self._positions = {index: i for i, index in enumerate(self.indices)}
+            for entry in self._entries:
+                if not isinstance(entry, int):
+                    self._positions[entry.index] = entry
+        return self._positions.get(tuple(index))
+
+    def _index(self, index):
+        index = tuple(index)
+        found = self._lookup(index)
+        if isinstance(found, int):
+            return self.leaves[found]
+        if found is not None:
+            return found.rebuild(self.leaves)
+        # the index continues into a leaf, such as an array
+        for i in range(len(index) - 1, 0, -1):
+            found = self._lookup(index[:i])
+            if isinstance(found, int):
+                return index_nest(self.leaves[found], index[i:])
+        return index_nest(unflatten_nest(self), index)
+
+    def _argwhere(self, fn, check_nests, stop_after_n_found):
+        if self._root is None:
+            return [[]] if fn(self.leaves[0]) else False
+        found = []
+        for entry in self._entries:
+            if isinstance(entry, int):
+                if fn(self.leaves[entry]):
+                    found.append(list(self.indices[entry]))
+            elif (
+                check_nests
+                and entry is not self._root
+                and fn(entry.rebuild(self.leaves))
+            ):
+                found.append(list(entry.index))
+            if stop_after_n_found is not None and len(found) >= stop_after_n_found:
+                break
+        return found
+
+    def _update_at_indices(self, indices, fn, shallow):
+        """Replace the value at each of `indices` with ``fn(i, value)``,
+        where `i` is the position of the index in `indices`."""
+        positions = [self._lookup(index) for index in indices]
+        if not all(isinstance(position, int) for position in positions):
+            # the structure itself changes, so rebuild and flatten it again
+            nest = unflatten_nest(self)
+            for i, index in enumerate(indices):
+                value = fn(i, index_nest(nest, index))
+                nest = set_nest_at_index(nest, index, value, shallow=False)
+            ret = flatten_nest(nest, to_ignore=self._to_ignore)
+            if shallow:
+                self.__dict__.update(ret.__dict__)
+                return self
+            return ret
+        leaves = self.leaves if shallow else list(self.leaves)
+        for i, position in enumerate(positions):
+            leaves[position] = fn(i, leaves[position])
+        return self if shallow else self._with_leaves(leaves)
+
+
+@handle_exceptions
+def flatten_nest(
+    nest: Iterable,
+    /,
+    *,
+    to_ignore: Optional[Union[type, Tuple[type]]] = None,
+) -> FlatNest:
+    """Flatten a nest into a :class:`ivy.FlatNest`, holding the list of its
+    leaves and their index chains in depth-first order.
+
+    The nest is traversed only once, iteratively. Passing the returned flat
+    nest to :func:`ivy.nested_map`, :func:`ivy.nested_argwhere`,
+    :func:`ivy.multi_index_nest`, :func:`ivy.set_nest_at_indices` or
+    :func:`ivy.map_nest_at_indices` makes them linear in the number of
+    leaves, and :func:`ivy.unflatten_nest` rebuilds the nest.
+
+    Parameters
+    ----------
+    nest
+        The nest to flatten. Tuples, lists and dicts, including their
+        subclasses, are traversed.
+    to_ignore
+        Types to treat as leaves rather than traversing into them.
+
+    Returns
+    -------
+    ret
+        The flattened nest.
+
+    Examples
+    --------
+    >>> nest = {"a": [1, 2], "b": (3, {"c": 4})}
+    >>> flat = ivy.flatten_nest(nest)
+    >>> print(flat.leaves)
+    [1, 2, 3, 4]
+    >>> print(flat.indices)
+    [('a', 0), ('a', 1), ('b', 0), ('b', 1, 'c')]
+    >>> print(ivy.unflatten_nest(flat))
+    {'a': [1, 2], 'b': (3, {'c': 4})}
+    """
+    to_ignore = ivy.default(to_ignore, ())
+    nest_types = (tuple, list, dict, UserDict)
+    leaves, indices, entries = [], [], []
+    if not isinstance(nest, nest_types) or isinstance(nest, to_ignore):
+        return FlatNest([nest], [()], None, [0], to_ignore)
+    root = _NestNode(nest, (), 0)
+    stack = [(root, root.items())]
+    while stack:
+        node, children = stack[-1]
+        for key, child in children:
+            index = node.index + (key,)
+            if isinstance(child, nest_types) and not isinstance(child, to_ignore):
+                child_node = _NestNode(child, index, len(leaves))
+                node.children.append(child_node)
+                stack.append((child_node, child_node.items()))
+                break
+            node.children.append(len(leaves))
+            entries.append(len(leaves))
+            leaves.append(child)
+            indices.append(index)
+        else:
+            stack.pop()
+            node.leaf_stop = len(leaves)
+            entries.append(node)
+    return FlatNest(leaves, indices, root, entries, to_ignore)
+
+
+@handle_exceptions
+def unflatten_nest(
+    flat_nest: FlatNest,
+    /,
+    leaves: Optional[Sequence] = None,
+) -> Any:
+    """Rebuild the nest of a :class:`ivy.FlatNest` from its leaves.
+
+    Parameters
+    ----------
+    flat_nest
+        The flattened nest, as returned by :func:`ivy.flatten_nest`.
+    leaves
+        Leaves to use instead of those of `flat_nest`, in the same order.
+        Default is ``None``.
+
+    Returns
+    -------
+    ret
+        A new nest with the structure of the flattened one. The tuples, lists
+        and dicts of the original nest are not modified.
+
+    Examples
+    --------
+    >>> flat = ivy.flatten_nest([1, (2, 3)])
+    >>> print(ivy.unflatten_nest(flat, [4, 5, 6]))
+    [4, (5, 6)]
+    """
+    leaves = flat_nest.leaves if leaves is None else leaves
+    if flat_nest._root is None:
+        return leaves[0]
+    return flat_nest._root.rebuild(leaves)
@@ -1181,11 +1181,18 @@ def cumprod(
 def einsum(
     equation: str,
     *operands: Union[ivy.Array, ivy.NativeArray],
+    optimize: Union[bool, str] = False,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """Sum the product of the elements of the input operands along dimensions
     specified using a notation based on the Einstein summation convention.
 
+    With ``optimize``, a contraction of three or more operands is planned as a
+    sequence of pairwise contractions, each one run as a tensordot where
+    possible, rather than as a single einsum whose cost grows with the product
+    of the sizes of all of its indices. The plan is cached on the equation and
+    the operand shapes.
+
     Parameters
     ----------
     equation
@@ -1193,6 +1200,10 @@ def einsum(
     operands
         seq of arrays, the inputs to contract (each one an ivy.Array), whose shapes
         should be consistent with equation.
+    optimize
+        Whether to plan the contraction into pairwise contractions, and with which
+        path algorithm, either ``"greedy"`` or ``"optimal"``. ``True`` uses
+        ``"greedy"``. Default is ``False``.
     out
         optional output array, for writing the result to.
 
@@ -1295,4 +1306,6 @@ def einsum(
         b: ivy.array(15)
     }
     """
-    return current_backend(operands[0]).einsum(equation, *operands, out=out)
+    return current_backend(operands[0]).einsum(
+        equation, *operands, optimize=optimize, out=out
+    )
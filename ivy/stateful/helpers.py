@@ -1,15 +1,174 @@
 """Base class for helper module methods."""
 
 # global
+import copy
 import functools
 import logging
 
+import numpy as np
+
 # local
 import ivy
 from ivy.data_classes.container import Container
 from ivy.func_wrapper import _get_first_array
 
 
+# Flat Buffers #
+# -------------#
+
+
+def _to_native(x):
+    return x._data if isinstance(x, ivy.Array) else x
+
+
+class _ParamGroup:
+    """Variables of one dtype and device, concatenated into one flat
+    buffer."""
+
+    def __init__(self, key, idxs, shapes, device):
+        self.key = key
+        self.idxs = idxs
+        self.shapes = shapes
+        sizes = [int(np.prod(shape)) for shape in shapes]
+        self.offsets = np.cumsum([0] + sizes).tolist()
+        self.num_segments = len(idxs)
+        # the index of the variable each element of the flat buffer belongs to,
+        # for the layer-wise norms
+        self.segment_ids = ivy.array(
+            np.repeat(np.arange(len(idxs)), sizes), dtype="int64", device=device
+        )
+
+    def concat(self, natives):
+        return ivy.Array(
+            ivy.current_backend().concat([natives[i] for i in self.idxs], axis=None)
+        )
+
+    def split(self, flat, leaves):
+        flat = flat._data
+        backend = ivy.current_backend()
+        for i, shape, start, stop in zip(
+            self.idxs, self.shapes, self.offsets[:-1], self.offsets[1:]
+        ):
+            leaves[i] = ivy.Array(backend.reshape(flat[start:stop], shape))
+
+    def segment_norms(self, x):
+        """Return the vector norm of each variable in the flat buffer `x`,
+        repeated for each of its elements."""
+        sums = ivy.unsorted_segment_sum(x**2, self.segment_ids, self.num_segments)
+        return ivy.gather(ivy.sqrt(sums), self.segment_ids)
+
+
+class _ParamGroups:
+    """The leaves of a container of variables, grouped by dtype and device."""
+
+    def __init__(self, key_chains, natives):
+        self.key_chains = key_chains
+        self.signature = self.get_signature(key_chains, natives)
+        group_idxs = {}
+        for i, x in enumerate(natives):
+            group_idxs.setdefault((str(x.dtype), ivy.dev(x)), []).append(i)
+        self.groups = [
+            _ParamGroup(key, idxs, [tuple(natives[i].shape) for i in idxs], key[1])
+            for key, idxs in group_idxs.items()
+        ]
+        self.keys = tuple(group.key for group in self.groups)
+
+    @staticmethod
+    def get_signature(key_chains, natives):
+        return key_chains, tuple((tuple(x.shape), x.dtype) for x in natives)
+
+    def to_device(self, device):
+        """Return the groups moved to `device`, or None if groups of the same
+        dtype would be merged."""
+        if len({key[0] for key in self.keys}) != len(self.keys):
+            return None
+        ret = copy.copy(self)
+        ret.groups = [
+            _ParamGroup((group.key[0], device), group.idxs, group.shapes, device)
+            for group in self.groups
+        ]
+        ret.keys = tuple(group.key for group in ret.groups)
+        return ret
+
+
+class _FlatBuffers:
+    """The variables of a container stored in one flat buffer per dtype and
+    device, of which the leaves of the container are views.
+
+    The buffers are attached to the container they were built with, and
+    are only used as long as its leaves are still the views into them,
+    see ``Container._cont_get_flat_buffers``.
+    """
+
+    def __init__(self, param_groups, flats, views):
+        self.param_groups = param_groups
+        self.flats = flats
+        self.views = views
+
+    @property
+    def key_chains(self):
+        return self.param_groups.key_chains
+
+    @classmethod
+    def flatten(cls, v):
+        """Copy the leaves of `v` into flat buffers, and return a container
+        with the structure of `v` holding views into them."""
+        items = list(v.cont_to_iterator())
+        key_chains = tuple(kc for kc, _ in items)
+        natives = [_to_native(x) for _, x in items]
+        param_groups = _ParamGroups(key_chains, natives)
+        flats = {group.key: group.concat(natives) for group in param_groups.groups}
+        return cls.from_flats(v, param_groups, flats)
+
+    @classmethod
+    def from_flats(cls, template, param_groups, flats):
+        """Return a container with the structure of `template` holding views
+        into the flat buffers `flats` of `param_groups`."""
+        leaves = [None] * len(param_groups.key_chains)
+        for group in param_groups.groups:
+            group.split(flats[group.key], leaves)
+        views = [x._data for x in leaves]
+        ret = template.cont_from_flat_list(leaves)
+        ret.__dict__["_cont_flat_buffers"] = cls(param_groups, flats, views)
+        return ret
+
+    def to_device(self, template, device):
+        device = ivy.as_ivy_dev(device)
+        param_groups = self.param_groups.to_device(device)
+        if param_groups is None:
+            return self.flatten(ivy.to_device(template, device))
+        flats = {
+            new_key: ivy.to_device(self.flats[key], device)
+            for key, new_key in zip(self.param_groups.keys, param_groups.keys)
+        }
+        return self.from_flats(template, param_groups, flats)
+
+    def as_container(self):
+        """Return the flat buffers as a container, with one key per group."""
+        keys = self.param_groups.keys
+        return ivy.Container({f"group{i}": self.flats[k] for i, k in enumerate(keys)})
+
+    def from_container(self, template, flats):
+        """Inverse of `as_container`, applied to each sub-container of
+        `flats` holding the keys of the groups."""
+        if not isinstance(flats, ivy.Container):
+            return flats
+        keys = [f"group{i}" for i in range(len(self.param_groups.keys))]
+        if sorted(flats.keys()) != sorted(keys):
+            # gradients of several returned arrays
+            return ivy.Container(
+                {k: self.from_container(template, x) for k, x in flats.items()}
+            )
+        return self.from_flats(
+            template,
+            self.param_groups,
+            {
+                key: ivy.to_ivy(flats[name])
+                for key, name in zip(self.param_groups.keys, keys)
+            },
+        )
+
+
 class ModuleHelpers:
     def _find_variables(
         self,
@@ -4,6 +4,7 @@
 # local
 import ivy
 from ivy.func_wrapper import handle_nestable
+from ivy.functional.ivy.layers import _split_heads
 from ivy.stateful.initializers import GlorotUniform, Zeros
 from ivy.stateful.module import Module
 
@@ -386,6 +387,7 @@ class MultiHeadAttention(Module):
         is_causal=False,
         return_attention_weights=False,
         average_attention_weights=True,
+        kv_cache=None,
     ):
         """Perform forward pass of the MultiHeadAttention layer.
 
@@ -409,6 +411,13 @@ class MultiHeadAttention(Module):
             If true, indicates that the returned ``attention_weights`` should be averaged across
             heads. Otherwise, ``attention_weights`` are provided separately per head. Note that this flag only has an
             effect when ``return_attention_weights=True``. Default: ``True`` (i.e. average weights across heads)
+        kv_cache
+            A dict caching the projected keys and values of the previous calls, for
+            autoregressive decoding. The keys and values of this call are appended to
+            it in place, and the queries attend to all the cached keys, such that each
+            new token only projects its own key and value. With ``is_causal``, the
+            queries are taken as the last positions of the cached sequence.
+            Default is ``None``.
 
         Returns
         -------
@@ -417,6 +426,19 @@ class MultiHeadAttention(Module):
             *[batch_shape,num_queries,out_feat_dim]* if input is batched
             otherwise *[num_queries, out_feat_dim]
         """
+        static_k = static_v = None
+        if kv_cache is not None:
+            static_k, static_v = self._update_kv_cache(kv_cache, query, key, value)
+            num_queries, num_keys = query.shape[-2], static_k.shape[1]
+            if is_causal and num_queries > 1:
+                attention_mask = ivy.astype(
+                    ivy.triu(
+                        ivy.ones((num_queries, num_keys)), k=num_keys - num_queries + 1
+                    ),
+                    bool,
+                )
+            # the last query attends to all the cached keys
+            is_causal = False
         return ivy.multi_head_attention(
             query,
             key=key,
@@ -440,12 +462,40 @@ class MultiHeadAttention(Module):
             in_proj_bias=self.v.in_proj_bias if self._use_proj_bias else None,
             out_proj_bias=self.v.out_proj_bias if self._use_proj_bias else None,
             is_causal=is_causal,
+            static_k=static_k,
+            static_v=static_v,
             return_attention_weights=return_attention_weights,
             average_attention_weights=average_attention_weights,
             dropout=self._dropout_rate,
             training=self.training,
         )
 
+    def _update_kv_cache(self, kv_cache, query, key, value):
+        """Project the keys and values of this call into heads, and append them
+        to the cached ones."""
+        if key is None and value is None:
+            key = value = query
+        if key.ndim == 2:
+            key, value = ivy.expand_dims(key, axis=0), ivy.expand_dims(value, axis=0)
+        if self._qkv_same_embed_dim:
+            _, w_k, w_v = ivy.split(self.v.in_proj_weights, num_or_size_splits=3)
+        else:
+            w_k, w_v = self.v.k_proj_weights, self.v.v_proj_weights
+        b_k = b_v = None
+        if self._use_proj_bias:
+            _, b_k, b_v = ivy.split(self.v.in_proj_bias, num_or_size_splits=3)
+        k = _split_heads(
+            ivy.linear(key, w_k, bias=b_k), self._num_heads, self._head_dim
+        )
+        v = _split_heads(
+            ivy.linear(value, w_v, bias=b_v), self._num_heads, self._head_dim
+        )
+        if "k" in kv_cache:
+            k = ivy.concat([kv_cache["k"], k], axis=1)
+            v = ivy.concat([kv_cache["v"], v], axis=1)
+        kv_cache["k"], kv_cache["v"] = k, v
+        return k, v
+
     def _extra_repr(self) -> str:
         return (
             f"embed_dim={self._embed_dim}, key_dim={self._key_dim}, "
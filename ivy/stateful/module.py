@@ -9,9 +9,10 @@ from typing import Optional, Tuple, Dict
 
 # local
 import ivy
+from ivy.compiler.tracer import Graph
 from ivy.data_classes.container import Container
-from ivy.functional.ivy.gradients import _is_variable
-from ivy.stateful.helpers import ModuleHelpers
+from ivy.functional.ivy.gradients import _is_variable, _variable
+from ivy.stateful.helpers import ModuleHelpers, _FlatBuffers
 from ivy.stateful.converters import ModuleConverters
 
 
@@ -51,6 +52,7 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         training=True,
         dtype=None,
         device=None,
+        flat_params=False,
         **kwargs,
     ):
         """Initialize Ivy layer, which is a stateful object consisting of
@@ -84,6 +86,12 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         device
             Device on which to create the module's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None).
+        flat_params
+            Whether to store the variables in one contiguous flat buffer per dtype and
+            device, with the leaves of ``v`` as views into them, such that the
+            optimizers with ``foreach=True``, ``ivy.execute_with_gradients`` and
+            ``to_device`` operate on these buffers rather than on each variable.
+            (Default value = False).
         kwargs
             Keyword arguments to the _build method.
         """
@@ -108,6 +116,7 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         self._dynamic_backend = dynamic_backend
         self._device = ivy.default(device, ivy.default_device())
         self._dtype = ivy.default(dtype, ivy.default_dtype())
+        self._flat_params = flat_params
         if build_mode != "on_init":
             return
         if hasattr(Module, "_init_var"):
@@ -280,6 +289,8 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         # wrap call methods if the module is fully built
         if built:
             self._wrap_call_methods(keychain_mappings, obj=self)
+            if self._flat_params and self._v:
+                self._v = _FlatBuffers.flatten(self._v)
 
         # flag built and remove local variables if specified
         self._built = bool(built)
@@ -328,6 +339,10 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         kwargs["v"] = self.v
 
         fn_to_trace = ivy.default(self._module_graph, self._call)
+        if isinstance(fn_to_trace, Graph):
+            # graphs of the pure-Python tracer retrace the module themselves when
+            # called with new input shapes or dtypes
+            fn_to_trace = fn_to_trace.fn
 
         self._module_graph = ivy.trace_graph(
             fn_to_trace, **trace_kwargs, args=args, kwargs=kwargs
@@ -378,7 +393,16 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
     def to_device(self, device):
         """Move the weights and buffers  to the specified device."""
         self._device = ivy.default(device, self._device)
-        for obj in self.state_dict.values():
+        flat_buffers = (
+            self._v._cont_get_flat_buffers() if isinstance(self._v, Container) else None
+        )
+        if flat_buffers is not None:
+            # one transfer per flat buffer rather than per variable
+            self._v = flat_buffers.to_device(self._v, self._device)
+            state_dict = self.buffers
+        else:
+            state_dict = self.state_dict
+        for obj in state_dict.values():
             if isinstance(obj, ivy.Module):
                 obj.to_device(device)
             elif ivy.is_array(obj) or ivy.is_ivy_container(obj):
@@ -412,20 +436,62 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
             fname=fname,
         )
 
-    def save_weights(self, weights_path, /):
+    def save_weights(self, weights_path, /, *, format="h5py"):
         """Save the weights on the Module.
 
         Parameters
         ----------
         weights_path
-            The hdf5 file for saving the weights.
+            The file for saving the weights.
+        format
+            The format of the file, one of the formats of ``Container.cont_save``.
+            ``"mmap"`` saves a file which ``load_weights`` can memory-map.
+            Default is ``"h5py"``.
 
         Returns
         -------
         None
         """
-        os.makedirs("/".join(weights_path.split("/")[:-1]), exist_ok=True)
-        self.v.cont_to_disk_as_hdf5(weights_path)
+        weights_dir = os.path.dirname(weights_path)
+        if weights_dir:
+            os.makedirs(weights_dir, exist_ok=True)
+        self.v.cont_save(weights_path, format=format)
+
+    def load_weights(self, weights_path, /, *, format="h5py", key_chains=None):
+        """Load weights saved by ``save_weights`` onto the Module.
+
+        Parameters
+        ----------
+        weights_path
+            The file the weights were saved to.
+        format
+            The format of the file. Default is ``"h5py"``.
+        key_chains
+            The key chains of the weights to load, only supported by the
+            ``"mmap"`` format, whose file is then only read for these weights.
+            Default is ``None``, in which case all weights are loaded.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        IvyException
+            If ``key_chains`` is given with a format other than ``"mmap"``.
+        """
+        if key_chains is not None and format != "mmap":
+            raise ivy.utils.exceptions.IvyException(
+                f"key_chains are only supported by the mmap format, not {format}."
+            )
+        if format == "mmap":
+            v = Container.cont_from_disk_as_mmap(weights_path, key_chains=key_chains)
+        else:
+            v = Container.cont_load(weights_path, format=format)
+        v = v.cont_map(lambda x, kc: _variable(ivy.to_device(x, self._device)))
+        if self.v:
+            v = self.v.cont_overwrite_at_key_chains(v)
+        self.v = v
 
     def save(self, filename):
         """Save the module object to disk using pickle.
@@ -519,6 +585,13 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         return super().__getattribute__(name)
 
     def __setattr__(self, name, value):
+        if (
+            name == "v"
+            and getattr(self, "_flat_params", False)
+            and isinstance(value, Container)
+            and value._cont_get_flat_buffers() is None
+        ):
+            value = _FlatBuffers.flatten(value)
         if name in ["v", "buffers"]:
             name = "_" + name
         if isinstance(value, Module):
@@ -7,6 +7,7 @@ from typing import Union, Optional, Callable
 
 # local
 import ivy
+from ivy.stateful.helpers import _to_native, _FlatBuffers, _ParamGroup, _ParamGroups
 
 
 # Base #
@@ -23,6 +24,7 @@ class Optimizer(abc.ABC):
         trace_on_next_step: bool = False,
         fallback_to_non_traced: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
     ):
         """Construct a general Optimizer. This is an abstract class, and must
         be derived.
@@ -50,6 +52,10 @@ class Optimizer(abc.ABC):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to update all the variables of the same dtype and device at
+            once, concatenated into a flat buffer, rather than one by one.
+            Default is ``False``.
         """
         self._lr = lr
         self._inplace = inplace
@@ -62,6 +68,12 @@ class Optimizer(abc.ABC):
         self._count = ivy.array([0], device=self._dev)
         self._traced_step_fn = None
         self._traced = False
+        self._foreach = foreach
+        self._param_groups = None
+        self._foreach_template = None
+        # the state of the foreach updates, either as a container or as a dict
+        # mapping each parameter group to its flat buffer
+        self._foreach_state = {}
 
     # Private #
     # --------#
@@ -88,8 +100,124 @@ class Optimizer(abc.ABC):
         """
         raise ivy.utils.exceptions.IvyNotImplementedException
 
+    def _foreach_update(self, group: _ParamGroup, w: ivy.Array, g: ivy.Array, lr):
+        """Update the flat buffer w of a group of variables of the same dtype
+        and device, using the flat buffer g of their gradients. Override this
+        method to support the foreach updates.
+
+        Parameters
+        ----------
+        group
+            The group of variables.
+        w
+            The variables of the group, concatenated into a flat array.
+        g
+            The gradients of the variables of the group, concatenated into a flat
+            array.
+        lr
+            Learning rate of the step.
+
+        Returns
+        -------
+        ret
+            The updated flat array of variables.
+        """
+        raise ivy.utils.exceptions.IvyNotImplementedException
+
     # Given #
 
+    def _update_param_groups(self, v, key_chains, natives, param_groups=None):
+        signature = _ParamGroups.get_signature(key_chains, natives)
+        if (
+            self._param_groups is not None
+            and self._param_groups.signature == signature
+            and (param_groups is None or param_groups.keys == self._param_groups.keys)
+        ):
+            return
+        # the flat state of the previous groups is moved to the new ones through
+        # containers
+        for name in self._foreach_state:
+            self._foreach_state[name] = self._get_foreach_state(name)
+        self._param_groups = (
+            _ParamGroups(key_chains, natives) if param_groups is None else param_groups
+        )
+        self._foreach_template = v
+
+    def _get_foreach_state(self, name):
+        state = self._foreach_state.get(name)
+        if state is None or isinstance(state, ivy.Container):
+            return state
+        leaves = [None] * len(self._param_groups.key_chains)
+        for group in self._param_groups.groups:
+            group.split(state[group.key], leaves)
+        return self._foreach_template.cont_from_flat_list(leaves)
+
+    def _set_foreach_state(self, name, state):
+        self._foreach_state[name] = state
+
+    def _get_flat_state(self, group, name):
+        state = self._foreach_state.get(name)
+        if isinstance(state, ivy.Container):
+            natives = [_to_native(state[kc]) for kc in self._param_groups.key_chains]
+            state = {g.key: g.concat(natives) for g in self._param_groups.groups}
+            self._foreach_state[name] = state
+        return None if state is None else state.get(group.key)
+
+    def _set_flat_state(self, group, name, x):
+        self._foreach_state.setdefault(name, {})[group.key] = x
+
+    def _foreach_step(self, v: ivy.Container, grads: ivy.Container):
+        """Update nested variables container v with the foreach updates of the
+        child class, applied once to each group of variables of the same dtype
+        and device.
+
+        The variables and gradients which are views into flat buffers are
+        updated through these buffers directly, and the updated variables are
+        returned as views into the new flat buffers, such that the next step
+        doesn't concatenate them again.
+
+        Parameters
+        ----------
+        v
+            Nested variables to update.
+        grads
+            Nested gradients to update.
+
+        Returns
+        -------
+        ret
+            The updated variables.
+        """
+        flat_v = v._cont_get_flat_buffers()
+        if flat_v is None:
+            items = list(v.cont_to_iterator())
+            key_chains = tuple(kc for kc, _ in items)
+            ws = [_to_native(w) for _, w in items]
+        else:
+            key_chains, ws = flat_v.key_chains, flat_v.views
+        self._update_param_groups(
+            v, key_chains, ws, None if flat_v is None else flat_v.param_groups
+        )
+        flat_g = grads._cont_get_flat_buffers()
+        if flat_g is not None and (
+            flat_g.param_groups.signature != self._param_groups.signature
+            or flat_g.param_groups.keys != self._param_groups.keys
+        ):
+            flat_g = None
+        if flat_g is None:
+            grad_items = list(grads.cont_to_iterator())
+            if tuple(kc for kc, _ in grad_items) == key_chains:
+                gs = [_to_native(g) for _, g in grad_items]
+            else:
+                gs = [_to_native(grads[kc]) for kc in key_chains]
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+        new_flats = {}
+        for group in self._param_groups.groups:
+            w = group.concat(ws) if flat_v is None else flat_v.flats[group.key]
+            g = group.concat(gs) if flat_g is None else flat_g.flats[group.key]
+            new_flats[group.key] = self._foreach_update(group, w, g, lr)
+        return _FlatBuffers.from_flats(v, self._param_groups, new_flats)
+
     def _step_fn(
         self, v: ivy.Container, grads: ivy.Container, ignore_missing: bool = False
     ):
@@ -106,9 +234,10 @@ class Optimizer(abc.ABC):
             the variables.
             Default is ``False``
         """
+        step = self._foreach_step if self._foreach else self._step
         if ignore_missing:
-            return v.cont_set_at_keys(self._step(v.cont_at_key_chains(grads), grads))
-        return self._step(v, grads)
+            return v.cont_set_at_keys(step(v.cont_at_key_chains(grads), grads))
+        return step(v, grads)
 
     # Public #
     # -------#
@@ -166,6 +295,7 @@ class SGD(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
+        foreach: bool = False,
     ):
         """Construct a Stochastic-Gradient-Descent (SGD) optimizer.
 
@@ -183,9 +313,18 @@ class SGD(Optimizer):
             Default is ``True``.
         trace_on_next_step
             Whether to trace the optimizer on the next step. Default is ``False``.
+        foreach
+            Whether to update all the variables of the same dtype and device at
+            once, concatenated into a flat buffer, rather than one by one.
+            Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, trace_on_next_step=trace_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            trace_on_next_step=trace_on_next_step,
+            foreach=foreach,
         )
 
     # Custom Step
@@ -213,6 +352,11 @@ class SGD(Optimizer):
             stop_gradients=self._stop_gradients,
         )
 
+    def _foreach_update(self, group, w, g, lr):
+        return ivy.gradient_descent_update(
+            w, g, lr, stop_gradients=self._stop_gradients
+        )
+
     def set_state(self, state: ivy.Container):
         """Set state of the optimizer.
 
@@ -236,6 +380,7 @@ class LARS(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
+        foreach: bool = False,
     ):
         """Construct a Layer-wise Adaptive Rate Scaling (LARS) optimizer.
 
@@ -255,10 +400,19 @@ class LARS(Optimizer):
             Default is ``True``.
         trace_on_next_step
             Whether to trace the optimizer on the next step. Default is ``False``.
+        foreach
+            Whether to update all the variables of the same dtype and device at
+            once, concatenated into a flat buffer, rather than one by one.
+            Default is ``False``.
         """
         self._decay_lambda = decay_lambda
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, trace_on_next_step=trace_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            trace_on_next_step=trace_on_next_step,
+            foreach=foreach,
         )
 
     # Custom Step
@@ -287,6 +441,16 @@ class LARS(Optimizer):
             stop_gradients=self._stop_gradients,
         )
 
+    def _foreach_update(self, group, w, g, lr):
+        # the layer-wise norms of ivy.lars_update, one per variable of the group
+        w_norm = group.segment_norms(w)
+        lr = ivy.stable_divide(w_norm * lr, group.segment_norms(g))
+        if self._decay_lambda > 0:
+            lr /= w_norm * self._decay_lambda
+        return ivy.gradient_descent_update(
+            w, g, lr, stop_gradients=self._stop_gradients
+        )
+
     def set_state(self, state: ivy.Container):
         """Set state of the optimizer.
 
@@ -313,6 +477,7 @@ class Adam(Optimizer):
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
     ):
         """Construct an ADAM optimizer.
 
@@ -340,6 +505,10 @@ class Adam(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to update all the variables of the same dtype and device at
+            once, concatenated into a flat buffer, rather than one by one.
+            Default is ``False``.
         """
         self._beta1 = beta1
         self._beta2 = beta2
@@ -350,7 +519,14 @@ class Adam(Optimizer):
         self._should_trace = False
 
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, trace_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            trace_on_next_step,
+            device=device,
+            foreach=foreach,
         )
 
     # Custom Step
@@ -390,6 +566,27 @@ class Adam(Optimizer):
         )
         return new_v
 
+    def _foreach_update(self, group, w, g, lr):
+        mw = self._get_flat_state(group, "mw")
+        vw = self._get_flat_state(group, "vw")
+        if mw is None:
+            mw, vw = g, g**2
+        new_w, mw, vw = ivy.adam_update(
+            w,
+            g,
+            lr,
+            mw,
+            vw,
+            self._count,
+            beta1=self._beta1,
+            beta2=self._beta2,
+            epsilon=self._epsilon,
+            stop_gradients=self._stop_gradients,
+        )
+        self._set_flat_state(group, "mw", mw)
+        self._set_flat_state(group, "vw", vw)
+        return new_w
+
     def set_state(self, state: ivy.Container):
         """Set state of the optimizer.
 
@@ -398,11 +595,22 @@ class Adam(Optimizer):
         state
             Nested state to update.
         """
+        if self._foreach:
+            self._set_foreach_state("mw", state.mw)
+            self._set_foreach_state("vw", state.vw)
+            return
         self._mw = state.mw
         self._vw = state.vw
 
     @property
     def state(self):
+        if self._foreach:
+            return ivy.Container(
+                {
+                    "mw": self._get_foreach_state("mw"),
+                    "vw": self._get_foreach_state("vw"),
+                }
+            )
         return ivy.Container({"mw": self._mw, "vw": self._vw})
 
 
@@ -418,6 +626,7 @@ class AdamW(Adam):
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
     ):
         """Construct an ADAMW optimizer.
 
@@ -447,6 +656,10 @@ class AdamW(Adam):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to update all the variables of the same dtype and device at
+            once, concatenated into a flat buffer, rather than one by one.
+            Default is ``False``.
         """
         self._weight_decay = weight_decay
         super().__init__(
@@ -458,6 +671,7 @@ class AdamW(Adam):
             stop_gradients,
             trace_on_next_step,
             device,
+            foreach,
         )
 
     def _step(self, v: ivy.Container, grads: ivy.Container):
@@ -482,6 +696,11 @@ class AdamW(Adam):
 
         return super()._step(v, grads)
 
+    def _foreach_update(self, group, w, g, lr):
+        if self._weight_decay != 0:
+            g = g + self._weight_decay * w
+        return super()._foreach_update(group, w, g, lr)
+
 
 class LAMB(Optimizer):
     def __init__(
@@ -496,6 +715,7 @@ class LAMB(Optimizer):
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
     ):
         """Construct an LAMB optimizer.
 
@@ -528,9 +748,20 @@ class LAMB(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to update all the variables of the same dtype and device at
+            once, concatenated into a flat buffer, rather than one by one.
+            Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, trace_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            trace_on_next_step,
+            device=device,
+            foreach=foreach,
         )
         self._beta1 = beta1
         self._beta2 = beta2
@@ -580,6 +811,34 @@ class LAMB(Optimizer):
         )
         return new_v
 
+    def _foreach_update(self, group, w, g, lr):
+        mw = self._get_flat_state(group, "mw")
+        vw = self._get_flat_state(group, "vw")
+        if mw is None:
+            mw, vw = g, g**2
+        # the layer-wise trust ratios of ivy.lamb_update, one per variable of the
+        # group
+        r1 = group.segment_norms(w)
+        eff_grads, mw, vw = ivy.adam_step(
+            g,
+            mw,
+            vw,
+            self._count,
+            beta1=self._beta1,
+            beta2=self._beta2,
+            epsilon=self._epsilon,
+        )
+        if self._decay_lambda > 0:
+            r2 = group.segment_norms(eff_grads + self._decay_lambda * w)
+        else:
+            r2 = group.segment_norms(eff_grads)
+        r = ivy.minimum(ivy.stable_divide(r1, r2), float(self._max_trust_ratio))
+        self._set_flat_state(group, "mw", mw)
+        self._set_flat_state(group, "vw", vw)
+        return ivy.optimizer_update(
+            w, eff_grads, r * lr, stop_gradients=self._stop_gradients
+        )
+
     def set_state(self, state: ivy.Container):
         """Set state of the optimizer.
 
@@ -588,9 +847,20 @@ class LAMB(Optimizer):
         state
             Nested state to update.
         """
+        if self._foreach:
+            self._set_foreach_state("mw", state.mw)
+            self._set_foreach_state("vw", state.vw)
+            return
         self._mw = state.mw
         self._vw = state.vw
 
     @property
     def state(self):
+        if self._foreach:
+            return ivy.Container(
+                {
+                    "mw": self._get_foreach_state("mw"),
+                    "vw": self._get_foreach_state("vw"),
+                }
+            )
         return ivy.Container({"mw": self._mw, "vw": self._vw})
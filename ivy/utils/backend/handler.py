@@ -6,11 +6,12 @@ import ivy
 import importlib
 import functools
 import numpy as np
-import gc
+import weakref
 from ivy.utils import _importlib, verbosity
 
 # local
 from ivy.func_wrapper import _wrap_function
+from ivy.utils.backend import sub_backend_handler
 from ivy.utils.backend.sub_backend_handler import (
     _clear_current_sub_backends,
     fn_name_from_version_specific_fn_name,
@@ -24,6 +25,16 @@ implicit_backend = "numpy"
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = {}
 
+# the version of ivy's namespace `ivy_original_dict` was copied at, and the
+# updates restoring it to the ivy and ivy.functional namespaces
+_original_dict_version = None
+_original_updates = None
+
+
+# fully wrapped namespaces of the backends set so far, keyed on the backend
+# string and on whether cython wrappers were used to build them
+_backend_snapshots = {}
+
 
 class ContextManager:
     def __init__(self, module):
@@ -196,8 +207,118 @@ def current_backend(*args, **kwargs):
     return importlib.import_module(_backend_dict[implicit_backend])
 
 
+def _array_leaf(value):
+    return tuple(value.shape), getattr(value, "dtype", None)
+
+
+class _NamespaceSnapshot:
+    """Record of every namespace update made while setting a backend, which
+    can be replayed to set that backend again without re-wrapping any
+    functions."""
+
+    def __init__(self, original_dict, version):
+        self.version = version
+        # arrays can be reshaped or recast in place without changing the
+        # version of the namespace, so their shapes and dtypes are recorded
+        self.original_arrays = [
+            (v, _array_leaf(v))
+            for v in original_dict.values()
+            if hasattr(type(v), "shape")
+        ]
+        self.sub_backends = ()
+        self.sub_backend_original_dict = None
+        self._updates = {}
+
+    def _entry(self, namespace):
+        if id(namespace) not in self._updates:
+            self._updates[id(namespace)] = (namespace, {}, set())
+        return self._updates[id(namespace)]
+
+    def set(self, namespace, key, value):
+        _, updates, deletions = self._entry(namespace)
+        updates[key] = value
+        deletions.discard(key)
+
+    def delete(self, namespace, key):
+        _, updates, deletions = self._entry(namespace)
+        updates.pop(key, None)
+        deletions.add(key)
+
+    def record_sub_backends(self):
+        # the sub-backends are set on top of the backend, and replayed with it
+        original_dict = sub_backend_handler.original_backend_dict
+        self.sub_backends = tuple(ivy.current_sub_backends)
+        self.sub_backend_original_dict = original_dict
+        if original_dict is None:
+            return
+        for k, v in ivy.__dict__.items():
+            if original_dict.get(k) is not v:
+                self.set(ivy.__dict__, k, v)
+
+    def is_valid_for(self, version):
+        # the snapshot is stale if ivy's namespace was updated, or any of its
+        # arrays reshaped or recast in place, since it was recorded
+        return version == self.version and all(
+            _array_leaf(v) == leaf for v, leaf in self.original_arrays
+        )
+
+    def apply(self):
+        for namespace, updates, deletions in self._updates.values():
+            namespace.update(updates)
+            for key in deletions:
+                namespace.pop(key, None)
+        sub_backend_handler.original_backend_dict = self.sub_backend_original_dict
+        ivy.current_sub_backends[:] = self.sub_backends
+
+
+def _get_backend_snapshot(backend_str):
+    snapshot = _backend_snapshots.get((backend_str, ivy.cython_wrappers_mode))
+    if snapshot is not None and snapshot.is_valid_for(_original_dict_version):
+        return snapshot
+    return None
+
+
+def _get_original_updates():
+    # the updates restoring ivy's own namespace, computed once per copy of it
+    global _original_updates
+    if _original_updates is None:
+        global_props = set(ivy.GLOBAL_PROPS)
+        original_dict = {
+            k: v for k, v in ivy_original_dict.items() if k not in global_props
+        }
+        _original_updates = original_dict, {
+            k: v
+            for k, v in original_dict.items()
+            if k in ivy.functional.__dict__ and not k.startswith("__")
+        }
+    return _original_updates
+
+
+def clear_backend_snapshots():
+    """Discard the cached namespaces of all previously set backends.
+
+    `set_backend` wraps all functions of a backend only the first time it is
+    set, and replays the resulting namespace on every later call. This
+    function needs to be called after modifying a backend module in place,
+    for the change to be picked up by the next call to `set_backend`.
+
+    Examples
+    --------
+    >>> ivy.set_backend("numpy")
+    >>> ivy.previous_backend()
+    >>> ivy.utils.backend.clear_backend_snapshots()
+    >>> ivy.set_backend("numpy")  # re-wraps the numpy backend
+    """
+    _backend_snapshots.clear()
+
+
 def _set_module_backend(
-    original_dict, target, backend, invalid_dtypes=None, backend_str=None
+    original_dict,
+    target,
+    backend,
+    invalid_dtypes=None,
+    backend_str=None,
+    snapshot=None,
 ):
     invalid_dtypes = (
         backend.invalid_dtypes if invalid_dtypes is None else invalid_dtypes
@@ -208,13 +329,18 @@ def _set_module_backend(
             continue
         compositional = k not in backend.__dict__
         if compositional:
-            if k in invalid_dtypes and k in target.__dict__:
-                del target.__dict__[k]
-                continue
+            if k in invalid_dtypes:
+                if snapshot is not None:
+                    snapshot.delete(target.__dict__, k)
+                if k in target.__dict__:
+                    del target.__dict__[k]
+                    continue
             backend.__dict__[k] = v
         target.__dict__[k] = _wrap_function(
             key=k, to_wrap=backend.__dict__[k], original=v, compositional=compositional
         )
+        if snapshot is not None:
+            snapshot.set(target.__dict__, k, target.__dict__[k])
         if (
             isinstance(v, types.ModuleType)
             and "ivy.functional." in v.__name__
@@ -226,6 +352,7 @@ def _set_module_backend(
                 backend.__dict__[k],
                 invalid_dtypes=invalid_dtypes,
                 backend_str=backend_str,
+                snapshot=snapshot,
             )
 
 
@@ -247,6 +374,32 @@ def _data_to_new_backend(x, previous_backend):
     return result
 
 
+# Array Registry #
+# -------------- #
+
+# all live ivy.Array instances, grouped by the backend of their data
+_array_registry = {}
+
+
+def _register_array(x, previous_backend=None):
+    """Track `x` under its current backend, moving it out of the group of
+    `previous_backend` if its backend has changed."""
+    if previous_backend is not None and previous_backend != x._backend:
+        _array_registry[previous_backend].pop(id(x), None)
+    if x._backend not in _array_registry:
+        _array_registry[x._backend] = weakref.WeakValueDictionary()
+    _array_registry[x._backend][id(x)] = x
+
+
+def _get_registered_arrays(backend=None):
+    """Return the live ivy.Array instances of `backend`, or of all backends if
+    `backend` is None, in the order they were registered."""
+    if backend is not None:
+        registry = _array_registry.get(backend)
+        return list(registry.values()) if registry is not None else []
+    return [x for registry in list(_array_registry.values()) for x in registry.values()]
+
+
 def dynamic_backend_converter(backend_stack):
     from ivy.functional.ivy.gradients import _variable
 
@@ -276,51 +429,30 @@ def dynamic_backend_converter(backend_stack):
                 return False
             return backend.gradients._is_variable(obj)
 
-    # get all ivy array instances in the project scope
-    container_list = [
-        obj
-        for obj in gc.get_objects()
-        if "ivy" in type(obj).__module__ and isinstance(obj, ivy.Container)
-    ]
-    cont_array_idxs = ivy.nested_argwhere(
-        container_list,
-        lambda x: isinstance(x, ivy.Array) and x.backend != ivy.current_backend_str(),
-    )
-    cont_array_vals = ivy.multi_index_nest(container_list, cont_array_idxs)
-    array_list = [
-        obj
-        for obj in gc.get_objects()
-        if "ivy" in type(obj).__module__ and isinstance(obj, ivy.Array)
-    ]
-    array_list.extend(cont_array_vals)
-
-    # filter uninitialized arrays and arrays with other backends, and ensure the order
-    array_list = [
-        arr
-        for arr in array_list
-        if arr.__dict__ and arr.backend != ivy.current_backend_str()
-    ]
-    new_objs = [obj for obj in array_list if obj.dynamic_backend]
-
-    # now convert all ivy.Array and ivy.Container instances
-    # to the new backend
-
-    for obj in new_objs:
-        # the following if condition avoids converting arrays that were already
-        # updated inplace i.e. are references to other arrays
-        if obj.backend != ivy.current_backend_str():
-            backend = ivy.with_backend(obj.backend, cached=True)
-            if _is_var(obj, backend):
-                native_var = backend.gradients._variable_data(obj)
-                data = _data_to_new_backend(native_var, backend)
-                new_data = _variable(data)
-
-            else:
-                new_data = _data_to_new_backend(obj, backend)
+    # convert the arrays of each other backend as a batch, creating the
+    # backend they are currently on only once
+    current_backend_str = ivy.current_backend_str()
+    for backend_str in list(_array_registry):
+        if backend_str == current_backend_str:
+            continue
+        new_objs = [
+            obj for obj in _get_registered_arrays(backend_str) if obj.dynamic_backend
+        ]
+        if not new_objs:
+            continue
+        backend = ivy.with_backend(backend_str, cached=True)
+        for obj in new_objs:
+            # the following if condition avoids converting arrays that were already
+            # updated inplace i.e. are references to other arrays
+            if obj.backend != current_backend_str:
+                if _is_var(obj, backend):
+                    native_var = backend.gradients._variable_data(obj)
+                    data = _data_to_new_backend(native_var, backend)
+                    new_data = _variable(data)
+
+                else:
+                    new_data = _data_to_new_backend(obj, backend)
 
-            if isinstance(obj, ivy.Container):
-                obj.cont_inplace_update(new_data)
-            else:
                 obj.data = new_data.data
 
 
@@ -355,34 +487,51 @@ def set_backend(backend: str, dynamic: bool = False):
 
     # update the global dict with the new backend
     with ivy.locks["backend_setter"]:
-        global ivy_original_dict
-        if not backend_stack:
+        global ivy_original_dict, _original_dict_version, _original_updates
+        if not backend_stack and _original_dict_version != ivy._namespace_version:
             ivy_original_dict = ivy.__dict__.copy()
+            _original_dict_version = ivy._namespace_version
+            _original_updates = None
         _clear_current_sub_backends()
+        backend_str = (
+            backend if isinstance(backend, str) else backend.current_backend_str()
+        )
+        snapshot = _get_backend_snapshot(backend_str)
         if isinstance(backend, str):
-            temp_stack = []
-            while backend_stack:
-                temp_stack.append(previous_backend())
-            backend = importlib.import_module(_backend_dict[backend])
-            for fw in reversed(temp_stack):
-                backend_stack.append(fw)
+            if snapshot is None:
+                temp_stack = []
+                while backend_stack:
+                    temp_stack.append(previous_backend())
+                backend = importlib.import_module(_backend_dict[backend])
+                for fw in reversed(temp_stack):
+                    backend_stack.append(fw)
+            else:
+                backend = importlib.import_module(_backend_dict[backend])
         if backend.current_backend_str() == "numpy":
             ivy.set_default_device("cpu")
         elif backend.current_backend_str() == "jax":
             ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
         backend_stack.append(backend)
-        set_backend_to_specific_version(backend)
-        _set_module_backend(ivy_original_dict, ivy, backend)
-        # following snippet is required to update the ivy.functional namespace with
-        # backend-specific functions
-        for key in ivy.__dict__.keys():
-            if key in ivy.functional.__dict__ and not key.startswith("__"):
-                ivy.functional.__dict__[key] = ivy.__dict__[key]
+        if snapshot is None:
+            snapshot = _NamespaceSnapshot(ivy_original_dict, _original_dict_version)
+            set_backend_to_specific_version(backend)
+            _set_module_backend(ivy_original_dict, ivy, backend, snapshot=snapshot)
+            # following snippet is required to update the ivy.functional namespace
+            # with backend-specific functions
+            for key in ivy.__dict__.keys():
+                if key in ivy.functional.__dict__ and not key.startswith("__"):
+                    ivy.functional.__dict__[key] = ivy.__dict__[key]
+                    snapshot.set(ivy.functional.__dict__, key, ivy.__dict__[key])
+            for sub_backend in ivy.available_sub_backends:
+                ivy.set_sub_backend(sub_backend)
+            snapshot.record_sub_backends()
+            _backend_snapshots[(backend_str, ivy.cython_wrappers_mode)] = snapshot
+        else:
+            # the sub-backends are replayed along with the backend
+            snapshot.apply()
 
         if dynamic:
             dynamic_backend_converter(backend_stack)
-        for sub_backend in ivy.available_sub_backends:
-            ivy.set_sub_backend(sub_backend)
         if verbosity.level > 0:
             verbosity.cprint(f"backend stack: {backend_stack}")
     _handle_inplace_mode()
@@ -486,20 +635,32 @@ def previous_backend():
                 ivy.set_default_device("cpu")
             elif new_backend.current_backend_str() == "jax":
                 ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
-        new_backend_dict = (
-            backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
+        snapshot = (
+            _get_backend_snapshot(backend_stack[-1].current_backend_str())
+            if backend_stack
+            else None
         )
-        # wrap backend functions if there still is a backend, and add functions
-        # to ivy namespace
-        for k, v in new_backend_dict.items():
-            if k in ivy.GLOBAL_PROPS:
-                continue
-            if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
-            if k in ivy_original_dict:
-                ivy.__dict__[k] = v
-            if k in ivy.functional.__dict__ and not k.startswith("__"):
-                ivy.functional.__dict__[k] = v
+        if snapshot is not None:
+            # the backend has been wrapped before, so just replay its namespace
+            snapshot.apply()
+        elif not backend_stack:
+            # restore ivy's own implementations in bulk
+            original_updates, functional_updates = _get_original_updates()
+            ivy.__dict__.update(original_updates)
+            ivy.functional.__dict__.update(functional_updates)
+        else:
+            new_backend_dict = backend_stack[-1].__dict__
+            # wrap backend functions if there still is a backend, and add
+            # functions to ivy namespace
+            for k, v in new_backend_dict.items():
+                if k in ivy.GLOBAL_PROPS:
+                    continue
+                if backend_stack and k in ivy_original_dict:
+                    v = _wrap_function(k, v, ivy_original_dict[k])
+                if k in ivy_original_dict:
+                    ivy.__dict__[k] = v
+                if k in ivy.functional.__dict__ and not k.startswith("__"):
+                    ivy.functional.__dict__[k] = v
     if verbosity.level > 0:
         verbosity.cprint(f"backend stack: {backend_stack}")
     _handle_inplace_mode()
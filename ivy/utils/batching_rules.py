@@ -0,0 +1,835 @@
+# Batching rules, with which the backends lacking a native vmap run the
+# vectorized function once over the whole batch rather than once per example
+
+import contextvars
+import functools
+import importlib
+import inspect
+import string
+
+import ivy
+
+# the modules of the functions which are rebound while the function being
+# vectorized runs, functions of these without a batching rule are looped over
+_batched_modules = (
+    "activations",
+    "creation",
+    "elementwise",
+    "layers",
+    "linear_algebra",
+    "losses",
+    "manipulation",
+    "norms",
+    "searching",
+    "set",
+    "sorting",
+    "statistical",
+    "utility",
+)
+
+_batching_rules = {}
+
+# whether the vectorized function of a batched call runs in the current context,
+# the rebound functions call the original ones everywhere else, such that the
+# other threads running ivy meanwhile are unaffected
+_batching = contextvars.ContextVar("batching", default=False)
+
+# the ivy namespace is rebound for all the batched calls running at the same
+# time, in any thread, and restored when the last of them returns, both under
+# the lock of the backend setter such that neither interleaves with a change of
+# backend
+_rebind_count = 0
+
+# the numpy ufuncs named differently from the ivy functions they stand for
+_ufunc_names = {
+    "absolute": "abs",
+    "arccos": "acos",
+    "arccosh": "acosh",
+    "arcsin": "asin",
+    "arcsinh": "asinh",
+    "arctan": "atan",
+    "arctan2": "atan2",
+    "arctanh": "atanh",
+    "conjugate": "conj",
+    "invert": "bitwise_invert",
+    "left_shift": "bitwise_left_shift",
+    "power": "pow",
+    "right_shift": "bitwise_right_shift",
+    "true_divide": "divide",
+}
+
+
+class _NoBatchingRule(ivy.utils.exceptions.IvyException):
+    """Raised where the function being vectorized does something the batching
+    rules can't follow, such that the backend falls back to calling it on each
+    example instead."""
+
+
+class _NoBatchingAttribute(_NoBatchingRule, AttributeError):
+    # still an AttributeError, for hasattr to keep returning False
+    pass
+
+
+def _batching_rule(*names):
+    def _register(rule):
+        for name in names:
+            _batching_rules[name] = rule
+        return rule
+
+    return _register
+
+
+class BatchedArray:
+    """A batch of arrays stacked along axis 0, which stands in for a single one
+    of them while a vectorized function runs.
+
+    The ivy functions called on it apply their batching rule to the whole
+    batch, such that the function runs once, as it would on a single example.
+    """
+
+    def __init__(self, data):
+        self.data = data
+
+    @property
+    def shape(self):
+        return ivy.Shape(tuple(self.data.shape)[1:])
+
+    @property
+    def ndim(self):
+        return len(self.data.shape) - 1
+
+    @property
+    def dtype(self):
+        return ivy.dtype(self.data)
+
+    @property
+    def device(self):
+        return ivy.dev(self.data)
+
+    def __len__(self):
+        return self.data.shape[1]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __bool__(self):
+        raise _NoBatchingRule(
+            "The truth value of an array being vectorized depends on the example, "
+            "control flow on it can't be batched."
+        )
+
+    def _not_batched(self, *args, **kwargs):
+        raise _NoBatchingRule(
+            "An array being vectorized can't be converted to a single value or to "
+            "an array of another framework."
+        )
+
+    __array__ = __int__ = __float__ = __complex__ = __index__ = _not_batched
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # the numpy ufuncs called on the batch, including the operators of the
+        # numpy arrays, apply the batching rule of the matching ivy function
+        fn = getattr(ivy, _ufunc_names.get(ufunc.__name__, ufunc.__name__), None)
+        if method != "__call__" or kwargs or not _is_batched_fn(fn):
+            raise _NoBatchingRule(f"numpy.{ufunc.__name__} can't be batched.")
+        return fn(*inputs)
+
+    def __getattr__(self, name):
+        # the methods of ivy.Array, such as x.sum()
+        if not name.startswith("_") and callable(getattr(ivy, name, None)):
+            return functools.partial(getattr(ivy, name), self)
+        if not name.startswith("_") and hasattr(ivy.Array, name):
+            raise _NoBatchingAttribute(f"Array.{name} can't be batched.")
+        raise AttributeError(name)
+
+    def __getitem__(self, query):
+        return _get_item(self, query)
+
+    def __repr__(self):
+        return f"BatchedArray({self.data!r})"
+
+    # Operators #
+    # --------- #
+
+    def __add__(self, other):
+        return ivy.add(self, other)
+
+    def __radd__(self, other):
+        return ivy.add(other, self)
+
+    def __sub__(self, other):
+        return ivy.subtract(self, other)
+
+    def __rsub__(self, other):
+        return ivy.subtract(other, self)
+
+    def __mul__(self, other):
+        return ivy.multiply(self, other)
+
+    def __rmul__(self, other):
+        return ivy.multiply(other, self)
+
+    def __truediv__(self, other):
+        return ivy.divide(self, other)
+
+    def __rtruediv__(self, other):
+        return ivy.divide(other, self)
+
+    def __floordiv__(self, other):
+        return ivy.floor_divide(self, other)
+
+    def __rfloordiv__(self, other):
+        return ivy.floor_divide(other, self)
+
+    def __mod__(self, other):
+        return ivy.remainder(self, other)
+
+    def __rmod__(self, other):
+        return ivy.remainder(other, self)
+
+    def __pow__(self, other):
+        return ivy.pow(self, other)
+
+    def __rpow__(self, other):
+        return ivy.pow(other, self)
+
+    def __matmul__(self, other):
+        return ivy.matmul(self, other)
+
+    def __rmatmul__(self, other):
+        return ivy.matmul(other, self)
+
+    def __neg__(self):
+        return ivy.negative(self)
+
+    def __pos__(self):
+        return ivy.positive(self)
+
+    def __abs__(self):
+        return ivy.abs(self)
+
+    def __invert__(self):
+        return ivy.bitwise_invert(self)
+
+    def __and__(self, other):
+        return ivy.bitwise_and(self, other)
+
+    def __or__(self, other):
+        return ivy.bitwise_or(self, other)
+
+    def __xor__(self, other):
+        return ivy.bitwise_xor(self, other)
+
+    def __eq__(self, other):
+        return ivy.equal(self, other)
+
+    def __ne__(self, other):
+        return ivy.not_equal(self, other)
+
+    def __lt__(self, other):
+        return ivy.less(self, other)
+
+    def __le__(self, other):
+        return ivy.less_equal(self, other)
+
+    def __gt__(self, other):
+        return ivy.greater(self, other)
+
+    def __ge__(self, other):
+        return ivy.greater_equal(self, other)
+
+
+# Helpers #
+# ------- #
+
+
+def _is_batched(x):
+    return isinstance(x, BatchedArray) or (
+        isinstance(x, (list, tuple)) and any(isinstance(i, BatchedArray) for i in x)
+    )
+
+
+def _contains_batched(xs):
+    return any(_is_batched(x) for x in xs)
+
+
+def _batch_size(xs):
+    for x in xs:
+        if isinstance(x, BatchedArray):
+            return x.data.shape[0]
+        if isinstance(x, (list, tuple)):
+            for i in x:
+                if isinstance(i, BatchedArray):
+                    return i.data.shape[0]
+
+
+def _example(x, i):
+    if isinstance(x, BatchedArray):
+        return x.data[i]
+    if isinstance(x, (list, tuple)) and _is_batched(x):
+        return type(x)(_example(j, i) for j in x)
+    return x
+
+
+def _example_ndim(x):
+    if isinstance(x, BatchedArray):
+        return x.ndim
+    if ivy.is_array(x):
+        return len(x.shape)
+    return 0
+
+
+def _align(x, ndim):
+    # insert unit axes after the batch axis, for the trailing axes of all the
+    # arguments to broadcast against each other as they do for one example
+    if not isinstance(x, BatchedArray):
+        return x
+    shape = tuple(x.data.shape)
+    return ivy.reshape(x.data, shape[:1] + (1,) * (ndim - x.ndim) + shape[1:])
+
+
+def _data(x):
+    return x.data if isinstance(x, BatchedArray) else x
+
+
+def _as_matrix(x, axis):
+    if isinstance(x, BatchedArray):
+        return BatchedArray(ivy.to_native(ivy.expand_dims(x.data, axis=axis)))
+    return ivy.expand_dims(x, axis=axis)
+
+
+def _first_batched(args, kwargs):
+    # whether the batch is the first argument only, as most rules expect
+    return (
+        len(args) > 0
+        and isinstance(args[0], BatchedArray)
+        and not _contains_batched(args[1:])
+        and not _contains_batched(kwargs.values())
+    )
+
+
+def _shift_axis(axis, ndim):
+    return axis % ndim + 1
+
+
+def _shift_axes(axis, ndim):
+    if isinstance(axis, int):
+        return _shift_axis(axis, ndim)
+    return tuple(_shift_axis(a, ndim) for a in axis)
+
+
+def _stack_examples(rets):
+    if isinstance(rets[0], tuple) and hasattr(rets[0], "_fields"):
+        return type(rets[0])(*(_stack_examples(list(r)) for r in zip(*rets)))
+    if isinstance(rets[0], (list, tuple)):
+        return type(rets[0])(_stack_examples(list(r)) for r in zip(*rets))
+    if ivy.is_array(rets[0]):
+        return ivy.stack([ivy.to_native(r) for r in rets])
+    if all(r == rets[0] for r in rets[1:]):
+        # the same for all examples, such as a shape or a dtype
+        return rets[0]
+    raise _NoBatchingRule(
+        "The return of the function differs across examples but isn't an array."
+    )
+
+
+def _wrap(ret):
+    if isinstance(ret, tuple) and hasattr(ret, "_fields"):
+        return type(ret)(*(_wrap(r) for r in ret))
+    if isinstance(ret, (list, tuple)):
+        return type(ret)(_wrap(r) for r in ret)
+    if ivy.is_array(ret):
+        return BatchedArray(ivy.to_native(ret))
+    return ret
+
+
+def _unbatch(ret, batch_size):
+    # the native arrays of the batched return, with the arrays which don't
+    # depend on the inputs broadcast along the batch
+    if isinstance(ret, BatchedArray):
+        return ret.data
+    if isinstance(ret, tuple) and hasattr(ret, "_fields"):
+        return type(ret)(*(_unbatch(r, batch_size) for r in ret))
+    if isinstance(ret, (list, tuple)):
+        return type(ret)(_unbatch(r, batch_size) for r in ret)
+    if ret is None:
+        return ret
+    ret = ivy.asarray(ret)
+    return ivy.to_native(
+        ivy.broadcast_to(ivy.expand_dims(ret, axis=0), (batch_size, *ret.shape))
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _batched_names():
+    names = set(_batching_rules)
+    for module_name in _batched_modules:
+        for prefix in ("ivy.functional.ivy.", "ivy.functional.ivy.experimental."):
+            module = importlib.import_module(prefix + module_name)
+            names.update(
+                name
+                for name, value in vars(module).items()
+                if inspect.isfunction(value)
+                and not name.startswith("_")
+                and value.__module__ == module.__name__
+            )
+    return frozenset(names)
+
+
+@functools.lru_cache(maxsize=None)
+def _batched_fn(fn, name):
+    rule = _batching_rules.get(name, _loop_rule)
+
+    @functools.wraps(fn)
+    def _batched(*args, **kwargs):
+        if not _batching.get() or (
+            not _contains_batched(args) and not _contains_batched(kwargs.values())
+        ):
+            return fn(*args, **kwargs)
+        return _wrap(rule(fn, args, kwargs))
+
+    # private, such that the attribute isn't copied onto the backend functions
+    # if the namespace is captured while rebound
+    _batched._applies_batching_rule = True
+    return _batched
+
+
+def _is_batched_fn(fn):
+    return getattr(fn, "_applies_batching_rule", False)
+
+
+def _rebind():
+    global _rebind_count
+    with ivy.locks["backend_setter"]:
+        # the functions set by a change of backend during a batched call are
+        # rebound by the next one
+        ivy.__dict__.update(
+            {
+                name: _batched_fn(ivy.__dict__[name], name)
+                for name in _batched_names()
+                if callable(ivy.__dict__.get(name))
+                and not _is_batched_fn(ivy.__dict__[name])
+            }
+        )
+        _rebind_count += 1
+
+
+def _restore():
+    global _rebind_count
+    with ivy.locks["backend_setter"]:
+        _rebind_count -= 1
+        if not _rebind_count:
+            # only the functions still rebound, those set by a change of backend
+            # meanwhile are kept
+            ivy.__dict__.update(
+                {
+                    name: ivy.__dict__[name].__wrapped__
+                    for name in _batched_names()
+                    if _is_batched_fn(ivy.__dict__.get(name))
+                }
+            )
+
+
+@functools.lru_cache(maxsize=None)
+def _axis_default(fn):
+    return inspect.signature(fn).parameters["axis"].default
+
+
+def _get_item(x, query):
+    query = query if isinstance(query, tuple) else (query,)
+    if all(
+        q is None or q is Ellipsis or isinstance(q, (int, slice)) for q in query
+    ) and not any(isinstance(q, bool) for q in query):
+        return BatchedArray(x.data[(slice(None), *query)])
+    # advanced indexing moves the indexed axes, which the batch axis can't follow
+    return _wrap(_loop_rule(lambda y, q: y[q], (x, query), {}))
+
+
+# Rules #
+# ----- #
+
+
+def _loop_rule(fn, args, kwargs):
+    batch_size = _batch_size([*args, *kwargs.values()])
+    return _stack_examples(
+        [
+            fn(
+                *(_example(arg, i) for arg in args),
+                **{k: _example(v, i) for k, v in kwargs.items()},
+            )
+            for i in range(batch_size)
+        ]
+    )
+
+
+@_batching_rule(
+    "abs",
+    "acos",
+    "acosh",
+    "add",
+    "angle",
+    "asin",
+    "asinh",
+    "astype",
+    "atan",
+    "atan2",
+    "atanh",
+    "bitwise_and",
+    "bitwise_invert",
+    "bitwise_left_shift",
+    "bitwise_or",
+    "bitwise_right_shift",
+    "bitwise_xor",
+    "ceil",
+    "clip",
+    "copy_array",
+    "cos",
+    "cosh",
+    "deg2rad",
+    "divide",
+    "equal",
+    "erf",
+    "exp",
+    "exp2",
+    "expm1",
+    "floor",
+    "floor_divide",
+    "fmin",
+    "fmod",
+    "full_like",
+    "gcd",
+    "gelu",
+    "greater",
+    "greater_equal",
+    "hardswish",
+    "imag",
+    "isfinite",
+    "isinf",
+    "isnan",
+    "isreal",
+    "lcm",
+    "leaky_relu",
+    "less",
+    "less_equal",
+    "log",
+    "log10",
+    "log1p",
+    "log2",
+    "logaddexp",
+    "logaddexp2",
+    "logical_and",
+    "logical_not",
+    "logical_or",
+    "logical_xor",
+    "maximum",
+    "minimum",
+    "mish",
+    "multiply",
+    "nan_to_num",
+    "negative",
+    "not_equal",
+    "ones_like",
+    "positive",
+    "pow",
+    "rad2deg",
+    "real",
+    "reciprocal",
+    "relu",
+    "remainder",
+    "round",
+    "sigmoid",
+    "sign",
+    "sin",
+    "sinh",
+    "softplus",
+    "sqrt",
+    "square",
+    "stop_gradient",
+    "subtract",
+    "tan",
+    "tanh",
+    "trunc",
+    "trunc_divide",
+    "where",
+    "zeros_like",
+)
+def _elementwise_rule(fn, args, kwargs):
+    if (
+        _contains_batched(kwargs.values())
+        or any(isinstance(arg, (list, tuple)) for arg in args)
+        or (fn.__name__ == "where" and len(args) < 3)
+    ):
+        return _loop_rule(fn, args, kwargs)
+    ndim = max(_example_ndim(arg) for arg in args)
+    return fn(*(_align(arg, ndim) for arg in args), **kwargs)
+
+
+@_batching_rule(
+    "all",
+    "any",
+    "argmax",
+    "argmin",
+    "argsort",
+    "cumprod",
+    "cumsum",
+    "flip",
+    "log_softmax",
+    "max",
+    "mean",
+    "min",
+    "prod",
+    "softmax",
+    "sort",
+    "std",
+    "sum",
+    "var",
+    "vector_norm",
+)
+def _axis_rule(fn, args, kwargs):
+    if len(args) > 1 or not _first_batched(args, kwargs) or args[0].ndim == 0:
+        return _loop_rule(fn, args, kwargs)
+    x = args[0]
+    axis = kwargs.get("axis", _axis_default(fn))
+    if axis is None:
+        if fn.__name__ in ("argmax", "argmin"):
+            # over the flattened example
+            return _loop_rule(fn, args, kwargs)
+        if fn.__name__ != "softmax":
+            # over all the axes of the example, as softmax is over the last one
+            axis = tuple(range(x.ndim))
+    if axis is not None:
+        kwargs = {**kwargs, "axis": _shift_axes(axis, x.ndim)}
+    return fn(x.data, **kwargs)
+
+
+@_batching_rule("cholesky", "det", "eigh", "eigvalsh", "inv", "matrix_transpose")
+def _trailing_axes_rule(fn, args, kwargs):
+    # functions of the last two axes, batched over the leading ones
+    if not _first_batched(args, kwargs):
+        return _loop_rule(fn, args, kwargs)
+    return fn(args[0].data, *args[1:], **kwargs)
+
+
+@_batching_rule("matmul")
+def _matmul_rule(fn, args, kwargs):
+    x1, x2 = args
+    squeeze_rows = _example_ndim(x1) == 1
+    squeeze_cols = _example_ndim(x2) == 1
+    if _contains_batched(kwargs.values()) or (
+        (squeeze_rows or squeeze_cols)
+        and any(kwargs.get(k) for k in kwargs if k != "out")
+    ):
+        return _loop_rule(fn, args, kwargs)
+    # vectors are matrices of a single row or column, squeezed out again
+    if squeeze_rows:
+        x1 = _as_matrix(x1, -2)
+    if squeeze_cols:
+        x2 = _as_matrix(x2, -1)
+    ndim = max(_example_ndim(x1), _example_ndim(x2))
+    ret = fn(_align(x1, ndim), _align(x2, ndim), **kwargs)
+    if squeeze_cols:
+        ret = ivy.squeeze(ret, axis=-1)
+    if squeeze_rows:
+        ret = ivy.squeeze(ret, axis=-1 if squeeze_cols else -2)
+    return ret
+
+
+@_batching_rule("vecdot")
+def _vecdot_rule(fn, args, kwargs):
+    # only the dot products of vectors, as some backends contract the other
+    # axes of the inputs as tensordot does rather than broadcasting them
+    if (
+        len(args) != 2
+        or any(_example_ndim(arg) != 1 for arg in args)
+        or any(ivy.is_complex_dtype(ivy.dtype(_data(arg))) for arg in args)
+        or _contains_batched(kwargs.values())
+    ):
+        return _loop_rule(fn, args, kwargs)
+    return ivy.sum(ivy.multiply(*(_data(arg) for arg in args)), axis=-1)
+
+
+@_batching_rule("einsum")
+def _einsum_rule(fn, args, kwargs):
+    equation, *operands = args
+    if (
+        not isinstance(equation, str)
+        or "..." in equation
+        or "->" not in equation
+        or _contains_batched(kwargs.values())
+    ):
+        return _loop_rule(fn, args, kwargs)
+    batch_letter = next(c for c in string.ascii_letters if c not in equation)
+    inputs, output = equation.replace(" ", "").split("->")
+    inputs = [
+        batch_letter + subscripts if isinstance(operand, BatchedArray) else subscripts
+        for subscripts, operand in zip(inputs.split(","), operands)
+    ]
+    equation = ",".join(inputs) + "->" + batch_letter + output
+    return fn(
+        equation,
+        *(o.data if isinstance(o, BatchedArray) else o for o in operands),
+        **kwargs,
+    )
+
+
+@_batching_rule("linear")
+def _linear_rule(fn, args, kwargs):
+    if not _first_batched(args, kwargs):
+        return _loop_rule(fn, args, kwargs)
+    return fn(args[0].data, *args[1:], **kwargs)
+
+
+@_batching_rule("reshape")
+def _reshape_rule(fn, args, kwargs):
+    if not _first_batched(args, kwargs):
+        return _loop_rule(fn, args, kwargs)
+    x, *rest = args
+    shape = rest[0] if rest else kwargs.get("shape")
+    if isinstance(shape, ivy.Shape):
+        shape = tuple(shape)
+    if (
+        len(rest) > 1
+        or kwargs.get("order", "C") != "C"
+        or not isinstance(shape, (list, tuple))
+    ):
+        return _loop_rule(fn, args, kwargs)
+    kwargs = {**kwargs, "shape": (x.data.shape[0], *shape)}
+    return fn(x.data, **kwargs)
+
+
+@_batching_rule("permute_dims")
+def _permute_dims_rule(fn, args, kwargs):
+    if not _first_batched(args, kwargs) or len(args) > 2:
+        return _loop_rule(fn, args, kwargs)
+    x, *rest = args
+    axes = rest[0] if rest else kwargs.get("axes")
+    kwargs = {**kwargs, "axes": (0, *_shift_axes(axes, x.ndim))}
+    return fn(x.data, **kwargs)
+
+
+@_batching_rule("swapaxes")
+def _swapaxes_rule(fn, args, kwargs):
+    if not _first_batched(args, kwargs) or len(args) != 3:
+        return _loop_rule(fn, args, kwargs)
+    x, axis0, axis1 = args
+    return fn(x.data, _shift_axis(axis0, x.ndim), _shift_axis(axis1, x.ndim), **kwargs)
+
+
+@_batching_rule("expand_dims")
+def _expand_dims_rule(fn, args, kwargs):
+    if len(args) > 1 or not _first_batched(args, kwargs):
+        return _loop_rule(fn, args, kwargs)
+    x = args[0]
+    axis = kwargs.get("axis", 0)
+    num_axes = 1 if isinstance(axis, int) else len(axis)
+    kwargs = {**kwargs, "axis": _shift_axes(axis, x.ndim + num_axes)}
+    return fn(x.data, **kwargs)
+
+
+@_batching_rule("squeeze")
+def _squeeze_rule(fn, args, kwargs):
+    if len(args) > 1 or not _first_batched(args, kwargs):
+        return _loop_rule(fn, args, kwargs)
+    x = args[0]
+    axis = kwargs.get("axis")
+    if axis is None:
+        axis = tuple(i for i, d in enumerate(x.shape) if d == 1)
+        if not axis:
+            return x.data
+    kwargs = {**kwargs, "axis": _shift_axes(axis, x.ndim)}
+    return fn(x.data, **kwargs)
+
+
+@_batching_rule("concat", "stack")
+def _join_rule(fn, args, kwargs):
+    axis = kwargs.get("axis", 0)
+    if (
+        len(args) != 1
+        or not isinstance(args[0], (list, tuple))
+        or _contains_batched(kwargs.values())
+        or axis is None
+    ):
+        return _loop_rule(fn, args, kwargs)
+    xs = args[0]
+    batch_size = _batch_size(xs)
+    xs = [
+        (
+            x.data
+            if isinstance(x, BatchedArray)
+            else ivy.broadcast_to(
+                ivy.expand_dims(x, axis=0), (batch_size, *ivy.shape(x))
+            )
+        )
+        for x in xs
+    ]
+    ndim = len(xs[0].shape) - 1 + (fn.__name__ == "stack")
+    return fn(xs, **{**kwargs, "axis": _shift_axis(axis, ndim)})
+
+
+@_batching_rule("flatten")
+def _flatten_rule(fn, args, kwargs):
+    if len(args) > 1 or not _first_batched(args, kwargs) or args[0].ndim == 0:
+        return _loop_rule(fn, args, kwargs)
+    x = args[0]
+    kwargs = {
+        **kwargs,
+        "start_dim": _shift_axis(kwargs.get("start_dim", 0), x.ndim),
+        "end_dim": _shift_axis(kwargs.get("end_dim", -1), x.ndim),
+    }
+    return fn(x.data, **kwargs)
+
+
+# Main #
+# ---- #
+
+
+def batched_call(func, args, mapped):
+    """Call a function once over batches of its arguments, as it would be
+    called on each of their examples.
+
+    The mapped arguments are passed to ``func`` as :class:`BatchedArray`, and
+    the ivy functions are rebound while it runs, such that each of them called
+    on a batch applies its batching rule: elementwise functions broadcast the
+    batches against each other, matmul and einsum batch over a leading axis,
+    and reductions and manipulations shift their axes past the batch axis.
+    Functions without a rule are looped over the examples of the batch. The
+    rules only apply within the context of the call, other threads calling
+    the ivy functions meanwhile get the original ones, and the namespace is
+    rebound and restored under the lock of the backend setter.
+
+    Where ``func`` does something the rules can't follow, such as control flow
+    on the values of a batch, :class:`_NoBatchingRule` is raised, for the
+    caller to fall back to calling ``func`` on each example. Any other error
+    raised by ``func`` is its own.
+
+    Parameters
+    ----------
+    func
+        The function to call.
+    args
+        The positional arguments of ``func``.
+    mapped
+        Whether each argument is batched along its axis 0, or is the same for
+        all examples.
+
+    Returns
+    -------
+    ret
+        The native arrays returned by ``func`` for all examples, stacked along
+        axis 0.
+    """
+    args = [BatchedArray(arg) if m else arg for arg, m in zip(args, mapped)]
+    batch_size = _batch_size(args)
+    _rebind()
+    token = _batching.set(True)
+    try:
+        rebound = ivy.__dict__.get(getattr(func, "__name__", None))
+        if _is_batched_fn(rebound) and rebound.__wrapped__ is func:
+            # func is itself one of the functions rebound
+            func = rebound
+        ret = func(*args)
+    finally:
+        _batching.reset(token)
+        _restore()
+    return _unbatch(ret, batch_size)
@@ -1,6 +1,7 @@
 # Einsum expression parser, this file has been adapted from `opt_einsum` parser here
 # https://github.com/dgasmith/opt_einsum/blob/master/opt_einsum/parser.py
 
+import functools
 import itertools
 from typing import Any, Dict, Iterator, List, Tuple, Union
 import numpy as np
@@ -254,8 +255,17 @@ def legalise_einsum_expr(*operands: Any) -> str:
         operands = [possibly_convert_to_numpy(x) for x in operands[1:]]
     else:
         subscripts, operands = convert_interleaved_input(operands)
-    operand_shapes = [o.shape for o in operands]
+    return _legalise_einsum_subscripts(
+        subscripts, tuple(tuple(o.shape) for o in operands)
+    )
+
 
+@functools.lru_cache(maxsize=1024)
+def _legalise_einsum_subscripts(
+    subscripts: str, operand_shapes: Tuple[TensorShapeType, ...]
+) -> str:
+    # the parsing only depends on the subscripts and on the operand shapes, so it
+    # is cached on them rather than re-run on every call of einsum
     # Check for proper "->"
     if ("-" in subscripts) or (">" in subscripts):
         invalid = (subscripts.count("-") > 1) or (subscripts.count(">") > 1)
@@ -331,10 +341,10 @@ def legalise_einsum_expr(*operands: Any) -> str:
             raise ValueError(f"Output character '{char}' did not appear in the input")
 
     # Make sure number operands is equivalent to the number of terms
-    if len(input_subscripts.split(",")) != len(operands):
+    if len(input_subscripts.split(",")) != len(operand_shapes):
         raise ValueError(
             f"Number of einsum subscripts, {len(input_subscripts.split(','))}, must be"
-            f" equal to the number of operands, {len(operands)}."
+            f" equal to the number of operands, {len(operand_shapes)}."
         )
 
     eqn = f"{input_subscripts}->{output_subscript}"
@@ -2,9 +2,14 @@
 # `numpy core einsumfunc.py file` here
 # https://github.com/numpy/numpy/blob/v1.26.0/numpy/core/einsumfunc.py
 
+import functools
 from itertools import combinations
 
-from ivy.utils.einsum_parser import possibly_convert_to_numpy, convert_interleaved_input
+from ivy.utils.einsum_parser import (
+    possibly_convert_to_numpy,
+    convert_interleaved_input,
+    _legalise_einsum_subscripts,
+)
 
 einsum_symbols = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
 einsum_symbols_set = set(einsum_symbols)
@@ -637,3 +642,157 @@ def parse_einsum_input(operands, subscripts=None):
         )
 
     return (input_subscripts, output_subscript, operands)
+
+
+@functools.lru_cache(maxsize=1024)
+def plan_contraction(subscripts, operand_shapes, optimize="greedy"):
+    """Plan an einsum contraction as a sequence of pairwise contractions.
+
+    The plan only depends on the subscripts and on the operand shapes, and is
+    cached on them along with the legalised expression, so planning a
+    contraction which is run repeatedly is only done once.
+
+    Parameters
+    ----------
+    subscripts : str
+        The einsum equation, in the same format as numpy.einsum.
+    operand_shapes : tuple of tuples
+        The shapes of the operands.
+    optimize : str
+        The path algorithm, either ``"greedy"`` or ``"optimal"``.
+
+    Returns
+    -------
+    steps : tuple
+        The contractions to run in order. Each one is a tuple
+        ``(positions, einsum_str, dot)``, where ``positions`` are the indices of
+        the operands to pop from the list of remaining operands, in decreasing
+        order, and whose result is appended to it. ``dot`` is ``None`` if the
+        contraction has to be run with ``einsum_str``, otherwise it is a tuple
+        ``(axes, perm)`` of the tensordot axes and the permutation to apply to
+        the tensordot result, ``None`` if it is already ordered.
+
+    Examples
+    --------
+    >>> plan_contraction("ij,jk,kl->il", ((2, 3), (3, 4), (4, 5)))[0]
+    ((2, 1), 'kl,jk->jl', (([0], [1]), (1, 0)))
+    """
+    input_subscripts, output_subscript = _legalise_einsum_subscripts(
+        subscripts.replace(" ", ""), operand_shapes
+    ).split("->")
+    input_list = input_subscripts.split(",")
+    input_sets = [set(x) for x in input_list]
+    output_set = set(output_subscript)
+    indices = set(input_subscripts.replace(",", ""))
+
+    # Get length of each unique dimension and ensure all dimensions are correct
+    dimension_dict = {}
+    broadcast_indices = [set() for _ in input_list]
+    for tnum, term in enumerate(input_list):
+        shape = operand_shapes[tnum]
+        if len(shape) != len(term):
+            raise ValueError(
+                f"Einstein sum subscript {term} does not contain the correct "
+                f"number of indices for operand {tnum}."
+            )
+        for char, dim in zip(term, shape):
+            if dim == 1:
+                broadcast_indices[tnum].add(char)
+            if dimension_dict.get(char, 1) == 1:
+                dimension_dict[char] = dim
+            elif dim not in (1, dimension_dict[char]):
+                raise ValueError(
+                    f"Size of label '{char}' for operand {tnum} ({dim}) does not "
+                    f"match previous terms ({dimension_dict[char]})."
+                )
+
+    if len(input_list) < 3 or indices == output_set:
+        # nothing to plan, leave it to einsum
+        path = [tuple(range(len(input_list)))]
+    else:
+        memory_limit = max(
+            compute_size_by_dict(term, dimension_dict)
+            for term in input_list + [output_subscript]
+        )
+        if optimize == "greedy":
+            path = greedy_path(input_sets, output_set, dimension_dict, memory_limit)
+        elif optimize == "optimal":
+            path = optimal_path(input_sets, output_set, dimension_dict, memory_limit)
+        else:
+            raise KeyError(f"Path name {optimize} not found")
+
+    steps = []
+    for cnum, contract_inds in enumerate(path):
+        # make sure we remove inds from right to left
+        contract_inds = tuple(sorted(contract_inds, reverse=True))
+        out_inds, input_sets, idx_removed, _ = find_contraction(
+            contract_inds, input_sets, output_set
+        )
+        tmp_inputs = [input_list.pop(x) for x in contract_inds]
+        bcast = set().union(*[broadcast_indices.pop(x) for x in contract_inds])
+
+        if cnum == len(path) - 1:
+            idx_result = output_subscript
+        else:
+            idx_result = "".join(sorted(out_inds, key=lambda c: (dimension_dict[c], c)))
+        input_list.append(idx_result)
+        broadcast_indices.append(bcast - idx_removed)
+        einsum_str = ",".join(tmp_inputs) + "->" + idx_result
+
+        # if we're broadcasting, nix blas
+        dot = None
+        if not idx_removed & bcast and can_dot(tmp_inputs, out_inds, idx_removed):
+            left, right = tmp_inputs
+            removed = [c for c in left if c in idx_removed]
+            axes = ([left.index(c) for c in removed], [right.index(c) for c in removed])
+            dot_result = "".join(c for c in left + right if c not in idx_removed)
+            perm = None
+            if dot_result != idx_result:
+                perm = tuple(dot_result.index(c) for c in idx_result)
+            dot = (axes, perm)
+        steps.append((contract_inds, einsum_str, dot))
+    return tuple(steps)
+
+
+def planned_einsum(subscripts, *operands, optimize, einsum, tensordot, transpose):
+    """Run an einsum contraction as the pairwise contractions planned by
+    ``plan_contraction``, with the native functions of a backend.
+
+    Parameters
+    ----------
+    subscripts : str
+        The einsum equation, in the same format as numpy.einsum.
+    operands : list of native arrays
+        The operands of the contraction.
+    optimize : bool or str
+        The path algorithm, either ``"greedy"`` or ``"optimal"``, ``True`` uses
+        ``"greedy"``.
+    einsum : callable
+        The native einsum, called as ``einsum(einsum_str, *operands)``.
+    tensordot : callable
+        The native tensordot, called as ``tensordot(x1, x2, axes)``.
+    transpose : callable
+        The native transpose, called as ``transpose(x, perm)``.
+
+    Returns
+    -------
+    ret
+        The result of the contraction.
+    """
+    steps = plan_contraction(
+        subscripts,
+        tuple(tuple(operand.shape) for operand in operands),
+        "greedy" if optimize is True else optimize,
+    )
+    operands = list(operands)
+    for positions, einsum_str, dot in steps:
+        inputs = [operands.pop(position) for position in positions]
+        if dot is None:
+            ret = einsum(einsum_str, *inputs)
+        else:
+            axes, perm = dot
+            ret = tensordot(*inputs, axes)
+            if perm is not None:
+                ret = transpose(ret, perm)
+        operands.append(ret)
+    return operands[0]
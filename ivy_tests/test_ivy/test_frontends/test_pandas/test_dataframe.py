@@ -1,11 +1,13 @@
 # global
-from hypothesis import strategies as st
+from hypothesis import strategies as st, given
 import pytest
 import numpy as np
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_frontend_method
+from ivy.functional.frontends.pandas import DataFrame
 
 
 CLASS_TREE = "ivy.functional.frontends.pandas.DataFrame"
@@ -163,3 +165,46 @@ def test_pandas_series_to_numpy(
         backend_to_test=backend_fw,
         on_device=on_device,
     )
+
+
+@given(
+    dtype_x=helpers.dtype_and_values(
+        available_dtypes=helpers.get_dtypes("float"),
+        min_num_dims=2,
+        max_num_dims=2,
+        min_dim_size=1,
+    ),
+)
+def test_pandas_dataframe_columns(
+    dtype_x,
+    backend_fw,
+):
+    ivy.set_backend(backend_fw)
+    _, x = dtype_x
+    labels = [f"c{j}" for j in range(x[0].shape[1])]
+    frame = DataFrame({label: x[0][:, j] for j, label in enumerate(labels)})
+    assert np.array_equal(frame.to_numpy(), x[0], equal_nan=True)
+    for j, label in enumerate(labels):
+        assert frame.columns.get_loc(label) == j
+        assert np.array_equal(frame[label].to_numpy(), x[0][:, j], equal_nan=True)
+    helpers.assert_all_close(
+        ret_np=frame.sum().to_numpy(),
+        ret_from_gt_np=np.nansum(x[0], axis=0),
+        backend=backend_fw,
+    )
+    # a column set on the frame isn't seen by the frames it was taken from
+    other = DataFrame(frame, columns=labels[:1])
+    other[labels[0]] = 0.0
+    assert np.array_equal(frame[labels[0]].to_numpy(), x[0][:, 0], equal_nan=True)
+    assert np.all(other[labels[0]].to_numpy() == 0.0)
+    # the stacked frame is cached until its columns are set
+    assert frame.array is frame.array
+    stacked = other.array
+    other[labels[0]] = 1.0
+    assert np.all(other.to_numpy() == 1.0)
+    other.array = ivy.zeros_like(stacked)
+    assert np.all(other[labels[0]].to_numpy() == 0.0)
+    # numpy scalars are broadcast along the rows, as python ones
+    frame = DataFrame({"a": np.int64(1), labels[0]: x[0][:, 0]})
+    assert np.all(frame["a"].to_numpy() == 1)
+    ivy.previous_backend()
@@ -1,5 +1,6 @@
 from ivy.functional.frontends.sklearn.tree import DecisionTreeClassifier as ivy_DTC
 import ivy
+import numpy as np
 from hypothesis import given
 import ivy_tests.test_ivy.helpers as helpers
 
@@ -9,8 +10,8 @@ import ivy_tests.test_ivy.helpers as helpers
 
 
 # helper functions
-def _get_sklearn_predict(X, y, max_depth, DecisionTreeClassifier):
-    clf = DecisionTreeClassifier(max_depth=max_depth, random_state=0)
+def _get_sklearn_predict(X, y, max_depth, DecisionTreeClassifier, **kwargs):
+    clf = DecisionTreeClassifier(max_depth=max_depth, random_state=0, **kwargs)
     clf.fit(X, y)
     return clf.predict
 
@@ -42,3 +43,75 @@ def test_sklearn_tree_predict(X, y, max_depth):
     sklearn_pred = _get_sklearn_predict(X, y, max_depth, sklearn_DTC)(X)
     ivy_pred = _get_sklearn_predict(ivy.array(X), ivy.array(y), max_depth, ivy_DTC)(X)
     helpers.assert_same_type_and_shape([sklearn_pred, ivy_pred])
+
+
+def test_sklearn_tree_hist_splitter(backend_fw):
+    # without ties between splits, the histogram builder grows the same tree
+    # as the best splitter when there are fewer distinct values than bins
+    ivy.set_backend(backend_fw)
+    rng = np.random.RandomState(0)
+    X = ivy.array(rng.uniform(size=(20, 2)).astype("float32"))
+    y = ivy.array(rng.randint(0, 3, size=(20,)))
+    trees = [
+        ivy_DTC(max_depth=2, random_state=0, splitter=splitter).fit(X, y).tree_
+        for splitter in ["best", "hist"]
+    ]
+    for tree in trees[1:]:
+        assert tree.node_count == trees[0].node_count
+        for node, node_best in zip(tree.nodes, trees[0].nodes):
+            assert node.left_child == node_best.left_child
+            assert node.feature == node_best.feature
+            assert np.isclose(node.threshold, node_best.threshold)
+        assert np.allclose(
+            ivy.to_numpy(tree.value[: tree.node_count]),
+            ivy.to_numpy(trees[0].value[: tree.node_count]),
+        )
+        assert np.array_equal(
+            ivy.to_numpy(tree.apply(X)), ivy.to_numpy(trees[0].apply(X))
+        )
+    ivy.previous_backend()
+
+
+def test_sklearn_tree_hist_splitter_missing_values(backend_fw):
+    # the samples with missing values are routed at prediction to the leaves
+    # they were counted in during training
+    ivy.set_backend(backend_fw)
+    rng = np.random.RandomState(0)
+    X = rng.uniform(size=(40, 2))
+    # the left children of the splits hold most of the samples
+    y = ivy.array((X[:, 0] > 0.8).astype("int64"))
+    X[rng.uniform(size=X.shape) < 0.3] = np.nan
+    X = ivy.array(X.astype("float32"))
+    tree = ivy_DTC(max_depth=3, random_state=0, splitter="hist").fit(X, y).tree_
+    leaves = ivy.to_numpy(tree.apply(X))
+    for node_id, node in enumerate(tree.nodes[: tree.node_count]):
+        if node.left_child == -1:
+            assert np.sum(leaves == node_id) == node.n_node_samples
+    ivy.previous_backend()
+
+
+# todo: integrate with already existing strats and generalize
+@given(
+    X=helpers.array_values(
+        shape=(5, 2),
+        dtype=helpers.get_dtypes("float", prune_function=False),
+        safety_factor_scale="log",
+    ),
+    y=helpers.array_values(
+        shape=(5,),
+        dtype=helpers.get_dtypes("signed_integer", prune_function=False),
+        safety_factor_scale="log",
+    ),
+    max_depth=helpers.ints(max_value=5, min_value=1),
+)
+def test_sklearn_tree_predict_hist_splitter(X, y, max_depth):
+    try:
+        from sklearn.tree import DecisionTreeClassifier as sklearn_DTC
+    except ImportError:
+        print("sklearn not installed, skipping test_sklearn_tree_predict_hist_splitter")
+        return
+    sklearn_pred = _get_sklearn_predict(X, y, max_depth, sklearn_DTC)(X)
+    ivy_pred = _get_sklearn_predict(
+        ivy.array(X), ivy.array(y), max_depth, ivy_DTC, splitter="hist"
+    )(X)
+    helpers.assert_same_type_and_shape([sklearn_pred, ivy_pred])
@@ -1,5 +1,6 @@
 # global
 import pytest
+import weakref
 from types import SimpleNamespace
 import numpy as np
 
@@ -1495,6 +1496,30 @@ def test_torch__requires_grad(
     ivy.previous_backend()
 
 
+@given(
+    dtype_x=helpers.dtype_and_values(
+        available_dtypes=helpers.get_dtypes("valid", prune_function=False),
+        num_arrays=2,
+        shared_dtype=True,
+    ),
+)
+def test_torch__slots(
+    dtype_x,
+    backend_fw,
+):
+    ivy.set_backend(backend_fw)
+    _, data = dtype_x
+    x = Tensor(data[0])
+    y = Tensor(data[1])
+    assert not hasattr(x, "__dict__")
+    with pytest.raises(AttributeError):
+        x.undefined_attribute = None
+    x.data = y
+    assert x.ivy_array is y.ivy_array
+    assert weakref.ref(x)() is x
+    ivy.previous_backend()
+
+
 # abs
 @handle_frontend_method(
     class_tree=CLASS_TREE,
@@ -3937,6 +3962,55 @@ def test_torch_backward(
     )
 
 
+@given(
+    dtype_x=helpers.dtype_and_values(
+        available_dtypes=helpers.get_dtypes("float", prune_function=False),
+        num_arrays=2,
+        min_value=-1e2,
+        max_value=1e2,
+    ).filter(lambda x: all(dt == "float32" for dt in x[0])),
+)
+def test_torch_backward_shared_inputs(
+    dtype_x,
+    backend_fw,
+):
+    ivy.set_backend(backend_fw)
+    if ivy.current_backend_str() == "numpy":
+        ivy.warnings.warn("Gradient calculation unavailable for numpy backend")
+        return
+    if ivy.current_backend_str() == "paddle":
+        ivy.warnings.warn("torch.Tensor.backward() unavailable for paddle backend")
+        return
+    _, values = dtype_x
+    # x feeds into c both directly and through a, and is accumulated into twice
+    x = Tensor(values[0], requires_grad=True)
+    y = Tensor(values[1], requires_grad=True)
+    a = x * y
+    b = a * a + a
+    c = (b + x).sum()
+    c.backward()
+    x.mul(y).sum().backward()
+    x_torch = torch.tensor(values[0], requires_grad=True, dtype=torch.float32)
+    y_torch = torch.tensor(values[1], requires_grad=True, dtype=torch.float32)
+    a_torch = x_torch * y_torch
+    b_torch = a_torch * a_torch + a_torch
+    c_torch = (b_torch + x_torch).sum()
+    c_torch.backward()
+    x_torch.mul(y_torch).sum().backward()
+    for grads, grads_torch in [(x._grads, x_torch.grad), (y._grads, y_torch.grad)]:
+        helpers.assertions.value_test(
+            ret_np_flat=helpers.flatten_and_to_np(
+                ret=grads.ivy_array, backend=backend_fw
+            ),
+            ret_np_from_gt_flat=helpers.flatten_and_to_np(
+                ret=ivy.to_ivy(grads_torch.numpy()), backend=backend_fw
+            ),
+            rtol=1e-3,
+            atol=1e-3,
+            backend="torch",
+        )
+
+
 @handle_frontend_method(
     class_tree=CLASS_TREE,
     init_tree="torch.tensor",
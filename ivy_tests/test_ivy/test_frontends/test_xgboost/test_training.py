@@ -0,0 +1,127 @@
+import gc
+
+import numpy as np
+import pytest
+
+import ivy
+import ivy.functional.frontends.xgboost as xgb
+from ivy.functional.frontends.xgboost.tree.updater_quantile_hist import (
+    quantile_hist_updater,
+)
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+def _get_data(n_samples, seed=0):
+    rng = np.random.RandomState(seed)
+    X = rng.uniform(size=(n_samples, 3)).astype("float32")
+    y = (X[:, 0] + X[:, 1] > 1.0).astype("float32")
+    return ivy.array(X), ivy.array(y[:, None])
+
+
+def _get_params(**kwargs):
+    params = {
+        "base_score": None,
+        "scale_pos_weight": None,
+        "base_margin": None,
+        "learning_rate": 0.3,
+        "reg_lambda": 1.0,
+        "reg_alpha": 0.0,
+        "booster": "gbtree",
+        "max_depth": 3,
+    }
+    params.update(kwargs)
+    return params
+
+
+# --- Main --- #
+# ------------ #
+
+
+def test_xgboost_gbtree_cached_predictions(backend_fw):
+    # the cached margins of the training data are updated from the leaf positions,
+    # they must match the margins predicted from scratch
+    ivy.set_backend(backend_fw)
+    X, y = _get_data(100)
+    bst = xgb.train(_get_params(), X, y, 5)
+    assert bst.gbm.boosted_rounds() == 5
+    cached = ivy.to_numpy(bst.gbm.pred(X))
+    fresh = ivy.to_numpy(bst.gbm.pred(ivy.array(ivy.to_numpy(X))))
+    assert np.allclose(cached, fresh, atol=1e-6)
+    first_tree = ivy.to_numpy(bst.gbm.pred(X, iteration_range=(0, 1)))
+    assert not np.allclose(first_tree, cached)
+    accuracy = np.mean(ivy.to_numpy(bst.predict(X)).ravel() == ivy.to_numpy(y).ravel())
+    assert accuracy > 0.8
+    ivy.previous_backend()
+
+
+def test_xgboost_gblinear_predict(backend_fw):
+    ivy.set_backend(backend_fw)
+    X, y = _get_data(100)
+    bst = xgb.train(_get_params(booster="gblinear"), X, y, 5)
+    pred = bst.predict(X)
+    assert pred.shape == (100, 1)
+    # the linear booster only predicts with all its rounds
+    full_range = bst.predict(X, iteration_range=(0, 5))
+    assert np.allclose(ivy.to_numpy(full_range), ivy.to_numpy(pred))
+    with pytest.raises(ValueError):
+        bst.predict(X, iteration_range=(0, 2))
+    ivy.previous_backend()
+
+
+def test_xgboost_gbtree_prediction_cache_freed(backend_fw):
+    # the cached predictions of the data are dropped along with the data
+    ivy.set_backend(backend_fw)
+    X, y = _get_data(100)
+    bst = xgb.train(_get_params(), X, y, 2)
+    n_cached = len(bst.gbm._prediction_cache)
+    for _ in range(5):
+        bst.predict(ivy.array(ivy.to_numpy(X)))
+    gc.collect()
+    assert len(bst.gbm._prediction_cache) == n_cached
+    ivy.previous_backend()
+
+
+def test_xgboost_quantile_hist_chunked(backend_fw):
+    # building the histograms a node at a time grows the same tree
+    ivy.set_backend(backend_fw)
+    rng = np.random.RandomState(0)
+    binned_data = ivy.array(rng.randint(0, 8, size=(200, 3)).astype("int64"))
+    cuts = ivy.array(np.sort(rng.uniform(size=(3, 8)), axis=1))
+    gpair = ivy.array(np.stack([rng.randn(200), rng.uniform(0.1, 1.0, 200)], 1))
+    args = (gpair, binned_data, cuts, 6, 0.3, 1.0, 0.0, 0.0, 1.0, 0.0)
+    tree, position = quantile_hist_updater(*args)
+    tree_chunked, position_chunked = quantile_hist_updater(
+        *args, max_histogram_size=1
+    )
+    assert np.array_equal(ivy.to_numpy(position), ivy.to_numpy(position_chunked))
+    for key, value in tree.items():
+        assert np.allclose(ivy.to_numpy(value), ivy.to_numpy(tree_chunked[key]))
+    ivy.previous_backend()
+
+
+def test_xgboost_train_early_stopping(backend_fw):
+    ivy.set_backend(backend_fw)
+    X, y = _get_data(100)
+    X_val, y_val = _get_data(50, seed=1)
+    evals_result = {}
+    bst = xgb.train(
+        _get_params(eval_metric=["error", "logloss"]),
+        X,
+        y,
+        50,
+        evals=[(xgb.DMatrix(X_val, label=y_val), "val")],
+        early_stopping_rounds=2,
+        evals_result=evals_result,
+        verbose_eval=False,
+    )
+    logloss = evals_result["val"]["logloss"]
+    assert len(evals_result["val"]["error"]) == len(logloss)
+    assert bst.gbm.boosted_rounds() == len(logloss)
+    assert bst.best_iteration == int(np.argmin(logloss))
+    assert np.isclose(bst.best_score, min(logloss))
+    if len(logloss) < 50:
+        assert len(logloss) - 1 - bst.best_iteration == 2
+    ivy.previous_backend()
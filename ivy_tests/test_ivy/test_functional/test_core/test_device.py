@@ -571,6 +571,66 @@ def test_split_func_call(
         )
 
 
+@handle_test(
+    fn_tree="functional.ivy.split_func_call",
+    array_shape=helpers.lists(
+        x=helpers.ints(min_value=1, max_value=3),
+        min_size="num_dims",
+        max_size="num_dims",
+        size_bounds=[1, 3],
+    ),
+    dtype=helpers.get_dtypes("float", full=False),
+    chunk_size=helpers.ints(min_value=1, max_value=3),
+    axis=_axis(),
+    mode=st.sampled_from(["concat", "mean", "sum"]),
+    parallel=st.booleans(),
+    stream=st.booleans(),
+)
+def test_split_func_call_parallel_and_stream(
+    *,
+    array_shape,
+    dtype,
+    chunk_size,
+    axis,
+    mode,
+    parallel,
+    stream,
+    backend_fw,
+):
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        x = np.random.uniform(size=tuple(array_shape)).astype(dtype[0])
+        x = ivy_backend.asarray(x)
+
+        # function
+        def func(t):
+            if mode == "concat":
+                return t * 2, t + 1
+            return ivy_backend.sum(t, axis=axis)
+
+        # predictions
+        ret = ivy_backend.split_func_call(
+            func,
+            [x],
+            mode,
+            chunk_size=chunk_size,
+            input_axes=axis,
+            parallel=parallel,
+            stream=stream,
+        )
+
+        # true
+        ret_true = ivy_backend.split_func_call(
+            func, [x], mode, chunk_size=chunk_size, input_axes=axis
+        )
+
+        # value test
+        if mode != "concat":
+            ret, ret_true = [ret], [ret_true]
+        for r, r_true in zip(ret, ret_true):
+            r, r_true = ivy_backend.to_numpy(r), ivy_backend.to_numpy(r_true)
+            helpers.assert_all_close(r, r_true, backend=backend_fw)
+
+
 @handle_test(
     fn_tree="functional.ivy.split_func_call",
     array_shape=helpers.lists(
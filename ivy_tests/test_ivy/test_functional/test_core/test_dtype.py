@@ -1,6 +1,8 @@
 """Collection of tests for unified dtype functions."""
 
 # global
+import os
+import tempfile
 import numpy as np
 from hypothesis import strategies as st
 import typing
@@ -48,6 +50,10 @@ def _composition_2():
     return ivy.ceil() or a
 
 
+def _typed(values):
+    return sorted((type(v).__name__, str(v)) for v in values)
+
+
 # Array API Standard Function Tests #
 # --------------------------------- #
 
@@ -241,6 +247,44 @@ def test_broadcast_to(
     )
 
 
+@handle_test(fn_tree="functional.ivy.build_support_table")
+def test_build_support_table(backend_fw):
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        fns = [ivy_backend.acosh, ivy_backend.nonzero]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            ivy_backend.clear_support_table(backend_fw)
+            expected = [ivy_backend.function_supported_dtypes(fn) for fn in fns]
+            ivy_backend.clear_support_table(backend_fw)
+            table = ivy_backend.build_support_table(
+                ["acosh", "nonzero"], cache_dir=cache_dir
+            )
+            assert len(table) == 2
+            assert len(os.listdir(cache_dir)) == 1
+            for fn, exp in zip(fns, expected):
+                res = ivy_backend.function_supported_dtypes(fn)
+                assert isinstance(res, tuple)
+                assert set(res) == set(exp)
+            # the table is loaded back from the cache directory with the same types
+            fresh = [
+                ivy_backend.function_supported_devices_and_dtypes(fn) for fn in fns
+            ]
+            ivy_backend.clear_support_table(backend_fw)
+            tables = ivy_backend.functional.ivy.data_type._support_tables
+            assert not tables
+            for fn, exp, exp_fresh in zip(fns, expected, fresh):
+                res = ivy_backend.function_supported_dtypes(fn)
+                assert len(next(iter(tables.values()))) == 2
+                assert _typed(res) == _typed(exp)
+                res = ivy_backend.function_supported_devices_and_dtypes(fn)
+                assert {k: _typed(v) for k, v in res.items()} == {
+                    k: _typed(v) for k, v in exp_fresh.items()
+                }
+            ivy_backend.clear_support_table(
+                backend_fw, persistent=True, cache_dir=cache_dir
+            )
+            assert not os.listdir(cache_dir)
+
+
 # can_cast
 @handle_test(
     fn_tree="functional.ivy.can_cast",
@@ -1056,7 +1056,13 @@ def test_gather_nd(
 
 
 def test_get_all_arrays_in_memory():
-    return
+    ivy.set_backend("numpy")
+    x = ivy.array([1.0, 2.0])
+    num_arrays = len(ivy.get_all_arrays_in_memory())
+    assert any(a is x for a in ivy.get_all_arrays_in_memory())
+    del x
+    assert len(ivy.get_all_arrays_in_memory()) == num_arrays - 1
+    ivy.previous_backend()
 
 
 # get_item
@@ -1635,6 +1641,20 @@ def test_scatter_nd(x, reduction, test_flags, backend_fw, fn_name, on_device):
 # ------#
 
 
+@pytest.mark.parametrize("mode", [True, False])
+def test_set_flat_container_mode(mode):
+    ivy.set_flat_container_mode(mode)
+    assert ivy.flat_container_mode == mode
+    ivy.unset_flat_container_mode()
+
+
+@pytest.mark.parametrize("mode", [True, False])
+def test_set_fused_dispatch_mode(mode):
+    ivy.set_fused_dispatch_mode(mode)
+    assert ivy.fused_dispatch_mode == mode
+    ivy.unset_fused_dispatch_mode()
+
+
 @pytest.mark.parametrize("mode", ["lenient", "strict"])
 def test_set_inplace_mode(mode):
     ivy.set_inplace_mode(mode)
@@ -1954,6 +1974,20 @@ def test_try_else_none(x):
         assert fn is None
 
 
+@pytest.mark.parametrize("mode", [True, False])
+def test_unset_flat_container_mode(mode):
+    ivy.set_flat_container_mode(mode)
+    ivy.unset_flat_container_mode()
+    assert ivy.flat_container_mode is False
+
+
+@pytest.mark.parametrize("mode", [True, False])
+def test_unset_fused_dispatch_mode(mode):
+    ivy.set_fused_dispatch_mode(mode)
+    ivy.unset_fused_dispatch_mode()
+    assert ivy.fused_dispatch_mode is False
+
+
 @pytest.mark.parametrize("mode", ["lenient", "strict"])
 def test_unset_inplace_mode(mode):
     ivy.set_inplace_mode(mode)
@@ -2073,6 +2107,94 @@ def test_vmap(func, dtype_and_arrays_and_axes, in_axes_as_cont, backend_fw):
         assert False, "One of the results is None while other isn't"
 
 
+@pytest.mark.parametrize(
+    ("func", "shapes", "in_axes"),
+    [
+        (lambda x, y: ivy.tanh(x * y + 1.0), [(4, 3, 2), (3, 2)], (0, None)),
+        (ivy.matmul, [(4, 2, 5), (5, 4, 3)], (0, 1)),
+        (ivy.matmul, [(4, 5), (5, 3)], (0, None)),
+        (ivy.matmul, [(2, 5), (4, 5)], (None, 0)),
+        (ivy.vecdot, [(4, 5), (4, 5)], (0, 0)),
+        (lambda x: ivy.softmax(x - ivy.mean(x), axis=0), [(3, 4, 2)], (1,)),
+        (lambda x: ivy.permute_dims(ivy.reshape(x, (3, 2)), (1, 0)), [(4, 6)], (0,)),
+        (
+            lambda x, y: ivy.concat([x, y], axis=-1)[:, 1:],
+            [(4, 2, 3), (2, 1)],
+            (0, None),
+        ),
+        (lambda x, y: ivy.einsum("ij,j->i", x, y), [(4, 2, 3), (3,)], (0, None)),
+        (lambda x: ivy.argmax(x) + ivy.sort(x, axis=0)[0], [(4, 3, 2)], (0,)),
+        (lambda x: x * 2 if ivy.sum(x) > 0 else x, [(4, 3)], (0,)),
+    ],
+)
+def test_vmap_batching_rules(func, shapes, in_axes, backend_fw):
+    ivy.set_backend(backend_fw)
+    rng = np.random.RandomState(0)
+    args = [ivy.array(rng.randn(*shape).astype("float32")) for shape in shapes]
+    ret = ivy.vmap(func, in_axes=in_axes)(*args)
+    # the results of the examples one by one
+    batch_size = next(x.shape[a] for x, a in zip(args, in_axes) if a is not None)
+    expected = ivy.stack(
+        [
+            func(
+                *(
+                    x if a is None else ivy.gather(x, i, axis=a)
+                    for x, a in zip(args, in_axes)
+                )
+            )
+            for i in range(batch_size)
+        ]
+    )
+    assert ret.shape == expected.shape
+    assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(expected), atol=1e-5)
+    ivy.previous_backend()
+
+
+def test_vmap_batching_rules_threads(backend_fw):
+    # the vectorized calls overlapping in several threads leave the ivy
+    # functions as they were once they return
+    ivy.set_backend(backend_fw)
+    sin = ivy.sin
+    x = ivy.array(np.random.RandomState(0).randn(8, 3).astype("float32"))
+    started = threading.Barrier(2)
+
+    def func(x):
+        started.wait(timeout=10)
+        return ivy.sin(x)
+
+    rets = [None, None]
+
+    def run(i):
+        rets[i] = ivy.vmap(func)(x)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert ivy.sin is sin
+    for ret in rets:
+        assert np.allclose(ivy.to_numpy(ret), np.sin(ivy.to_numpy(x)), atol=1e-6)
+    ivy.previous_backend()
+
+
+def test_vmap_batching_rules_errors(backend_fw):
+    # an error of the function itself is raised from its batched call, rather
+    # than falling back to calling it on each example
+    ivy.set_backend(backend_fw)
+    x = ivy.array(np.random.RandomState(0).randn(8, 3).astype("float32"))
+    calls = []
+
+    def func(x):
+        calls.append(x)
+        raise ValueError("invalid input")
+
+    with pytest.raises(ValueError, match="invalid input"):
+        ivy.vmap(func)(x)
+    assert len(calls) == 1
+    ivy.previous_backend()
+
+
 _composition_1.test_unsupported_devices_and_dtypes = {
     "cpu": {
         "numpy": ("bfloat16",),
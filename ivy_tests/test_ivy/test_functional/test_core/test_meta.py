@@ -1240,3 +1240,71 @@ def test_reptile_step(
                 assert list(inner_v_rets.cont_shape) == [num_tasks, 1]
             elif return_inner_v == "first":
                 assert list(inner_v_rets.cont_shape) == [1, 1]
+
+
+# fomaml step vmapped over the tasks
+@handle_test(
+    fn_tree="functional.ivy.fomaml_step",
+    inner_grad_steps=helpers.ints(min_value=1, max_value=3),
+    with_outer_cost_fn=st.booleans(),
+    average_across_steps=st.booleans(),
+    num_tasks=helpers.ints(min_value=1, max_value=3),
+    return_inner_v=st.sampled_from(["first", "all", False]),
+)
+def test_fomaml_step_vmap(
+    on_device,
+    inner_grad_steps,
+    with_outer_cost_fn,
+    average_across_steps,
+    num_tasks,
+    return_inner_v,
+    backend_fw,
+):
+    # Numpy does not support gradients
+    if backend_fw == "numpy":
+        pytest.skip()
+
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        variable_fn = ivy_backend.functional.ivy._variable
+        variables = ivy_backend.Container(
+            {
+                "latent": variable_fn(ivy_backend.array([0.5], device=on_device)),
+                "weight": variable_fn(ivy_backend.array([1.0], device=on_device)),
+            }
+        )
+        batch = ivy_backend.Container(
+            {"x": ivy_backend.arange(1, num_tasks + 1, dtype="float32")}
+        )
+
+        # cost functions of a single task
+        def inner_cost_fn(sub_batch_in, v):
+            return -(sub_batch_in["x"] * v["latent"] * v["weight"] ** 2)[0]
+
+        def outer_cost_fn(sub_batch_in, v):
+            return (sub_batch_in["x"] ** 2 * v["latent"] * v["weight"])[0]
+
+        # the vectorized inner loop matches the for loop over the tasks
+        rets = [
+            ivy_backend.fomaml_step(
+                batch,
+                inner_cost_fn,
+                outer_cost_fn if with_outer_cost_fn else None,
+                variables,
+                inner_grad_steps,
+                1e-2,
+                average_across_steps=average_across_steps,
+                batched=batched,
+                return_inner_v=return_inner_v,
+            )
+            for batched in (False, "vmap")
+        ]
+        for loop_ret, vmap_ret in zip(*rets):
+            if isinstance(loop_ret, ivy_backend.Container):
+                loop_ret = loop_ret.cont_to_flat_list()
+                vmap_ret = vmap_ret.cont_to_flat_list()
+            else:
+                loop_ret, vmap_ret = [loop_ret], [vmap_ret]
+            for x, y in zip(loop_ret, vmap_ret):
+                assert np.allclose(
+                    ivy_backend.to_numpy(x), ivy_backend.to_numpy(y), atol=1e-6
+                )
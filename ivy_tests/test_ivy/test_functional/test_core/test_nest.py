@@ -138,6 +138,63 @@ def test_duplicate_array_index_chains(nest, x, y):
     assert duplicate_index_chains[1] == [[0, "b", "c"], [1, 1]]
 
 
+# flatten_nest
+@pytest.mark.parametrize(
+    "nest", [{"a": [[0], [1]], "b": {"c": (((2,), (4,)), ((6,), (8,)))}}]
+)
+@pytest.mark.parametrize("shallow", [True, False])
+def test_flatten_nest(nest, shallow):
+    flat = ivy.flatten_nest(nest)
+    assert flat.leaves == [0, 1, 2, 4, 6, 8]
+    assert flat.indices == [
+        ("a", 0, 0),
+        ("a", 1, 0),
+        ("b", "c", 0, 0, 0),
+        ("b", "c", 0, 1, 0),
+        ("b", "c", 1, 0, 0),
+        ("b", "c", 1, 1, 0),
+    ]
+    assert ivy.unflatten_nest(flat) == nest
+    # the nest utilities operate on the leaves of the flattened nest
+    indices = [["a", 1, 0], ["b", "c", 1]]
+    assert ivy.multi_index_nest(flat, indices) == ivy.multi_index_nest(nest, indices)
+    ret = ivy.map_nest_at_indices(flat, [["a", 1, 0]], lambda x: x + 10, shallow)
+    ret = ivy.set_nest_at_indices(ret, [["b", "c", 0, 0, 0]], [3], shallow)
+    ret = ivy.nested_map(lambda x: x * 2, ret, shallow=shallow)
+    assert (ret is flat) == shallow
+    assert ivy.unflatten_nest(ret) == {
+        "a": [[0], [22]],
+        "b": {"c": (((6,), (8,)), ((12,), (16,)))},
+    }
+    # setting a whole sub-nest changes the structure
+    ret = ivy.set_nest_at_indices(ret, [["b", "c"]], [[5]], shallow)
+    assert ivy.unflatten_nest(ret) == {"a": [[0], [22]], "b": {"c": [5]}}
+    assert ret.indices[-1] == ("b", "c", 0)
+    assert ivy.unflatten_nest(flat) == (ivy.unflatten_nest(ret) if shallow else nest)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"include_derived": True},
+        {"to_ignore": list},
+        {"to_mutable": True},
+    ],
+)
+def test_flatten_nest_nested_map(kwargs):
+    from collections import namedtuple
+
+    NAMEDTUPLE = namedtuple("OutNamedTuple", ["x", "y"])
+    nest = {"a": [1, 2], "b": (NAMEDTUPLE(x=3, y=4), [5])}
+    flat = ivy.flatten_nest(nest)
+    # the flat nest is mapped over the same leaves as the nest itself
+    ret = ivy.nested_map(lambda x: x * 2, flat, shallow=False, **kwargs)
+    expected = ivy.nested_map(lambda x: x * 2, nest, shallow=False, **kwargs)
+    assert ivy.unflatten_nest(ret) == expected
+    assert ivy.unflatten_nest(flat) == nest
+
+
 # Tests #
 # ------#
 
@@ -307,6 +364,25 @@ def test_nested_argwhere_w_nest_checks(nest):
     assert indices[13] == ["b", "c"]
 
 
+# nested_argwhere_flat
+@pytest.mark.parametrize(
+    "nest", [{"a": [[0], [1]], "b": {"c": [[[2], [4]], [[6], [8]]]}}]
+)
+@pytest.mark.parametrize(
+    ("check_nests", "stop_after_n_found"), [(True, None), (False, None), (False, 3)]
+)
+def test_nested_argwhere_flat(nest, check_nests, stop_after_n_found):
+    def fn(x):
+        return isinstance(x, list) or (isinstance(x, int) and x < 5)
+
+    flat = ivy.flatten_nest(nest)
+    assert ivy.nested_argwhere(
+        flat, fn, check_nests, stop_after_n_found=stop_after_n_found
+    ) == ivy.nested_argwhere(
+        nest, fn, check_nests, stop_after_n_found=stop_after_n_found
+    )
+
+
 # nested_map
 @pytest.mark.parametrize("x", [{"a": [[0, 1], [2, 3]], "b": {"c": [[0], [1]]}}])
 @pytest.mark.parametrize("fn", [lambda x: x**2])
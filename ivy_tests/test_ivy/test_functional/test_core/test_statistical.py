@@ -2,9 +2,11 @@
 
 # global
 import numpy as np
+import pytest
 from hypothesis import strategies as st, assume
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_test
 
@@ -226,6 +228,28 @@ def test_einsum(
     )
 
 
+@pytest.mark.parametrize(
+    ("equation", "shapes"),
+    [
+        ("ij,jk,kl->il", [(6, 7), (7, 8), (8, 3)]),
+        ("bij,bjk,bkl,lm", [(2, 3, 4), (2, 4, 5), (2, 5, 6), (6, 2)]),
+        ("...ij,...jk,...kl->...il", [(4, 2, 3), (4, 3, 5), (1, 5, 2)]),
+        ("ii,ij,jk->k", [(4, 4), (4, 5), (5, 6)]),
+        ("i,i,i->", [(5,), (5,), (5,)]),
+    ],
+)
+@pytest.mark.parametrize("optimize", [True, "optimal"])
+def test_einsum_optimize(equation, shapes, optimize, backend_fw):
+    ivy.set_backend(backend_fw)
+    rng = np.random.RandomState(0)
+    operands = [rng.randn(*shape).astype("float32") for shape in shapes]
+    ret = ivy.einsum(equation, *operands, optimize=optimize)
+    expected = np.einsum(equation, *operands)
+    assert ret.shape == expected.shape
+    assert np.allclose(ivy.to_numpy(ret), expected, rtol=1e-4, atol=1e-4)
+    ivy.previous_backend()
+
+
 # max
 @handle_test(
     fn_tree="functional.ivy.max",
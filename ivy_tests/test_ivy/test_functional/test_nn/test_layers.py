@@ -1,9 +1,11 @@
 """Collection of tests for unified neural network layers."""
 
 # global
+import concurrent.futures
 from hypothesis import strategies as st, assume
 import ivy
 import numpy as np
+import pytest
 
 
 # local
@@ -1011,6 +1013,44 @@ def _x_and_scaled_attention(draw, dtypes):
 # ------------ #
 
 
+# batched_nms
+@pytest.mark.parametrize("top_k", [None, 20])
+def test_batched_nms(top_k, backend_fw):
+    ivy.set_backend(backend_fw)
+    rng = np.random.RandomState(0)
+    corners = rng.rand(3, 30, 2) * 50
+    boxes = np.concatenate([corners, corners + rng.rand(3, 30, 2) * 30 + 1], axis=-1)
+    boxes = boxes.astype("float32")
+    scores = rng.rand(3, 30).astype("float32")
+    class_ids = rng.randint(0, 3, (3, 30))
+    indices, num_valid = ivy.batched_nms(
+        boxes,
+        scores,
+        class_ids=class_ids,
+        iou_threshold=0.3,
+        max_output_size=40,
+        score_threshold=0.2,
+        top_k=top_k,
+    )
+    assert indices.shape == (3, 40)
+    for i in range(3):
+        # the boxes kept by nms for each class, merged by descending score
+        candidates = np.argsort(-scores[i], kind="stable")[:top_k]
+        expected = []
+        for class_id in range(3):
+            idxs = np.sort(candidates[class_ids[i, candidates] == class_id])
+            keep = ivy.nms(
+                boxes[i, idxs], scores[i, idxs], iou_threshold=0.3, score_threshold=0.2
+            )
+            expected += idxs[ivy.to_numpy(keep)].tolist()
+        expected.sort(key=lambda idx: (-scores[i, idx], idx))
+        assert int(num_valid[i]) == len(expected)
+        assert ivy.to_numpy(indices[i]).tolist() == expected + [-1] * (
+            40 - len(expected)
+        )
+    ivy.previous_backend()
+
+
 # conv
 @handle_test(
     fn_tree="functional.ivy.conv",
@@ -1602,6 +1642,67 @@ def test_lstm_update(*, dtype_lstm, test_flags, backend_fw, fn_name, on_device):
     )
 
 
+@pytest.mark.parametrize("time_major", [False, True])
+def test_lstm_update_lengths(time_major, backend_fw):
+    ivy.set_backend(backend_fw)
+    rng = np.random.RandomState(0)
+    x = rng.randn(3, 6, 4).astype("float32")
+    init_h, init_c = rng.randn(2, 3, 5).astype("float32")
+    kernel = rng.randn(4, 20).astype("float32")
+    recurrent_kernel = rng.randn(5, 20).astype("float32")
+    bias = rng.randn(20).astype("float32")
+    lengths = np.array([6, 2, 4])
+    ret, (h, c) = ivy.lstm_update(
+        np.swapaxes(x, 0, 1) if time_major else x,
+        init_h,
+        init_c,
+        kernel,
+        recurrent_kernel,
+        bias=bias,
+        time_major=time_major,
+        lengths=lengths,
+    )
+    ret = ivy.to_numpy(ret)
+    if time_major:
+        ret = np.swapaxes(ret, 0, 1)
+    # each sequence is updated up to its length only
+    for i, length in enumerate(lengths):
+        expected, (expected_h, expected_c) = ivy.lstm_update(
+            x[i : i + 1, :length],
+            init_h[i : i + 1],
+            init_c[i : i + 1],
+            kernel,
+            recurrent_kernel,
+            bias=bias,
+        )
+        assert np.allclose(ret[i, :length], ivy.to_numpy(expected)[0], atol=1e-5)
+        assert np.all(ret[i, length:] == 0)
+        assert np.allclose(ivy.to_numpy(h)[i], ivy.to_numpy(expected_h)[0], atol=1e-5)
+        assert np.allclose(ivy.to_numpy(c)[i], ivy.to_numpy(expected_c)[0], atol=1e-5)
+    ivy.previous_backend()
+
+
+def test_lstm_update_threads(backend_fw):
+    ivy.set_backend(backend_fw)
+    rng = np.random.RandomState(0)
+    inputs = [rng.randn(2, t, 4).astype("float32") for t in range(1, 9)]
+    init_h, init_c = rng.randn(2, 2, 3).astype("float32")
+    kernel = rng.randn(4, 12).astype("float32")
+    recurrent_kernel = rng.randn(3, 12).astype("float32")
+
+    def update(x):
+        ret, _ = ivy.lstm_update(x, init_h, init_c, kernel, recurrent_kernel)
+        return ivy.to_numpy(ret)
+
+    # concurrent updates don't share any state
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        rets = list(executor.map(update, inputs * 4))
+    expected = [update(x) for x in inputs * 4]
+    for ret, e in zip(rets, expected):
+        assert np.allclose(ret, e, atol=1e-5)
+    ivy.previous_backend()
+
+
 # multi_head_attention
 @handle_test(
     fn_tree="functional.ivy.multi_head_attention",
@@ -1792,3 +1893,29 @@ def test_scaled_dot_product_attention(
         is_causal=is_causal,
         training=training,
     )
+
+
+@pytest.mark.parametrize("masking", ["none", "causal", "mask", "broadcast_mask"])
+@pytest.mark.parametrize(("num_queries", "num_keys"), [(7, 7), (5, 11), (11, 5)])
+def test_scaled_dot_product_attention_chunked(
+    masking, num_queries, num_keys, backend_fw, monkeypatch
+):
+    ivy.set_backend(backend_fw)
+    rng = np.random.RandomState(0)
+    q, k, v = (
+        ivy.array(rng.randn(2, n, 4).astype("float32"))
+        for n in [num_queries, num_keys, num_keys]
+    )
+    kwargs = {}
+    if masking == "causal":
+        kwargs["is_causal"] = True
+    elif masking != "none":
+        mask = rng.rand(2, num_queries, num_keys) > 0.3
+        kwargs["mask"] = ivy.array(mask[:, :1] if masking == "broadcast_mask" else mask)
+    expected = ivy.scaled_dot_product_attention(q, k, v, **kwargs)
+    # attend over blocks of 3 queries and keys
+    monkeypatch.setattr(ivy.functional.ivy.layers, "_SDPA_CHUNK_SIZE", 3)
+    ret = ivy.scaled_dot_product_attention(q, k, v, **kwargs)
+    assert ret.shape == expected.shape
+    assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(expected), atol=1e-5)
+    ivy.previous_backend()
@@ -207,6 +207,8 @@ def test_previous_backend(backend):
     available_array_types_class,
 )
 def test_set_backend(backend, array_type):
+    # setting the same backend again reuses its wrapped functions
+    ivy.unset_backend()
     # recording data before backend change
     stack_before = []
     func_address_before = id(ivy.sum)
@@ -229,6 +231,44 @@ def test_set_backend(backend, array_type):
     )
 
 
+def test_set_backend_reuses_snapshot(backend_fw):
+    ivy.unset_backend()
+    ivy.utils.backend.clear_backend_snapshots()
+    ivy.set_backend(backend_fw)
+    wrapped_sum = ivy.sum
+    ivy.previous_backend()
+    # the backend's namespace is replayed rather than re-wrapped
+    ivy.set_backend(backend_fw)
+    assert ivy.sum is wrapped_sum
+    assert ivy.functional.sum is wrapped_sum
+    ivy.set_backend("numpy")
+    ivy.previous_backend()
+    assert ivy.sum is wrapped_sum
+    assert ivy.current_backend_str() == backend_fw
+    x = ivy.array([1.0, 2.0, 3.0])
+    assert ivy.to_scalar(ivy.sum(x)) == 6.0
+    ivy.previous_backend()
+    ivy.utils.backend.clear_backend_snapshots()
+    ivy.set_backend(backend_fw)
+    assert ivy.sum is not wrapped_sum
+    ivy.previous_backend()
+    # the snapshot isn't replayed once a value of ivy's namespace changed
+    ivy.snapshot_leaf = np.zeros(2)
+    ivy.set_backend(backend_fw)
+    wrapped_sum = ivy.sum
+    ivy.previous_backend()
+    ivy.snapshot_leaf.shape = (2, 1)
+    ivy.set_backend(backend_fw)
+    assert ivy.sum is not wrapped_sum
+    wrapped_sum = ivy.sum
+    ivy.previous_backend()
+    del ivy.snapshot_leaf
+    ivy.set_backend(backend_fw)
+    assert ivy.sum is not wrapped_sum
+    ivy.previous_backend()
+    ivy.utils.backend.clear_backend_snapshots()
+
+
 @pytest.mark.parametrize("backend", ["torch", "numpy"])
 def test_set_backend_no_warning_when_inplace_update_supported(backend):
     with pytest.warns(None):
@@ -1,6 +1,7 @@
 # global
 import os
 import queue
+import h5py
 import pytest
 import random
 import numpy as np
@@ -588,6 +589,57 @@ def test_container_cutoff_at_height(inplace, on_device):
     assert not cont_cutoff
 
 
+@pytest.mark.parametrize(
+    ("worker_type", "num_workers"), [("thread", 1), ("thread", 3), ("process", 2)]
+)
+def test_container_data_loader(worker_type, num_workers, on_device):
+    if worker_type == "process" and "gpu" in on_device:
+        # Cannot re-initialize CUDA in forked subprocess.
+        pytest.skip()
+
+    def dataset_fn(idx):
+        return {"a": np.full((3,), idx, dtype="float32"), "b": {"c": np.array(idx)}}
+
+    with ivy.DataLoader(
+        dataset_fn,
+        11,
+        batch_size=4,
+        num_workers=num_workers,
+        prefetch_depth=2,
+        worker_type=worker_type,
+        context="fork" if worker_type == "process" else None,
+        device=on_device,
+        timeout=60.0,
+    ) as loader:
+        assert len(loader) == 3
+        # every iteration loads the batches again, in order
+        for _ in range(2):
+            batches = list(loader)
+            assert [batch.a.shape for batch in batches] == [(4, 3), (4, 3), (3, 3)]
+            assert np.allclose(
+                np.concatenate([ivy.to_numpy(batch.b.c) for batch in batches]),
+                np.arange(11),
+            )
+            assert np.allclose(ivy.to_numpy(batches[2].a), [[8] * 3, [9] * 3, [10] * 3])
+            assert ivy.dev(batches[0].a) == on_device
+        assert loader.throughput > 0
+
+        # an iteration left unfinished doesn't affect the next one
+        next(iter(loader))
+        assert len(list(loader)) == 3
+
+    # the errors of the dataset function are raised when iterating
+    def failing_fn(idx):
+        raise ValueError("failed to load")
+
+    with ivy.DataLoader(failing_fn, 4, worker_type=worker_type) as loader:
+        with pytest.raises(ValueError):
+            list(loader)
+
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ivy.DataLoader(dataset_fn, 11, timeout=0)
+
+
 def test_container_deep_copy(on_device):
     dict_in = {
         "a": ivy.array([0.0], device=on_device),
@@ -929,6 +981,77 @@ def test_container_find_sub_structure(on_device):
     assert found_kc == ""
 
 
+@pytest.mark.parametrize(
+    "fn",
+    [
+        lambda x, y: x * 0.5 - y,
+        lambda x, y: 2 / (x + y),
+        lambda x, y: ivy.Container.static_add(x, y, alpha=2.0),
+        lambda x, y: ivy.Container.static_sin(x),
+        lambda x, y: x.cont_map(lambda v, kc: v * 3, key_chains=["b/c"]),
+        lambda x, y: ivy.Container.cont_multi_map(
+            lambda vs, kc: vs[0] * vs[1], [x, y], key_chains=["b"]
+        ),
+    ],
+)
+@pytest.mark.parametrize("same_shapes", [True, False])
+def test_container_flat_mode(fn, same_shapes, on_device):
+    x = Container(
+        {
+            "a": ivy.array([1.0, 2.0], device=on_device),
+            "b": {
+                "c": ivy.array([[3.0]], device=on_device),
+                "d": ivy.array(4.0, device=on_device),
+            },
+        }
+    )
+    # leaves of different shapes can't be applied to at once, and fall back to
+    # mapping over the leaves one by one
+    y = x.cont_map(lambda v, kc: v + 1) if same_shapes else x.sum(axis=-1)
+    expected = fn(x, y)
+    ivy.set_flat_container_mode(True)
+    ret = fn(x, y)
+    ivy.unset_flat_container_mode()
+    assert Container.cont_identical_structure([ret, expected])
+    assert ret.cont_config == expected.cont_config
+    for (kc, v), (_, e) in zip(ret.cont_to_iterator(), expected.cont_to_iterator()):
+        assert type(v) is type(e), kc
+        assert np.allclose(ivy.to_numpy(v), ivy.to_numpy(e))
+
+
+def test_container_flat_mode_mutation(on_device):
+    x = Container(
+        {
+            "a": ivy.array([1.0, 2.0], device=on_device),
+            "b": {"c": ivy.array([3.0], device=on_device)},
+        }
+    )
+    ivy.set_flat_container_mode(True)
+    assert np.allclose(ivy.to_numpy((x * 2).b.c), [6.0])
+    # the cached leaves of the container are refreshed after mutations
+    x.b.c = ivy.array([4.0], device=on_device)
+    assert np.allclose(ivy.to_numpy((x * 2).b.c), [8.0])
+    x.b["e"] = ivy.array([5.0], device=on_device)
+    assert np.allclose(ivy.to_numpy((x * 2).b.e), [10.0])
+    del x.b["e"]
+    assert "e" not in (x * 2).b
+    x.b.update({"c": ivy.array([1], device=on_device)})
+    ret = x * 2
+    ivy.unset_flat_container_mode()
+    assert ivy.to_numpy(ret.b.c).tolist() == [2]
+    assert ivy.to_numpy(ret.a).tolist() == [2.0, 4.0]
+    # mutating another container keeps the cached leaves of the container
+    y = x.cont_deep_copy()
+    ivy.set_flat_container_mode(True)
+    x * 2
+    view = x._cont_get_flat_view()
+    y * 2
+    y.b.c = ivy.array([7.0], device=on_device)
+    assert x._cont_get_flat_view() is view
+    assert np.allclose(ivy.to_numpy((y * 2).b.c), [14.0])
+    ivy.unset_flat_container_mode()
+
+
 def test_container_flatten_key_chains(on_device):
     container = Container(
         {
@@ -2992,6 +3115,46 @@ def test_container_to_and_from_disk_as_json(on_device):
     os.remove(save_filepath)
 
 
+@pytest.mark.parametrize("lazy", [True, False])
+def test_container_to_and_from_disk_as_mmap(lazy, on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk.mmap"
+    dict_in = {
+        "a": ivy.array(np.arange(10, dtype=np.float32), device=on_device),
+        "b": {
+            "c": ivy.array([[True, False, True]], device=on_device),
+            "d": ivy.array(np.int32(3), device=on_device),
+        },
+        "e": ivy.array(np.random.rand(3, 5), device=on_device),
+    }
+    container = Container(dict_in)
+
+    # saving
+    container.cont_save(save_filepath, format="mmap")
+    assert os.path.exists(save_filepath)
+
+    # loading
+    loaded_container = Container.cont_from_disk_as_mmap(
+        save_filepath, lazy=lazy, num_workers=2
+    )
+    assert Container.cont_identical_structure([loaded_container, container])
+    for key_chain, value in container.cont_to_iterator():
+        loaded_value = loaded_container[key_chain]
+        assert ivy.dtype(loaded_value) == ivy.dtype(value)
+        assert np.array_equal(ivy.to_numpy(loaded_value), ivy.to_numpy(value))
+
+    # partial loading
+    loaded_container = Container.cont_from_disk_as_mmap(
+        save_filepath, key_chains=["b/c", "e"], lazy=lazy
+    )
+    assert loaded_container.cont_all_key_chains() == ["b/c", "e"]
+    assert np.array_equal(ivy.to_numpy(loaded_container.e), ivy.to_numpy(container.e))
+
+    os.remove(save_filepath)
+
+
 def test_container_to_and_from_disk_as_pickled(on_device):
     save_filepath = "container_on_disk.pickled"
     dict_in = {
@@ -3042,6 +3205,47 @@ def test_container_to_dict(on_device):
     assert res == {"a": 1, "b": {"c": True, "d": {"g": 2.0, "h": 3}}}
 
 
+@pytest.mark.parametrize(
+    ("chunks", "compression"), [(None, None), (True, "gzip"), (2, "lzf")]
+)
+def test_container_to_and_from_disk_as_hdf5_chunked(chunks, compression, on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk.hdf5"
+    rng = np.random.RandomState(0)
+    x = rng.rand(8, 3).astype(np.float32)
+    y = rng.randint(0, 10, (8,)).astype(np.int32)
+    container1, container2 = (
+        Container(
+            {
+                "x": ivy.array(x[rows], device=on_device),
+                "y": {"z": ivy.array(y[rows], device=on_device)},
+            }
+        )
+        for rows in (slice(0, 4), slice(4, 8))
+    )
+
+    # saving in two batches of rows
+    container1.cont_to_disk_as_hdf5(
+        save_filepath, max_batch_size=8, chunks=chunks, compression=compression
+    )
+    container2.cont_to_disk_as_hdf5(save_filepath, starting_index=4)
+    with h5py.File(save_filepath, "r") as h5_obj:
+        assert h5_obj["x"].compression == compression
+        assert h5_obj["y/z"].shape == (8,)
+        if chunks == 2:
+            assert h5_obj["x"].chunks == (2, 3)
+
+    # loading a batch of rows of all leaves
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath, slice(2, 6))
+    assert np.array_equal(ivy.to_numpy(loaded_container.x), x[2:6])
+    assert np.array_equal(ivy.to_numpy(loaded_container.y.z), y[2:6])
+    assert ivy.dtype(loaded_container.y.z) == "int32"
+
+    os.remove(save_filepath)
+
+
 def test_container_to_disk_shuffle_and_from_disk_as_hdf5(on_device):
     if ivy.current_backend_str() == "tensorflow":
         # container disk saving requires eager execution
@@ -3081,6 +3285,38 @@ def test_container_to_disk_shuffle_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+def test_container_to_disk_shuffle_as_hdf5_out_of_core(on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk.hdf5"
+    x = np.arange(40, dtype=np.float32).reshape(10, 4)
+    container = Container(
+        {
+            "x": ivy.array(x, device=on_device),
+            "y": {"z": ivy.array(np.arange(10), device=on_device)},
+        }
+    )
+    container.cont_to_disk_as_hdf5(save_filepath, chunks=3, compression="gzip")
+
+    # shuffling blocks of at most 2 rows
+    Container.shuffle_h5_file(save_filepath, seed_value=1, buffer_size=32)
+
+    # loading
+    container_shuffled = Container.cont_from_disk_as_hdf5(save_filepath)
+
+    # testing
+    permutation = list(range(10))
+    random.Random(1).shuffle(permutation)
+    assert np.array_equal(ivy.to_numpy(container_shuffled.x), x[permutation])
+    assert np.array_equal(ivy.to_numpy(container_shuffled.y.z), permutation)
+    with h5py.File(save_filepath, "r") as h5_obj:
+        assert sorted(h5_obj.keys()) == ["x", "y"]
+        assert h5_obj["x"].compression == "gzip"
+
+    os.remove(save_filepath)
+
+
 def test_container_to_flat_list(on_device):
     dict_in = {
         "a": ivy.array([1], device=on_device),
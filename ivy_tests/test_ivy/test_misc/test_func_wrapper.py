@@ -55,6 +55,91 @@ def _jl(x, *args, fn_original, **kwargs):
 # ------------ #
 
 
+def test_dispatch_cache(backend_fw):
+    ivy.set_backend(backend_fw)
+    x = ivy.array([1.0, 2.0])
+    ivy.clear_dispatch_cache()
+    ivy.add(x, x)
+    info = ivy.dispatch_cache_info()
+    assert info.misses > 0
+    assert info.currsize > 0
+    hits = info.hits
+    with patch("ivy.nested_any", wraps=ivy.nested_any) as nested_any:
+        ivy.add(x, x)
+        assert nested_any.call_count == 0
+    assert ivy.dispatch_cache_info().hits > hits
+    # containers, also inside of lists, are still mapped over
+    c = ivy.Container(a=x)
+    assert isinstance(ivy.add(c, x), ivy.Container)
+    assert isinstance(ivy.concat([c, c]), ivy.Container)
+    assert isinstance(ivy.concat([x, x]), ivy.Array)
+    ivy.clear_dispatch_cache()
+    info = ivy.dispatch_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize(
+    ("fn_name", "args", "kwargs"),
+    [
+        ("add", ([1.0, 2.0], [3.0, 4.0]), {}),
+        ("add", ([1.0, 2.0], 3.0), {"alpha": 2}),
+        ("sum", ([[1.0, 2.0], [3.0, 4.0]],), {"axis": 0}),
+        ("matmul", ([[1.0, 2.0], [3.0, 4.0]], [[1.0], [2.0]]), {}),
+        ("split", ([1.0, 2.0, 3.0, 4.0],), {"num_or_size_splits": 2}),
+    ],
+)
+def test_fused_dispatch(fn_name, args, kwargs, backend_fw):
+    ivy.set_backend(backend_fw)
+    args = [ivy.array(arg) if isinstance(arg, list) else arg for arg in args]
+    with patch(
+        "ivy.func_wrapper._dispatch_flags", wraps=ivy.func_wrapper._dispatch_flags
+    ) as dispatch_flags:
+        expected = ivy.__dict__[fn_name](*args, **kwargs)
+        num_unfused_calls = dispatch_flags.call_count
+        dispatch_flags.reset_mock()
+        ivy.set_fused_dispatch_mode(True)
+        ret = ivy.__dict__[fn_name](*args, **kwargs)
+        ivy.unset_fused_dispatch_mode()
+        # the outer wrappers, including handle_nestable, were skipped
+        assert dispatch_flags.call_count < num_unfused_calls
+    if not isinstance(ret, (list, tuple)):
+        ret, expected = [ret], [expected]
+    for r, e in zip(ret, expected):
+        assert isinstance(r, ivy.Array)
+        assert np.allclose(ivy.to_numpy(r), ivy.to_numpy(e))
+    ivy.previous_backend()
+
+
+def test_fused_dispatch_fallback(backend_fw):
+    ivy.set_backend(backend_fw)
+    ivy.set_fused_dispatch_mode(True)
+    x = ivy.array([1.0, 2.0, 3.0])
+    # containers go through the full wrapper stack
+    ret = ivy.add(ivy.Container(a=x), x)
+    assert isinstance(ret, ivy.Container)
+    assert np.allclose(ivy.to_numpy(ret.a), [2.0, 4.0, 6.0])
+    # so do out arguments
+    out = ivy.zeros(3)
+    ivy.add(x, x, out=out)
+    assert np.allclose(ivy.to_numpy(out), [2.0, 4.0, 6.0])
+    # backend errors are raised as the full wrapper stack raises them, without
+    # running the call again through it
+    y = ivy.ones(2)
+    with patch(
+        "ivy.func_wrapper._dispatch_flags", wraps=ivy.func_wrapper._dispatch_flags
+    ) as dispatch_flags:
+        with pytest.raises(ivy.utils.exceptions.IvyException) as fused_error:
+            ivy.add(x, y)
+        assert dispatch_flags.call_count == 0
+        ivy.unset_fused_dispatch_mode()
+        with pytest.raises(ivy.utils.exceptions.IvyException) as error:
+            ivy.add(x, y)
+    assert isinstance(fused_error.value, type(error.value))
+    assert str(fused_error.value) == str(error.value)
+    ivy.previous_backend()
+
+
 @pytest.mark.parametrize(
     ("fn", "x", "expected_type"),
     [
@@ -0,0 +1,150 @@
+import concurrent.futures
+import threading
+
+import numpy as np
+
+import ivy
+from ivy.compiler.tracer import Graph, trace_graph
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+def _fn(x, w, scale=2.0):
+    y = ivy.relu(ivy.matmul(x, w) * scale + 1)
+    z = ivy.sum(y, axis=-1)
+    return {"y": y, "z": [z, ivy.mean(z)]}
+
+
+def _assert_same(ret, expected):
+    ret, expected = ivy.flatten_nest(ret), ivy.flatten_nest(expected)
+    assert ret.indices == expected.indices
+    for r, e in zip(ret.leaves, expected.leaves):
+        assert type(r) is type(e)
+        assert np.allclose(ivy.to_numpy(r), ivy.to_numpy(e))
+
+
+# --- Main --- #
+# ------------ #
+
+
+def test_trace_graph(backend_fw):
+    ivy.set_backend(backend_fw)
+    x = ivy.random_uniform(shape=(4, 3))
+    w = ivy.random_uniform(shape=(3, 3))
+    graph = trace_graph(_fn, args=(x, w))
+    assert isinstance(graph, Graph)
+    info = graph.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 1, 1)
+    # new arrays with the same signature replay the traced operations
+    x = ivy.random_uniform(shape=(4, 3))
+    _assert_same(graph(x, w), _fn(x, w))
+    assert graph.cache_info().hits == 1
+    # new shapes, dtypes and static arguments trace new graphs
+    x = ivy.random_uniform(shape=(2, 3))
+    _assert_same(graph(x, w), _fn(x, w))
+    _assert_same(graph(x, w, scale=3.0), _fn(x, w, scale=3.0))
+    x, w = ivy.astype(x, "float64"), ivy.astype(w, "float64")
+    _assert_same(graph(x, w), _fn(x, w))
+    info = graph.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 4, 4)
+    # the least recently used graphs are evicted
+    graph._cache.maxsize = 2
+    graph(x, w)
+    graph(ivy.random_uniform(shape=(6, 3)), ivy.random_uniform(shape=(3, 3)))
+    info = graph.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 5, 2)
+    graph(x, w)
+    assert graph.cache_info().hits == 3
+    graph(ivy.random_uniform(shape=(4, 3)), ivy.random_uniform(shape=(3, 3)))
+    assert graph.cache_info().misses == 6
+    ivy.previous_backend()
+
+
+def test_trace_graph_generators(backend_fw):
+    ivy.set_backend(backend_fw)
+
+    def _noisy(x):
+        return x + ivy.random_uniform(shape=x.shape)
+
+    x = ivy.zeros((10,))
+    replayed = trace_graph(_noisy, args=(x,))
+    folded = trace_graph(_noisy, include_generators=False, args=(x,))
+    assert not np.allclose(ivy.to_numpy(replayed(x)), ivy.to_numpy(replayed(x)))
+    assert np.allclose(ivy.to_numpy(folded(x)), ivy.to_numpy(folded(x)))
+    ivy.previous_backend()
+
+
+def test_trace_graph_caching(backend_fw):
+    ivy.set_backend(backend_fw)
+    ivy.clear_graph_cache()
+    x = ivy.array([1.0, 2.0])
+    trace_graph(ivy.sin, graph_caching=True)(x)
+    # graphs of the same function share the traces of the graph cache
+    ret = trace_graph(ivy.sin, graph_caching=True)(x)
+    assert np.allclose(ivy.to_numpy(ret), np.sin([1.0, 2.0]))
+    info = ivy.graph_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+    ivy.clear_graph_cache()
+    info = ivy.graph_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+    ivy.previous_backend()
+
+
+def test_trace_graph_threads(backend_fw):
+    ivy.set_backend(backend_fw)
+    started, done = threading.Event(), threading.Event()
+
+    def _waiting(x):
+        y = ivy.sin(x)
+        started.set()
+        done.wait()
+        return y * 2
+
+    def _other_calls():
+        started.wait()
+        ivy.cos(ivy.array([1.0]))
+        done.set()
+
+    # the calls of other threads aren't recorded into the graph
+    graph = trace_graph(_waiting)
+    other = threading.Thread(target=_other_calls)
+    other.start()
+    x = ivy.array([1.0, 2.0])
+    graph(x)
+    other.join()
+    (trace,) = graph._cache.values()
+    assert len(trace.ops) == 2
+    assert np.allclose(ivy.to_numpy(graph(x)), 2 * np.sin([1.0, 2.0]))
+
+    # graphs traced and replayed concurrently through the shared graph cache
+    ivy.clear_graph_cache()
+    inputs = [ivy.ones((n, 3)) for n in range(1, 9)] * 4
+    w = ivy.ones((3, 2))
+
+    def _traced(x):
+        return trace_graph(_fn, graph_caching=True)(x, w)
+
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        rets = list(executor.map(_traced, inputs))
+    for x, ret in zip(inputs, rets):
+        _assert_same(ret, _fn(x, w))
+    ivy.clear_graph_cache()
+    ivy.previous_backend()
+
+
+def test_trace_graph_module(backend_fw):
+    ivy.set_backend(backend_fw)
+    module = ivy.Linear(3, 2)
+    x = ivy.random_uniform(shape=(4, 3))
+    module.trace_graph(args=(x,))
+    for batch_size in [4, 5, 4]:
+        x = ivy.random_uniform(shape=(batch_size, 3))
+        ret = module(x)
+        assert ret.shape == (batch_size, 2)
+        expected = module._call(x, v=module.v)
+        assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(expected))
+    info = module._module_graph.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+    ivy.previous_backend()
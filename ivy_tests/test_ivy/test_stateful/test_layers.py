@@ -1557,6 +1557,22 @@ def test_multi_head_attention_layer(
     assert_same_type_and_shape([ret_np_flat, ret_np_from_gt_flat])
 
 
+def test_multi_head_attention_kv_cache(backend_fw):
+    with ivy.utils.backend.ContextManager(backend_fw):
+        layer = ivy.MultiHeadAttention(8, num_heads=2)
+        x = ivy.random_normal(shape=(2, 6, 8))
+        expected = layer(x, is_causal=True)
+        # a prompt of three tokens, then one token at a time
+        kv_cache = {}
+        steps = [layer(x[:, :3], is_causal=True, kv_cache=kv_cache)]
+        for i in range(3, 6):
+            steps.append(layer(x[:, i : i + 1], is_causal=True, kv_cache=kv_cache))
+        assert kv_cache["k"].shape == (4, 6, 4)
+        assert kv_cache["v"].shape == (4, 6, 4)
+        ret = ivy.concat(steps, axis=1)
+        assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(expected), atol=1e-5)
+
+
 # # Sequential #
 @handle_method(
     method_tree="Sequential.__call__",
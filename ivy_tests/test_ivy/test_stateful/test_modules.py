@@ -4,6 +4,7 @@
 import os
 from hypothesis import given, strategies as st
 import numpy as np
+import pytest
 
 # local
 import ivy
@@ -20,11 +21,18 @@ class TrainableModule(ivy.Module):
         hidden_size=64,
         v=None,
         with_partial_v=False,
+        flat_params=False,
     ):
         self._linear0 = ivy.Linear(in_size, hidden_size, device=device)
         self._linear1 = ivy.Linear(hidden_size, hidden_size, device=device)
         self._linear2 = ivy.Linear(hidden_size, out_size, device=device)
-        ivy.Module.__init__(self, device=device, v=v, with_partial_v=with_partial_v)
+        ivy.Module.__init__(
+            self,
+            device=device,
+            v=v,
+            with_partial_v=with_partial_v,
+            flat_params=flat_params,
+        )
 
     def _forward(self, x):
         x = ivy.expand_dims(x, axis=0)
@@ -214,6 +222,47 @@ def test_module_save_and_load_as_pickled(
         os.remove(save_filepath)
 
 
+@given(
+    format=st.sampled_from(["h5py", "mmap"]),
+    flat_params=st.booleans(),
+)
+def test_module_save_and_load_weights(format, flat_params, on_device, backend_fw):
+    save_filepath = f"module_weights.{format}"
+    with ivy.utils.backend.ContextManager(backend_fw):
+        x = ivy.astype(ivy.linspace(ivy.zeros((2,)), ivy.ones((2,)), 3), "float32")
+        module = TrainableModule(3, 4, device=on_device)
+        module.save_weights(save_filepath, format=format)
+        assert os.path.exists(save_filepath)
+
+        loaded_module = TrainableModule(3, 4, device=on_device, flat_params=flat_params)
+        loaded_module.load_weights(save_filepath, format=format)
+        assert ivy.Container.all(loaded_module.v == module.v).cont_all_true()
+        assert np.allclose(ivy.to_numpy(loaded_module(x)), ivy.to_numpy(module(x)))
+
+        if format == "mmap":
+            # only the weights of the first linear layer are loaded
+            partial_module = TrainableModule(3, 4, device=on_device)
+            partial_module.load_weights(
+                save_filepath, format=format, key_chains=["linear0"]
+            )
+            assert np.array_equal(
+                ivy.to_numpy(partial_module.v.linear0.w),
+                ivy.to_numpy(module.v.linear0.w),
+            )
+            assert not np.array_equal(
+                ivy.to_numpy(partial_module.v.linear1.w),
+                ivy.to_numpy(module.v.linear1.w),
+            )
+        else:
+            # the other formats can't load only some of the weights
+            with pytest.raises(ivy.utils.exceptions.IvyException):
+                loaded_module.load_weights(
+                    save_filepath, format=format, key_chains=["linear0"]
+                )
+
+        os.remove(save_filepath)
+
+
 @given(dummy=st.booleans())
 def test_module_to_device(dummy, on_device, backend_fw):
     with ivy.utils.backend.ContextManager(backend_fw):
@@ -300,6 +349,75 @@ def test_module_training(
             return
 
 
+# module training with flat parameter buffers
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+)
+def test_module_flat_params(
+    batch_shape, input_channels, output_channels, on_device, backend_fw
+):
+    with ivy.utils.backend.ContextManager(backend_fw):
+        x = ivy.astype(
+            ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
+            "float32",
+        )
+        module = TrainableModule(
+            input_channels, output_channels, device=on_device, flat_params=True
+        )
+        flat_buffers = module.v._cont_get_flat_buffers()
+        assert flat_buffers is not None
+        assert len(flat_buffers.flats) == 1
+        (flat,) = flat_buffers.flats.values()
+        assert flat.shape == (sum(x.size for x in module.v.cont_to_flat_list()),)
+        if backend_fw == "numpy":
+            for leaf in module.v.cont_to_flat_list():
+                assert np.shares_memory(leaf.data, flat.data)
+        # the views give the same outputs as the variables they were copied from
+        expected = TrainableModule(
+            input_channels,
+            output_channels,
+            device=on_device,
+            v=module.v.cont_deep_copy(),
+        )(x)
+        assert np.allclose(ivy.to_numpy(module(x)), ivy.to_numpy(expected))
+
+        # the flat buffers are kept through the foreach steps and device transfers
+        optimizer = ivy.Adam(lr=1e-3, foreach=True)
+        grads = module.v.cont_map(lambda x, kc: ivy.ones_like(x))
+        module.v = optimizer.step(module.v, grads)
+        assert module.v._cont_get_flat_buffers() is not None
+        module.to_device(on_device)
+        assert module.v._cont_get_flat_buffers() is not None
+        # variables assigned to the module are copied into flat buffers
+        module.v = module.v.cont_map(lambda x, kc: x + 1)
+        assert module.v._cont_get_flat_buffers() is not None
+        # replacing a leaf invalidates the buffers
+        v = module.v
+        v.linear0.b = ivy.zeros_like(v.linear0.b)
+        assert v._cont_get_flat_buffers() is None
+
+        if backend_fw == "numpy":
+            # NumPy does not support gradients
+            return
+
+        def loss_fn(v_):
+            return ivy.mean(module(x, v=v_))
+
+        loss_tm1 = 1e12
+        for i in range(10):
+            loss, grads = ivy.execute_with_gradients(loss_fn, module.v)
+            assert grads._cont_get_flat_buffers() is not None
+            module.v = optimizer.step(module.v, grads)
+            assert loss < loss_tm1
+            loss_tm1 = loss
+        assert ivy.max(ivy.abs(grads.linear0.w)) > 0
+        assert ivy.max(ivy.abs(grads.linear2.b)) > 0
+
+
 # module training with duplicate
 @given(
     batch_shape=helpers.get_shape(
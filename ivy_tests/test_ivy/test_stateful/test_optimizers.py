@@ -1,9 +1,12 @@
 """Collection of tests for Ivy optimizers."""
 
 # global
+import numpy as np
+import pytest
 from hypothesis import strategies as st
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_method
 from ivy_tests.test_ivy.test_functional.test_core.test_gradients import (
@@ -267,6 +270,55 @@ def test_lars_optimizer(
     )
 
 
+# foreach
+@pytest.mark.parametrize(
+    ("optimizer", "kwargs"),
+    [
+        ("SGD", {}),
+        ("LARS", {"decay_lambda": 0.1}),
+        ("Adam", {}),
+        ("AdamW", {"weight_decay": 0.1}),
+        ("LAMB", {"decay_lambda": 0.1}),
+    ],
+)
+def test_optimizer_foreach(optimizer, kwargs, backend_fw):
+    ivy.set_backend(backend_fw)
+    rng = np.random.RandomState(0)
+
+    def _container():
+        # two dtypes, updated as two flat buffers
+        return ivy.Container(
+            {
+                "a": ivy.array(rng.randn(3, 4).astype("float32")),
+                "b": {
+                    "c": ivy.array(rng.randn(5).astype("float32")),
+                    "d": ivy.array(rng.randn(2, 2).astype("float64")),
+                },
+            }
+        )
+
+    v = _container()
+    grads = [_container() for _ in range(3)]
+    rets = []
+    for foreach in [False, True]:
+        optimizer_class = getattr(ivy, optimizer)
+        opt = optimizer_class(lr=0.1, foreach=foreach, **kwargs)
+        new_v = v
+        for g in grads:
+            new_v = opt.step(new_v, g.cont_deep_copy())
+        rets.append((new_v, opt.state))
+    (expected, expected_state), (ret, state) = rets
+    assert ivy.Container.cont_identical_structure([ret, expected])
+    assert ivy.Container.cont_identical_structure([state, expected_state])
+    for (_, r), (_, e) in zip(
+        ivy.Container({"v": ret, "state": state}).cont_to_iterator(),
+        ivy.Container({"v": expected, "state": expected_state}).cont_to_iterator(),
+    ):
+        assert r.dtype == e.dtype
+        assert np.allclose(ivy.to_numpy(r), ivy.to_numpy(e), rtol=1e-5, atol=1e-6)
+    ivy.previous_backend()
+
+
 # sgd
 @handle_method(
     method_tree="SGD._step",
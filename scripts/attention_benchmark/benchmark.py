@@ -0,0 +1,159 @@
+"""Benchmark of scaled dot product attention and of decoding with a key/value
+cache.
+
+``ivy.scaled_dot_product_attention`` is timed at several sequence lengths,
+once attending all the keys at once, and once over blocks of keys with the
+online softmax used for long sequences. The peak memory allocated by each call
+is traced with ``tracemalloc`` in a separate call, as tracing slows down the
+calls, and only sees the allocations of backends reporting to it, such as
+numpy. The dense calls are skipped above ``max_dense_length``, where the
+similarity matrix alone takes gigabytes.
+
+The next token of prompts of several lengths is then decoded with
+``ivy.MultiHeadAttention``, once attending the whole prompt again, and once
+with a ``kv_cache`` holding the keys and values of the prompt.
+
+Usage::
+
+    python scripts/attention_benchmark/benchmark.py --backend numpy \
+        --lengths 1024 2048 4096 8192 16384
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import ivy
+from ivy.functional.ivy import layers
+
+
+def _time(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1e3
+
+
+def _measure(fn):
+    elapsed = _time(fn)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def _dense_attention(q, k, v):
+    chunk_size = layers._SDPA_CHUNK_SIZE
+    layers._SDPA_CHUNK_SIZE = max(q.shape[-2], k.shape[-2])
+    try:
+        return ivy.scaled_dot_product_attention(q, k, v, is_causal=True)
+    finally:
+        layers._SDPA_CHUNK_SIZE = chunk_size
+
+
+def attention_benchmark(
+    backend="numpy",
+    lengths=(1024, 2048, 4096, 8192, 16384),
+    feat_dim=64,
+    max_dense_length=8192,
+    prompt_lengths=(512, 1024, 2048, 4096),
+):
+    """Time and trace the memory of causal attention over long sequences, and
+    of decoding with and without a key/value cache.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+    lengths
+        The sequence lengths to attend over.
+        (Default value = (1024, 2048, 4096, 8192, 16384)).
+    feat_dim
+        The number of features of the queries, keys and values.
+        (Default value = 64).
+    max_dense_length
+        The longest sequence to attend over at once. (Default value = 8192).
+    prompt_lengths
+        The lengths of the prompts to decode the next token of.
+        (Default value = (512, 1024, 2048, 4096)).
+
+    Returns
+    -------
+    ret
+        A dict mapping each sequence length to the ``"dense"`` and ``"chunked"``
+        time in milliseconds and peak memory in MiB, and a dict mapping each
+        prompt length to the ``"prompt"`` and ``"kv_cache"`` time of decoding a
+        token, in milliseconds.
+    """
+    ivy.set_backend(backend)
+    attention = {}
+    for length in lengths:
+        q, k, v = (
+            ivy.random_normal(shape=(1, length, feat_dim), dtype="float32")
+            for _ in range(3)
+        )
+        attention[length] = {
+            "chunked": _measure(
+                lambda: ivy.scaled_dot_product_attention(q, k, v, is_causal=True)
+            )
+        }
+        if length <= max_dense_length:
+            attention[length]["dense"] = _measure(lambda: _dense_attention(q, k, v))
+    decoding = {}
+    layer = ivy.MultiHeadAttention(feat_dim, num_heads=4)
+    for length in prompt_lengths:
+        x = ivy.random_normal(shape=(1, length + 1, feat_dim), dtype="float32")
+        kv_cache = {}
+        layer(x[:, :length], is_causal=True, kv_cache=kv_cache)
+        decoding[length] = {
+            "prompt": _time(lambda: layer(x, is_causal=True)),
+            "kv_cache": _time(
+                lambda: layer(x[:, length:], is_causal=True, kv_cache=dict(kv_cache))
+            ),
+        }
+    ivy.previous_backend()
+    return attention, decoding
+
+
+def _print_results(results):
+    attention, decoding = results
+    print(
+        f"{'length':<8}{'dense ms':>12}{'dense MiB':>12}"
+        f"{'chunked ms':>12}{'chunked MiB':>13}"
+    )
+    for length, timings in attention.items():
+        dense_ms, dense_mib = timings.get("dense", (float("nan"),) * 2)
+        chunked_ms, chunked_mib = timings["chunked"]
+        print(
+            f"{length:<8}{dense_ms:>12.1f}{dense_mib:>12.1f}"
+            f"{chunked_ms:>12.1f}{chunked_mib:>13.1f}"
+        )
+    print(f"\n{'prompt':<8}{'prompt ms':>12}{'kv_cache ms':>13}{'speedup':>10}")
+    for length, timings in decoding.items():
+        print(
+            f"{length:<8}{timings['prompt']:>12.1f}{timings['kv_cache']:>13.1f}"
+            f"{timings['prompt'] / timings['kv_cache']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument(
+        "--lengths", type=int, nargs="+", default=[1024, 2048, 4096, 8192, 16384]
+    )
+    parser.add_argument("--feat-dim", type=int, default=64)
+    parser.add_argument("--max-dense-length", type=int, default=8192)
+    parser.add_argument(
+        "--prompt-lengths", type=int, nargs="+", default=[512, 1024, 2048, 4096]
+    )
+    parsed = parser.parse_args()
+    _print_results(
+        attention_benchmark(
+            parsed.backend,
+            parsed.lengths,
+            parsed.feat_dim,
+            parsed.max_dense_length,
+            parsed.prompt_lengths,
+        )
+    )
@@ -0,0 +1,69 @@
+"""Micro-benchmark of the latency of switching between ivy backends.
+
+The first time a backend is set, all of its functions are wrapped and the
+resulting namespace is cached. This script reports the cost of that first
+switch, and the average cost of the later ``ivy.set_backend`` and
+``ivy.previous_backend`` calls which only replay the cached namespace.
+
+Usage::
+
+    python scripts/backend_switch_benchmark/benchmark.py --backends numpy torch
+"""
+
+import argparse
+import timeit
+
+import ivy
+
+
+def backend_switch_benchmark(backends=("numpy",), num_switches=100):
+    """Measure the latency of setting and unsetting backends.
+
+    Parameters
+    ----------
+    backends
+        The backends to alternate between. (Default value = ("numpy",)).
+    num_switches
+        How many times each backend is set and unset per measurement.
+        (Default value = 100).
+
+    Returns
+    -------
+    ret
+        A dict mapping each backend to its ``"first_set"``, ``"set"`` and
+        ``"unset"`` latencies, in microseconds.
+    """
+    ivy.unset_backend()
+    ivy.utils.backend.clear_backend_snapshots()
+    results = {}
+    for backend in backends:
+        first_set = timeit.timeit(lambda: ivy.set_backend(backend), number=1)
+        ivy.previous_backend()
+        results[backend] = {"first_set": first_set * 1e6, "set": 0.0, "unset": 0.0}
+    for _ in range(num_switches):
+        for backend in backends:
+            results[backend]["set"] += timeit.timeit(
+                lambda: ivy.set_backend(backend), number=1
+            )
+            results[backend]["unset"] += timeit.timeit(ivy.previous_backend, number=1)
+    for timings in results.values():
+        timings["set"] *= 1e6 / num_switches
+        timings["unset"] *= 1e6 / num_switches
+    return results
+
+
+def _print_results(results):
+    print(f"{'backend':<12}{'first set us':>16}{'set us':>12}{'unset us':>12}")
+    for backend, timings in results.items():
+        print(
+            f"{backend:<12}{timings['first_set']:>16.2f}"
+            f"{timings['set']:>12.2f}{timings['unset']:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--switches", type=int, default=100)
+    parsed = parser.parse_args()
+    _print_results(backend_switch_benchmark(parsed.backends, parsed.switches))
@@ -0,0 +1,135 @@
+"""Benchmark of saving and loading containers of weights.
+
+A container of weights is saved in the hdf5, pickle and mmap formats of
+``Container.cont_save``. Each file is then loaded, and all of its leaves are
+read by summing them. The mmap format is loaded lazily, eagerly with a pool of
+threads, and partially, only for the weights of one layer. The peak memory
+allocated by numpy while loading and reading is traced with tracemalloc. The
+pages of a memory-mapped file are owned by the page cache and aren't counted.
+
+Usage::
+
+    python scripts/checkpoint_benchmark/benchmark.py --backend numpy \
+        --layers 16 --width 1024
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy
+
+
+def _make_weights(num_layers, width):
+    rng = np.random.RandomState(0)
+    return ivy.Container(
+        {
+            f"layer{i}": {
+                "w": ivy.array(rng.randn(width, width).astype("float32")),
+                "b": ivy.array(rng.randn(width).astype("float32")),
+            }
+            for i in range(num_layers)
+        }
+    )
+
+
+def _read_all(container):
+    return sum(
+        float(np.sum(ivy.to_numpy(x))) for x in container.cont_to_iterator_values()
+    )
+
+
+def checkpoint_benchmark(backend="numpy", num_layers=16, width=1024, num_workers=4):
+    """Time the saving and loading of a container of weights.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+    num_layers
+        The number of layers of weights. (Default value = 16).
+    width
+        The width of the square weight matrix of each layer.
+        (Default value = 1024).
+    num_workers
+        The number of threads of the eager mmap loading. (Default value = 4).
+
+    Returns
+    -------
+    ret
+        A dict mapping each method to its save time in milliseconds, its load
+        time, its time to load and read all loaded leaves, and the peak memory
+        in MiB allocated while loading and reading.
+    """
+    ivy.set_backend(backend)
+    weights = _make_weights(num_layers, width)
+    methods = {
+        "h5py": ("h5py", lambda path: ivy.Container.cont_load(path, format="h5py")),
+        "pickle": (
+            "pickle",
+            lambda path: ivy.Container.cont_load(path, format="pickle"),
+        ),
+        "mmap lazy": ("mmap", lambda path: ivy.Container.cont_load(path, "mmap")),
+        "mmap eager": (
+            "mmap",
+            lambda path: ivy.Container.cont_from_disk_as_mmap(
+                path, lazy=False, num_workers=num_workers
+            ),
+        ),
+        "mmap partial": (
+            "mmap",
+            lambda path: ivy.Container.cont_from_disk_as_mmap(
+                path, key_chains=["layer0"]
+            ),
+        ),
+    }
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, (format, load_fn) in methods.items():
+            path = os.path.join(tmp_dir, f"weights.{format}")
+            start = time.perf_counter()
+            if not os.path.exists(path):
+                weights.cont_save(path, format=format)
+            save_time = (time.perf_counter() - start) * 1000
+            tracemalloc.start()
+            start = time.perf_counter()
+            loaded = load_fn(path)
+            load_time = (time.perf_counter() - start) * 1000
+            _read_all(loaded)
+            read_time = (time.perf_counter() - start) * 1000
+            peak = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+            del loaded
+            results[name] = {
+                "save": save_time,
+                "load": load_time,
+                "load + read": read_time,
+                "peak MiB": peak,
+            }
+    ivy.previous_backend()
+    return results
+
+
+def _print_results(results):
+    columns = ["save", "load", "load + read", "peak MiB"]
+    print(f"{'method':<14}" + "".join(f"{column:>14}" for column in columns))
+    for name, values in results.items():
+        print(f"{name:<14}" + "".join(f"{values[column]:>14.1f}" for column in columns))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--layers", type=int, default=16)
+    parser.add_argument("--width", type=int, default=1024)
+    parser.add_argument("--workers", type=int, default=4)
+    parsed = parser.parse_args()
+    _print_results(
+        checkpoint_benchmark(
+            parsed.backend, parsed.layers, parsed.width, parsed.workers
+        )
+    )
@@ -0,0 +1,103 @@
+"""Benchmark of container operations with and without flat container mode.
+
+A container of many small arrays, as found in the parameters and gradients of
+a network, is mapped over with ``cont_map`` and ``cont_multi_map``, and passed
+to the elementwise operators and static methods, once recursing over the
+container structure and once in ``ivy.flat_container_mode``.
+
+Usage::
+
+    python scripts/container_benchmark/benchmark.py --backend numpy --width 10 \
+        --depth 4
+"""
+
+import argparse
+import time
+
+import ivy
+
+
+def _build(width, depth, shape):
+    if depth == 0:
+        return ivy.random_uniform(shape=shape)
+    return {f"k{i}": _build(width, depth - 1, shape) for i in range(width)}
+
+
+_OPS = {
+    "cont_map": lambda x, y: x.cont_map(lambda v, kc: v),
+    "cont_multi_map": lambda x, y: ivy.Container.cont_multi_map(
+        lambda vs, kc: vs[0], [x, y]
+    ),
+    "x + y": lambda x, y: x + y,
+    "x * 0.9": lambda x, y: x * 0.9,
+    "static_sin": lambda x, y: ivy.Container.static_sin(x),
+}
+
+
+def container_benchmark(backend="numpy", width=10, depth=4, shape=(2,), num_calls=3):
+    """Time container operations with and without flat container mode.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+    width
+        The number of keys of each sub-container. (Default value = 10).
+    depth
+        The depth of the container, which holds ``width ** depth`` leaves.
+        (Default value = 4).
+    shape
+        The shape of the leaves. (Default value = (2,)).
+    num_calls
+        How many times each operation is called per measurement.
+        (Default value = 3).
+
+    Returns
+    -------
+    ret
+        A dict mapping each operation to its ``"recursive"`` and ``"flat"`` time
+        per call, in milliseconds.
+    """
+    ivy.set_backend(backend)
+    x = ivy.Container(_build(width, depth, shape))
+    y = ivy.Container(_build(width, depth, shape))
+    results = {name: {} for name in _OPS}
+    for mode, label in ((False, "recursive"), (True, "flat")):
+        ivy.set_flat_container_mode(mode)
+        for name, op in _OPS.items():
+            start = time.perf_counter()
+            for _ in range(num_calls):
+                op(x, y)
+            elapsed = time.perf_counter() - start
+            results[name][label] = elapsed / num_calls * 1e3
+        ivy.unset_flat_container_mode()
+    ivy.previous_backend()
+    return results
+
+
+def _print_results(results):
+    print(f"{'operation':<16}{'recursive ms':>14}{'flat ms':>12}{'speedup':>10}")
+    for name, timings in results.items():
+        print(
+            f"{name:<16}{timings['recursive']:>14.1f}{timings['flat']:>12.1f}"
+            f"{timings['recursive'] / timings['flat']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--width", type=int, default=10)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--shape", type=int, nargs="+", default=[2])
+    parser.add_argument("--calls", type=int, default=3)
+    parsed = parser.parse_args()
+    _print_results(
+        container_benchmark(
+            parsed.backend,
+            parsed.width,
+            parsed.depth,
+            tuple(parsed.shape),
+            parsed.calls,
+        )
+    )
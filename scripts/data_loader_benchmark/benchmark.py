@@ -0,0 +1,136 @@
+"""Benchmark of the throughput of ``ivy.DataLoader``.
+
+Each sample of the dataset takes a fixed latency to read, standing in for disk
+or network access, and is then decoded with numpy. The samples are consumed by
+a training step of fixed duration per batch. The batches are loaded once
+synchronously before each step, and once by ``ivy.DataLoader`` with thread and
+process workers, which load the next batches while the step runs. The
+throughput in samples per second is reported.
+
+Usage::
+
+    python scripts/data_loader_benchmark/benchmark.py --backend numpy \
+        --num-samples 512 --batch-size 32
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+class _Dataset:
+    def __init__(self, latency, image_size):
+        self._latency = latency
+        self._image_size = image_size
+
+    def __call__(self, idx):
+        time.sleep(self._latency)
+        rng = np.random.RandomState(idx)
+        raw = rng.randint(0, 255, (self._image_size, self._image_size, 3))
+        image = (raw.astype("float32") / 255 - 0.5) / 0.25
+        return {"image": image, "label": np.array(idx % 10)}
+
+
+def _synchronous(dataset_fn, num_samples, batch_size):
+    for start in range(0, num_samples, batch_size):
+        samples = [
+            dataset_fn(idx)
+            for idx in range(start, min(start + batch_size, num_samples))
+        ]
+        yield ivy.Container(
+            image=ivy.stack([sample["image"] for sample in samples]),
+            label=ivy.stack([sample["label"] for sample in samples]),
+        )
+
+
+def data_loader_benchmark(
+    backend="numpy",
+    num_samples=512,
+    batch_size=32,
+    latency=0.002,
+    image_size=64,
+    step_time=0.05,
+    worker_counts=(1, 4),
+):
+    """Time the loading and consumption of a dataset.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+    num_samples
+        The number of samples of the dataset. (Default value = 512).
+    batch_size
+        The number of samples of each batch. (Default value = 32).
+    latency
+        The time in seconds to read each sample. (Default value = 0.002).
+    image_size
+        The height and width of the images of the samples.
+        (Default value = 64).
+    step_time
+        The time in seconds of the training step run on each batch.
+        (Default value = 0.05).
+    worker_counts
+        The numbers of workers to benchmark the loader with.
+        (Default value = (1, 4)).
+
+    Returns
+    -------
+    ret
+        A dict mapping ``"synchronous"`` and each loader configuration to its
+        throughput, in samples per second.
+    """
+    ivy.set_backend(backend)
+    dataset_fn = _Dataset(latency, image_size)
+    loaders = {"synchronous": lambda: _synchronous(dataset_fn, num_samples, batch_size)}
+    for worker_type in ("thread", "process"):
+        for num_workers in worker_counts:
+            loaders[f"{worker_type} x{num_workers}"] = ivy.DataLoader(
+                dataset_fn,
+                num_samples,
+                batch_size=batch_size,
+                num_workers=num_workers,
+                worker_type=worker_type,
+            )
+    results = {}
+    for name, loader in loaders.items():
+        start = time.perf_counter()
+        for _ in loader() if callable(loader) else loader:
+            time.sleep(step_time)
+        results[name] = num_samples / (time.perf_counter() - start)
+        if isinstance(loader, ivy.DataLoader):
+            loader.close()
+    ivy.previous_backend()
+    return results
+
+
+def _print_results(results):
+    print(f"{'loader':<14}{'samples/s':>12}")
+    for name, samples_per_second in results.items():
+        print(f"{name:<14}{samples_per_second:>12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--num-samples", type=int, default=512)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.002)
+    parser.add_argument("--image-size", type=int, default=64)
+    parser.add_argument("--step-time", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parsed = parser.parse_args()
+    _print_results(
+        data_loader_benchmark(
+            parsed.backend,
+            parsed.num_samples,
+            parsed.batch_size,
+            parsed.latency,
+            parsed.image_size,
+            parsed.step_time,
+            parsed.workers,
+        )
+    )
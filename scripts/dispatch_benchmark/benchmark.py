@@ -0,0 +1,93 @@
+"""Micro-benchmark of the per-call overhead added by ivy's function wrappers.
+
+Each function is timed three times on small inputs: calling the unwrapped
+backend implementation directly, calling the ``ivy.*`` function through the full
+wrapper stack, and calling it with ``ivy.set_fused_dispatch_mode(True)``.
+
+Usage::
+
+    python scripts/dispatch_benchmark/benchmark.py --backend numpy --calls 2000
+"""
+
+import argparse
+import timeit
+
+import ivy
+
+
+def _default_cases():
+    x = ivy.random_uniform(shape=(4, 4))
+    y = ivy.random_uniform(shape=(4, 4))
+    return {
+        "add": ((x, y), {}),
+        "multiply": ((x, y), {}),
+        "matmul": ((x, y), {}),
+        "sum": ((x,), {"axis": 0}),
+        "exp": ((x,), {}),
+        "reshape": ((x, (2, 8)), {}),
+        "concat": (([x, y],), {"axis": 0}),
+    }
+
+
+def _time_per_call(fn, args, kwargs, num_calls):
+    return timeit.timeit(lambda: fn(*args, **kwargs), number=num_calls) / num_calls
+
+
+def dispatch_benchmark(backend="numpy", num_calls=1000, cases=None):
+    """Measure the wrapper overhead of ivy functions.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+    num_calls
+        How many times each function is called per measurement.
+        (Default value = 1000).
+    cases
+        A dict mapping function names to the ``(args, kwargs)`` to call them
+        with. Defaults to a handful of elementwise, linear algebra, reduction
+        and manipulation functions on 4x4 arrays.
+
+    Returns
+    -------
+    ret
+        A dict mapping each function name to its time per call, in
+        microseconds, for the ``"native"``, ``"wrapped"`` and ``"fused"`` paths.
+    """
+    ivy.set_backend(backend)
+    backend_module = ivy.current_backend()
+    cases = _default_cases() if cases is None else cases
+    results = {}
+    for fn_name, (args, kwargs) in cases.items():
+        native_args, native_kwargs = ivy.args_to_native(*args, **kwargs)
+        timings = {
+            "native": _time_per_call(
+                backend_module.__dict__[fn_name], native_args, native_kwargs, num_calls
+            )
+        }
+        for label, mode in (("wrapped", False), ("fused", True)):
+            ivy.set_fused_dispatch_mode(mode)
+            timings[label] = _time_per_call(
+                ivy.__dict__[fn_name], args, kwargs, num_calls
+            )
+            ivy.unset_fused_dispatch_mode()
+        results[fn_name] = {k: v * 1e6 for k, v in timings.items()}
+    ivy.previous_backend()
+    return results
+
+
+def _print_results(results):
+    print(f"{'function':<12}{'native us':>12}{'wrapped us':>14}{'fused us':>12}")
+    for fn_name, timings in results.items():
+        print(
+            f"{fn_name:<12}{timings['native']:>12.2f}"
+            f"{timings['wrapped']:>14.2f}{timings['fused']:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--calls", type=int, default=1000)
+    parsed = parser.parse_args()
+    _print_results(dispatch_benchmark(parsed.backend, parsed.calls))
@@ -0,0 +1,92 @@
+"""Benchmark of ``ivy.einsum`` on contractions of three or more operands.
+
+Each contraction is run as a single einsum, and planned into pairwise
+contractions with ``optimize``. The plan is cached on the equation and the
+operand shapes, so the first call, which plans the contraction, is timed
+separately from the following ones.
+
+Usage::
+
+    python scripts/einsum_benchmark/benchmark.py --backend numpy --size 64
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _contractions(size):
+    # equations along with the shapes of their operands
+    return {
+        "matrix chain": ("ij,jk,kl,lm->im", [(size, size)] * 4),
+        "batched chain": (
+            "bij,bjk,bkl->bil",
+            [(16, size, size), (16, size, size), (16, size, size)],
+        ),
+        "bilinear": ("bi,ij,bj->b", [(size * 4, size), (size, size), (size * 4, size)]),
+        "tensor network": (
+            "abc,cd,def->abef",
+            [(size // 4, size // 4, size), (size, size), (size, size // 4, size // 4)],
+        ),
+    }
+
+
+def einsum_benchmark(backend="numpy", size=64, num_calls=5):
+    """Time ivy.einsum on contractions of three or more operands.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+    size
+        The size of the contracted dimensions. (Default value = 64).
+    num_calls
+        How many times each contraction is run per measurement.
+        (Default value = 5).
+
+    Returns
+    -------
+    ret
+        A dict mapping each contraction to the time in milliseconds of a call
+        to the ``"einsum"``, and of the first (``"first planned"``) and
+        following (``"planned"``) calls with ``optimize=True``.
+    """
+    ivy.set_backend(backend)
+    rng = np.random.RandomState(0)
+    results = {}
+    for name, (equation, shapes) in _contractions(size).items():
+        operands = [ivy.array(rng.randn(*shape).astype("float32")) for shape in shapes]
+        results[name] = {}
+        start = time.perf_counter()
+        ivy.einsum(equation, *operands, optimize=True)
+        results[name]["first planned"] = (time.perf_counter() - start) * 1000
+        for method, optimize in (("einsum", False), ("planned", True)):
+            ivy.einsum(equation, *operands, optimize=optimize)
+            start = time.perf_counter()
+            for _ in range(num_calls):
+                ivy.einsum(equation, *operands, optimize=optimize)
+            elapsed = time.perf_counter() - start
+            results[name][method] = elapsed * 1000 / num_calls
+    ivy.previous_backend()
+    return results
+
+
+def _print_results(results):
+    print(f"{'contraction':<16}{'einsum ms':>12}{'first ms':>12}{'planned ms':>12}")
+    for name, times in results.items():
+        print(
+            f"{name:<16}{times['einsum']:>12.2f}{times['first planned']:>12.2f}"
+            f"{times['planned']:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--size", type=int, default=64)
+    parser.add_argument("--calls", type=int, default=5)
+    parsed = parser.parse_args()
+    _print_results(einsum_benchmark(parsed.backend, parsed.size, parsed.calls))
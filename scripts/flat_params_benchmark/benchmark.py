@@ -0,0 +1,97 @@
+"""Benchmark of modules with and without flat parameter buffers.
+
+A deep stack of small linear layers is built once with the variables stored
+leaf by leaf, and once with ``flat_params=True``, which stores them in one flat
+buffer per dtype and device. The foreach optimizer steps and the transfers of
+the variables with ``to_device`` are timed for both.
+
+Usage::
+
+    python scripts/flat_params_benchmark/benchmark.py --backend numpy --depth 200
+"""
+
+import argparse
+import time
+
+import ivy
+
+
+class _Stack(ivy.Module):
+    def __init__(self, width, depth, flat_params):
+        self._layers = [ivy.Linear(width, width) for _ in range(depth)]
+        super().__init__(flat_params=flat_params)
+
+    def _forward(self, x):
+        for layer in self._layers:
+            x = layer(x)
+        return x
+
+
+def _time(fn, num_calls):
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        fn()
+    return (time.perf_counter() - start) / num_calls * 1e3
+
+
+def flat_params_benchmark(backend="numpy", width=16, depth=200, num_calls=5):
+    """Time the optimizer steps and device transfers of modules with and
+    without flat parameter buffers.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+    width
+        The number of features of each layer. (Default value = 16).
+    depth
+        The number of layers, each holding a weight and a bias.
+        (Default value = 200).
+    num_calls
+        How many times each operation is called per measurement.
+        (Default value = 5).
+
+    Returns
+    -------
+    ret
+        A dict mapping each operation to its ``"default"`` and ``"flat"`` time
+        per call, in milliseconds.
+    """
+    ivy.set_backend(backend)
+    results = {"Adam step": {}, "to_device": {}}
+    for label, flat_params in (("default", False), ("flat", True)):
+        module = _Stack(width, depth, flat_params)
+        grads = module.v.cont_map(lambda x, kc: ivy.ones_like(x))
+        optimizer = ivy.Adam(lr=1e-3, foreach=True)
+        module.v = optimizer.step(module.v, grads)
+
+        def _step():
+            module.v = optimizer.step(module.v, grads)
+
+        results["Adam step"][label] = _time(_step, num_calls)
+        results["to_device"][label] = _time(
+            lambda: module.to_device(ivy.default_device()), num_calls
+        )
+    ivy.previous_backend()
+    return results
+
+
+def _print_results(results):
+    print(f"{'operation':<12}{'default ms':>12}{'flat ms':>12}{'speedup':>10}")
+    for name, timings in results.items():
+        print(
+            f"{name:<12}{timings['default']:>12.1f}{timings['flat']:>12.1f}"
+            f"{timings['default'] / timings['flat']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--width", type=int, default=16)
+    parser.add_argument("--depth", type=int, default=200)
+    parser.add_argument("--calls", type=int, default=5)
+    parsed = parser.parse_args()
+    _print_results(
+        flat_params_benchmark(parsed.backend, parsed.width, parsed.depth, parsed.calls)
+    )
@@ -0,0 +1,140 @@
+"""Benchmark of the hdf5 writer, reader and shuffler of containers.
+
+A container of a few leaves sharing their number of rows is written with
+``cont_to_disk_as_hdf5``, with and without compression, read back with
+``cont_from_disk_as_hdf5`` and shuffled on disk with ``shuffle_h5_file``. Each
+is compared with the row by row writes, the reads through python lists and the
+row swaps of ``random.shuffle`` they replace. The throughput in rows per second
+is reported.
+
+Usage::
+
+    python scripts/hdf5_benchmark/benchmark.py --backend numpy --rows 20000 \
+        --features 256
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import h5py
+import numpy as np
+
+import ivy
+
+
+def _legacy_write(container, filepath):
+    with h5py.File(filepath, "a") as h5_obj:
+        for key_chain, value in container.cont_to_iterator():
+            value_as_np = ivy.to_numpy(value)
+            h5_obj.create_dataset(
+                key_chain,
+                value_as_np.shape,
+                dtype=value_as_np.dtype,
+                maxshape=[None for _ in value_as_np.shape],
+            )
+            for i in range(value_as_np.shape[0]):
+                h5_obj[key_chain][i : i + 1] = value_as_np[i : i + 1]
+
+
+def _legacy_read(filepath):
+    leaves = {}
+    with h5py.File(filepath, "r") as h5_obj:
+
+        def _read(name, value):
+            if isinstance(value, h5py.Dataset):
+                leaves[name] = ivy.array(list(value[:]), dtype=str(value.dtype))
+
+        h5_obj.visititems(_read)
+    return leaves
+
+
+def _legacy_shuffle(filepath, seed_value=0):
+    with h5py.File(filepath, "a") as h5_obj:
+
+        def _shuffle(name, value):
+            if isinstance(value, h5py.Dataset):
+                random.seed(seed_value)
+                random.shuffle(value)
+
+        h5_obj.visititems(_shuffle)
+
+
+def hdf5_benchmark(backend="numpy", num_rows=20000, num_features=256):
+    """Time the writing, reading and shuffling of a container on disk.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+    num_rows
+        The number of rows of each leaf. (Default value = 20000).
+    num_features
+        The number of features of each row of the largest leaf.
+        (Default value = 256).
+
+    Returns
+    -------
+    ret
+        A dict mapping each method to its throughput, in rows per second.
+    """
+    ivy.set_backend(backend)
+    rng = np.random.RandomState(0)
+    container = ivy.Container(
+        {
+            "features": ivy.array(
+                rng.rand(num_rows, num_features).astype("float32").round(2)
+            ),
+            "labels": {
+                "class": ivy.array(rng.randint(0, 10, (num_rows,))),
+                "box": ivy.array(rng.rand(num_rows, 4).astype("float32")),
+            },
+        }
+    )
+    directory = tempfile.mkdtemp()
+    filepath = os.path.join(directory, "container.hdf5")
+    legacy_filepath = os.path.join(directory, "legacy.hdf5")
+    methods = {
+        "write (legacy)": lambda: _legacy_write(container, legacy_filepath),
+        "write": lambda: container.cont_to_disk_as_hdf5(filepath, chunks=1024),
+        "write (gzip)": lambda: container.cont_to_disk_as_hdf5(
+            filepath, chunks=1024, compression="gzip", compression_opts=1
+        ),
+        "read (legacy)": lambda: _legacy_read(legacy_filepath),
+        "read": lambda: ivy.Container.cont_from_disk_as_hdf5(filepath),
+        "shuffle (legacy)": lambda: _legacy_shuffle(legacy_filepath),
+        "shuffle": lambda: ivy.Container.shuffle_h5_file(filepath),
+    }
+    results = {}
+    for name, method in methods.items():
+        if name.startswith("write"):
+            # each write starts from a new file
+            path = legacy_filepath if name.endswith("(legacy)") else filepath
+            if os.path.exists(path):
+                os.remove(path)
+        start = time.perf_counter()
+        method()
+        elapsed = time.perf_counter() - start
+        results[name] = num_rows / elapsed
+    for path in (filepath, legacy_filepath):
+        os.remove(path)
+    os.rmdir(directory)
+    ivy.previous_backend()
+    return results
+
+
+def _print_results(results):
+    print(f"{'method':<18}{'rows/s':>12}")
+    for name, rows_per_second in results.items():
+        print(f"{name:<18}{rows_per_second:>12.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--features", type=int, default=256)
+    parsed = parser.parse_args()
+    _print_results(hdf5_benchmark(parsed.backend, parsed.rows, parsed.features))
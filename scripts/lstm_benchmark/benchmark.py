@@ -0,0 +1,137 @@
+"""Benchmark of the lstm throughput in tokens per second.
+
+A batch of sequences is run through ``ivy.lstm_update``, through a stack of
+layers with ``ivy.LSTM``, and through ``ivy.lstm`` as a packed batch of
+sequences of variable lengths, which stops updating each sequence past its
+length.
+
+Usage::
+
+    python scripts/lstm_benchmark/benchmark.py --backend numpy --batch-size 64 \
+        --seq-len 512
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _packed_batch(x, lengths):
+    # time-major data of the sequences of decreasing lengths, as packed by torch
+    data = ivy.concat(
+        [x[t, : int(np.sum(lengths > t))] for t in range(int(lengths.max()))]
+    )
+    batch_sizes = np.array([np.sum(lengths > t) for t in range(int(lengths.max()))])
+    return data, batch_sizes
+
+
+def lstm_benchmark(
+    backend="numpy",
+    batch_size=64,
+    seq_len=512,
+    input_channels=128,
+    hidden_channels=256,
+    num_layers=2,
+    num_calls=2,
+):
+    """Time the lstm over a batch of sequences.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+    batch_size
+        The number of sequences of each batch. (Default value = 64).
+    seq_len
+        The length of the sequences. (Default value = 512).
+    input_channels
+        The number of input features. (Default value = 128).
+    hidden_channels
+        The number of hidden features. (Default value = 256).
+    num_layers
+        The number of layers of ``ivy.LSTM``. (Default value = 2).
+    num_calls
+        How many times the batch is processed per measurement.
+        (Default value = 2).
+
+    Returns
+    -------
+    ret
+        A dict mapping ``"lstm_update"``, ``"LSTM"`` and ``"packed"`` to their
+        throughput, in tokens per second.
+    """
+    ivy.set_backend(backend)
+    rng = np.random.RandomState(0)
+    x = ivy.array(rng.randn(batch_size, seq_len, input_channels).astype("float32"))
+    h = ivy.zeros((batch_size, hidden_channels))
+    kernel = ivy.array(
+        rng.randn(input_channels, 4 * hidden_channels).astype("float32") * 0.1
+    )
+    recurrent_kernel = ivy.array(
+        rng.randn(hidden_channels, 4 * hidden_channels).astype("float32") * 0.1
+    )
+    bias = ivy.zeros((4 * hidden_channels,))
+    layer = ivy.LSTM(input_channels, hidden_channels, num_layers=num_layers)
+
+    # sequences of lengths evenly spread up to seq_len, by decreasing length
+    lengths = np.linspace(seq_len, 1, batch_size).astype("int64")
+    data, batch_sizes = _packed_batch(ivy.swapaxes(x, 0, 1), lengths)
+    weights = [ivy.swapaxes(kernel, 0, 1), ivy.swapaxes(recurrent_kernel, 0, 1)]
+    weights += [bias, bias]
+    states = (ivy.zeros((1, batch_size, hidden_channels)),) * 2
+
+    methods = {
+        "lstm_update": (
+            lambda: ivy.lstm_update(x, h, h, kernel, recurrent_kernel, bias=bias),
+            batch_size * seq_len,
+        ),
+        "LSTM": (lambda: layer(x), batch_size * seq_len),
+        "packed": (
+            lambda: ivy.lstm(
+                data, states, weights, 1, 0.0, False, False, batch_sizes=batch_sizes
+            ),
+            int(lengths.sum()),
+        ),
+    }
+    results = {}
+    for name, (method, num_tokens) in methods.items():
+        method()
+        start = time.perf_counter()
+        for _ in range(num_calls):
+            method()
+        elapsed = time.perf_counter() - start
+        results[name] = num_tokens * num_calls / elapsed
+    ivy.previous_backend()
+    return results
+
+
+def _print_results(results):
+    print(f"{'method':<14}{'tokens/s':>12}")
+    for name, tokens_per_second in results.items():
+        print(f"{name:<14}{tokens_per_second:>12.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--seq-len", type=int, default=512)
+    parser.add_argument("--input-channels", type=int, default=128)
+    parser.add_argument("--hidden-channels", type=int, default=256)
+    parser.add_argument("--layers", type=int, default=2)
+    parser.add_argument("--calls", type=int, default=2)
+    parsed = parser.parse_args()
+    _print_results(
+        lstm_benchmark(
+            parsed.backend,
+            parsed.batch_size,
+            parsed.seq_len,
+            parsed.input_channels,
+            parsed.hidden_channels,
+            parsed.layers,
+            parsed.calls,
+        )
+    )
@@ -0,0 +1,83 @@
+"""Benchmark of ivy's recursive nest utilities against flattened nests.
+
+A typical gradient or container dispatch sequence is timed on a nest of
+``width ** depth`` leaves: finding the leaves matching a condition with
+``ivy.nested_argwhere``, gathering them with ``ivy.multi_index_nest``,
+writing new values back with ``ivy.set_nest_at_indices`` and mapping a
+function over all leaves with ``ivy.nested_map``. The same sequence is then
+timed on a nest flattened once with ``ivy.flatten_nest``, including the
+flattening and the final ``ivy.unflatten_nest``.
+
+Usage::
+
+    python scripts/nest_benchmark/benchmark.py --width 8 --depth 4
+"""
+
+import argparse
+import timeit
+
+import ivy
+
+
+def _make_nest(width, depth):
+    if depth == 0:
+        return 1.0
+    children = [_make_nest(width, depth - 1) for _ in range(width)]
+    if depth % 2:
+        return children
+    return {f"k{i}": child for i, child in enumerate(children)}
+
+
+def _recursive(nest):
+    indices = ivy.nested_argwhere(nest, lambda x: isinstance(x, float))
+    values = ivy.multi_index_nest(nest, indices)
+    ivy.set_nest_at_indices(nest, indices, [v + 1 for v in values])
+    return ivy.nested_map(lambda x: x * 2, nest, shallow=False)
+
+
+def _flattened(nest):
+    flat = ivy.flatten_nest(nest)
+    indices = ivy.nested_argwhere(flat, lambda x: isinstance(x, float))
+    values = ivy.multi_index_nest(flat, indices)
+    ivy.set_nest_at_indices(flat, indices, [v + 1 for v in values])
+    return ivy.unflatten_nest(ivy.nested_map(lambda x: x * 2, flat, shallow=False))
+
+
+def nest_benchmark(width=8, depth=4, num_runs=5):
+    """Time the recursive and the flattened nest utilities.
+
+    Parameters
+    ----------
+    width
+        The number of children of each nested list or dict. (Default value = 8).
+    depth
+        The depth of the nest. (Default value = 4).
+    num_runs
+        How many times each sequence is run. (Default value = 5).
+
+    Returns
+    -------
+    ret
+        A dict with the number of leaves, and the average time in milliseconds
+        of the ``"recursive"`` and ``"flattened"`` sequences.
+    """
+    results = {"leaves": width**depth}
+    for label, fn in (("recursive", _recursive), ("flattened", _flattened)):
+        nests = [_make_nest(width, depth) for _ in range(num_runs)]
+        results[label] = (
+            timeit.timeit(lambda: fn(nests.pop()), number=num_runs) / num_runs * 1e3
+        )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--width", type=int, default=8)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=5)
+    parsed = parser.parse_args()
+    results = nest_benchmark(parsed.width, parsed.depth, parsed.runs)
+    print(
+        f"{results['leaves']} leaves: recursive {results['recursive']:.2f} ms,"
+        f" flattened {results['flattened']:.2f} ms"
+    )
@@ -0,0 +1,127 @@
+"""Benchmark of non-maximum suppression over batches of images.
+
+Each image holds many detections jittered around a few objects, as produced by
+a detector before post-processing. The batch is suppressed once image by image
+with ``ivy.nms``, and once at once with ``ivy.batched_nms``, with and without
+pre-filtering the highest scoring boxes with ``top_k``. The throughput in
+images per second is reported.
+
+Usage::
+
+    python scripts/nms_benchmark/benchmark.py --backend numpy --batch-size 8 \
+        --boxes 500 1000 2000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _make_detections(batch_size, num_boxes, num_objects=50, seed=0):
+    rng = np.random.RandomState(seed)
+    centers = rng.rand(batch_size, num_objects, 2) * 1000
+    sizes = rng.rand(batch_size, num_objects, 2) * 100 + 20
+    objects = rng.randint(0, num_objects, (batch_size, num_boxes))
+    batch_idxs = np.arange(batch_size)[:, None]
+    center = centers[batch_idxs, objects] + rng.randn(batch_size, num_boxes, 2) * 5
+    size = sizes[batch_idxs, objects] * rng.uniform(
+        0.8, 1.2, (batch_size, num_boxes, 2)
+    )
+    boxes = np.concatenate([center - size / 2, center + size / 2], axis=-1)
+    scores = rng.rand(batch_size, num_boxes)
+    return ivy.array(boxes.astype("float32")), ivy.array(scores.astype("float32"))
+
+
+def nms_benchmark(
+    backend="numpy",
+    batch_size=8,
+    box_counts=(500, 1000, 2000),
+    top_k=500,
+    iou_threshold=0.5,
+    num_calls=3,
+):
+    """Time the suppression of batches of detections.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+    batch_size
+        The number of images of each batch. (Default value = 8).
+    box_counts
+        The numbers of boxes per image to benchmark.
+        (Default value = (500, 1000, 2000)).
+    top_k
+        The number of highest scoring boxes kept by the pre-filtering.
+        (Default value = 500).
+    iou_threshold
+        The intersection over union above which boxes are suppressed.
+        (Default value = 0.5).
+    num_calls
+        How many times each batch is suppressed per measurement.
+        (Default value = 3).
+
+    Returns
+    -------
+    ret
+        A dict mapping each number of boxes to the ``"nms"``, ``"batched"`` and
+        ``"top_k"`` throughput, in images per second.
+    """
+    ivy.set_backend(backend)
+    methods = {
+        "nms": lambda boxes, scores: [
+            ivy.nms(boxes[i], scores[i], iou_threshold) for i in range(batch_size)
+        ],
+        "batched": lambda boxes, scores: ivy.batched_nms(
+            boxes, scores, iou_threshold=iou_threshold
+        ),
+        "top_k": lambda boxes, scores: ivy.batched_nms(
+            boxes, scores, iou_threshold=iou_threshold, top_k=top_k
+        ),
+    }
+    results = {}
+    for num_boxes in box_counts:
+        boxes, scores = _make_detections(batch_size, num_boxes)
+        results[num_boxes] = {}
+        for name, method in methods.items():
+            method(boxes, scores)
+            start = time.perf_counter()
+            for _ in range(num_calls):
+                method(boxes, scores)
+            elapsed = time.perf_counter() - start
+            results[num_boxes][name] = batch_size * num_calls / elapsed
+    ivy.previous_backend()
+    return results
+
+
+def _print_results(results):
+    print(f"{'boxes':<8}{'nms img/s':>12}{'batched img/s':>16}{'top_k img/s':>14}")
+    for num_boxes, throughputs in results.items():
+        print(
+            f"{num_boxes:<8}{throughputs['nms']:>12.1f}"
+            f"{throughputs['batched']:>16.1f}{throughputs['top_k']:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--boxes", type=int, nargs="+", default=[500, 1000, 2000])
+    parser.add_argument("--top-k", type=int, default=500)
+    parser.add_argument("--iou-threshold", type=float, default=0.5)
+    parser.add_argument("--calls", type=int, default=3)
+    parsed = parser.parse_args()
+    _print_results(
+        nms_benchmark(
+            parsed.backend,
+            parsed.batch_size,
+            parsed.boxes,
+            parsed.top_k,
+            parsed.iou_threshold,
+            parsed.calls,
+        )
+    )
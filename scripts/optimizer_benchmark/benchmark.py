@@ -0,0 +1,93 @@
+"""Benchmark of the optimizer steps with and without the foreach updates.
+
+The variables of a model with many small layers are updated with a few steps of
+each optimizer, once variable by variable, and once with ``foreach=True``,
+which updates all variables of the same dtype and device as a single flat
+buffer. The average time per step is reported.
+
+Usage::
+
+    python scripts/optimizer_benchmark/benchmark.py --backend numpy --tensors 500
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _make_variables(num_tensors, seed=0):
+    # layers of a weight and a bias each
+    rng = np.random.RandomState(seed)
+    shapes = [(16, 16), (16,)]
+    layers = {}
+    for i in range(num_tensors):
+        shape = shapes[i % len(shapes)]
+        layers.setdefault(f"layer{i // len(shapes)}", {})[f"v{i % len(shapes)}"] = (
+            ivy.array(rng.randn(*shape).astype("float32"))
+        )
+    return ivy.Container(layers)
+
+
+_OPTIMIZERS = {
+    "SGD": ivy.SGD,
+    "LARS": ivy.LARS,
+    "Adam": ivy.Adam,
+    "LAMB": ivy.LAMB,
+}
+
+
+def optimizer_benchmark(backend="numpy", num_tensors=500, num_steps=5):
+    """Time the steps of the optimizers with and without the foreach updates.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+    num_tensors
+        The number of variables of the model. (Default value = 500).
+    num_steps
+        The number of optimizer steps per measurement. (Default value = 5).
+
+    Returns
+    -------
+    ret
+        A dict mapping each optimizer to its ``"default"`` and ``"foreach"`` time
+        per step, in milliseconds.
+    """
+    ivy.set_backend(backend)
+    v = _make_variables(num_tensors)
+    grads = _make_variables(num_tensors, seed=1)
+    results = {}
+    for name, optimizer_class in _OPTIMIZERS.items():
+        results[name] = {}
+        for label, foreach in (("default", False), ("foreach", True)):
+            optimizer = optimizer_class(lr=1e-3, foreach=foreach)
+            new_v = optimizer.step(v, grads)
+            start = time.perf_counter()
+            for _ in range(num_steps):
+                new_v = optimizer.step(new_v, grads)
+            elapsed = time.perf_counter() - start
+            results[name][label] = elapsed / num_steps * 1e3
+    ivy.previous_backend()
+    return results
+
+
+def _print_results(results):
+    print(f"{'optimizer':<12}{'default ms':>12}{'foreach ms':>12}{'speedup':>10}")
+    for name, timings in results.items():
+        print(
+            f"{name:<12}{timings['default']:>12.1f}{timings['foreach']:>12.1f}"
+            f"{timings['default'] / timings['foreach']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--tensors", type=int, default=500)
+    parser.add_argument("--steps", type=int, default=5)
+    parsed = parser.parse_args()
+    _print_results(optimizer_benchmark(parsed.backend, parsed.tensors, parsed.steps))
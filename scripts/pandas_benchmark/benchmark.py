@@ -0,0 +1,77 @@
+"""Benchmark of the construction, reductions and lookups of the pandas frontend.
+
+A DataFrame of a few float columns is constructed both from a 2-D array and
+from a dict of 1-D arrays, reduced with ``sum`` and ``mean`` over its columns,
+and indexed by column label. A Series of one of the columns is then indexed by
+row label. The time of each in milliseconds is reported, the lookups per call.
+
+Usage::
+
+    python scripts/pandas_benchmark/benchmark.py --backend numpy --rows 1000000 \
+        --columns 8
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+import ivy.functional.frontends.pandas as pd_frontend
+
+
+def _time(fn, num_calls=1):
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        ret = fn()
+    return ret, (time.perf_counter() - start) / num_calls * 1000
+
+
+def pandas_benchmark(backend="numpy", num_rows=1_000_000, num_columns=8):
+    """Time the construction, reductions and lookups of a DataFrame.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+    num_rows
+        The number of rows of the frame. (Default value = 1_000_000).
+    num_columns
+        The number of columns of the frame. (Default value = 8).
+
+    Returns
+    -------
+    ret
+        A dict mapping each operation to its time in milliseconds.
+    """
+    ivy.set_backend(backend)
+    rng = np.random.RandomState(0)
+    array = ivy.array(rng.rand(num_rows, num_columns))
+    columns = {f"c{j}": ivy.array(rng.rand(num_rows)) for j in range(num_columns)}
+    results = {}
+    _, results["construct (array)"] = _time(lambda: pd_frontend.DataFrame(array))
+    frame, results["construct (dict)"] = _time(lambda: pd_frontend.DataFrame(columns))
+    _, results["sum"] = _time(frame.sum)
+    _, results["mean"] = _time(frame.mean)
+    _, results["column lookup"] = _time(lambda: frame["c0"], num_calls=100)
+    series = frame["c0"]
+    # the first lookup hashes the labels of the index
+    _, results["first label lookup"] = _time(lambda: series[num_rows - 1])
+    _, results["label lookup"] = _time(lambda: series[num_rows - 1], num_calls=100)
+    ivy.previous_backend()
+    return results
+
+
+def _print_results(results):
+    print(f"{'operation':<20}{'time (ms)':>12}")
+    for name, elapsed in results.items():
+        print(f"{name:<20}{elapsed:>12.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--columns", type=int, default=8)
+    parsed = parser.parse_args()
+    _print_results(pandas_benchmark(parsed.backend, parsed.rows, parsed.columns))
@@ -0,0 +1,105 @@
+"""Benchmark of the sklearn frontend's DecisionTreeClassifier.
+
+A classifier is fitted on random data and then used to predict the training
+samples, once with the default ``"best"`` splitter, which grows the tree node by
+node with per-sample loops, and once with the ``"hist"`` splitter, which bins
+the features and splits all the nodes of a level with batched reductions.
+
+Usage::
+
+    python scripts/sklearn_tree_benchmark/benchmark.py --samples 200 --features 4
+    python scripts/sklearn_tree_benchmark/benchmark.py --samples 100000 \
+        --splitters hist
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+from ivy.functional.frontends.sklearn.tree import DecisionTreeClassifier
+
+
+def _make_data(n_samples, n_features, seed=0):
+    rng = np.random.RandomState(seed)
+    X = rng.uniform(size=(n_samples, n_features)).astype("float32")
+    y = (X[:, 0] + X[:, 1] > 1).astype("int64") + (X[:, -1] > 0.5)
+    return ivy.array(X), ivy.array(y)
+
+
+def tree_benchmark(
+    n_samples=200,
+    n_features=4,
+    max_depth=4,
+    splitters=("best", "hist"),
+    backend="numpy",
+):
+    """Time fitting and predicting with a DecisionTreeClassifier.
+
+    Parameters
+    ----------
+    n_samples
+        The number of training samples. (Default value = 200).
+    n_features
+        The number of features. (Default value = 4).
+    max_depth
+        The maximum depth of the tree. (Default value = 4).
+    splitters
+        The splitters to benchmark. (Default value = ("best", "hist")).
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+
+    Returns
+    -------
+    ret
+        A dict mapping each splitter to its ``"fit"`` and ``"predict"`` times in
+        seconds, and its training ``"accuracy"``.
+    """
+    ivy.set_backend(backend)
+    X, y = _make_data(n_samples, n_features)
+    results = {}
+    for splitter in splitters:
+        clf = DecisionTreeClassifier(
+            max_depth=max_depth, random_state=0, splitter=splitter
+        )
+        start = time.perf_counter()
+        clf.fit(X, y)
+        fitted = time.perf_counter()
+        pred = clf.predict(X)
+        predicted = time.perf_counter()
+        results[splitter] = {
+            "fit": fitted - start,
+            "predict": predicted - fitted,
+            "accuracy": float(ivy.mean(ivy.astype(pred == y, "float32"))),
+        }
+    ivy.previous_backend()
+    return results
+
+
+def _print_results(results):
+    print(f"{'splitter':<12}{'fit s':>12}{'predict s':>12}{'accuracy':>12}")
+    for splitter, timings in results.items():
+        print(
+            f"{splitter:<12}{timings['fit']:>12.3f}"
+            f"{timings['predict']:>12.3f}{timings['accuracy']:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--features", type=int, default=4)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--splitters", nargs="+", default=["best", "hist"])
+    parser.add_argument("--backend", default="numpy")
+    parsed = parser.parse_args()
+    _print_results(
+        tree_benchmark(
+            parsed.samples,
+            parsed.features,
+            parsed.depth,
+            parsed.splitters,
+            parsed.backend,
+        )
+    )
@@ -0,0 +1,160 @@
+"""Benchmark of the backward pass of the torch frontend on an MLP.
+
+A multilayer perceptron built from torch frontend tensors is run forward to a
+scalar loss, and ``Tensor.backward`` is then called on the loss, which
+propagates vector-jacobian products through the recorded graph. The time of
+both passes is reported, along with the size of the jacobians which computing
+the gradients through full jacobians of each op would have materialized.
+
+Gradients require a backend with automatic differentiation.
+
+Usage::
+
+    python scripts/torch_autograd_benchmark/benchmark.py --backend torch \
+        --batch-size 64 --hidden 256 512
+"""
+
+import argparse
+import math
+import time
+
+import numpy as np
+
+import ivy
+import ivy.functional.frontends.torch as torch_frontend
+
+
+def _jacobian_nbytes(grad_fn):
+    # the size of the jacobian of the output of each op with respect to each
+    # of its differentiable inputs
+    nbytes = 0
+    nodes = [grad_fn]
+    visited = {id(grad_fn)}
+    while nodes:
+        node = nodes.pop()
+        if not hasattr(node, "_inputs"):
+            continue
+        output = node.__self__
+        for input_tensor in node._inputs:
+            nbytes += (
+                math.prod(output.shape)
+                * math.prod(input_tensor.shape)
+                * ivy.dtype_bits(output.dtype)
+                // 8
+            )
+        for next_function in node.next_functions:
+            if id(next_function) not in visited:
+                visited.add(id(next_function))
+                nodes.append(next_function)
+    return nbytes
+
+
+def _mlp_loss(x, target, weights, biases):
+    for i, (w, b) in enumerate(zip(weights, biases)):
+        x = torch_frontend.matmul(x, w) + b
+        if i < len(weights) - 1:
+            x = torch_frontend.nn.functional.relu(x)
+    return ((x - target) * (x - target)).mean()
+
+
+def torch_autograd_benchmark(
+    backend="torch",
+    batch_size=64,
+    hidden_sizes=(256, 512),
+    in_features=128,
+    out_features=10,
+    num_calls=5,
+):
+    """Time the forward and backward passes of an MLP.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "torch").
+    batch_size
+        The number of samples of each batch. (Default value = 64).
+    hidden_sizes
+        The number of features of each hidden layer.
+        (Default value = (256, 512)).
+    in_features
+        The number of input features. (Default value = 128).
+    out_features
+        The number of output features. (Default value = 10).
+    num_calls
+        How many times both passes are run per measurement.
+        (Default value = 5).
+
+    Returns
+    -------
+    ret
+        A dict mapping ``"forward"`` and ``"backward"`` to their time in
+        milliseconds, and ``"jacobians"`` to the size in MiB of the full
+        jacobians of the ops of the graph.
+    """
+    ivy.set_backend(backend)
+    rng = np.random.RandomState(0)
+    sizes = [in_features, *hidden_sizes, out_features]
+    weights = [
+        torch_frontend.tensor(
+            (rng.randn(n_in, n_out) / np.sqrt(n_in)).astype("float32"),
+            requires_grad=True,
+        )
+        for n_in, n_out in zip(sizes[:-1], sizes[1:])
+    ]
+    biases = [
+        torch_frontend.tensor(np.zeros(n_out, "float32"), requires_grad=True)
+        for n_out in sizes[1:]
+    ]
+    x = torch_frontend.tensor(rng.randn(batch_size, in_features).astype("float32"))
+    target = torch_frontend.tensor(
+        rng.randn(batch_size, out_features).astype("float32")
+    )
+
+    forward_time = backward_time = 0.0
+    for i in range(num_calls + 1):
+        start = time.perf_counter()
+        loss = _mlp_loss(x, target, weights, biases)
+        forward_end = time.perf_counter()
+        loss.backward()
+        backward_end = time.perf_counter()
+        if i == 0:
+            # the first call warms up
+            continue
+        forward_time += forward_end - start
+        backward_time += backward_end - forward_end
+    results = {
+        "forward": forward_time / num_calls * 1000,
+        "backward": backward_time / num_calls * 1000,
+        "jacobians": _jacobian_nbytes(loss.grad_fn) / 2**20,
+    }
+    ivy.previous_backend()
+    return results
+
+
+def _print_results(results):
+    print(f"{'forward (ms)':>14}{'backward (ms)':>15}{'jacobians (MiB)':>17}")
+    print(
+        f"{results['forward']:>14.2f}{results['backward']:>15.2f}"
+        f"{results['jacobians']:>17.1f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="torch")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--hidden", type=int, nargs="+", default=[256, 512])
+    parser.add_argument("--in-features", type=int, default=128)
+    parser.add_argument("--out-features", type=int, default=10)
+    parser.add_argument("--calls", type=int, default=5)
+    parsed = parser.parse_args()
+    _print_results(
+        torch_autograd_benchmark(
+            parsed.backend,
+            parsed.batch_size,
+            parsed.hidden,
+            parsed.in_features,
+            parsed.out_features,
+            parsed.calls,
+        )
+    )
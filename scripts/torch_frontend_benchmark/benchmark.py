@@ -0,0 +1,106 @@
+"""Benchmark of the per-op overhead of the torch frontend.
+
+A few ops are called on torch frontend tensors, and the same ops are called on
+the native arrays they wrap through the native library of the backend. The
+time per call of each in microseconds is reported, along with the overhead of
+the frontend as a ratio of the two.
+
+Usage::
+
+    python scripts/torch_frontend_benchmark/benchmark.py --backend torch \
+        --size 64
+"""
+
+import argparse
+import importlib
+import operator
+import time
+
+import numpy as np
+
+import ivy
+import ivy.functional.frontends.torch as torch_frontend
+
+# the native library of each backend, whose functions share their names with
+# the ones of numpy
+_native_modules = {"jax": "jax.numpy", "tensorflow": "tensorflow.experimental.numpy"}
+
+# the frontend op and the name of the native function of each benchmarked op
+_ops = {
+    "add": (torch_frontend.add, "add"),
+    "mul": (torch_frontend.mul, "multiply"),
+    "matmul": (torch_frontend.matmul, "matmul"),
+    "exp": (torch_frontend.exp, "exp"),
+    "tanh": (torch_frontend.tanh, "tanh"),
+    "sum": (torch_frontend.sum, "sum"),
+}
+
+
+def _time_per_call(fn, args, num_calls):
+    fn(*args)
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        fn(*args)
+    return (time.perf_counter() - start) / num_calls * 1e6
+
+
+def torch_frontend_benchmark(backend="torch", size=64, num_calls=1000):
+    """Time torch frontend ops against the native ops of the backend.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "torch").
+    size
+        The size of both dimensions of the square input tensors.
+        (Default value = 64).
+    num_calls
+        How many times each op is called per measurement.
+        (Default value = 1000).
+
+    Returns
+    -------
+    ret
+        A dict mapping each op to the time per call of the ``"native"`` op and
+        of the ``"frontend"`` op, in microseconds.
+    """
+    ivy.set_backend(backend)
+    native = importlib.import_module(_native_modules.get(backend, backend))
+    rng = np.random.RandomState(0)
+    x = torch_frontend.tensor(rng.rand(size, size).astype("float32"))
+    y = torch_frontend.tensor(rng.rand(size, size).astype("float32"))
+    x_native, y_native = x.ivy_array.data, y.ivy_array.data
+    results = {}
+    for name, (frontend_fn, native_name) in _ops.items():
+        # the unary ops take the first input only
+        num_args = 2 if name in ("add", "mul", "matmul") else 1
+        results[name] = {
+            "native": _time_per_call(
+                getattr(native, native_name), (x_native, y_native)[:num_args], num_calls
+            ),
+            "frontend": _time_per_call(frontend_fn, (x, y)[:num_args], num_calls),
+        }
+    results["tensor +"] = {
+        "native": _time_per_call(operator.add, (x_native, y_native), num_calls),
+        "frontend": _time_per_call(operator.add, (x, y), num_calls),
+    }
+    ivy.previous_backend()
+    return results
+
+
+def _print_results(results):
+    print(f"{'op':<10}{'native (us)':>13}{'frontend (us)':>15}{'overhead':>10}")
+    for name, times in results.items():
+        print(
+            f"{name:<10}{times['native']:>13.1f}{times['frontend']:>15.1f}"
+            f"{times['frontend'] / times['native']:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="torch")
+    parser.add_argument("--size", type=int, default=64)
+    parser.add_argument("--calls", type=int, default=1000)
+    parsed = parser.parse_args()
+    _print_results(torch_frontend_benchmark(parsed.backend, parsed.size, parsed.calls))
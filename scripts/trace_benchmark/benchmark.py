@@ -0,0 +1,98 @@
+"""Benchmark of eager calls against graphs of the pure-Python tracer.
+
+A small multi-layer perceptron is called eagerly, and through the graph traced
+by ``ivy.trace_graph``, for a few batch sizes. The first traced call of each
+batch size traces a new graph, the later ones replay it from the graph cache,
+so the average time of both is reported.
+
+Usage::
+
+    python scripts/trace_benchmark/benchmark.py --backend numpy --calls 100
+"""
+
+import argparse
+import timeit
+
+import ivy
+
+
+class _MLP(ivy.Module):
+    def __init__(self, width, depth):
+        self._layers = [ivy.Linear(width, width) for _ in range(depth)]
+        super().__init__()
+
+    def _forward(self, x):
+        for layer in self._layers:
+            x = ivy.relu(layer(x))
+        return ivy.softmax(x)
+
+
+def trace_benchmark(
+    backend="numpy", width=32, depth=4, batch_sizes=(1, 16, 64), num_calls=100
+):
+    """Time eager and traced calls of a multi-layer perceptron.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+    width
+        The number of features of each layer. (Default value = 32).
+    depth
+        The number of layers. (Default value = 4).
+    batch_sizes
+        The batch sizes to call the network with. (Default value = (1, 16, 64)).
+    num_calls
+        How many times the network is called per measurement.
+        (Default value = 100).
+
+    Returns
+    -------
+    ret
+        A dict mapping each batch size to the ``"eager"``, ``"trace"`` and
+        ``"replay"`` time per call, in microseconds.
+    """
+    ivy.set_backend(backend)
+    module = _MLP(width, depth)
+    graph = ivy.trace_graph(module._call)
+    results = {}
+    for batch_size in batch_sizes:
+        x = ivy.random_uniform(shape=(batch_size, width))
+        eager = timeit.timeit(lambda: module._call(x, v=module.v), number=num_calls)
+        trace = timeit.timeit(lambda: graph(x, v=module.v), number=1)
+        replay = timeit.timeit(lambda: graph(x, v=module.v), number=num_calls)
+        results[batch_size] = {
+            "eager": eager / num_calls * 1e6,
+            "trace": trace * 1e6,
+            "replay": replay / num_calls * 1e6,
+        }
+    ivy.previous_backend()
+    return results
+
+
+def _print_results(results):
+    print(f"{'batch':<8}{'eager us':>12}{'trace us':>12}{'replay us':>12}")
+    for batch_size, timings in results.items():
+        print(
+            f"{batch_size:<8}{timings['eager']:>12.2f}"
+            f"{timings['trace']:>12.2f}{timings['replay']:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--width", type=int, default=32)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--calls", type=int, default=100)
+    parsed = parser.parse_args()
+    _print_results(
+        trace_benchmark(
+            parsed.backend,
+            parsed.width,
+            parsed.depth,
+            parsed.batch_sizes,
+            parsed.calls,
+        )
+    )
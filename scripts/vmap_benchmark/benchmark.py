@@ -0,0 +1,124 @@
+"""Benchmark of ``ivy.vmap`` on the backends without a native vmap.
+
+A few functions of a single example are vectorized over a batch, both with
+``ivy.vmap``, which runs them once through the batching rules, and with the
+loop over the examples it used to run, stacking their results. The time of
+each in milliseconds is reported.
+
+Usage::
+
+    python scripts/vmap_benchmark/benchmark.py --backend numpy --batch-size 1024
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _loop_vmap(func, in_axes):
+    # one call of func per example, as ivy.vmap ran before the batching rules
+    def _vmap(*args):
+        args = [
+            ivy.to_native(ivy.moveaxis(arg, axis, 0)) if axis is not None else arg
+            for arg, axis in zip(args, in_axes)
+        ]
+        batch_size = next(
+            arg.shape[0] for arg, axis in zip(args, in_axes) if axis is not None
+        )
+        args = [
+            (
+                arg
+                if axis is not None
+                else ivy.to_native(ivy.broadcast_to(arg, (batch_size, *arg.shape)))
+            )
+            for arg, axis in zip(args, in_axes)
+        ]
+        return ivy.stack([func(*arrays) for arrays in zip(*args)])
+
+    return _vmap
+
+
+def vmap_benchmark(backend="numpy", batch_size=1024, num_features=64, num_calls=5):
+    """Time vectorized functions over a batch of examples.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+    batch_size
+        The number of examples of the batch. (Default value = 1024).
+    num_features
+        The number of features of each example. (Default value = 64).
+    num_calls
+        How many times each function is called per measurement.
+        (Default value = 5).
+
+    Returns
+    -------
+    ret
+        A dict mapping each function to the time of the ``"loop"`` and of
+        ``"vmap"``, in milliseconds.
+    """
+    ivy.set_backend(backend)
+    rng = np.random.RandomState(0)
+    x = ivy.array(rng.randn(batch_size, num_features).astype("float32"))
+    y = ivy.array(rng.randn(batch_size, num_features).astype("float32"))
+    w1 = ivy.array(rng.randn(num_features, 4 * num_features).astype("float32"))
+    w2 = ivy.array(rng.randn(4 * num_features, num_features).astype("float32"))
+    matrices = ivy.array(
+        rng.randn(batch_size, 8, num_features).astype("float32") / num_features
+    )
+
+    def _mlp(x, w1, w2):
+        return ivy.sum(ivy.relu(x @ w1) @ w2, axis=-1)
+
+    def _attention(q, k):
+        return ivy.softmax(ivy.matmul(k, q) / num_features**0.5, axis=-1)
+
+    def _median_distance(x, y):
+        # median has no batching rule, and is looped over within the batch
+        return ivy.median(ivy.abs(x - y))
+
+    functions = {
+        "elementwise": (lambda x, y: ivy.tanh(x * y + 1.0), (x, y), (0, 0)),
+        "mlp": (_mlp, (x, w1, w2), (0, None, None)),
+        "attention": (_attention, (x, matrices), (0, 0)),
+        "vecdot": (ivy.vecdot, (x, y), (0, 0)),
+        "median_distance": (_median_distance, (x, y), (0, 0)),
+    }
+    results = {}
+    for name, (func, args, in_axes) in functions.items():
+        results[name] = {}
+        for method, vectorized in (
+            ("loop", _loop_vmap(func, in_axes)),
+            ("vmap", ivy.vmap(func, in_axes=in_axes)),
+        ):
+            vectorized(*args)
+            start = time.perf_counter()
+            for _ in range(num_calls):
+                vectorized(*args)
+            elapsed = time.perf_counter() - start
+            results[name][method] = elapsed / num_calls * 1000
+    ivy.previous_backend()
+    return results
+
+
+def _print_results(results):
+    print(f"{'function':<18}{'loop (ms)':>12}{'vmap (ms)':>12}")
+    for name, times in results.items():
+        print(f"{name:<18}{times['loop']:>12.2f}{times['vmap']:>12.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--batch-size", type=int, default=1024)
+    parser.add_argument("--features", type=int, default=64)
+    parser.add_argument("--calls", type=int, default=5)
+    parsed = parser.parse_args()
+    _print_results(
+        vmap_benchmark(parsed.backend, parsed.batch_size, parsed.features, parsed.calls)
+    )
@@ -0,0 +1,108 @@
+"""Benchmark of the boosters of ivy's xgboost frontend.
+
+A binary classifier is trained with ``xgboost.train`` on synthetic data with
+the linear booster and with the histogram tree booster, and the training
+throughput in rows times boosting rounds per second is reported along with the
+accuracy on the training data.
+
+Usage::
+
+    python scripts/xgboost_benchmark/benchmark.py --rows 10000 --rounds 20
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+import ivy.functional.frontends.xgboost as xgb
+
+
+def _make_data(num_rows, num_features, seed=0):
+    rng = np.random.RandomState(seed)
+    X = rng.uniform(size=(num_rows, num_features)).astype("float32")
+    y = (np.sin(4 * X[:, 0]) + X[:, 1] + 0.1 * rng.normal(size=num_rows) > 0.5).astype(
+        "float32"
+    )
+    return ivy.array(X), ivy.array(y[:, None])
+
+
+def xgboost_benchmark(
+    backend="numpy", num_rows=10000, num_features=8, num_rounds=20, max_depth=6
+):
+    """Time the training of the gblinear and gbtree boosters.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+    num_rows
+        The number of training samples. (Default value = 10000).
+    num_features
+        The number of features of the samples. (Default value = 8).
+    num_rounds
+        The number of boosting rounds. (Default value = 20).
+    max_depth
+        The maximum depth of the trees. (Default value = 6).
+
+    Returns
+    -------
+    ret
+        A dict mapping each booster to its ``"rows_per_second"``, counting each
+        row once per boosting round, and its training ``"accuracy"``.
+    """
+    ivy.set_backend(backend)
+    X, y = _make_data(num_rows, num_features)
+    results = {}
+    for booster in ("gblinear", "gbtree"):
+        params = {
+            "base_score": None,
+            "scale_pos_weight": None,
+            "base_margin": None,
+            "learning_rate": 0.3,
+            "reg_lambda": 1.0,
+            "reg_alpha": 0.0,
+            "booster": booster,
+            "max_depth": max_depth,
+        }
+        start = time.perf_counter()
+        bst = xgb.train(params, X, y, num_rounds)
+        elapsed = time.perf_counter() - start
+        accuracy = np.mean(
+            ivy.to_numpy(bst.predict(X)).ravel() == ivy.to_numpy(y).ravel()
+        )
+        results[booster] = {
+            "rows_per_second": num_rows * num_rounds / elapsed,
+            "accuracy": float(accuracy),
+        }
+    ivy.previous_backend()
+    return results
+
+
+def _print_results(results):
+    print(f"{'booster':<12}{'rows/s':>14}{'accuracy':>12}")
+    for booster, timings in results.items():
+        print(
+            f"{booster:<12}{timings['rows_per_second']:>14.0f}"
+            f"{timings['accuracy']:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--features", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--max-depth", type=int, default=6)
+    parsed = parser.parse_args()
+    _print_results(
+        xgboost_benchmark(
+            parsed.backend,
+            parsed.rows,
+            parsed.features,
+            parsed.rounds,
+            parsed.max_depth,
+        )
+    )